@@ -44,6 +44,12 @@ typedef struct {
     bool gl_enable_dither;
     bool gl_disable_dither;
     bool gl_log_context;
+
+    // Asset with all the payloads when the trace was generated with packed
+    // assets, mapped on first use and kept open until exit
+    AAsset* pAssetPack;
+    const char* pAssetPackBuffer;
+    off_t assetPackLength;
 } DrawState;
 
 #define LOGV(...) ((void)__android_log_print(ANDROID_LOG_VERBOSE, "native-activity", __VA_ARGS__))
@@ -27,9 +27,22 @@
 #include <memory.h>
 #include <stdbool.h>
 #include <stdlib.h>
+#include <string.h>
+#include <zlib.h>
 
 #include "common.h"
 
+// Same as glparse.ASSET_PACK_FILENAME
+#define ASSET_PACK_FILENAME "asset_pack"
+// Same as glparse.ASSET_COMPRESSED_EXTENSION
+#define ASSET_COMPRESSED_EXTENSION ".zlib"
+// Size of the header with the little endian uncompressed size in front of the
+// zlib stream of compressed assets, see glparse.ASSET_COMPRESSION_HEADER_FORMAT
+#define ASSET_COMPRESSION_HEADER_SIZE 4
+// Maximum number of inflated or reassembled assets open at the same time,
+// glparse only keeps one asset open per asset variable
+#define MAX_ALLOCATED_ASSETS 32
+
 #ifndef GL_RED
 // GLES2 headers don't have this one, but GLES3 do
 #define GL_RED 0x1903
@@ -142,6 +155,95 @@ int getAssetBuffer(AAsset* pAsset, const void** ppBuffer)
     return ret;
 }
 
+// Buffers of the inflated and reassembled assets, freed when closing their
+// asset. Reassembled assets don't have an AAsset, they use the buffer as asset
+// so it can be found when closing it
+static struct {
+    AAsset* pAsset;
+    void* pBuffer;
+} g_allocated_assets[MAX_ALLOCATED_ASSETS];
+
+/**
+ * Register a buffer allocated for an asset, to be freed by closeAsset
+ */
+static int registerAllocatedAsset(AAsset* pAsset, void* pBuffer)
+{
+    int slot;
+
+    for (slot = 0; slot < MAX_ALLOCATED_ASSETS; ++slot)
+    {
+        if (g_allocated_assets[slot].pAsset == NULL)
+        {
+            g_allocated_assets[slot].pAsset = pAsset;
+            g_allocated_assets[slot].pBuffer = pBuffer;
+
+            return 0;
+        }
+    }
+
+    LOGW("Too many allocated assets open");
+
+    return -1;
+}
+
+/**
+ * Inflate a compressed asset generated by glparse, returning the inflated
+ * buffer, which is freed by closeAsset
+ */
+static int inflateAssetBuffer(AAsset* pAsset, const void** ppBuffer)
+{
+    const unsigned char* pCompressed = *ppBuffer;
+    off_t compressedLength = AAsset_getLength(pAsset);
+    uLongf inflatedLength;
+    void* pInflated;
+    int ret;
+
+    if (compressedLength < ASSET_COMPRESSION_HEADER_SIZE)
+    {
+        LOGW("Compressed asset %p too short", pAsset);
+        return -1;
+    }
+
+    // Widen each byte before shifting, shifting into the sign bit of an int is
+    // undefined
+    inflatedLength = ((uLongf) pCompressed[0]) | (((uLongf) pCompressed[1]) << 8) |
+                     (((uLongf) pCompressed[2]) << 16) | (((uLongf) pCompressed[3]) << 24);
+    pInflated = malloc(inflatedLength);
+    if (pInflated == NULL)
+    {
+        LOGW("Unable to allocate %lu bytes to inflate asset %p", inflatedLength, pAsset);
+        return -1;
+    }
+
+    ret = uncompress(pInflated, &inflatedLength,
+                     pCompressed + ASSET_COMPRESSION_HEADER_SIZE,
+                     compressedLength - ASSET_COMPRESSION_HEADER_SIZE);
+    if (ret != Z_OK)
+    {
+        LOGW("Unable to inflate asset %p, error %d", pAsset, ret);
+        free(pInflated);
+        return -1;
+    }
+
+    if (registerAllocatedAsset(pAsset, pInflated) != 0)
+    {
+        free(pInflated);
+        return -1;
+    }
+    *ppBuffer = pInflated;
+
+    return 0;
+}
+
+static bool isCompressedAsset(const char* filename)
+{
+    size_t length = strlen(filename);
+    size_t extensionLength = strlen(ASSET_COMPRESSED_EXTENSION);
+
+    return ((length >= extensionLength) &&
+            (strcmp(filename + length - extensionLength, ASSET_COMPRESSED_EXTENSION) == 0));
+}
+
 int openAndGetAssetBuffer(DrawState* pDrawState, const char* filename, AAsset** ppAsset, const void** ppBuffer)
 {
     AAssetManager* pAssetManager = pDrawState->pAssetManager;
@@ -155,6 +257,15 @@ int openAndGetAssetBuffer(DrawState* pDrawState, const char* filename, AAsset**
             LOGE("Unable to getAssetBuffer %s, error %d", filename, ret);
             exit(EXIT_FAILURE);
         }
+        if (isCompressedAsset(filename))
+        {
+            ret = inflateAssetBuffer(*ppAsset, ppBuffer);
+            if (ret != 0)
+            {
+                LOGE("Unable to inflateAssetBuffer %s, error %d", filename, ret);
+                exit(EXIT_FAILURE);
+            }
+        }
     }
     else
     {
@@ -167,9 +278,114 @@ int openAndGetAssetBuffer(DrawState* pDrawState, const char* filename, AAsset**
     return ret;
 }
 
+/**
+ * Get the buffer of a payload in the asset pack generated by glparse when
+ * packing assets, mapping the pack the first time.
+ * The returned asset is NULL since the pack is shared by all the payloads,
+ * closeAsset ignores it.
+ */
+static const char* getPackedBuffer(DrawState* pDrawState, unsigned int offset, unsigned int length)
+{
+    if (pDrawState->pAssetPackBuffer == NULL)
+    {
+        // openAndGetAssetBuffer exits on error
+        openAndGetAssetBuffer(pDrawState, ASSET_PACK_FILENAME, &pDrawState->pAssetPack,
+                              (const void**) &pDrawState->pAssetPackBuffer);
+        pDrawState->assetPackLength = AAsset_getLength(pDrawState->pAssetPack);
+    }
+
+    if (((off_t) offset + length) > pDrawState->assetPackLength)
+    {
+        LOGE("Packed asset at %u with length %u out of bounds of asset pack with length %ld",
+             offset, length, (long) pDrawState->assetPackLength);
+        exit(EXIT_FAILURE);
+    }
+
+    return pDrawState->pAssetPackBuffer + offset;
+}
+
+int getPackedAssetBuffer(DrawState* pDrawState, unsigned int offset, unsigned int length, AAsset** ppAsset, const void** ppBuffer)
+{
+    *ppAsset = NULL;
+    *ppBuffer = getPackedBuffer(pDrawState, offset, length);
+
+    LOGD("getPackedAssetBuffer %p", *ppBuffer);
+
+    return 0;
+}
+
+/**
+ * Reassemble a payload from its chunks in the asset pack generated by glparse
+ * when chunking assets, into a buffer freed by closeAsset.
+ * The returned asset is the buffer itself, only to be passed to closeAsset.
+ *
+ * @param chunks Offset and length in the asset pack of each chunk
+ */
+int getChunkedAssetBuffer(DrawState* pDrawState, const unsigned int* chunks, int numChunks, unsigned int length, AAsset** ppAsset, const void** ppBuffer)
+{
+    char* pBuffer = malloc(length);
+    unsigned int bufferOffset = 0;
+    int i;
+
+    if (pBuffer == NULL)
+    {
+        LOGE("Unable to allocate %u bytes for chunked asset", length);
+        exit(EXIT_FAILURE);
+    }
+
+    for (i = 0; i < numChunks; ++i)
+    {
+        unsigned int chunkOffset = chunks[i * 2];
+        unsigned int chunkLength = chunks[i * 2 + 1];
+        if ((bufferOffset + chunkLength) > length)
+        {
+            LOGE("Chunk %d with length %u out of bounds of chunked asset with length %u",
+                 i, chunkLength, length);
+            exit(EXIT_FAILURE);
+        }
+        memcpy(pBuffer + bufferOffset, getPackedBuffer(pDrawState, chunkOffset, chunkLength), chunkLength);
+        bufferOffset += chunkLength;
+    }
+
+    if (registerAllocatedAsset((AAsset*) pBuffer, pBuffer) != 0)
+    {
+        LOGE("Unable to register chunked asset");
+        exit(EXIT_FAILURE);
+    }
+
+    *ppAsset = (AAsset*) pBuffer;
+    *ppBuffer = pBuffer;
+
+    LOGD("getChunkedAssetBuffer %p", *ppBuffer);
+
+    return 0;
+}
+
 void closeAsset(AAsset* pAsset)
 {
-    AAsset_close(pAsset);
+    int slot;
+
+    // Packed assets don't have their own asset
+    if (pAsset != NULL)
+    {
+        // Free the buffer if the asset was inflated or reassembled
+        for (slot = 0; slot < MAX_ALLOCATED_ASSETS; ++slot)
+        {
+            if (g_allocated_assets[slot].pAsset == pAsset)
+            {
+                g_allocated_assets[slot].pAsset = NULL;
+                // Reassembled assets are not real assets
+                if (g_allocated_assets[slot].pBuffer == (void*) pAsset)
+                {
+                    free(g_allocated_assets[slot].pBuffer);
+                    return;
+                }
+                free(g_allocated_assets[slot].pBuffer);
+                break;
+            }
+        }
+        AAsset_close(pAsset);
+    }
 }
 
 void glPushGroupMarkerEXT(GLsizei length, const char *marker)
@@ -251,10 +467,16 @@ void glOverriddenEnable(DrawState* pDrawState, GLenum cap);
 // preserves the casts generated by glparser
 #define openAndGetAssetBuffer(pDrawState, filename, ppAsset, ppBuffer) \
         openAndGetAssetBuffer(pDrawState, filename, ppAsset, (const void**) ppBuffer)
+#define getPackedAssetBuffer(pDrawState, offset, length, ppAsset, ppBuffer) \
+        getPackedAssetBuffer(pDrawState, offset, length, ppAsset, (const void**) ppBuffer)
+#define getChunkedAssetBuffer(pDrawState, chunks, numChunks, length, ppAsset, ppBuffer) \
+        getChunkedAssetBuffer(pDrawState, chunks, numChunks, length, ppAsset, (const void**) ppBuffer)
 
 #include "trace2.inc"
 
 #undef openAndGetAssetBuffer
+#undef getPackedAssetBuffer
+#undef getChunkedAssetBuffer
 
 void eglOverriddenMakeCurrent(DrawState* pDrawState, EGLContext context)
 {
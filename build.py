@@ -68,7 +68,20 @@ def check_call(cmds):
 def trace_command(trace_filepath = "_out/com.amazon.tv.launcher.gltrace.gz",
                   trace_contexts = None,
                   deinline = False,
-                  output_dir = "_out/Replayer"):
+                  output_dir = "_out/Replayer",
+                  trace_index = False,
+                  message_decoder = "protobuf",
+                  decode_processes = 1,
+                  read_ahead = 0,
+                  start_frame = 0,
+                  end_frame = None,
+                  lazy_translations = False,
+                  asset_store_dir = None,
+                  pack_assets = False,
+                  asset_writer_threads = 0,
+                  compress_assets = False,
+                  chunk_assets = False,
+                  decompress_processes = 1):
     """
     Generate C include files and assets from an OpenGL ES trace.
 
@@ -77,7 +90,38 @@ def trace_command(trace_filepath = "_out/com.amazon.tv.launcher.gltrace.gz",
                            OpenGL ES contexts to trace
     :param deinline: Perform trace deinlining
     :param output_dir: Output directory for the generated include files and logs
+    :param trace_index: Use (and build if necessary) the trace index sidecar file
+    :param message_decoder: Decoder to use for the trace messages, "protobuf" or
+                            "fast"
+    :param decode_processes: Number of processes to decode the trace messages,
+                             0 to use all the CPUs
+    :param read_ahead: Number of batches of trace messages to read ahead on a
+                       background thread, 0 to disable
+    :param start_frame: First frame to replay, the previous frames only generate
+                        the setup code needed by the replayed frames
+    :param end_frame: Last frame to replay (inclusive)
+    :param lazy_translations: Build the GL enum translations only for the
+                              functions in the trace, memoised across runs
+    :param asset_store_dir: Directory to keep the assets in across builds (eg
+                            shared by the traces of the same app), only the
+                            new assets are written and the ones used are
+                            linked into the assets directory
+    :param pack_assets: Pack all the assets in a single asset the replayer
+                        maps once, instead of one asset per payload
+    :param asset_writer_threads: Number of threads to write the assets in the
+                                 background, 0 to disable
+    :param compress_assets: Compress the big assets that compress well, the
+                            replayer inflates them when loading them
+    :param chunk_assets: Pack the assets storing once the chunks shared by
+                         different assets (eg re-uploaded textures that are
+                         mostly the same)
+    :param decompress_processes: Number of processes to decompress blocked gzip
+                                 traces, 0 to use all the CPUs
     """
+    # Fail before deleting the old assets
+    if ((end_frame is not None) and (int(end_frame) < int(start_frame))):
+        raise Exception("End frame %s is before start frame %s" % (end_frame, start_frame))
+
     # Generate the necessary dirs and filepaths
     output_dir = scriptine.path(output_dir)
     assets_dir = output_dir.joinpath("assets")
@@ -90,7 +134,8 @@ def trace_command(trace_filepath = "_out/com.amazon.tv.launcher.gltrace.gz",
     scriptine.log.mark("Creating assets directory %s" % assets_dir)
     assets_dir.ensure_dir()
 
-    # Delete the old assets
+    # Delete the old assets, the asset store is kept so the assets don't need
+    # to be written again
     scriptine.log.mark("Deleting old assets")
     assets_dir.rmtree(True)
 
@@ -109,11 +154,26 @@ def trace_command(trace_filepath = "_out/com.amazon.tv.launcher.gltrace.gz",
         gl_contexts_to_trace = trace_contexts
         if (gl_contexts_to_trace is not None):
             gl_contexts_to_trace = [int(item) for item in gl_contexts_to_trace.split(",")]
-        lines = glparse.glparse(trace_filepath, output_dir, assets_dir, gl_contexts_to_trace)
-
-        with open(trace_incpath, "w") as f:
-            for line in lines:
-                f.writelines([line, "\n"])
+        if (decode_processes == 0):
+            decode_processes = None
+        if (decompress_processes == 0):
+            decompress_processes = None
+        if (end_frame is not None):
+            end_frame = int(end_frame)
+        # Stream the frames to trace.inc as they are generated instead of
+        # holding the whole program in memory
+        glparse.glparse(trace_filepath, output_dir, assets_dir, gl_contexts_to_trace,
+                        trace_index, message_decoder, decode_processes,
+                        read_ahead, start_frame = start_frame,
+                        end_frame = end_frame,
+                        lazy_translations = lazy_translations,
+                        code_writer = glparse.FileCodeWriter(trace_incpath),
+                        asset_store_dir = asset_store_dir,
+                        pack_assets = pack_assets,
+                        asset_writer_threads = asset_writer_threads,
+                        compress_assets = compress_assets,
+                        chunk_assets = chunk_assets,
+                        decompress_processes = decompress_processes)
 
     # Generate the deinlined file
     if (deinline):
@@ -137,6 +197,19 @@ def trace_command(trace_filepath = "_out/com.amazon.tv.launcher.gltrace.gz",
         if (not scriptine.misc.options.dry):
             scriptine.path.copyfile(trace_incpath, deinlined_incpath)
 
+def translations_command(module_filepath = None):
+    """
+    Generate the Python module with the GL enum translation tables from gl.xml,
+    so traces can be converted without parsing gl.xml (regenerate it when
+    gl.xml or the translation overrides change).
+
+    :param module_filepath: Path of the module to generate, next to gl.xml by
+                            default
+    """
+    scriptine.log.mark("Generating the translation module")
+    if (not scriptine.misc.options.dry):
+        glparse.generate_translation_module(module_filepath)
+
 def ndk_command(ndk_home = None, debug = False, activity_dir = "activity", output_dir = "_out/Replayer"):
     """
     Build the NDK project and generate native object files (requires the 'trace'
@@ -330,6 +403,19 @@ def all_command(targets="trace,ndk,ant,install,run",
                 activity_dir = "activity",
                 run_options="",
                 output_dir="_out/Replayer",
+                trace_index = False,
+                message_decoder = "protobuf",
+                decode_processes = 1,
+                read_ahead = 0,
+                start_frame = 0,
+                end_frame = None,
+                lazy_translations = False,
+                asset_store_dir = None,
+                pack_assets = False,
+                asset_writer_threads = 0,
+                compress_assets = False,
+                chunk_assets = False,
+                decompress_processes = 1,
                 ):
     """
     Build all or selected targets.
@@ -352,11 +438,35 @@ def all_command(targets="trace,ndk,ant,install,run",
     :param activity_dir: Directory where the activity skeleton is
     :param run_options: Comma-separated list of options to pass to "am start"
     :param output_dir: Root directory where to generate the trace/ndk build/ant build
+    :param trace_index: Use (and build if necessary) the trace index sidecar file
+    :param message_decoder: Decoder to use for the trace messages, "protobuf" or
+                            "fast"
+    :param decode_processes: Number of processes to decode the trace messages,
+                             0 to use all the CPUs
+    :param read_ahead: Number of batches of trace messages to read ahead on a
+                       background thread, 0 to disable
+    :param start_frame: First frame to replay, the previous frames only generate
+                        the setup code needed by the replayed frames
+    :param end_frame: Last frame to replay (inclusive)
+    :param lazy_translations: Build the GL enum translations only for the
+                              functions in the trace, memoised across runs
+    :param asset_store_dir: Directory to keep the assets in across builds
+    :param pack_assets: Pack all the assets in a single asset
+    :param asset_writer_threads: Number of threads to write the assets in the
+                                 background, 0 to disable
+    :param compress_assets: Compress the big assets that compress well
+    :param chunk_assets: Pack the assets storing the shared chunks once
+    :param decompress_processes: Number of processes to decompress blocked gzip
+                                 traces, 0 to use all the CPUs
 
     """
     target_list = targets.split(",")
     if ("trace" in target_list):
-        trace_command(trace_filepath, trace_contexts, deinline, output_dir)
+        trace_command(trace_filepath, trace_contexts, deinline, output_dir, trace_index,
+                      message_decoder, decode_processes, read_ahead, start_frame,
+                      end_frame, lazy_translations, asset_store_dir, pack_assets,
+                      asset_writer_threads, compress_assets, chunk_assets,
+                      decompress_processes)
     if ("ndk" in target_list):
         ndk_command(ndk_home, ndk_debug, activity_dir, output_dir)
     if ("ant" in target_list):
@@ -0,0 +1,4649 @@
+# Generated by glparse.generate_translation_module from gl.xml, don't edit
+# Regenerate with "build.py translations"
+
+# Key of the xml and overrides this was generated from, see
+# glparse.get_translation_cache_key
+TRANSLATION_KEY = 'ab215b4ad2d55e5f2daf0b073b888c4b7bb1c463'
+
+REQUIRED_COMMANDS = [
+    'glActiveTexture',
+    'glAttachShader',
+    'glBindAttribLocation',
+    'glBindBuffer',
+    'glBindFramebuffer',
+    'glBindRenderbuffer',
+    'glBindTexture',
+    'glBlendColor',
+    'glBlendEquation',
+    'glBlendEquationSeparate',
+    'glBlendFunc',
+    'glBlendFuncSeparate',
+    'glBufferData',
+    'glBufferSubData',
+    'glCheckFramebufferStatus',
+    'glClear',
+    'glClearColor',
+    'glClearDepthf',
+    'glClearStencil',
+    'glColorMask',
+    'glCompileShader',
+    'glCompressedTexImage2D',
+    'glCompressedTexSubImage2D',
+    'glCopyTexImage2D',
+    'glCopyTexSubImage2D',
+    'glCreateProgram',
+    'glCreateShader',
+    'glCullFace',
+    'glDeleteBuffers',
+    'glDeleteFramebuffers',
+    'glDeleteProgram',
+    'glDeleteRenderbuffers',
+    'glDeleteShader',
+    'glDeleteTextures',
+    'glDepthFunc',
+    'glDepthMask',
+    'glDepthRangef',
+    'glDetachShader',
+    'glDisable',
+    'glDisableVertexAttribArray',
+    'glDrawArrays',
+    'glDrawElements',
+    'glEnable',
+    'glEnableVertexAttribArray',
+    'glFinish',
+    'glFlush',
+    'glFramebufferRenderbuffer',
+    'glFramebufferTexture2D',
+    'glFrontFace',
+    'glGenBuffers',
+    'glGenerateMipmap',
+    'glGenFramebuffers',
+    'glGenRenderbuffers',
+    'glGenTextures',
+    'glGetActiveAttrib',
+    'glGetActiveUniform',
+    'glGetAttachedShaders',
+    'glGetAttribLocation',
+    'glGetBooleanv',
+    'glGetBufferParameteriv',
+    'glGetError',
+    'glGetFloatv',
+    'glGetFramebufferAttachmentParameteriv',
+    'glGetIntegerv',
+    'glGetProgramiv',
+    'glGetProgramInfoLog',
+    'glGetRenderbufferParameteriv',
+    'glGetShaderiv',
+    'glGetShaderInfoLog',
+    'glGetShaderPrecisionFormat',
+    'glGetShaderSource',
+    'glGetString',
+    'glGetTexParameterfv',
+    'glGetTexParameteriv',
+    'glGetUniformfv',
+    'glGetUniformiv',
+    'glGetUniformLocation',
+    'glGetVertexAttribfv',
+    'glGetVertexAttribiv',
+    'glGetVertexAttribPointerv',
+    'glHint',
+    'glIsBuffer',
+    'glIsEnabled',
+    'glIsFramebuffer',
+    'glIsProgram',
+    'glIsRenderbuffer',
+    'glIsShader',
+    'glIsTexture',
+    'glLineWidth',
+    'glLinkProgram',
+    'glPixelStorei',
+    'glPolygonOffset',
+    'glReadPixels',
+    'glReleaseShaderCompiler',
+    'glRenderbufferStorage',
+    'glSampleCoverage',
+    'glScissor',
+    'glShaderBinary',
+    'glShaderSource',
+    'glStencilFunc',
+    'glStencilFuncSeparate',
+    'glStencilMask',
+    'glStencilMaskSeparate',
+    'glStencilOp',
+    'glStencilOpSeparate',
+    'glTexImage2D',
+    'glTexParameterf',
+    'glTexParameterfv',
+    'glTexParameteri',
+    'glTexParameteriv',
+    'glTexSubImage2D',
+    'glUniform1f',
+    'glUniform1fv',
+    'glUniform1i',
+    'glUniform1iv',
+    'glUniform2f',
+    'glUniform2fv',
+    'glUniform2i',
+    'glUniform2iv',
+    'glUniform3f',
+    'glUniform3fv',
+    'glUniform3i',
+    'glUniform3iv',
+    'glUniform4f',
+    'glUniform4fv',
+    'glUniform4i',
+    'glUniform4iv',
+    'glUniformMatrix2fv',
+    'glUniformMatrix3fv',
+    'glUniformMatrix4fv',
+    'glUseProgram',
+    'glValidateProgram',
+    'glVertexAttrib1f',
+    'glVertexAttrib1fv',
+    'glVertexAttrib2f',
+    'glVertexAttrib2fv',
+    'glVertexAttrib3f',
+    'glVertexAttrib3fv',
+    'glVertexAttrib4f',
+    'glVertexAttrib4fv',
+    'glVertexAttribPointer',
+    'glViewport',
+]
+
+COMMANDS = {
+    'glActiveTexture' : [(0, 'TextureUnit')],
+    'glAttachShader' : [(0, None), (1, None)],
+    'glBindAttribLocation' : [(0, None), (1, None), (2, None)],
+    'glBindBuffer' : [(0, 'BufferTargetARB'), (1, None)],
+    'glBindFramebuffer' : [(0, 'FramebufferTarget'), (1, None)],
+    'glBindRenderbuffer' : [(0, 'RenderbufferTarget'), (1, None)],
+    'glBindTexture' : [(0, 'TextureTarget'), (1, 'Texture')],
+    'glBlendColor' : [(0, 'ColorF'), (1, 'ColorF'), (2, 'ColorF'), (3, 'ColorF')],
+    'glBlendEquation' : [(0, 'BlendEquationMode')],
+    'glBlendEquationSeparate' : [(0, 'BlendEquationModeEXT'), (1, 'BlendEquationModeEXT')],
+    'glBlendFunc' : [(0, 'BlendingFactorSrc'), (1, 'BlendingFactorDest')],
+    'glBlendFuncSeparate' : [(0, 'BlendFuncSeparateParameterEXT'), (1, 'BlendFuncSeparateParameterEXT'), (2, 'BlendFuncSeparateParameterEXT'), (3, 'BlendFuncSeparateParameterEXT')],
+    'glBufferData' : [(0, 'BufferTargetARB'), (1, 'BufferSize'), (2, None), (3, 'BufferUsageARB')],
+    'glBufferSubData' : [(0, 'BufferTargetARB'), (1, 'BufferOffset'), (2, 'BufferSize'), (3, None)],
+    'glCheckFramebufferStatus' : [(0, 'FramebufferTarget')],
+    'glClear' : [(0, 'ClearBufferMask')],
+    'glClearColor' : [(0, 'ColorF'), (1, 'ColorF'), (2, 'ColorF'), (3, 'ColorF')],
+    'glClearDepthf' : [(0, None)],
+    'glClearStencil' : [(0, 'StencilValue')],
+    'glColorMask' : [(0, 'Boolean'), (1, 'Boolean'), (2, 'Boolean'), (3, 'Boolean')],
+    'glCompileShader' : [(0, None)],
+    'glCompressedTexImage2D' : [(0, 'TextureTarget'), (1, 'CheckedInt32'), (2, 'PixelInternalFormat'), (3, None), (4, None), (5, 'CheckedInt32'), (6, None), (7, 'CompressedTextureARB')],
+    'glCompressedTexSubImage2D' : [(0, 'TextureTarget'), (1, 'CheckedInt32'), (2, 'CheckedInt32'), (3, 'CheckedInt32'), (4, None), (5, None), (6, 'PixelFormat'), (7, None), (8, 'CompressedTextureARB')],
+    'glCopyTexImage2D' : [(0, 'TextureTarget'), (1, 'CheckedInt32'), (2, 'PixelInternalFormat'), (3, 'WinCoord'), (4, 'WinCoord'), (5, None), (6, None), (7, 'CheckedInt32')],
+    'glCopyTexSubImage2D' : [(0, 'TextureTarget'), (1, 'CheckedInt32'), (2, 'CheckedInt32'), (3, 'CheckedInt32'), (4, 'WinCoord'), (5, 'WinCoord'), (6, None), (7, None)],
+    'glCreateProgram' : [],
+    'glCreateShader' : [(0, None)],
+    'glCullFace' : [(0, 'CullFaceMode')],
+    'glDeleteBuffers' : [(0, None), (1, None)],
+    'glDeleteFramebuffers' : [(0, None), (1, None)],
+    'glDeleteProgram' : [(0, None)],
+    'glDeleteRenderbuffers' : [(0, None), (1, None)],
+    'glDeleteShader' : [(0, None)],
+    'glDeleteTextures' : [(0, None), (1, 'Texture')],
+    'glDepthFunc' : [(0, 'DepthFunction')],
+    'glDepthMask' : [(0, 'Boolean')],
+    'glDepthRangef' : [(0, None), (1, None)],
+    'glDetachShader' : [(0, None), (1, None)],
+    'glDisable' : [(0, 'EnableCap')],
+    'glDisableVertexAttribArray' : [(0, None)],
+    'glDrawArrays' : [(0, 'PrimitiveType'), (1, None), (2, None)],
+    'glDrawElements' : [(0, 'PrimitiveType'), (1, None), (2, 'DrawElementsType'), (3, None)],
+    'glEnable' : [(0, 'EnableCap')],
+    'glEnableVertexAttribArray' : [(0, None)],
+    'glFinish' : [],
+    'glFlush' : [],
+    'glFramebufferRenderbuffer' : [(0, 'FramebufferTarget'), (1, 'FramebufferAttachment'), (2, 'RenderbufferTarget'), (3, None)],
+    'glFramebufferTexture2D' : [(0, 'FramebufferTarget'), (1, 'FramebufferAttachment'), (2, None), (3, None), (4, None)],
+    'glFrontFace' : [(0, 'FrontFaceDirection')],
+    'glGenBuffers' : [(0, None), (1, None)],
+    'glGenFramebuffers' : [(0, None), (1, None)],
+    'glGenRenderbuffers' : [(0, None), (1, None)],
+    'glGenTextures' : [(0, None), (1, 'Texture')],
+    'glGenerateMipmap' : [(0, None)],
+    'glGetActiveAttrib' : [(0, None), (1, None), (2, None), (3, None), (4, None), (5, None), (6, None)],
+    'glGetActiveUniform' : [(0, None), (1, None), (2, None), (3, None), (4, None), (5, None), (6, None)],
+    'glGetAttachedShaders' : [(0, None), (1, None), (2, None), (3, None)],
+    'glGetAttribLocation' : [(0, None), (1, None)],
+    'glGetBooleanv' : [(0, 'GetPName'), (1, 'Boolean')],
+    'glGetBufferParameteriv' : [(0, 'BufferTargetARB'), (1, 'BufferPNameARB'), (2, None)],
+    'glGetError' : [],
+    'glGetFloatv' : [(0, 'GetPName'), (1, None)],
+    'glGetFramebufferAttachmentParameteriv' : [(0, 'FramebufferTarget'), (1, 'FramebufferAttachment'), (2, None), (3, None)],
+    'glGetIntegerv' : [(0, 'GetPName'), (1, None)],
+    'glGetProgramInfoLog' : [(0, None), (1, None), (2, None), (3, None)],
+    'glGetProgramiv' : [(0, None), (1, None), (2, None)],
+    'glGetRenderbufferParameteriv' : [(0, 'RenderbufferTarget'), (1, None), (2, None)],
+    'glGetShaderInfoLog' : [(0, None), (1, None), (2, None), (3, None)],
+    'glGetShaderPrecisionFormat' : [(0, None), (1, None), (2, None), (3, None)],
+    'glGetShaderSource' : [(0, None), (1, None), (2, None), (3, None)],
+    'glGetShaderiv' : [(0, None), (1, None), (2, None)],
+    'glGetString' : [(0, 'StringName')],
+    'glGetTexParameterfv' : [(0, 'TextureTarget'), (1, 'GetTextureParameter'), (2, None)],
+    'glGetTexParameteriv' : [(0, 'TextureTarget'), (1, 'GetTextureParameter'), (2, None)],
+    'glGetUniformLocation' : [(0, None), (1, None)],
+    'glGetUniformfv' : [(0, None), (1, None), (2, None)],
+    'glGetUniformiv' : [(0, None), (1, None), (2, None)],
+    'glGetVertexAttribPointerv' : [(0, None), (1, 'VertexAttribPointerPropertyARB'), (2, None)],
+    'glGetVertexAttribfv' : [(0, None), (1, 'VertexAttribPropertyARB'), (2, None)],
+    'glGetVertexAttribiv' : [(0, None), (1, 'VertexAttribPropertyARB'), (2, None)],
+    'glHint' : [(0, 'HintTarget'), (1, 'HintMode')],
+    'glIsBuffer' : [(0, None)],
+    'glIsEnabled' : [(0, 'EnableCap')],
+    'glIsFramebuffer' : [(0, None)],
+    'glIsProgram' : [(0, None)],
+    'glIsRenderbuffer' : [(0, None)],
+    'glIsShader' : [(0, None)],
+    'glIsTexture' : [(0, 'Texture')],
+    'glLineWidth' : [(0, 'CheckedFloat32')],
+    'glLinkProgram' : [(0, None)],
+    'glPixelStorei' : [(0, 'PixelStoreParameter'), (1, 'CheckedInt32')],
+    'glPolygonOffset' : [(0, None), (1, None)],
+    'glReadPixels' : [(0, 'WinCoord'), (1, 'WinCoord'), (2, None), (3, None), (4, 'PixelFormat'), (5, 'PixelType'), (6, None)],
+    'glReleaseShaderCompiler' : [],
+    'glRenderbufferStorage' : [(0, 'RenderbufferTarget'), (1, None), (2, None), (3, None)],
+    'glSampleCoverage' : [(0, None), (1, 'Boolean')],
+    'glScissor' : [(0, 'WinCoord'), (1, 'WinCoord'), (2, None), (3, None)],
+    'glShaderBinary' : [(0, None), (1, None), (2, None), (3, None), (4, None)],
+    'glShaderSource' : [(0, None), (1, None), (2, None), (3, None)],
+    'glStencilFunc' : [(0, 'StencilFunction'), (1, 'StencilValue'), (2, 'MaskedStencilValue')],
+    'glStencilFuncSeparate' : [(0, 'StencilFaceDirection'), (1, 'StencilFunction'), (2, 'StencilValue'), (3, 'MaskedStencilValue')],
+    'glStencilMask' : [(0, 'MaskedStencilValue')],
+    'glStencilMaskSeparate' : [(0, 'StencilFaceDirection'), (1, 'MaskedStencilValue')],
+    'glStencilOp' : [(0, 'StencilOp'), (1, 'StencilOp'), (2, 'StencilOp')],
+    'glStencilOpSeparate' : [(0, 'StencilFaceDirection'), (1, 'StencilOp'), (2, 'StencilOp'), (3, 'StencilOp')],
+    'glTexImage2D' : [(0, 'TextureTarget'), (1, 'CheckedInt32'), (2, 'TextureComponentCount'), (3, None), (4, None), (5, 'CheckedInt32'), (6, 'PixelFormat'), (7, 'PixelType'), (8, None)],
+    'glTexParameterf' : [(0, 'TextureTarget'), (1, 'TextureParameterName'), (2, 'CheckedFloat32')],
+    'glTexParameterfv' : [(0, 'TextureTarget'), (1, 'TextureParameterName'), (2, 'CheckedFloat32')],
+    'glTexParameteri' : [(0, 'TextureTarget'), (1, 'TextureParameterName'), (2, 'CheckedInt32')],
+    'glTexParameteriv' : [(0, 'TextureTarget'), (1, 'TextureParameterName'), (2, 'CheckedInt32')],
+    'glTexSubImage2D' : [(0, 'TextureTarget'), (1, 'CheckedInt32'), (2, 'CheckedInt32'), (3, 'CheckedInt32'), (4, None), (5, None), (6, 'PixelFormat'), (7, 'PixelType'), (8, None)],
+    'glUniform1f' : [(0, None), (1, None)],
+    'glUniform1fv' : [(0, None), (1, None), (2, None)],
+    'glUniform1i' : [(0, None), (1, None)],
+    'glUniform1iv' : [(0, None), (1, None), (2, None)],
+    'glUniform2f' : [(0, None), (1, None), (2, None)],
+    'glUniform2fv' : [(0, None), (1, None), (2, None)],
+    'glUniform2i' : [(0, None), (1, None), (2, None)],
+    'glUniform2iv' : [(0, None), (1, None), (2, None)],
+    'glUniform3f' : [(0, None), (1, None), (2, None), (3, None)],
+    'glUniform3fv' : [(0, None), (1, None), (2, None)],
+    'glUniform3i' : [(0, None), (1, None), (2, None), (3, None)],
+    'glUniform3iv' : [(0, None), (1, None), (2, None)],
+    'glUniform4f' : [(0, None), (1, None), (2, None), (3, None), (4, None)],
+    'glUniform4fv' : [(0, None), (1, None), (2, None)],
+    'glUniform4i' : [(0, None), (1, None), (2, None), (3, None), (4, None)],
+    'glUniform4iv' : [(0, None), (1, None), (2, None)],
+    'glUniformMatrix2fv' : [(0, None), (1, None), (2, 'Boolean'), (3, None)],
+    'glUniformMatrix3fv' : [(0, None), (1, None), (2, 'Boolean'), (3, None)],
+    'glUniformMatrix4fv' : [(0, None), (1, None), (2, 'Boolean'), (3, None)],
+    'glUseProgram' : [(0, None)],
+    'glValidateProgram' : [(0, None)],
+    'glVertexAttrib1f' : [(0, None), (1, None)],
+    'glVertexAttrib1fv' : [(0, None), (1, None)],
+    'glVertexAttrib2f' : [(0, None), (1, None), (2, None)],
+    'glVertexAttrib2fv' : [(0, None), (1, None)],
+    'glVertexAttrib3f' : [(0, None), (1, None), (2, None), (3, None)],
+    'glVertexAttrib3fv' : [(0, None), (1, None)],
+    'glVertexAttrib4f' : [(0, None), (1, None), (2, None), (3, None), (4, None)],
+    'glVertexAttrib4fv' : [(0, None), (1, None)],
+    'glVertexAttribPointer' : [(0, None), (1, None), (2, 'VertexAttribPointerType'), (3, 'Boolean'), (4, None), (5, None)],
+    'glViewport' : [(0, 'WinCoord'), (1, 'WinCoord'), (2, None), (3, None)],
+}
+
+GROUPS = {
+    'BlendEquationMode' : None,
+    'BlendEquationModeEXT' : None,
+    'BlendFuncSeparateParameterEXT' : None,
+    'BlendingFactorDest' : {
+        0x0 : 'GL_ZERO',
+        0x1 : 'GL_ONE',
+        0x300 : 'GL_SRC_COLOR',
+        0x301 : 'GL_ONE_MINUS_SRC_COLOR',
+        0x302 : 'GL_SRC_ALPHA',
+        0x303 : 'GL_ONE_MINUS_SRC_ALPHA',
+        0x304 : 'GL_DST_ALPHA',
+        0x305 : 'GL_ONE_MINUS_DST_ALPHA',
+        0x8001 : 'GL_CONSTANT_COLOR_EXT',
+        0x8002 : 'GL_ONE_MINUS_CONSTANT_COLOR_EXT',
+        0x8003 : 'GL_CONSTANT_ALPHA_EXT',
+        0x8004 : 'GL_ONE_MINUS_CONSTANT_ALPHA_EXT',
+    },
+    'BlendingFactorSrc' : {
+        0x0 : 'GL_ZERO',
+        0x1 : 'GL_ONE',
+        0x302 : 'GL_SRC_ALPHA',
+        0x303 : 'GL_ONE_MINUS_SRC_ALPHA',
+        0x304 : 'GL_DST_ALPHA',
+        0x305 : 'GL_ONE_MINUS_DST_ALPHA',
+        0x306 : 'GL_DST_COLOR',
+        0x307 : 'GL_ONE_MINUS_DST_COLOR',
+        0x308 : 'GL_SRC_ALPHA_SATURATE',
+        0x8001 : 'GL_CONSTANT_COLOR_EXT',
+        0x8002 : 'GL_ONE_MINUS_CONSTANT_COLOR_EXT',
+        0x8003 : 'GL_CONSTANT_ALPHA_EXT',
+        0x8004 : 'GL_ONE_MINUS_CONSTANT_ALPHA_EXT',
+    },
+    'Boolean' : {
+        False : 'GL_FALSE',
+        True : 'GL_TRUE',
+    },
+    'BufferOffset' : None,
+    'BufferPNameARB' : None,
+    'BufferSize' : None,
+    'BufferTargetARB' : None,
+    'BufferUsageARB' : None,
+    'CheckedFloat32' : None,
+    'CheckedInt32' : None,
+    'ClearBufferMask' : {
+        0x100 : 'GL_DEPTH_BUFFER_BIT',
+        0x200 : 'GL_ACCUM_BUFFER_BIT',
+        0x400 : 'GL_STENCIL_BUFFER_BIT',
+        0x4000 : 'GL_COLOR_BUFFER_BIT',
+        0x8000 : 'GL_COVERAGE_BUFFER_BIT_NV',
+    },
+    'ColorF' : None,
+    'CompressedTextureARB' : None,
+    'CullFaceMode' : {
+        0x404 : 'GL_FRONT',
+        0x405 : 'GL_BACK',
+        0x408 : 'GL_FRONT_AND_BACK',
+    },
+    'DepthFunction' : {
+        0x200 : 'GL_NEVER',
+        0x201 : 'GL_LESS',
+        0x202 : 'GL_EQUAL',
+        0x203 : 'GL_LEQUAL',
+        0x204 : 'GL_GREATER',
+        0x205 : 'GL_NOTEQUAL',
+        0x206 : 'GL_GEQUAL',
+        0x207 : 'GL_ALWAYS',
+    },
+    'DrawElementsType' : None,
+    'EnableCap' : {
+        0xb10 : 'GL_POINT_SMOOTH',
+        0xb20 : 'GL_LINE_SMOOTH',
+        0xb24 : 'GL_LINE_STIPPLE',
+        0xb41 : 'GL_POLYGON_SMOOTH',
+        0xb42 : 'GL_POLYGON_STIPPLE',
+        0xb44 : 'GL_CULL_FACE',
+        0xb50 : 'GL_LIGHTING',
+        0xb57 : 'GL_COLOR_MATERIAL',
+        0xb60 : 'GL_FOG',
+        0xb71 : 'GL_DEPTH_TEST',
+        0xb90 : 'GL_STENCIL_TEST',
+        0xba1 : 'GL_NORMALIZE',
+        0xbc0 : 'GL_ALPHA_TEST',
+        0xbd0 : 'GL_DITHER',
+        0xbe2 : 'GL_BLEND',
+        0xbf1 : 'GL_INDEX_LOGIC_OP',
+        0xbf2 : 'GL_COLOR_LOGIC_OP',
+        0xc11 : 'GL_SCISSOR_TEST',
+        0xc60 : 'GL_TEXTURE_GEN_S',
+        0xc61 : 'GL_TEXTURE_GEN_T',
+        0xc62 : 'GL_TEXTURE_GEN_R',
+        0xc63 : 'GL_TEXTURE_GEN_Q',
+        0xd80 : 'GL_AUTO_NORMAL',
+        0xd90 : 'GL_MAP1_COLOR_4',
+        0xd91 : 'GL_MAP1_INDEX',
+        0xd92 : 'GL_MAP1_NORMAL',
+        0xd93 : 'GL_MAP1_TEXTURE_COORD_1',
+        0xd94 : 'GL_MAP1_TEXTURE_COORD_2',
+        0xd95 : 'GL_MAP1_TEXTURE_COORD_3',
+        0xd96 : 'GL_MAP1_TEXTURE_COORD_4',
+        0xd97 : 'GL_MAP1_VERTEX_3',
+        0xd98 : 'GL_MAP1_VERTEX_4',
+        0xdb0 : 'GL_MAP2_COLOR_4',
+        0xdb1 : 'GL_MAP2_INDEX',
+        0xdb2 : 'GL_MAP2_NORMAL',
+        0xdb3 : 'GL_MAP2_TEXTURE_COORD_1',
+        0xdb4 : 'GL_MAP2_TEXTURE_COORD_2',
+        0xdb5 : 'GL_MAP2_TEXTURE_COORD_3',
+        0xdb6 : 'GL_MAP2_TEXTURE_COORD_4',
+        0xdb7 : 'GL_MAP2_VERTEX_3',
+        0xdb8 : 'GL_MAP2_VERTEX_4',
+        0xde0 : 'GL_TEXTURE_1D',
+        0xde1 : 'GL_TEXTURE_2D',
+        0x2a01 : 'GL_POLYGON_OFFSET_POINT',
+        0x2a02 : 'GL_POLYGON_OFFSET_LINE',
+        0x3000 : 'GL_CLIP_PLANE0',
+        0x3001 : 'GL_CLIP_PLANE1',
+        0x3002 : 'GL_CLIP_PLANE2',
+        0x3003 : 'GL_CLIP_PLANE3',
+        0x3004 : 'GL_CLIP_PLANE4',
+        0x3005 : 'GL_CLIP_PLANE5',
+        0x4000 : 'GL_LIGHT0',
+        0x4001 : 'GL_LIGHT1',
+        0x4002 : 'GL_LIGHT2',
+        0x4003 : 'GL_LIGHT3',
+        0x4004 : 'GL_LIGHT4',
+        0x4005 : 'GL_LIGHT5',
+        0x4006 : 'GL_LIGHT6',
+        0x4007 : 'GL_LIGHT7',
+        0x8010 : 'GL_CONVOLUTION_1D_EXT',
+        0x8011 : 'GL_CONVOLUTION_2D_EXT',
+        0x8012 : 'GL_SEPARABLE_2D_EXT',
+        0x8024 : 'GL_HISTOGRAM_EXT',
+        0x802e : 'GL_MINMAX_EXT',
+        0x8037 : 'GL_POLYGON_OFFSET_FILL',
+        0x803a : 'GL_RESCALE_NORMAL_EXT',
+        0x806f : 'GL_TEXTURE_3D_EXT',
+        0x8074 : 'GL_VERTEX_ARRAY',
+        0x8075 : 'GL_NORMAL_ARRAY',
+        0x8076 : 'GL_COLOR_ARRAY',
+        0x8077 : 'GL_INDEX_ARRAY',
+        0x8078 : 'GL_TEXTURE_COORD_ARRAY',
+        0x8079 : 'GL_EDGE_FLAG_ARRAY',
+        0x8094 : 'GL_INTERLACE_SGIX',
+        0x809d : 'GL_MULTISAMPLE_SGIS',
+        0x809e : 'GL_SAMPLE_ALPHA_TO_MASK_SGIS',
+        0x809f : 'GL_SAMPLE_ALPHA_TO_ONE_SGIS',
+        0x80a0 : 'GL_SAMPLE_MASK_SGIS',
+        0x80bc : 'GL_TEXTURE_COLOR_TABLE_SGI',
+        0x80d0 : 'GL_COLOR_TABLE_SGI',
+        0x80d1 : 'GL_POST_CONVOLUTION_COLOR_TABLE_SGI',
+        0x80d2 : 'GL_POST_COLOR_MATRIX_COLOR_TABLE_SGI',
+        0x8134 : 'GL_TEXTURE_4D_SGIS',
+        0x8139 : 'GL_PIXEL_TEX_GEN_SGIX',
+        0x8148 : 'GL_SPRITE_SGIX',
+        0x817d : 'GL_REFERENCE_PLANE_SGIX',
+        0x817f : 'GL_IR_INSTRUMENT1_SGIX',
+        0x8183 : 'GL_CALLIGRAPHIC_FRAGMENT_SGIX',
+        0x818b : 'GL_FRAMEZOOM_SGIX',
+        0x8198 : 'GL_FOG_OFFSET_SGIX',
+        0x81fb : 'GL_SHARED_TEXTURE_PALETTE_EXT',
+        0x832c : 'GL_ASYNC_HISTOGRAM_SGIX',
+        0x8353 : 'GL_PIXEL_TEXTURE_SGIS',
+        0x835c : 'GL_ASYNC_TEX_IMAGE_SGIX',
+        0x835d : 'GL_ASYNC_DRAW_PIXELS_SGIX',
+        0x835e : 'GL_ASYNC_READ_PIXELS_SGIX',
+        0x8400 : 'GL_FRAGMENT_LIGHTING_SGIX',
+        0x8401 : 'GL_FRAGMENT_COLOR_MATERIAL_SGIX',
+        0x840c : 'GL_FRAGMENT_LIGHT0_SGIX',
+        0x840d : 'GL_FRAGMENT_LIGHT1_SGIX',
+        0x840e : 'GL_FRAGMENT_LIGHT2_SGIX',
+        0x840f : 'GL_FRAGMENT_LIGHT3_SGIX',
+        0x8410 : 'GL_FRAGMENT_LIGHT4_SGIX',
+        0x8411 : 'GL_FRAGMENT_LIGHT5_SGIX',
+        0x8412 : 'GL_FRAGMENT_LIGHT6_SGIX',
+        0x8413 : 'GL_FRAGMENT_LIGHT7_SGIX',
+    },
+    'FramebufferAttachment' : None,
+    'FramebufferTarget' : None,
+    'FrontFaceDirection' : {
+        0x900 : 'GL_CW',
+        0x901 : 'GL_CCW',
+    },
+    'GetPName' : {
+        0xb00 : 'GL_CURRENT_COLOR',
+        0xb01 : 'GL_CURRENT_INDEX',
+        0xb02 : 'GL_CURRENT_NORMAL',
+        0xb03 : 'GL_CURRENT_TEXTURE_COORDS',
+        0xb04 : 'GL_CURRENT_RASTER_COLOR',
+        0xb05 : 'GL_CURRENT_RASTER_INDEX',
+        0xb06 : 'GL_CURRENT_RASTER_TEXTURE_COORDS',
+        0xb07 : 'GL_CURRENT_RASTER_POSITION',
+        0xb08 : 'GL_CURRENT_RASTER_POSITION_VALID',
+        0xb09 : 'GL_CURRENT_RASTER_DISTANCE',
+        0xb10 : 'GL_POINT_SMOOTH',
+        0xb11 : 'GL_POINT_SIZE',
+        0xb12 : 'GL_POINT_SIZE_RANGE',
+        0xb13 : 'GL_POINT_SIZE_GRANULARITY',
+        0xb20 : 'GL_LINE_SMOOTH',
+        0xb21 : 'GL_LINE_WIDTH',
+        0xb22 : 'GL_LINE_WIDTH_RANGE',
+        0xb23 : 'GL_LINE_WIDTH_GRANULARITY',
+        0xb24 : 'GL_LINE_STIPPLE',
+        0xb25 : 'GL_LINE_STIPPLE_PATTERN',
+        0xb26 : 'GL_LINE_STIPPLE_REPEAT',
+        0xb30 : 'GL_LIST_MODE',
+        0xb31 : 'GL_MAX_LIST_NESTING',
+        0xb32 : 'GL_LIST_BASE',
+        0xb33 : 'GL_LIST_INDEX',
+        0xb40 : 'GL_POLYGON_MODE',
+        0xb41 : 'GL_POLYGON_SMOOTH',
+        0xb42 : 'GL_POLYGON_STIPPLE',
+        0xb43 : 'GL_EDGE_FLAG',
+        0xb44 : 'GL_CULL_FACE',
+        0xb45 : 'GL_CULL_FACE_MODE',
+        0xb46 : 'GL_FRONT_FACE',
+        0xb50 : 'GL_LIGHTING',
+        0xb51 : 'GL_LIGHT_MODEL_LOCAL_VIEWER',
+        0xb52 : 'GL_LIGHT_MODEL_TWO_SIDE',
+        0xb53 : 'GL_LIGHT_MODEL_AMBIENT',
+        0xb54 : 'GL_SHADE_MODEL',
+        0xb55 : 'GL_COLOR_MATERIAL_FACE',
+        0xb56 : 'GL_COLOR_MATERIAL_PARAMETER',
+        0xb57 : 'GL_COLOR_MATERIAL',
+        0xb60 : 'GL_FOG',
+        0xb61 : 'GL_FOG_INDEX',
+        0xb62 : 'GL_FOG_DENSITY',
+        0xb63 : 'GL_FOG_START',
+        0xb64 : 'GL_FOG_END',
+        0xb65 : 'GL_FOG_MODE',
+        0xb66 : 'GL_FOG_COLOR',
+        0xb70 : 'GL_DEPTH_RANGE',
+        0xb71 : 'GL_DEPTH_TEST',
+        0xb72 : 'GL_DEPTH_WRITEMASK',
+        0xb73 : 'GL_DEPTH_CLEAR_VALUE',
+        0xb74 : 'GL_DEPTH_FUNC',
+        0xb80 : 'GL_ACCUM_CLEAR_VALUE',
+        0xb90 : 'GL_STENCIL_TEST',
+        0xb91 : 'GL_STENCIL_CLEAR_VALUE',
+        0xb92 : 'GL_STENCIL_FUNC',
+        0xb93 : 'GL_STENCIL_VALUE_MASK',
+        0xb94 : 'GL_STENCIL_FAIL',
+        0xb95 : 'GL_STENCIL_PASS_DEPTH_FAIL',
+        0xb96 : 'GL_STENCIL_PASS_DEPTH_PASS',
+        0xb97 : 'GL_STENCIL_REF',
+        0xb98 : 'GL_STENCIL_WRITEMASK',
+        0xba0 : 'GL_MATRIX_MODE',
+        0xba1 : 'GL_NORMALIZE',
+        0xba2 : 'GL_VIEWPORT',
+        0xba3 : 'GL_MODELVIEW0_STACK_DEPTH_EXT',
+        0xba4 : 'GL_PROJECTION_STACK_DEPTH',
+        0xba5 : 'GL_TEXTURE_STACK_DEPTH',
+        0xba6 : 'GL_MODELVIEW0_MATRIX_EXT',
+        0xba7 : 'GL_PROJECTION_MATRIX',
+        0xba8 : 'GL_TEXTURE_MATRIX',
+        0xbb0 : 'GL_ATTRIB_STACK_DEPTH',
+        0xbb1 : 'GL_CLIENT_ATTRIB_STACK_DEPTH',
+        0xbc0 : 'GL_ALPHA_TEST',
+        0xbc1 : 'GL_ALPHA_TEST_FUNC',
+        0xbc2 : 'GL_ALPHA_TEST_REF',
+        0xbd0 : 'GL_DITHER',
+        0xbe0 : 'GL_BLEND_DST',
+        0xbe1 : 'GL_BLEND_SRC',
+        0xbe2 : 'GL_BLEND',
+        0xbf0 : 'GL_LOGIC_OP_MODE',
+        0xbf1 : 'GL_INDEX_LOGIC_OP',
+        0xbf2 : 'GL_COLOR_LOGIC_OP',
+        0xc00 : 'GL_AUX_BUFFERS',
+        0xc01 : 'GL_DRAW_BUFFER',
+        0xc02 : 'GL_READ_BUFFER',
+        0xc10 : 'GL_SCISSOR_BOX',
+        0xc11 : 'GL_SCISSOR_TEST',
+        0xc20 : 'GL_INDEX_CLEAR_VALUE',
+        0xc21 : 'GL_INDEX_WRITEMASK',
+        0xc22 : 'GL_COLOR_CLEAR_VALUE',
+        0xc23 : 'GL_COLOR_WRITEMASK',
+        0xc30 : 'GL_INDEX_MODE',
+        0xc31 : 'GL_RGBA_MODE',
+        0xc32 : 'GL_DOUBLEBUFFER',
+        0xc33 : 'GL_STEREO',
+        0xc40 : 'GL_RENDER_MODE',
+        0xc50 : 'GL_PERSPECTIVE_CORRECTION_HINT',
+        0xc51 : 'GL_POINT_SMOOTH_HINT',
+        0xc52 : 'GL_LINE_SMOOTH_HINT',
+        0xc53 : 'GL_POLYGON_SMOOTH_HINT',
+        0xc54 : 'GL_FOG_HINT',
+        0xc60 : 'GL_TEXTURE_GEN_S',
+        0xc61 : 'GL_TEXTURE_GEN_T',
+        0xc62 : 'GL_TEXTURE_GEN_R',
+        0xc63 : 'GL_TEXTURE_GEN_Q',
+        0xcb0 : 'GL_PIXEL_MAP_I_TO_I_SIZE',
+        0xcb1 : 'GL_PIXEL_MAP_S_TO_S_SIZE',
+        0xcb2 : 'GL_PIXEL_MAP_I_TO_R_SIZE',
+        0xcb3 : 'GL_PIXEL_MAP_I_TO_G_SIZE',
+        0xcb4 : 'GL_PIXEL_MAP_I_TO_B_SIZE',
+        0xcb5 : 'GL_PIXEL_MAP_I_TO_A_SIZE',
+        0xcb6 : 'GL_PIXEL_MAP_R_TO_R_SIZE',
+        0xcb7 : 'GL_PIXEL_MAP_G_TO_G_SIZE',
+        0xcb8 : 'GL_PIXEL_MAP_B_TO_B_SIZE',
+        0xcb9 : 'GL_PIXEL_MAP_A_TO_A_SIZE',
+        0xcf0 : 'GL_UNPACK_SWAP_BYTES',
+        0xcf1 : 'GL_UNPACK_LSB_FIRST',
+        0xcf2 : 'GL_UNPACK_ROW_LENGTH',
+        0xcf3 : 'GL_UNPACK_SKIP_ROWS',
+        0xcf4 : 'GL_UNPACK_SKIP_PIXELS',
+        0xcf5 : 'GL_UNPACK_ALIGNMENT',
+        0xd00 : 'GL_PACK_SWAP_BYTES',
+        0xd01 : 'GL_PACK_LSB_FIRST',
+        0xd02 : 'GL_PACK_ROW_LENGTH',
+        0xd03 : 'GL_PACK_SKIP_ROWS',
+        0xd04 : 'GL_PACK_SKIP_PIXELS',
+        0xd05 : 'GL_PACK_ALIGNMENT',
+        0xd10 : 'GL_MAP_COLOR',
+        0xd11 : 'GL_MAP_STENCIL',
+        0xd12 : 'GL_INDEX_SHIFT',
+        0xd13 : 'GL_INDEX_OFFSET',
+        0xd14 : 'GL_RED_SCALE',
+        0xd15 : 'GL_RED_BIAS',
+        0xd16 : 'GL_ZOOM_X',
+        0xd17 : 'GL_ZOOM_Y',
+        0xd18 : 'GL_GREEN_SCALE',
+        0xd19 : 'GL_GREEN_BIAS',
+        0xd1a : 'GL_BLUE_SCALE',
+        0xd1b : 'GL_BLUE_BIAS',
+        0xd1c : 'GL_ALPHA_SCALE',
+        0xd1d : 'GL_ALPHA_BIAS',
+        0xd1e : 'GL_DEPTH_SCALE',
+        0xd1f : 'GL_DEPTH_BIAS',
+        0xd30 : 'GL_MAX_EVAL_ORDER',
+        0xd31 : 'GL_MAX_LIGHTS',
+        0xd32 : 'GL_MAX_CLIP_DISTANCES',
+        0xd33 : 'GL_MAX_TEXTURE_SIZE',
+        0xd34 : 'GL_MAX_PIXEL_MAP_TABLE',
+        0xd35 : 'GL_MAX_ATTRIB_STACK_DEPTH',
+        0xd36 : 'GL_MAX_MODELVIEW_STACK_DEPTH',
+        0xd37 : 'GL_MAX_NAME_STACK_DEPTH',
+        0xd38 : 'GL_MAX_PROJECTION_STACK_DEPTH',
+        0xd39 : 'GL_MAX_TEXTURE_STACK_DEPTH',
+        0xd3a : 'GL_MAX_VIEWPORT_DIMS',
+        0xd3b : 'GL_MAX_CLIENT_ATTRIB_STACK_DEPTH',
+        0xd50 : 'GL_SUBPIXEL_BITS',
+        0xd51 : 'GL_INDEX_BITS',
+        0xd52 : 'GL_RED_BITS',
+        0xd53 : 'GL_GREEN_BITS',
+        0xd54 : 'GL_BLUE_BITS',
+        0xd55 : 'GL_ALPHA_BITS',
+        0xd56 : 'GL_DEPTH_BITS',
+        0xd57 : 'GL_STENCIL_BITS',
+        0xd58 : 'GL_ACCUM_RED_BITS',
+        0xd59 : 'GL_ACCUM_GREEN_BITS',
+        0xd5a : 'GL_ACCUM_BLUE_BITS',
+        0xd5b : 'GL_ACCUM_ALPHA_BITS',
+        0xd70 : 'GL_NAME_STACK_DEPTH',
+        0xd80 : 'GL_AUTO_NORMAL',
+        0xd90 : 'GL_MAP1_COLOR_4',
+        0xd91 : 'GL_MAP1_INDEX',
+        0xd92 : 'GL_MAP1_NORMAL',
+        0xd93 : 'GL_MAP1_TEXTURE_COORD_1',
+        0xd94 : 'GL_MAP1_TEXTURE_COORD_2',
+        0xd95 : 'GL_MAP1_TEXTURE_COORD_3',
+        0xd96 : 'GL_MAP1_TEXTURE_COORD_4',
+        0xd97 : 'GL_MAP1_VERTEX_3',
+        0xd98 : 'GL_MAP1_VERTEX_4',
+        0xdb0 : 'GL_MAP2_COLOR_4',
+        0xdb1 : 'GL_MAP2_INDEX',
+        0xdb2 : 'GL_MAP2_NORMAL',
+        0xdb3 : 'GL_MAP2_TEXTURE_COORD_1',
+        0xdb4 : 'GL_MAP2_TEXTURE_COORD_2',
+        0xdb5 : 'GL_MAP2_TEXTURE_COORD_3',
+        0xdb6 : 'GL_MAP2_TEXTURE_COORD_4',
+        0xdb7 : 'GL_MAP2_VERTEX_3',
+        0xdb8 : 'GL_MAP2_VERTEX_4',
+        0xdd0 : 'GL_MAP1_GRID_DOMAIN',
+        0xdd1 : 'GL_MAP1_GRID_SEGMENTS',
+        0xdd2 : 'GL_MAP2_GRID_DOMAIN',
+        0xdd3 : 'GL_MAP2_GRID_SEGMENTS',
+        0xde0 : 'GL_TEXTURE_1D',
+        0xde1 : 'GL_TEXTURE_2D',
+        0xdf1 : 'GL_FEEDBACK_BUFFER_SIZE',
+        0xdf2 : 'GL_FEEDBACK_BUFFER_TYPE',
+        0xdf4 : 'GL_SELECTION_BUFFER_SIZE',
+        0x2a00 : 'GL_POLYGON_OFFSET_UNITS',
+        0x2a01 : 'GL_POLYGON_OFFSET_POINT',
+        0x2a02 : 'GL_POLYGON_OFFSET_LINE',
+        0x3000 : 'GL_CLIP_PLANE0',
+        0x3001 : 'GL_CLIP_PLANE1',
+        0x3002 : 'GL_CLIP_PLANE2',
+        0x3003 : 'GL_CLIP_PLANE3',
+        0x3004 : 'GL_CLIP_PLANE4',
+        0x3005 : 'GL_CLIP_PLANE5',
+        0x4000 : 'GL_LIGHT0',
+        0x4001 : 'GL_LIGHT1',
+        0x4002 : 'GL_LIGHT2',
+        0x4003 : 'GL_LIGHT3',
+        0x4004 : 'GL_LIGHT4',
+        0x4005 : 'GL_LIGHT5',
+        0x4006 : 'GL_LIGHT6',
+        0x4007 : 'GL_LIGHT7',
+        0x8005 : 'GL_BLEND_COLOR_EXT',
+        0x800e : 'GL_PACK_CMYK_HINT_EXT',
+        0x800f : 'GL_UNPACK_CMYK_HINT_EXT',
+        0x8010 : 'GL_CONVOLUTION_1D_EXT',
+        0x8011 : 'GL_CONVOLUTION_2D_EXT',
+        0x8012 : 'GL_SEPARABLE_2D_EXT',
+        0x801c : 'GL_POST_CONVOLUTION_RED_SCALE_EXT',
+        0x801d : 'GL_POST_CONVOLUTION_GREEN_SCALE_EXT',
+        0x801e : 'GL_POST_CONVOLUTION_BLUE_SCALE_EXT',
+        0x801f : 'GL_POST_CONVOLUTION_ALPHA_SCALE_EXT',
+        0x8020 : 'GL_POST_CONVOLUTION_RED_BIAS_EXT',
+        0x8021 : 'GL_POST_CONVOLUTION_GREEN_BIAS_EXT',
+        0x8022 : 'GL_POST_CONVOLUTION_BLUE_BIAS_EXT',
+        0x8023 : 'GL_POST_CONVOLUTION_ALPHA_BIAS_EXT',
+        0x8024 : 'GL_HISTOGRAM_EXT',
+        0x802e : 'GL_MINMAX_EXT',
+        0x8037 : 'GL_POLYGON_OFFSET_FILL',
+        0x8038 : 'GL_POLYGON_OFFSET_FACTOR',
+        0x8039 : 'GL_POLYGON_OFFSET_BIAS_EXT',
+        0x803a : 'GL_RESCALE_NORMAL_EXT',
+        0x8068 : 'GL_TEXTURE_BINDING_1D',
+        0x8069 : 'GL_TEXTURE_BINDING_2D',
+        0x806a : 'GL_TEXTURE_3D_BINDING_EXT',
+        0x806b : 'GL_PACK_SKIP_IMAGES_EXT',
+        0x806c : 'GL_PACK_IMAGE_HEIGHT_EXT',
+        0x806d : 'GL_UNPACK_SKIP_IMAGES_EXT',
+        0x806e : 'GL_UNPACK_IMAGE_HEIGHT_EXT',
+        0x806f : 'GL_TEXTURE_3D_EXT',
+        0x8073 : 'GL_MAX_3D_TEXTURE_SIZE_EXT',
+        0x8074 : 'GL_VERTEX_ARRAY',
+        0x8075 : 'GL_NORMAL_ARRAY',
+        0x8076 : 'GL_COLOR_ARRAY',
+        0x8077 : 'GL_INDEX_ARRAY',
+        0x8078 : 'GL_TEXTURE_COORD_ARRAY',
+        0x8079 : 'GL_EDGE_FLAG_ARRAY',
+        0x807a : 'GL_VERTEX_ARRAY_SIZE',
+        0x807b : 'GL_VERTEX_ARRAY_TYPE',
+        0x807c : 'GL_VERTEX_ARRAY_STRIDE',
+        0x807d : 'GL_VERTEX_ARRAY_COUNT_EXT',
+        0x807e : 'GL_NORMAL_ARRAY_TYPE',
+        0x807f : 'GL_NORMAL_ARRAY_STRIDE',
+        0x8080 : 'GL_NORMAL_ARRAY_COUNT_EXT',
+        0x8081 : 'GL_COLOR_ARRAY_SIZE',
+        0x8082 : 'GL_COLOR_ARRAY_TYPE',
+        0x8083 : 'GL_COLOR_ARRAY_STRIDE',
+        0x8084 : 'GL_COLOR_ARRAY_COUNT_EXT',
+        0x8085 : 'GL_INDEX_ARRAY_TYPE',
+        0x8086 : 'GL_INDEX_ARRAY_STRIDE',
+        0x8087 : 'GL_INDEX_ARRAY_COUNT_EXT',
+        0x8088 : 'GL_TEXTURE_COORD_ARRAY_SIZE',
+        0x8089 : 'GL_TEXTURE_COORD_ARRAY_TYPE',
+        0x808a : 'GL_TEXTURE_COORD_ARRAY_STRIDE',
+        0x808b : 'GL_TEXTURE_COORD_ARRAY_COUNT_EXT',
+        0x808c : 'GL_EDGE_FLAG_ARRAY_STRIDE',
+        0x808d : 'GL_EDGE_FLAG_ARRAY_COUNT_EXT',
+        0x8094 : 'GL_INTERLACE_SGIX',
+        0x8096 : 'GL_DETAIL_TEXTURE_2D_BINDING_SGIS',
+        0x809d : 'GL_MULTISAMPLE_SGIS',
+        0x809e : 'GL_SAMPLE_ALPHA_TO_MASK_SGIS',
+        0x809f : 'GL_SAMPLE_ALPHA_TO_ONE_SGIS',
+        0x80a0 : 'GL_SAMPLE_MASK_SGIS',
+        0x80a8 : 'GL_SAMPLE_BUFFERS_SGIS',
+        0x80a9 : 'GL_SAMPLES_SGIS',
+        0x80aa : 'GL_SAMPLE_MASK_VALUE_SGIS',
+        0x80ab : 'GL_SAMPLE_MASK_INVERT_SGIS',
+        0x80ac : 'GL_SAMPLE_PATTERN_SGIS',
+        0x80b1 : 'GL_COLOR_MATRIX_SGI',
+        0x80b2 : 'GL_COLOR_MATRIX_STACK_DEPTH_SGI',
+        0x80b3 : 'GL_MAX_COLOR_MATRIX_STACK_DEPTH_SGI',
+        0x80b4 : 'GL_POST_COLOR_MATRIX_RED_SCALE_SGI',
+        0x80b5 : 'GL_POST_COLOR_MATRIX_GREEN_SCALE_SGI',
+        0x80b6 : 'GL_POST_COLOR_MATRIX_BLUE_SCALE_SGI',
+        0x80b7 : 'GL_POST_COLOR_MATRIX_ALPHA_SCALE_SGI',
+        0x80b8 : 'GL_POST_COLOR_MATRIX_RED_BIAS_SGI',
+        0x80b9 : 'GL_POST_COLOR_MATRIX_GREEN_BIAS_SGI',
+        0x80ba : 'GL_POST_COLOR_MATRIX_BLUE_BIAS_SGI',
+        0x80bb : 'GL_POST_COLOR_MATRIX_ALPHA_BIAS_SGI',
+        0x80bc : 'GL_TEXTURE_COLOR_TABLE_SGI',
+        0x80d0 : 'GL_COLOR_TABLE_SGI',
+        0x80d1 : 'GL_POST_CONVOLUTION_COLOR_TABLE_SGI',
+        0x80d2 : 'GL_POST_COLOR_MATRIX_COLOR_TABLE_SGI',
+        0x8126 : 'GL_POINT_SIZE_MIN_SGIS',
+        0x8127 : 'GL_POINT_SIZE_MAX_SGIS',
+        0x8128 : 'GL_POINT_FADE_THRESHOLD_SIZE_SGIS',
+        0x8129 : 'GL_DISTANCE_ATTENUATION_SGIS',
+        0x812b : 'GL_FOG_FUNC_POINTS_SGIS',
+        0x812c : 'GL_MAX_FOG_FUNC_POINTS_SGIS',
+        0x8130 : 'GL_PACK_SKIP_VOLUMES_SGIS',
+        0x8131 : 'GL_PACK_IMAGE_DEPTH_SGIS',
+        0x8132 : 'GL_UNPACK_SKIP_VOLUMES_SGIS',
+        0x8133 : 'GL_UNPACK_IMAGE_DEPTH_SGIS',
+        0x8134 : 'GL_TEXTURE_4D_SGIS',
+        0x8138 : 'GL_MAX_4D_TEXTURE_SIZE_SGIS',
+        0x8139 : 'GL_PIXEL_TEX_GEN_SGIX',
+        0x813e : 'GL_PIXEL_TILE_BEST_ALIGNMENT_SGIX',
+        0x813f : 'GL_PIXEL_TILE_CACHE_INCREMENT_SGIX',
+        0x8140 : 'GL_PIXEL_TILE_WIDTH_SGIX',
+        0x8141 : 'GL_PIXEL_TILE_HEIGHT_SGIX',
+        0x8142 : 'GL_PIXEL_TILE_GRID_WIDTH_SGIX',
+        0x8143 : 'GL_PIXEL_TILE_GRID_HEIGHT_SGIX',
+        0x8144 : 'GL_PIXEL_TILE_GRID_DEPTH_SGIX',
+        0x8145 : 'GL_PIXEL_TILE_CACHE_SIZE_SGIX',
+        0x8148 : 'GL_SPRITE_SGIX',
+        0x8149 : 'GL_SPRITE_MODE_SGIX',
+        0x814a : 'GL_SPRITE_AXIS_SGIX',
+        0x814b : 'GL_SPRITE_TRANSLATION_SGIX',
+        0x814f : 'GL_TEXTURE_4D_BINDING_SGIS',
+        0x8177 : 'GL_MAX_CLIPMAP_DEPTH_SGIX',
+        0x8178 : 'GL_MAX_CLIPMAP_VIRTUAL_DEPTH_SGIX',
+        0x817b : 'GL_POST_TEXTURE_FILTER_BIAS_RANGE_SGIX',
+        0x817c : 'GL_POST_TEXTURE_FILTER_SCALE_RANGE_SGIX',
+        0x817d : 'GL_REFERENCE_PLANE_SGIX',
+        0x817e : 'GL_REFERENCE_PLANE_EQUATION_SGIX',
+        0x817f : 'GL_IR_INSTRUMENT1_SGIX',
+        0x8181 : 'GL_INSTRUMENT_MEASUREMENTS_SGIX',
+        0x8183 : 'GL_CALLIGRAPHIC_FRAGMENT_SGIX',
+        0x818b : 'GL_FRAMEZOOM_SGIX',
+        0x818c : 'GL_FRAMEZOOM_FACTOR_SGIX',
+        0x818d : 'GL_MAX_FRAMEZOOM_FACTOR_SGIX',
+        0x8192 : 'GL_GENERATE_MIPMAP_HINT_SGIS',
+        0x8196 : 'GL_DEFORMATIONS_MASK_SGIX',
+        0x8198 : 'GL_FOG_OFFSET_SGIX',
+        0x8199 : 'GL_FOG_OFFSET_VALUE_SGIX',
+        0x81f8 : 'GL_LIGHT_MODEL_COLOR_CONTROL',
+        0x81fb : 'GL_SHARED_TEXTURE_PALETTE_EXT',
+        0x8316 : 'GL_CONVOLUTION_HINT_SGIX',
+        0x8329 : 'GL_ASYNC_MARKER_SGIX',
+        0x832b : 'GL_PIXEL_TEX_GEN_MODE_SGIX',
+        0x832c : 'GL_ASYNC_HISTOGRAM_SGIX',
+        0x832d : 'GL_MAX_ASYNC_HISTOGRAM_SGIX',
+        0x8353 : 'GL_PIXEL_TEXTURE_SGIS',
+        0x835c : 'GL_ASYNC_TEX_IMAGE_SGIX',
+        0x835d : 'GL_ASYNC_DRAW_PIXELS_SGIX',
+        0x835e : 'GL_ASYNC_READ_PIXELS_SGIX',
+        0x835f : 'GL_MAX_ASYNC_TEX_IMAGE_SGIX',
+        0x8360 : 'GL_MAX_ASYNC_DRAW_PIXELS_SGIX',
+        0x8361 : 'GL_MAX_ASYNC_READ_PIXELS_SGIX',
+        0x83ee : 'GL_VERTEX_PRECLIP_SGIX',
+        0x83ef : 'GL_VERTEX_PRECLIP_HINT_SGIX',
+        0x8400 : 'GL_FRAGMENT_LIGHTING_SGIX',
+        0x8401 : 'GL_FRAGMENT_COLOR_MATERIAL_SGIX',
+        0x8402 : 'GL_FRAGMENT_COLOR_MATERIAL_FACE_SGIX',
+        0x8403 : 'GL_FRAGMENT_COLOR_MATERIAL_PARAMETER_SGIX',
+        0x8404 : 'GL_MAX_FRAGMENT_LIGHTS_SGIX',
+        0x8405 : 'GL_MAX_ACTIVE_LIGHTS_SGIX',
+        0x8407 : 'GL_LIGHT_ENV_MODE_SGIX',
+        0x8408 : 'GL_FRAGMENT_LIGHT_MODEL_LOCAL_VIEWER_SGIX',
+        0x8409 : 'GL_FRAGMENT_LIGHT_MODEL_TWO_SIDE_SGIX',
+        0x840a : 'GL_FRAGMENT_LIGHT_MODEL_AMBIENT_SGIX',
+        0x840b : 'GL_FRAGMENT_LIGHT_MODEL_NORMAL_INTERPOLATION_SGIX',
+        0x840c : 'GL_FRAGMENT_LIGHT0_SGIX',
+        0x842c : 'GL_PACK_RESAMPLE_SGIX',
+        0x842d : 'GL_UNPACK_RESAMPLE_SGIX',
+        0x846d : 'GL_ALIASED_POINT_SIZE_RANGE',
+        0x846e : 'GL_ALIASED_LINE_WIDTH_RANGE',
+        0x85a0 : 'GL_PACK_SUBSAMPLE_RATE_SGIX',
+        0x85a1 : 'GL_UNPACK_SUBSAMPLE_RATE_SGIX',
+    },
+    'GetTextureParameter' : {
+        0x1000 : 'GL_TEXTURE_WIDTH',
+        0x1001 : 'GL_TEXTURE_HEIGHT',
+        0x1003 : 'GL_TEXTURE_COMPONENTS',
+        0x1004 : 'GL_TEXTURE_BORDER_COLOR',
+        0x1005 : 'GL_TEXTURE_BORDER',
+        0x2800 : 'GL_TEXTURE_MAG_FILTER',
+        0x2801 : 'GL_TEXTURE_MIN_FILTER',
+        0x2802 : 'GL_TEXTURE_WRAP_S',
+        0x2803 : 'GL_TEXTURE_WRAP_T',
+        0x805c : 'GL_TEXTURE_RED_SIZE',
+        0x805d : 'GL_TEXTURE_GREEN_SIZE',
+        0x805e : 'GL_TEXTURE_BLUE_SIZE',
+        0x805f : 'GL_TEXTURE_ALPHA_SIZE',
+        0x8060 : 'GL_TEXTURE_LUMINANCE_SIZE',
+        0x8061 : 'GL_TEXTURE_INTENSITY_SIZE',
+        0x8066 : 'GL_TEXTURE_PRIORITY',
+        0x8067 : 'GL_TEXTURE_RESIDENT',
+        0x8071 : 'GL_TEXTURE_DEPTH_EXT',
+        0x8072 : 'GL_TEXTURE_WRAP_R_EXT',
+        0x809a : 'GL_DETAIL_TEXTURE_LEVEL_SGIS',
+        0x809b : 'GL_DETAIL_TEXTURE_MODE_SGIS',
+        0x809c : 'GL_DETAIL_TEXTURE_FUNC_POINTS_SGIS',
+        0x80b0 : 'GL_SHARPEN_TEXTURE_FUNC_POINTS_SGIS',
+        0x80bf : 'GL_SHADOW_AMBIENT_SGIX',
+        0x8124 : 'GL_DUAL_TEXTURE_SELECT_SGIS',
+        0x8125 : 'GL_QUAD_TEXTURE_SELECT_SGIS',
+        0x8136 : 'GL_TEXTURE_4DSIZE_SGIS',
+        0x8137 : 'GL_TEXTURE_WRAP_Q_SGIS',
+        0x813a : 'GL_TEXTURE_MIN_LOD_SGIS',
+        0x813b : 'GL_TEXTURE_MAX_LOD_SGIS',
+        0x813c : 'GL_TEXTURE_BASE_LEVEL_SGIS',
+        0x813d : 'GL_TEXTURE_MAX_LEVEL_SGIS',
+        0x8147 : 'GL_TEXTURE_FILTER4_SIZE_SGIS',
+        0x8171 : 'GL_TEXTURE_CLIPMAP_CENTER_SGIX',
+        0x8172 : 'GL_TEXTURE_CLIPMAP_FRAME_SGIX',
+        0x8173 : 'GL_TEXTURE_CLIPMAP_OFFSET_SGIX',
+        0x8174 : 'GL_TEXTURE_CLIPMAP_VIRTUAL_DEPTH_SGIX',
+        0x8175 : 'GL_TEXTURE_CLIPMAP_LOD_OFFSET_SGIX',
+        0x8176 : 'GL_TEXTURE_CLIPMAP_DEPTH_SGIX',
+        0x8179 : 'GL_POST_TEXTURE_FILTER_BIAS_SGIX',
+        0x817a : 'GL_POST_TEXTURE_FILTER_SCALE_SGIX',
+        0x818e : 'GL_TEXTURE_LOD_BIAS_S_SGIX',
+        0x818f : 'GL_TEXTURE_LOD_BIAS_T_SGIX',
+        0x8190 : 'GL_TEXTURE_LOD_BIAS_R_SGIX',
+        0x8191 : 'GL_GENERATE_MIPMAP_SGIS',
+        0x819a : 'GL_TEXTURE_COMPARE_SGIX',
+        0x819b : 'GL_TEXTURE_COMPARE_OPERATOR_SGIX',
+        0x819c : 'GL_TEXTURE_LEQUAL_R_SGIX',
+        0x819d : 'GL_TEXTURE_GEQUAL_R_SGIX',
+        0x8369 : 'GL_TEXTURE_MAX_CLAMP_S_SGIX',
+        0x836a : 'GL_TEXTURE_MAX_CLAMP_T_SGIX',
+        0x836b : 'GL_TEXTURE_MAX_CLAMP_R_SGIX',
+    },
+    'HintMode' : {
+        0x1100 : 'GL_DONT_CARE',
+        0x1101 : 'GL_FASTEST',
+        0x1102 : 'GL_NICEST',
+    },
+    'HintTarget' : {
+        0xc50 : 'GL_PERSPECTIVE_CORRECTION_HINT',
+        0xc51 : 'GL_POINT_SMOOTH_HINT',
+        0xc52 : 'GL_LINE_SMOOTH_HINT',
+        0xc53 : 'GL_POLYGON_SMOOTH_HINT',
+        0xc54 : 'GL_FOG_HINT',
+        0x800e : 'GL_PACK_CMYK_HINT_EXT',
+        0x800f : 'GL_UNPACK_CMYK_HINT_EXT',
+        0x80eb : 'GL_PHONG_HINT_WIN',
+        0x80f0 : 'GL_CLIP_VOLUME_CLIPPING_HINT_EXT',
+        0x812e : 'GL_TEXTURE_MULTI_BUFFER_HINT_SGIX',
+        0x8192 : 'GL_GENERATE_MIPMAP_HINT',
+        0x8257 : 'GL_PROGRAM_BINARY_RETRIEVABLE_HINT',
+        0x8316 : 'GL_CONVOLUTION_HINT_SGIX',
+        0x8322 : 'GL_SCALEBIAS_HINT_SGIX',
+        0x835b : 'GL_LINE_QUALITY_HINT_SGIX',
+        0x83ee : 'GL_VERTEX_PRECLIP_SGIX',
+        0x83ef : 'GL_VERTEX_PRECLIP_HINT_SGIX',
+        0x84ef : 'GL_TEXTURE_COMPRESSION_HINT',
+        0x851f : 'GL_VERTEX_ARRAY_STORAGE_HINT_APPLE',
+        0x8534 : 'GL_MULTISAMPLE_FILTER_HINT_NV',
+        0x85b1 : 'GL_TRANSFORM_HINT_APPLE',
+        0x85bc : 'GL_TEXTURE_STORAGE_HINT_APPLE',
+        0x8b8b : 'GL_FRAGMENT_SHADER_DERIVATIVE_HINT',
+        0x8fb0 : 'GL_BINNING_CONTROL_HINT_QCOM',
+        0x1a1f8 : 'GL_PREFER_DOUBLEBUFFER_HINT_PGI',
+        0x1a1fd : 'GL_CONSERVE_MEMORY_HINT_PGI',
+        0x1a1fe : 'GL_RECLAIM_MEMORY_HINT_PGI',
+        0x1a203 : 'GL_NATIVE_GRAPHICS_BEGIN_HINT_PGI',
+        0x1a204 : 'GL_NATIVE_GRAPHICS_END_HINT_PGI',
+        0x1a20c : 'GL_ALWAYS_FAST_HINT_PGI',
+        0x1a20d : 'GL_ALWAYS_SOFT_HINT_PGI',
+        0x1a20e : 'GL_ALLOW_DRAW_OBJ_HINT_PGI',
+        0x1a20f : 'GL_ALLOW_DRAW_WIN_HINT_PGI',
+        0x1a210 : 'GL_ALLOW_DRAW_FRG_HINT_PGI',
+        0x1a211 : 'GL_ALLOW_DRAW_MEM_HINT_PGI',
+        0x1a216 : 'GL_STRICT_DEPTHFUNC_HINT_PGI',
+        0x1a217 : 'GL_STRICT_LIGHTING_HINT_PGI',
+        0x1a218 : 'GL_STRICT_SCISSOR_HINT_PGI',
+        0x1a219 : 'GL_FULL_STIPPLE_HINT_PGI',
+        0x1a220 : 'GL_CLIP_NEAR_HINT_PGI',
+        0x1a221 : 'GL_CLIP_FAR_HINT_PGI',
+        0x1a222 : 'GL_WIDE_LINE_HINT_PGI',
+        0x1a223 : 'GL_BACK_NORMALS_HINT_PGI',
+        0x1a22a : 'GL_VERTEX_DATA_HINT_PGI',
+        0x1a22b : 'GL_VERTEX_CONSISTENT_HINT_PGI',
+        0x1a22c : 'GL_MATERIAL_SIDE_HINT_PGI',
+        0x1a22d : 'GL_MAX_VERTEX_HINT_PGI',
+    },
+    'MaskedStencilValue' : None,
+    'PixelFormat' : {
+        0x1403 : 'GL_UNSIGNED_SHORT',
+        0x1405 : 'GL_UNSIGNED_INT',
+        0x1900 : 'GL_COLOR_INDEX',
+        0x1901 : 'GL_STENCIL_INDEX',
+        0x1902 : 'GL_DEPTH_COMPONENT',
+        0x1903 : 'GL_RED',
+        0x1904 : 'GL_GREEN',
+        0x1905 : 'GL_BLUE',
+        0x1906 : 'GL_ALPHA',
+        0x1907 : 'GL_RGB',
+        0x1908 : 'GL_RGBA',
+        0x1909 : 'GL_LUMINANCE',
+        0x190a : 'GL_LUMINANCE_ALPHA',
+        0x8000 : 'GL_ABGR_EXT',
+        0x800c : 'GL_CMYK_EXT',
+        0x800d : 'GL_CMYKA_EXT',
+        0x81bb : 'GL_YCRCB_422_SGIX',
+        0x81bc : 'GL_YCRCB_444_SGIX',
+    },
+    'PixelInternalFormat' : None,
+    'PixelStoreParameter' : {
+        0xcf0 : 'GL_UNPACK_SWAP_BYTES',
+        0xcf1 : 'GL_UNPACK_LSB_FIRST',
+        0xcf2 : 'GL_UNPACK_ROW_LENGTH',
+        0xcf3 : 'GL_UNPACK_SKIP_ROWS',
+        0xcf4 : 'GL_UNPACK_SKIP_PIXELS',
+        0xcf5 : 'GL_UNPACK_ALIGNMENT',
+        0xd00 : 'GL_PACK_SWAP_BYTES',
+        0xd01 : 'GL_PACK_LSB_FIRST',
+        0xd02 : 'GL_PACK_ROW_LENGTH',
+        0xd03 : 'GL_PACK_SKIP_ROWS',
+        0xd04 : 'GL_PACK_SKIP_PIXELS',
+        0xd05 : 'GL_PACK_ALIGNMENT',
+        0x806b : 'GL_PACK_SKIP_IMAGES',
+        0x806c : 'GL_PACK_IMAGE_HEIGHT',
+        0x806d : 'GL_UNPACK_SKIP_IMAGES',
+        0x806e : 'GL_UNPACK_IMAGE_HEIGHT',
+        0x8130 : 'GL_PACK_SKIP_VOLUMES_SGIS',
+        0x8131 : 'GL_PACK_IMAGE_DEPTH_SGIS',
+        0x8132 : 'GL_UNPACK_SKIP_VOLUMES_SGIS',
+        0x8133 : 'GL_UNPACK_IMAGE_DEPTH_SGIS',
+        0x8140 : 'GL_PIXEL_TILE_WIDTH_SGIX',
+        0x8141 : 'GL_PIXEL_TILE_HEIGHT_SGIX',
+        0x8142 : 'GL_PIXEL_TILE_GRID_WIDTH_SGIX',
+        0x8143 : 'GL_PIXEL_TILE_GRID_HEIGHT_SGIX',
+        0x8144 : 'GL_PIXEL_TILE_GRID_DEPTH_SGIX',
+        0x8145 : 'GL_PIXEL_TILE_CACHE_SIZE_SGIX',
+        0x842c : 'GL_PACK_RESAMPLE_SGIX',
+        0x842d : 'GL_UNPACK_RESAMPLE_SGIX',
+        0x85a0 : 'GL_PACK_SUBSAMPLE_RATE_SGIX',
+        0x85a1 : 'GL_UNPACK_SUBSAMPLE_RATE_SGIX',
+        0x8984 : 'GL_PACK_RESAMPLE_OML',
+        0x8985 : 'GL_UNPACK_RESAMPLE_OML',
+    },
+    'PixelType' : {
+        0x1400 : 'GL_BYTE',
+        0x1401 : 'GL_UNSIGNED_BYTE',
+        0x1402 : 'GL_SHORT',
+        0x1403 : 'GL_UNSIGNED_SHORT',
+        0x1404 : 'GL_INT',
+        0x1405 : 'GL_UNSIGNED_INT',
+        0x1406 : 'GL_FLOAT',
+        0x1a00 : 'GL_BITMAP',
+        0x8032 : 'GL_UNSIGNED_BYTE_3_3_2',
+        0x8033 : 'GL_UNSIGNED_SHORT_4_4_4_4',
+        0x8034 : 'GL_UNSIGNED_SHORT_5_5_5_1',
+        0x8035 : 'GL_UNSIGNED_INT_8_8_8_8',
+        0x8036 : 'GL_UNSIGNED_INT_10_10_10_2',
+    },
+    'PrimitiveType' : {
+        0x0 : 'GL_POINTS',
+        0x1 : 'GL_LINES',
+        0x2 : 'GL_LINE_LOOP',
+        0x3 : 'GL_LINE_STRIP',
+        0x4 : 'GL_TRIANGLES',
+        0x5 : 'GL_TRIANGLE_STRIP',
+        0x6 : 'GL_TRIANGLE_FAN',
+        0x7 : 'GL_QUADS',
+        0x8 : 'GL_QUAD_STRIP',
+        0x9 : 'GL_POLYGON',
+        0xa : 'GL_LINES_ADJACENCY',
+        0xb : 'GL_LINE_STRIP_ADJACENCY',
+        0xc : 'GL_TRIANGLES_ADJACENCY',
+        0xd : 'GL_TRIANGLE_STRIP_ADJACENCY',
+        0xe : 'GL_PATCHES',
+    },
+    'RenderbufferTarget' : None,
+    'StencilFaceDirection' : None,
+    'StencilFunction' : {
+        0x200 : 'GL_NEVER',
+        0x201 : 'GL_LESS',
+        0x202 : 'GL_EQUAL',
+        0x203 : 'GL_LEQUAL',
+        0x204 : 'GL_GREATER',
+        0x205 : 'GL_NOTEQUAL',
+        0x206 : 'GL_GEQUAL',
+        0x207 : 'GL_ALWAYS',
+    },
+    'StencilOp' : {
+        0x0 : 'GL_ZERO',
+        0x150a : 'GL_INVERT',
+        0x1e00 : 'GL_KEEP',
+        0x1e01 : 'GL_REPLACE',
+        0x1e02 : 'GL_INCR',
+        0x1e03 : 'GL_DECR',
+    },
+    'StencilValue' : None,
+    'StringName' : {
+        0x1f00 : 'GL_VENDOR',
+        0x1f01 : 'GL_RENDERER',
+        0x1f02 : 'GL_VERSION',
+        0x1f03 : 'GL_EXTENSIONS',
+    },
+    'Texture' : None,
+    'TextureComponentCount' : None,
+    'TextureParameterName' : {
+        0x1004 : 'GL_TEXTURE_BORDER_COLOR',
+        0x2800 : 'GL_TEXTURE_MAG_FILTER',
+        0x2801 : 'GL_TEXTURE_MIN_FILTER',
+        0x2802 : 'GL_TEXTURE_WRAP_S',
+        0x2803 : 'GL_TEXTURE_WRAP_T',
+        0x8066 : 'GL_TEXTURE_PRIORITY',
+        0x8072 : 'GL_TEXTURE_WRAP_R',
+        0x809a : 'GL_DETAIL_TEXTURE_LEVEL_SGIS',
+        0x809b : 'GL_DETAIL_TEXTURE_MODE_SGIS',
+        0x80bf : 'GL_SHADOW_AMBIENT_SGIX',
+        0x8124 : 'GL_DUAL_TEXTURE_SELECT_SGIS',
+        0x8125 : 'GL_QUAD_TEXTURE_SELECT_SGIS',
+        0x8137 : 'GL_TEXTURE_WRAP_Q_SGIS',
+        0x8171 : 'GL_TEXTURE_CLIPMAP_CENTER_SGIX',
+        0x8172 : 'GL_TEXTURE_CLIPMAP_FRAME_SGIX',
+        0x8173 : 'GL_TEXTURE_CLIPMAP_OFFSET_SGIX',
+        0x8174 : 'GL_TEXTURE_CLIPMAP_VIRTUAL_DEPTH_SGIX',
+        0x8175 : 'GL_TEXTURE_CLIPMAP_LOD_OFFSET_SGIX',
+        0x8176 : 'GL_TEXTURE_CLIPMAP_DEPTH_SGIX',
+        0x8179 : 'GL_POST_TEXTURE_FILTER_BIAS_SGIX',
+        0x817a : 'GL_POST_TEXTURE_FILTER_SCALE_SGIX',
+        0x818e : 'GL_TEXTURE_LOD_BIAS_S_SGIX',
+        0x818f : 'GL_TEXTURE_LOD_BIAS_T_SGIX',
+        0x8190 : 'GL_TEXTURE_LOD_BIAS_R_SGIX',
+        0x8191 : 'GL_GENERATE_MIPMAP',
+        0x819a : 'GL_TEXTURE_COMPARE_SGIX',
+        0x8369 : 'GL_TEXTURE_MAX_CLAMP_S_SGIX',
+        0x836a : 'GL_TEXTURE_MAX_CLAMP_T_SGIX',
+        0x836b : 'GL_TEXTURE_MAX_CLAMP_R_SGIX',
+    },
+    'TextureTarget' : {
+        0xde0 : 'GL_TEXTURE_1D',
+        0xde1 : 'GL_TEXTURE_2D',
+        0x8063 : 'GL_PROXY_TEXTURE_1D',
+        0x8064 : 'GL_PROXY_TEXTURE_2D',
+        0x806f : 'GL_TEXTURE_3D',
+        0x8070 : 'GL_PROXY_TEXTURE_3D',
+        0x8095 : 'GL_DETAIL_TEXTURE_2D_SGIS',
+        0x8134 : 'GL_TEXTURE_4D_SGIS',
+        0x8135 : 'GL_PROXY_TEXTURE_4D_SGIS',
+        0x813a : 'GL_TEXTURE_MIN_LOD',
+        0x813b : 'GL_TEXTURE_MAX_LOD',
+        0x813c : 'GL_TEXTURE_BASE_LEVEL',
+        0x813d : 'GL_TEXTURE_MAX_LEVEL',
+    },
+    'TextureUnit' : None,
+    'VertexAttribPointerPropertyARB' : None,
+    'VertexAttribPointerType' : None,
+    'VertexAttribPropertyARB' : None,
+    'WinCoord' : None,
+}
+
+GLOBAL = {
+    -0x6 : 'GL_SKIP_COMPONENTS1_NV',
+    -0x5 : 'GL_SKIP_COMPONENTS2_NV',
+    -0x4 : 'GL_SKIP_COMPONENTS3_NV',
+    -0x3 : 'GL_SKIP_COMPONENTS4_NV',
+    -0x2 : 'GL_NEXT_BUFFER_NV',
+    0x0 : 'GL_ZERO',
+    0x1 : 'GL_ONE',
+    0x2 : 'GL_POINT_BIT',
+    0x3 : 'GL_REPLACE_OLDEST_SUN',
+    0x4 : 'GL_LINE_BIT',
+    0x5 : 'GL_TRIANGLE_STRIP',
+    0x6 : 'GL_TRIANGLE_FAN',
+    0x7 : 'GL_QUADS',
+    0x8 : 'GL_POLYGON_BIT',
+    0x9 : 'GL_POLYGON',
+    0xa : 'GL_LINES_ADJACENCY',
+    0xb : 'GL_LINE_STRIP_ADJACENCY',
+    0xc : 'GL_TRIANGLES_ADJACENCY',
+    0xd : 'GL_TRIANGLE_STRIP_ADJACENCY',
+    0xe : 'GL_PATCHES',
+    0xf : 'GL_RELATIVE_SMOOTH_QUADRATIC_CURVE_TO_NV',
+    0x10 : 'GL_POLYGON_STIPPLE_BIT',
+    0x11 : 'GL_RELATIVE_SMOOTH_CUBIC_CURVE_TO_NV',
+    0x12 : 'GL_SMALL_CCW_ARC_TO_NV',
+    0x13 : 'GL_RELATIVE_SMALL_CCW_ARC_TO_NV',
+    0x14 : 'GL_SMALL_CW_ARC_TO_NV',
+    0x15 : 'GL_RELATIVE_SMALL_CW_ARC_TO_NV',
+    0x16 : 'GL_LARGE_CCW_ARC_TO_NV',
+    0x17 : 'GL_RELATIVE_LARGE_CCW_ARC_TO_NV',
+    0x18 : 'GL_LARGE_CW_ARC_TO_NV',
+    0x19 : 'GL_RELATIVE_LARGE_CW_ARC_TO_NV',
+    0x20 : 'GL_PIXEL_MODE_BIT',
+    0x40 : 'GL_LIGHTING_BIT',
+    0x80 : 'GL_FOG_BIT',
+    0xf0 : 'GL_RESTART_PATH_NV',
+    0xf2 : 'GL_DUP_FIRST_CUBIC_CURVE_TO_NV',
+    0xf4 : 'GL_DUP_LAST_CUBIC_CURVE_TO_NV',
+    0xf6 : 'GL_RECT_NV',
+    0xf8 : 'GL_CIRCULAR_CCW_ARC_TO_NV',
+    0xfa : 'GL_CIRCULAR_CW_ARC_TO_NV',
+    0xfc : 'GL_CIRCULAR_TANGENT_ARC_TO_NV',
+    0xfe : 'GL_ARC_TO_NV',
+    0xff : 'GL_RELATIVE_ARC_TO_NV',
+    0x100 : 'GL_DEPTH_BUFFER_BIT',
+    0x101 : 'GL_LOAD',
+    0x102 : 'GL_RETURN',
+    0x103 : 'GL_MULT',
+    0x104 : 'GL_ADD',
+    0x200 : 'GL_ACCUM_BUFFER_BIT',
+    0x201 : 'GL_LESS',
+    0x202 : 'GL_EQUAL',
+    0x203 : 'GL_LEQUAL',
+    0x204 : 'GL_GREATER',
+    0x205 : 'GL_NOTEQUAL',
+    0x206 : 'GL_GEQUAL',
+    0x207 : 'GL_ALWAYS',
+    0x300 : 'GL_SRC_COLOR',
+    0x301 : 'GL_ONE_MINUS_SRC_COLOR',
+    0x302 : 'GL_SRC_ALPHA',
+    0x303 : 'GL_ONE_MINUS_SRC_ALPHA',
+    0x304 : 'GL_DST_ALPHA',
+    0x305 : 'GL_ONE_MINUS_DST_ALPHA',
+    0x306 : 'GL_DST_COLOR',
+    0x307 : 'GL_ONE_MINUS_DST_COLOR',
+    0x308 : 'GL_SRC_ALPHA_SATURATE',
+    0x400 : 'GL_STENCIL_BUFFER_BIT',
+    0x401 : 'GL_FRONT_RIGHT',
+    0x402 : 'GL_BACK_LEFT',
+    0x403 : 'GL_BACK_RIGHT',
+    0x404 : 'GL_FRONT',
+    0x405 : 'GL_BACK',
+    0x406 : 'GL_LEFT',
+    0x407 : 'GL_RIGHT',
+    0x408 : 'GL_FRONT_AND_BACK',
+    0x409 : 'GL_AUX0',
+    0x40a : 'GL_AUX1',
+    0x40b : 'GL_AUX2',
+    0x40c : 'GL_AUX3',
+    0x500 : 'GL_INVALID_ENUM',
+    0x501 : 'GL_INVALID_VALUE',
+    0x502 : 'GL_INVALID_OPERATION',
+    0x503 : 'GL_STACK_OVERFLOW',
+    0x504 : 'GL_STACK_UNDERFLOW',
+    0x505 : 'GL_OUT_OF_MEMORY',
+    0x506 : 'GL_INVALID_FRAMEBUFFER_OPERATION',
+    0x600 : 'GL_2D',
+    0x601 : 'GL_3D',
+    0x602 : 'GL_3D_COLOR',
+    0x603 : 'GL_3D_COLOR_TEXTURE',
+    0x604 : 'GL_4D_COLOR_TEXTURE',
+    0x700 : 'GL_PASS_THROUGH_TOKEN',
+    0x701 : 'GL_POINT_TOKEN',
+    0x702 : 'GL_LINE_TOKEN',
+    0x703 : 'GL_POLYGON_TOKEN',
+    0x704 : 'GL_BITMAP_TOKEN',
+    0x705 : 'GL_DRAW_PIXEL_TOKEN',
+    0x706 : 'GL_COPY_PIXEL_TOKEN',
+    0x707 : 'GL_LINE_RESET_TOKEN',
+    0x800 : 'GL_VIEWPORT_BIT',
+    0x801 : 'GL_EXP2',
+    0x900 : 'GL_CW',
+    0x901 : 'GL_CCW',
+    0xa00 : 'GL_COEFF',
+    0xa01 : 'GL_ORDER',
+    0xa02 : 'GL_DOMAIN',
+    0xb00 : 'GL_CURRENT_COLOR',
+    0xb01 : 'GL_CURRENT_INDEX',
+    0xb02 : 'GL_CURRENT_NORMAL',
+    0xb03 : 'GL_CURRENT_TEXTURE_COORDS',
+    0xb04 : 'GL_CURRENT_RASTER_COLOR',
+    0xb05 : 'GL_CURRENT_RASTER_INDEX',
+    0xb06 : 'GL_CURRENT_RASTER_TEXTURE_COORDS',
+    0xb07 : 'GL_CURRENT_RASTER_POSITION',
+    0xb08 : 'GL_CURRENT_RASTER_POSITION_VALID',
+    0xb09 : 'GL_CURRENT_RASTER_DISTANCE',
+    0xb10 : 'GL_POINT_SMOOTH',
+    0xb11 : 'GL_POINT_SIZE',
+    0xb12 : 'GL_POINT_SIZE_RANGE',
+    0xb13 : 'GL_POINT_SIZE_GRANULARITY',
+    0xb20 : 'GL_LINE_SMOOTH',
+    0xb21 : 'GL_LINE_WIDTH',
+    0xb22 : 'GL_LINE_WIDTH_RANGE',
+    0xb23 : 'GL_LINE_WIDTH_GRANULARITY',
+    0xb24 : 'GL_LINE_STIPPLE',
+    0xb25 : 'GL_LINE_STIPPLE_PATTERN',
+    0xb26 : 'GL_LINE_STIPPLE_REPEAT',
+    0xb30 : 'GL_LIST_MODE',
+    0xb31 : 'GL_MAX_LIST_NESTING',
+    0xb32 : 'GL_LIST_BASE',
+    0xb33 : 'GL_LIST_INDEX',
+    0xb40 : 'GL_POLYGON_MODE',
+    0xb41 : 'GL_POLYGON_SMOOTH',
+    0xb42 : 'GL_POLYGON_STIPPLE',
+    0xb43 : 'GL_EDGE_FLAG',
+    0xb44 : 'GL_CULL_FACE',
+    0xb45 : 'GL_CULL_FACE_MODE',
+    0xb46 : 'GL_FRONT_FACE',
+    0xb50 : 'GL_LIGHTING',
+    0xb51 : 'GL_LIGHT_MODEL_LOCAL_VIEWER',
+    0xb52 : 'GL_LIGHT_MODEL_TWO_SIDE',
+    0xb53 : 'GL_LIGHT_MODEL_AMBIENT',
+    0xb54 : 'GL_SHADE_MODEL',
+    0xb55 : 'GL_COLOR_MATERIAL_FACE',
+    0xb56 : 'GL_COLOR_MATERIAL_PARAMETER',
+    0xb57 : 'GL_COLOR_MATERIAL',
+    0xb60 : 'GL_FOG',
+    0xb61 : 'GL_FOG_INDEX',
+    0xb62 : 'GL_FOG_DENSITY',
+    0xb63 : 'GL_FOG_START',
+    0xb64 : 'GL_FOG_END',
+    0xb65 : 'GL_FOG_MODE',
+    0xb66 : 'GL_FOG_COLOR',
+    0xb70 : 'GL_DEPTH_RANGE',
+    0xb71 : 'GL_DEPTH_TEST',
+    0xb72 : 'GL_DEPTH_WRITEMASK',
+    0xb73 : 'GL_DEPTH_CLEAR_VALUE',
+    0xb74 : 'GL_DEPTH_FUNC',
+    0xb80 : 'GL_ACCUM_CLEAR_VALUE',
+    0xb90 : 'GL_STENCIL_TEST',
+    0xb91 : 'GL_STENCIL_CLEAR_VALUE',
+    0xb92 : 'GL_STENCIL_FUNC',
+    0xb93 : 'GL_STENCIL_VALUE_MASK',
+    0xb94 : 'GL_STENCIL_FAIL',
+    0xb95 : 'GL_STENCIL_PASS_DEPTH_FAIL',
+    0xb96 : 'GL_STENCIL_PASS_DEPTH_PASS',
+    0xb97 : 'GL_STENCIL_REF',
+    0xb98 : 'GL_STENCIL_WRITEMASK',
+    0xba0 : 'GL_MATRIX_MODE',
+    0xba1 : 'GL_NORMALIZE',
+    0xba2 : 'GL_VIEWPORT',
+    0xba3 : 'GL_MODELVIEW_STACK_DEPTH',
+    0xba4 : 'GL_PROJECTION_STACK_DEPTH',
+    0xba5 : 'GL_TEXTURE_STACK_DEPTH',
+    0xba6 : 'GL_MODELVIEW_MATRIX',
+    0xba7 : 'GL_PROJECTION_MATRIX',
+    0xba8 : 'GL_TEXTURE_MATRIX',
+    0xbb0 : 'GL_ATTRIB_STACK_DEPTH',
+    0xbb1 : 'GL_CLIENT_ATTRIB_STACK_DEPTH',
+    0xbc0 : 'GL_ALPHA_TEST',
+    0xbc1 : 'GL_ALPHA_TEST_FUNC',
+    0xbc2 : 'GL_ALPHA_TEST_REF',
+    0xbd0 : 'GL_DITHER',
+    0xbe0 : 'GL_BLEND_DST',
+    0xbe1 : 'GL_BLEND_SRC',
+    0xbe2 : 'GL_BLEND',
+    0xbf0 : 'GL_LOGIC_OP_MODE',
+    0xbf1 : 'GL_INDEX_LOGIC_OP',
+    0xbf2 : 'GL_COLOR_LOGIC_OP',
+    0xc00 : 'GL_AUX_BUFFERS',
+    0xc01 : 'GL_DRAW_BUFFER',
+    0xc02 : 'GL_READ_BUFFER',
+    0xc10 : 'GL_SCISSOR_BOX',
+    0xc11 : 'GL_SCISSOR_TEST',
+    0xc20 : 'GL_INDEX_CLEAR_VALUE',
+    0xc21 : 'GL_INDEX_WRITEMASK',
+    0xc22 : 'GL_COLOR_CLEAR_VALUE',
+    0xc23 : 'GL_COLOR_WRITEMASK',
+    0xc30 : 'GL_INDEX_MODE',
+    0xc31 : 'GL_RGBA_MODE',
+    0xc32 : 'GL_DOUBLEBUFFER',
+    0xc33 : 'GL_STEREO',
+    0xc40 : 'GL_RENDER_MODE',
+    0xc50 : 'GL_PERSPECTIVE_CORRECTION_HINT',
+    0xc51 : 'GL_POINT_SMOOTH_HINT',
+    0xc52 : 'GL_LINE_SMOOTH_HINT',
+    0xc53 : 'GL_POLYGON_SMOOTH_HINT',
+    0xc54 : 'GL_FOG_HINT',
+    0xc60 : 'GL_TEXTURE_GEN_S',
+    0xc61 : 'GL_TEXTURE_GEN_T',
+    0xc62 : 'GL_TEXTURE_GEN_R',
+    0xc63 : 'GL_TEXTURE_GEN_Q',
+    0xc70 : 'GL_PIXEL_MAP_I_TO_I',
+    0xc71 : 'GL_PIXEL_MAP_S_TO_S',
+    0xc72 : 'GL_PIXEL_MAP_I_TO_R',
+    0xc73 : 'GL_PIXEL_MAP_I_TO_G',
+    0xc74 : 'GL_PIXEL_MAP_I_TO_B',
+    0xc75 : 'GL_PIXEL_MAP_I_TO_A',
+    0xc76 : 'GL_PIXEL_MAP_R_TO_R',
+    0xc77 : 'GL_PIXEL_MAP_G_TO_G',
+    0xc78 : 'GL_PIXEL_MAP_B_TO_B',
+    0xc79 : 'GL_PIXEL_MAP_A_TO_A',
+    0xcb0 : 'GL_PIXEL_MAP_I_TO_I_SIZE',
+    0xcb1 : 'GL_PIXEL_MAP_S_TO_S_SIZE',
+    0xcb2 : 'GL_PIXEL_MAP_I_TO_R_SIZE',
+    0xcb3 : 'GL_PIXEL_MAP_I_TO_G_SIZE',
+    0xcb4 : 'GL_PIXEL_MAP_I_TO_B_SIZE',
+    0xcb5 : 'GL_PIXEL_MAP_I_TO_A_SIZE',
+    0xcb6 : 'GL_PIXEL_MAP_R_TO_R_SIZE',
+    0xcb7 : 'GL_PIXEL_MAP_G_TO_G_SIZE',
+    0xcb8 : 'GL_PIXEL_MAP_B_TO_B_SIZE',
+    0xcb9 : 'GL_PIXEL_MAP_A_TO_A_SIZE',
+    0xcf0 : 'GL_UNPACK_SWAP_BYTES',
+    0xcf1 : 'GL_UNPACK_LSB_FIRST',
+    0xcf2 : 'GL_UNPACK_ROW_LENGTH',
+    0xcf3 : 'GL_UNPACK_SKIP_ROWS',
+    0xcf4 : 'GL_UNPACK_SKIP_PIXELS',
+    0xcf5 : 'GL_UNPACK_ALIGNMENT',
+    0xd00 : 'GL_PACK_SWAP_BYTES',
+    0xd01 : 'GL_PACK_LSB_FIRST',
+    0xd02 : 'GL_PACK_ROW_LENGTH',
+    0xd03 : 'GL_PACK_SKIP_ROWS',
+    0xd04 : 'GL_PACK_SKIP_PIXELS',
+    0xd05 : 'GL_PACK_ALIGNMENT',
+    0xd10 : 'GL_MAP_COLOR',
+    0xd11 : 'GL_MAP_STENCIL',
+    0xd12 : 'GL_INDEX_SHIFT',
+    0xd13 : 'GL_INDEX_OFFSET',
+    0xd14 : 'GL_RED_SCALE',
+    0xd15 : 'GL_RED_BIAS',
+    0xd16 : 'GL_ZOOM_X',
+    0xd17 : 'GL_ZOOM_Y',
+    0xd18 : 'GL_GREEN_SCALE',
+    0xd19 : 'GL_GREEN_BIAS',
+    0xd1a : 'GL_BLUE_SCALE',
+    0xd1b : 'GL_BLUE_BIAS',
+    0xd1c : 'GL_ALPHA_SCALE',
+    0xd1d : 'GL_ALPHA_BIAS',
+    0xd1e : 'GL_DEPTH_SCALE',
+    0xd1f : 'GL_DEPTH_BIAS',
+    0xd30 : 'GL_MAX_EVAL_ORDER',
+    0xd31 : 'GL_MAX_LIGHTS',
+    0xd32 : 'GL_MAX_CLIP_PLANES',
+    0xd33 : 'GL_MAX_TEXTURE_SIZE',
+    0xd34 : 'GL_MAX_PIXEL_MAP_TABLE',
+    0xd35 : 'GL_MAX_ATTRIB_STACK_DEPTH',
+    0xd36 : 'GL_MAX_MODELVIEW_STACK_DEPTH',
+    0xd37 : 'GL_MAX_NAME_STACK_DEPTH',
+    0xd38 : 'GL_MAX_PROJECTION_STACK_DEPTH',
+    0xd39 : 'GL_MAX_TEXTURE_STACK_DEPTH',
+    0xd3a : 'GL_MAX_VIEWPORT_DIMS',
+    0xd3b : 'GL_MAX_CLIENT_ATTRIB_STACK_DEPTH',
+    0xd50 : 'GL_SUBPIXEL_BITS',
+    0xd51 : 'GL_INDEX_BITS',
+    0xd52 : 'GL_RED_BITS',
+    0xd53 : 'GL_GREEN_BITS',
+    0xd54 : 'GL_BLUE_BITS',
+    0xd55 : 'GL_ALPHA_BITS',
+    0xd56 : 'GL_DEPTH_BITS',
+    0xd57 : 'GL_STENCIL_BITS',
+    0xd58 : 'GL_ACCUM_RED_BITS',
+    0xd59 : 'GL_ACCUM_GREEN_BITS',
+    0xd5a : 'GL_ACCUM_BLUE_BITS',
+    0xd5b : 'GL_ACCUM_ALPHA_BITS',
+    0xd70 : 'GL_NAME_STACK_DEPTH',
+    0xd80 : 'GL_AUTO_NORMAL',
+    0xd90 : 'GL_MAP1_COLOR_4',
+    0xd91 : 'GL_MAP1_INDEX',
+    0xd92 : 'GL_MAP1_NORMAL',
+    0xd93 : 'GL_MAP1_TEXTURE_COORD_1',
+    0xd94 : 'GL_MAP1_TEXTURE_COORD_2',
+    0xd95 : 'GL_MAP1_TEXTURE_COORD_3',
+    0xd96 : 'GL_MAP1_TEXTURE_COORD_4',
+    0xd97 : 'GL_MAP1_VERTEX_3',
+    0xd98 : 'GL_MAP1_VERTEX_4',
+    0xdb0 : 'GL_MAP2_COLOR_4',
+    0xdb1 : 'GL_MAP2_INDEX',
+    0xdb2 : 'GL_MAP2_NORMAL',
+    0xdb3 : 'GL_MAP2_TEXTURE_COORD_1',
+    0xdb4 : 'GL_MAP2_TEXTURE_COORD_2',
+    0xdb5 : 'GL_MAP2_TEXTURE_COORD_3',
+    0xdb6 : 'GL_MAP2_TEXTURE_COORD_4',
+    0xdb7 : 'GL_MAP2_VERTEX_3',
+    0xdb8 : 'GL_MAP2_VERTEX_4',
+    0xdd0 : 'GL_MAP1_GRID_DOMAIN',
+    0xdd1 : 'GL_MAP1_GRID_SEGMENTS',
+    0xdd2 : 'GL_MAP2_GRID_DOMAIN',
+    0xdd3 : 'GL_MAP2_GRID_SEGMENTS',
+    0xde0 : 'GL_TEXTURE_1D',
+    0xde1 : 'GL_TEXTURE_2D',
+    0xdf0 : 'GL_FEEDBACK_BUFFER_POINTER',
+    0xdf1 : 'GL_FEEDBACK_BUFFER_SIZE',
+    0xdf2 : 'GL_FEEDBACK_BUFFER_TYPE',
+    0xdf3 : 'GL_SELECTION_BUFFER_POINTER',
+    0xdf4 : 'GL_SELECTION_BUFFER_SIZE',
+    0x1000 : 'GL_TRANSFORM_BIT',
+    0x1001 : 'GL_TEXTURE_HEIGHT',
+    0x1003 : 'GL_TEXTURE_INTERNAL_FORMAT',
+    0x1004 : 'GL_TEXTURE_BORDER_COLOR',
+    0x1005 : 'GL_TEXTURE_BORDER',
+    0x1100 : 'GL_DONT_CARE',
+    0x1101 : 'GL_FASTEST',
+    0x1102 : 'GL_NICEST',
+    0x1200 : 'GL_AMBIENT',
+    0x1201 : 'GL_DIFFUSE',
+    0x1202 : 'GL_SPECULAR',
+    0x1203 : 'GL_POSITION',
+    0x1204 : 'GL_SPOT_DIRECTION',
+    0x1205 : 'GL_SPOT_EXPONENT',
+    0x1206 : 'GL_SPOT_CUTOFF',
+    0x1207 : 'GL_CONSTANT_ATTENUATION',
+    0x1208 : 'GL_LINEAR_ATTENUATION',
+    0x1209 : 'GL_QUADRATIC_ATTENUATION',
+    0x1300 : 'GL_COMPILE',
+    0x1301 : 'GL_COMPILE_AND_EXECUTE',
+    0x1400 : 'GL_BYTE',
+    0x1401 : 'GL_UNSIGNED_BYTE',
+    0x1402 : 'GL_SHORT',
+    0x1403 : 'GL_UNSIGNED_SHORT',
+    0x1404 : 'GL_INT',
+    0x1405 : 'GL_UNSIGNED_INT',
+    0x1406 : 'GL_FLOAT',
+    0x1407 : 'GL_2_BYTES',
+    0x1408 : 'GL_3_BYTES',
+    0x1409 : 'GL_4_BYTES',
+    0x140a : 'GL_DOUBLE',
+    0x140b : 'GL_HALF_FLOAT',
+    0x140c : 'GL_FIXED',
+    0x140e : 'GL_INT64_NV',
+    0x140f : 'GL_UNSIGNED_INT64_ARB',
+    0x1500 : 'GL_CLEAR',
+    0x1501 : 'GL_AND',
+    0x1502 : 'GL_AND_REVERSE',
+    0x1503 : 'GL_COPY',
+    0x1504 : 'GL_AND_INVERTED',
+    0x1505 : 'GL_NOOP',
+    0x1506 : 'GL_XOR',
+    0x1507 : 'GL_OR',
+    0x1508 : 'GL_NOR',
+    0x1509 : 'GL_EQUIV',
+    0x150a : 'GL_INVERT',
+    0x150b : 'GL_OR_REVERSE',
+    0x150c : 'GL_COPY_INVERTED',
+    0x150d : 'GL_OR_INVERTED',
+    0x150e : 'GL_NAND',
+    0x150f : 'GL_SET',
+    0x1600 : 'GL_EMISSION',
+    0x1601 : 'GL_SHININESS',
+    0x1602 : 'GL_AMBIENT_AND_DIFFUSE',
+    0x1603 : 'GL_COLOR_INDEXES',
+    0x1700 : 'GL_MODELVIEW',
+    0x1701 : 'GL_PROJECTION',
+    0x1702 : 'GL_TEXTURE',
+    0x1800 : 'GL_COLOR',
+    0x1801 : 'GL_DEPTH',
+    0x1802 : 'GL_STENCIL',
+    0x1900 : 'GL_COLOR_INDEX',
+    0x1901 : 'GL_STENCIL_INDEX',
+    0x1902 : 'GL_DEPTH_COMPONENT',
+    0x1903 : 'GL_RED',
+    0x1904 : 'GL_GREEN',
+    0x1905 : 'GL_BLUE',
+    0x1906 : 'GL_ALPHA',
+    0x1907 : 'GL_RGB',
+    0x1908 : 'GL_RGBA',
+    0x1909 : 'GL_LUMINANCE',
+    0x190a : 'GL_LUMINANCE_ALPHA',
+    0x1a00 : 'GL_BITMAP',
+    0x1b00 : 'GL_POINT',
+    0x1b01 : 'GL_LINE',
+    0x1b02 : 'GL_FILL',
+    0x1c00 : 'GL_RENDER',
+    0x1c01 : 'GL_FEEDBACK',
+    0x1c02 : 'GL_SELECT',
+    0x1d00 : 'GL_FLAT',
+    0x1d01 : 'GL_SMOOTH',
+    0x1e00 : 'GL_KEEP',
+    0x1e01 : 'GL_REPLACE',
+    0x1e02 : 'GL_INCR',
+    0x1e03 : 'GL_DECR',
+    0x1f00 : 'GL_VENDOR',
+    0x1f01 : 'GL_RENDERER',
+    0x1f02 : 'GL_VERSION',
+    0x1f03 : 'GL_EXTENSIONS',
+    0x2000 : 'GL_ENABLE_BIT',
+    0x2001 : 'GL_T',
+    0x2002 : 'GL_R',
+    0x2003 : 'GL_Q',
+    0x2100 : 'GL_MODULATE',
+    0x2101 : 'GL_DECAL',
+    0x2200 : 'GL_TEXTURE_ENV_MODE',
+    0x2201 : 'GL_TEXTURE_ENV_COLOR',
+    0x2300 : 'GL_TEXTURE_ENV',
+    0x2400 : 'GL_EYE_LINEAR',
+    0x2401 : 'GL_OBJECT_LINEAR',
+    0x2402 : 'GL_SPHERE_MAP',
+    0x2500 : 'GL_TEXTURE_GEN_MODE',
+    0x2501 : 'GL_OBJECT_PLANE',
+    0x2502 : 'GL_EYE_PLANE',
+    0x2600 : 'GL_NEAREST',
+    0x2601 : 'GL_LINEAR',
+    0x2700 : 'GL_NEAREST_MIPMAP_NEAREST',
+    0x2701 : 'GL_LINEAR_MIPMAP_NEAREST',
+    0x2702 : 'GL_NEAREST_MIPMAP_LINEAR',
+    0x2703 : 'GL_LINEAR_MIPMAP_LINEAR',
+    0x2800 : 'GL_TEXTURE_MAG_FILTER',
+    0x2801 : 'GL_TEXTURE_MIN_FILTER',
+    0x2802 : 'GL_TEXTURE_WRAP_S',
+    0x2803 : 'GL_TEXTURE_WRAP_T',
+    0x2900 : 'GL_CLAMP',
+    0x2901 : 'GL_REPEAT',
+    0x2a00 : 'GL_POLYGON_OFFSET_UNITS',
+    0x2a01 : 'GL_POLYGON_OFFSET_POINT',
+    0x2a02 : 'GL_POLYGON_OFFSET_LINE',
+    0x2a10 : 'GL_R3_G3_B2',
+    0x2a20 : 'GL_V2F',
+    0x2a21 : 'GL_V3F',
+    0x2a22 : 'GL_C4UB_V2F',
+    0x2a23 : 'GL_C4UB_V3F',
+    0x2a24 : 'GL_C3F_V3F',
+    0x2a25 : 'GL_N3F_V3F',
+    0x2a26 : 'GL_C4F_N3F_V3F',
+    0x2a27 : 'GL_T2F_V3F',
+    0x2a28 : 'GL_T4F_V4F',
+    0x2a29 : 'GL_T2F_C4UB_V3F',
+    0x2a2a : 'GL_T2F_C3F_V3F',
+    0x2a2b : 'GL_T2F_N3F_V3F',
+    0x2a2c : 'GL_T2F_C4F_N3F_V3F',
+    0x2a2d : 'GL_T4F_C4F_N3F_V4F',
+    0x3000 : 'GL_CLIP_PLANE0',
+    0x3001 : 'GL_CLIP_PLANE1',
+    0x3002 : 'GL_CLIP_PLANE2',
+    0x3003 : 'GL_CLIP_PLANE3',
+    0x3004 : 'GL_CLIP_PLANE4',
+    0x3005 : 'GL_CLIP_PLANE5',
+    0x3006 : 'GL_CLIP_DISTANCE6',
+    0x3007 : 'GL_CLIP_DISTANCE7',
+    0x4000 : 'GL_COLOR_BUFFER_BIT',
+    0x4001 : 'GL_LIGHT1',
+    0x4002 : 'GL_LIGHT2',
+    0x4003 : 'GL_LIGHT3',
+    0x4004 : 'GL_LIGHT4',
+    0x4005 : 'GL_LIGHT5',
+    0x4006 : 'GL_LIGHT6',
+    0x4007 : 'GL_LIGHT7',
+    0x8000 : 'GL_HINT_BIT',
+    0x8001 : 'GL_CONSTANT_COLOR',
+    0x8002 : 'GL_ONE_MINUS_CONSTANT_COLOR',
+    0x8003 : 'GL_CONSTANT_ALPHA',
+    0x8004 : 'GL_ONE_MINUS_CONSTANT_ALPHA',
+    0x8005 : 'GL_BLEND_COLOR',
+    0x8006 : 'GL_FUNC_ADD',
+    0x8007 : 'GL_MIN',
+    0x8008 : 'GL_MAX',
+    0x8009 : 'GL_BLEND_EQUATION',
+    0x800a : 'GL_FUNC_SUBTRACT',
+    0x800b : 'GL_FUNC_REVERSE_SUBTRACT',
+    0x800c : 'GL_CMYK_EXT',
+    0x800d : 'GL_CMYKA_EXT',
+    0x800e : 'GL_PACK_CMYK_HINT_EXT',
+    0x800f : 'GL_UNPACK_CMYK_HINT_EXT',
+    0x8010 : 'GL_CONVOLUTION_1D',
+    0x8011 : 'GL_CONVOLUTION_2D',
+    0x8012 : 'GL_SEPARABLE_2D',
+    0x8013 : 'GL_CONVOLUTION_BORDER_MODE',
+    0x8014 : 'GL_CONVOLUTION_FILTER_SCALE',
+    0x8015 : 'GL_CONVOLUTION_FILTER_BIAS',
+    0x8016 : 'GL_REDUCE',
+    0x8017 : 'GL_CONVOLUTION_FORMAT',
+    0x8018 : 'GL_CONVOLUTION_WIDTH',
+    0x8019 : 'GL_CONVOLUTION_HEIGHT',
+    0x801a : 'GL_MAX_CONVOLUTION_WIDTH',
+    0x801b : 'GL_MAX_CONVOLUTION_HEIGHT',
+    0x801c : 'GL_POST_CONVOLUTION_RED_SCALE',
+    0x801d : 'GL_POST_CONVOLUTION_GREEN_SCALE',
+    0x801e : 'GL_POST_CONVOLUTION_BLUE_SCALE',
+    0x801f : 'GL_POST_CONVOLUTION_ALPHA_SCALE',
+    0x8020 : 'GL_POST_CONVOLUTION_RED_BIAS',
+    0x8021 : 'GL_POST_CONVOLUTION_GREEN_BIAS',
+    0x8022 : 'GL_POST_CONVOLUTION_BLUE_BIAS',
+    0x8023 : 'GL_POST_CONVOLUTION_ALPHA_BIAS',
+    0x8024 : 'GL_HISTOGRAM',
+    0x8025 : 'GL_PROXY_HISTOGRAM',
+    0x8026 : 'GL_HISTOGRAM_WIDTH',
+    0x8027 : 'GL_HISTOGRAM_FORMAT',
+    0x8028 : 'GL_HISTOGRAM_RED_SIZE',
+    0x8029 : 'GL_HISTOGRAM_GREEN_SIZE',
+    0x802a : 'GL_HISTOGRAM_BLUE_SIZE',
+    0x802b : 'GL_HISTOGRAM_ALPHA_SIZE',
+    0x802c : 'GL_HISTOGRAM_LUMINANCE_SIZE',
+    0x802d : 'GL_HISTOGRAM_SINK',
+    0x802e : 'GL_MINMAX',
+    0x802f : 'GL_MINMAX_FORMAT',
+    0x8030 : 'GL_MINMAX_SINK',
+    0x8031 : 'GL_TABLE_TOO_LARGE_EXT',
+    0x8032 : 'GL_UNSIGNED_BYTE_3_3_2',
+    0x8033 : 'GL_UNSIGNED_SHORT_4_4_4_4',
+    0x8034 : 'GL_UNSIGNED_SHORT_5_5_5_1',
+    0x8035 : 'GL_UNSIGNED_INT_8_8_8_8',
+    0x8036 : 'GL_UNSIGNED_INT_10_10_10_2',
+    0x8037 : 'GL_POLYGON_OFFSET_EXT',
+    0x8038 : 'GL_POLYGON_OFFSET_FACTOR',
+    0x8039 : 'GL_POLYGON_OFFSET_BIAS_EXT',
+    0x803a : 'GL_RESCALE_NORMAL',
+    0x803b : 'GL_ALPHA4',
+    0x803c : 'GL_ALPHA8',
+    0x803d : 'GL_ALPHA12',
+    0x803e : 'GL_ALPHA16',
+    0x803f : 'GL_LUMINANCE4',
+    0x8040 : 'GL_LUMINANCE8',
+    0x8041 : 'GL_LUMINANCE12',
+    0x8042 : 'GL_LUMINANCE16',
+    0x8043 : 'GL_LUMINANCE4_ALPHA4',
+    0x8044 : 'GL_LUMINANCE6_ALPHA2',
+    0x8045 : 'GL_LUMINANCE8_ALPHA8',
+    0x8046 : 'GL_LUMINANCE12_ALPHA4',
+    0x8047 : 'GL_LUMINANCE12_ALPHA12',
+    0x8048 : 'GL_LUMINANCE16_ALPHA16',
+    0x8049 : 'GL_INTENSITY',
+    0x804a : 'GL_INTENSITY4',
+    0x804b : 'GL_INTENSITY8',
+    0x804c : 'GL_INTENSITY12',
+    0x804d : 'GL_INTENSITY16',
+    0x804e : 'GL_RGB2_EXT',
+    0x804f : 'GL_RGB4',
+    0x8050 : 'GL_RGB5',
+    0x8051 : 'GL_RGB8',
+    0x8052 : 'GL_RGB10',
+    0x8053 : 'GL_RGB12',
+    0x8054 : 'GL_RGB16',
+    0x8055 : 'GL_RGBA2',
+    0x8056 : 'GL_RGBA4',
+    0x8057 : 'GL_RGB5_A1',
+    0x8058 : 'GL_RGBA8',
+    0x8059 : 'GL_RGB10_A2',
+    0x805a : 'GL_RGBA12',
+    0x805b : 'GL_RGBA16',
+    0x805c : 'GL_TEXTURE_RED_SIZE',
+    0x805d : 'GL_TEXTURE_GREEN_SIZE',
+    0x805e : 'GL_TEXTURE_BLUE_SIZE',
+    0x805f : 'GL_TEXTURE_ALPHA_SIZE',
+    0x8060 : 'GL_TEXTURE_LUMINANCE_SIZE',
+    0x8061 : 'GL_TEXTURE_INTENSITY_SIZE',
+    0x8062 : 'GL_REPLACE_EXT',
+    0x8063 : 'GL_PROXY_TEXTURE_1D',
+    0x8064 : 'GL_PROXY_TEXTURE_2D',
+    0x8065 : 'GL_TEXTURE_TOO_LARGE_EXT',
+    0x8066 : 'GL_TEXTURE_PRIORITY',
+    0x8067 : 'GL_TEXTURE_RESIDENT',
+    0x8068 : 'GL_TEXTURE_1D_BINDING_EXT',
+    0x8069 : 'GL_TEXTURE_2D_BINDING_EXT',
+    0x806a : 'GL_TEXTURE_3D_BINDING_EXT',
+    0x806b : 'GL_PACK_SKIP_IMAGES',
+    0x806c : 'GL_PACK_IMAGE_HEIGHT',
+    0x806d : 'GL_UNPACK_SKIP_IMAGES',
+    0x806e : 'GL_UNPACK_IMAGE_HEIGHT',
+    0x806f : 'GL_TEXTURE_3D',
+    0x8070 : 'GL_PROXY_TEXTURE_3D',
+    0x8071 : 'GL_TEXTURE_DEPTH',
+    0x8072 : 'GL_TEXTURE_WRAP_R',
+    0x8073 : 'GL_MAX_3D_TEXTURE_SIZE',
+    0x8074 : 'GL_VERTEX_ARRAY',
+    0x8075 : 'GL_NORMAL_ARRAY',
+    0x8076 : 'GL_COLOR_ARRAY',
+    0x8077 : 'GL_INDEX_ARRAY',
+    0x8078 : 'GL_TEXTURE_COORD_ARRAY',
+    0x8079 : 'GL_EDGE_FLAG_ARRAY',
+    0x807a : 'GL_VERTEX_ARRAY_SIZE',
+    0x807b : 'GL_VERTEX_ARRAY_TYPE',
+    0x807c : 'GL_VERTEX_ARRAY_STRIDE',
+    0x807d : 'GL_VERTEX_ARRAY_COUNT_EXT',
+    0x807e : 'GL_NORMAL_ARRAY_TYPE',
+    0x807f : 'GL_NORMAL_ARRAY_STRIDE',
+    0x8080 : 'GL_NORMAL_ARRAY_COUNT_EXT',
+    0x8081 : 'GL_COLOR_ARRAY_SIZE',
+    0x8082 : 'GL_COLOR_ARRAY_TYPE',
+    0x8083 : 'GL_COLOR_ARRAY_STRIDE',
+    0x8084 : 'GL_COLOR_ARRAY_COUNT_EXT',
+    0x8085 : 'GL_INDEX_ARRAY_TYPE',
+    0x8086 : 'GL_INDEX_ARRAY_STRIDE',
+    0x8087 : 'GL_INDEX_ARRAY_COUNT_EXT',
+    0x8088 : 'GL_TEXTURE_COORD_ARRAY_SIZE',
+    0x8089 : 'GL_TEXTURE_COORD_ARRAY_TYPE',
+    0x808a : 'GL_TEXTURE_COORD_ARRAY_STRIDE',
+    0x808b : 'GL_TEXTURE_COORD_ARRAY_COUNT_EXT',
+    0x808c : 'GL_EDGE_FLAG_ARRAY_STRIDE',
+    0x808d : 'GL_EDGE_FLAG_ARRAY_COUNT_EXT',
+    0x808e : 'GL_VERTEX_ARRAY_POINTER',
+    0x808f : 'GL_NORMAL_ARRAY_POINTER',
+    0x8090 : 'GL_COLOR_ARRAY_POINTER',
+    0x8091 : 'GL_INDEX_ARRAY_POINTER',
+    0x8092 : 'GL_TEXTURE_COORD_ARRAY_POINTER',
+    0x8093 : 'GL_EDGE_FLAG_ARRAY_POINTER',
+    0x8094 : 'GL_INTERLACE_SGIX',
+    0x8095 : 'GL_DETAIL_TEXTURE_2D_SGIS',
+    0x8096 : 'GL_DETAIL_TEXTURE_2D_BINDING_SGIS',
+    0x8097 : 'GL_LINEAR_DETAIL_SGIS',
+    0x8098 : 'GL_LINEAR_DETAIL_ALPHA_SGIS',
+    0x8099 : 'GL_LINEAR_DETAIL_COLOR_SGIS',
+    0x809a : 'GL_DETAIL_TEXTURE_LEVEL_SGIS',
+    0x809b : 'GL_DETAIL_TEXTURE_MODE_SGIS',
+    0x809c : 'GL_DETAIL_TEXTURE_FUNC_POINTS_SGIS',
+    0x809d : 'GL_MULTISAMPLE',
+    0x809e : 'GL_SAMPLE_ALPHA_TO_COVERAGE',
+    0x809f : 'GL_SAMPLE_ALPHA_TO_ONE',
+    0x80a0 : 'GL_SAMPLE_COVERAGE',
+    0x80a1 : 'GL_1PASS_EXT',
+    0x80a2 : 'GL_2PASS_0_EXT',
+    0x80a3 : 'GL_2PASS_1_EXT',
+    0x80a4 : 'GL_4PASS_0_EXT',
+    0x80a5 : 'GL_4PASS_1_EXT',
+    0x80a6 : 'GL_4PASS_2_EXT',
+    0x80a7 : 'GL_4PASS_3_EXT',
+    0x80a8 : 'GL_SAMPLE_BUFFERS',
+    0x80a9 : 'GL_SAMPLES',
+    0x80aa : 'GL_SAMPLE_COVERAGE_VALUE',
+    0x80ab : 'GL_SAMPLE_COVERAGE_INVERT',
+    0x80ac : 'GL_SAMPLE_PATTERN_EXT',
+    0x80ad : 'GL_LINEAR_SHARPEN_SGIS',
+    0x80ae : 'GL_LINEAR_SHARPEN_ALPHA_SGIS',
+    0x80af : 'GL_LINEAR_SHARPEN_COLOR_SGIS',
+    0x80b0 : 'GL_SHARPEN_TEXTURE_FUNC_POINTS_SGIS',
+    0x80b1 : 'GL_COLOR_MATRIX',
+    0x80b2 : 'GL_COLOR_MATRIX_STACK_DEPTH',
+    0x80b3 : 'GL_MAX_COLOR_MATRIX_STACK_DEPTH',
+    0x80b4 : 'GL_POST_COLOR_MATRIX_RED_SCALE',
+    0x80b5 : 'GL_POST_COLOR_MATRIX_GREEN_SCALE',
+    0x80b6 : 'GL_POST_COLOR_MATRIX_BLUE_SCALE',
+    0x80b7 : 'GL_POST_COLOR_MATRIX_ALPHA_SCALE',
+    0x80b8 : 'GL_POST_COLOR_MATRIX_RED_BIAS',
+    0x80b9 : 'GL_POST_COLOR_MATRIX_GREEN_BIAS',
+    0x80ba : 'GL_POST_COLOR_MATRIX_BLUE_BIAS',
+    0x80bb : 'GL_POST_COLOR_MATRIX_ALPHA_BIAS',
+    0x80bc : 'GL_TEXTURE_COLOR_TABLE_SGI',
+    0x80bd : 'GL_PROXY_TEXTURE_COLOR_TABLE_SGI',
+    0x80be : 'GL_TEXTURE_ENV_BIAS_SGIX',
+    0x80bf : 'GL_SHADOW_AMBIENT_SGIX',
+    0x80c8 : 'GL_BLEND_DST_RGB',
+    0x80c9 : 'GL_BLEND_SRC_RGB',
+    0x80ca : 'GL_BLEND_DST_ALPHA',
+    0x80cb : 'GL_BLEND_SRC_ALPHA',
+    0x80cc : 'GL_422_EXT',
+    0x80cd : 'GL_422_REV_EXT',
+    0x80ce : 'GL_422_AVERAGE_EXT',
+    0x80cf : 'GL_422_REV_AVERAGE_EXT',
+    0x80d0 : 'GL_COLOR_TABLE',
+    0x80d1 : 'GL_POST_CONVOLUTION_COLOR_TABLE',
+    0x80d2 : 'GL_POST_COLOR_MATRIX_COLOR_TABLE',
+    0x80d3 : 'GL_PROXY_COLOR_TABLE',
+    0x80d4 : 'GL_PROXY_POST_CONVOLUTION_COLOR_TABLE',
+    0x80d5 : 'GL_PROXY_POST_COLOR_MATRIX_COLOR_TABLE',
+    0x80d6 : 'GL_COLOR_TABLE_SCALE',
+    0x80d7 : 'GL_COLOR_TABLE_BIAS',
+    0x80d8 : 'GL_COLOR_TABLE_FORMAT',
+    0x80d9 : 'GL_COLOR_TABLE_WIDTH',
+    0x80da : 'GL_COLOR_TABLE_RED_SIZE',
+    0x80db : 'GL_COLOR_TABLE_GREEN_SIZE',
+    0x80dc : 'GL_COLOR_TABLE_BLUE_SIZE',
+    0x80dd : 'GL_COLOR_TABLE_ALPHA_SIZE',
+    0x80de : 'GL_COLOR_TABLE_LUMINANCE_SIZE',
+    0x80df : 'GL_COLOR_TABLE_INTENSITY_SIZE',
+    0x80e0 : 'GL_BGR',
+    0x80e1 : 'GL_BGRA',
+    0x80e2 : 'GL_COLOR_INDEX1_EXT',
+    0x80e3 : 'GL_COLOR_INDEX2_EXT',
+    0x80e4 : 'GL_COLOR_INDEX4_EXT',
+    0x80e5 : 'GL_COLOR_INDEX8_EXT',
+    0x80e6 : 'GL_COLOR_INDEX12_EXT',
+    0x80e7 : 'GL_COLOR_INDEX16_EXT',
+    0x80e8 : 'GL_MAX_ELEMENTS_VERTICES',
+    0x80e9 : 'GL_MAX_ELEMENTS_INDICES',
+    0x80ea : 'GL_PHONG_WIN',
+    0x80eb : 'GL_PHONG_HINT_WIN',
+    0x80ec : 'GL_FOG_SPECULAR_TEXTURE_WIN',
+    0x80ed : 'GL_TEXTURE_INDEX_SIZE_EXT',
+    0x80ee : 'GL_PARAMETER_BUFFER_ARB',
+    0x80ef : 'GL_PARAMETER_BUFFER_BINDING_ARB',
+    0x80f0 : 'GL_CLIP_VOLUME_CLIPPING_HINT_EXT',
+    0x8110 : 'GL_DUAL_ALPHA4_SGIS',
+    0x8111 : 'GL_DUAL_ALPHA8_SGIS',
+    0x8112 : 'GL_DUAL_ALPHA12_SGIS',
+    0x8113 : 'GL_DUAL_ALPHA16_SGIS',
+    0x8114 : 'GL_DUAL_LUMINANCE4_SGIS',
+    0x8115 : 'GL_DUAL_LUMINANCE8_SGIS',
+    0x8116 : 'GL_DUAL_LUMINANCE12_SGIS',
+    0x8117 : 'GL_DUAL_LUMINANCE16_SGIS',
+    0x8118 : 'GL_DUAL_INTENSITY4_SGIS',
+    0x8119 : 'GL_DUAL_INTENSITY8_SGIS',
+    0x811a : 'GL_DUAL_INTENSITY12_SGIS',
+    0x811b : 'GL_DUAL_INTENSITY16_SGIS',
+    0x811c : 'GL_DUAL_LUMINANCE_ALPHA4_SGIS',
+    0x811d : 'GL_DUAL_LUMINANCE_ALPHA8_SGIS',
+    0x811e : 'GL_QUAD_ALPHA4_SGIS',
+    0x811f : 'GL_QUAD_ALPHA8_SGIS',
+    0x8120 : 'GL_QUAD_LUMINANCE4_SGIS',
+    0x8121 : 'GL_QUAD_LUMINANCE8_SGIS',
+    0x8122 : 'GL_QUAD_INTENSITY4_SGIS',
+    0x8123 : 'GL_QUAD_INTENSITY8_SGIS',
+    0x8124 : 'GL_DUAL_TEXTURE_SELECT_SGIS',
+    0x8125 : 'GL_QUAD_TEXTURE_SELECT_SGIS',
+    0x8126 : 'GL_POINT_SIZE_MIN',
+    0x8127 : 'GL_POINT_SIZE_MAX',
+    0x8128 : 'GL_POINT_FADE_THRESHOLD_SIZE',
+    0x8129 : 'GL_DISTANCE_ATTENUATION_EXT',
+    0x812a : 'GL_FOG_FUNC_SGIS',
+    0x812b : 'GL_FOG_FUNC_POINTS_SGIS',
+    0x812c : 'GL_MAX_FOG_FUNC_POINTS_SGIS',
+    0x812d : 'GL_CLAMP_TO_BORDER',
+    0x812e : 'GL_TEXTURE_MULTI_BUFFER_HINT_SGIX',
+    0x812f : 'GL_CLAMP_TO_EDGE',
+    0x8130 : 'GL_PACK_SKIP_VOLUMES_SGIS',
+    0x8131 : 'GL_PACK_IMAGE_DEPTH_SGIS',
+    0x8132 : 'GL_UNPACK_SKIP_VOLUMES_SGIS',
+    0x8133 : 'GL_UNPACK_IMAGE_DEPTH_SGIS',
+    0x8134 : 'GL_TEXTURE_4D_SGIS',
+    0x8135 : 'GL_PROXY_TEXTURE_4D_SGIS',
+    0x8136 : 'GL_TEXTURE_4DSIZE_SGIS',
+    0x8137 : 'GL_TEXTURE_WRAP_Q_SGIS',
+    0x8138 : 'GL_MAX_4D_TEXTURE_SIZE_SGIS',
+    0x8139 : 'GL_PIXEL_TEX_GEN_SGIX',
+    0x813a : 'GL_TEXTURE_MIN_LOD',
+    0x813b : 'GL_TEXTURE_MAX_LOD',
+    0x813c : 'GL_TEXTURE_BASE_LEVEL',
+    0x813d : 'GL_TEXTURE_MAX_LEVEL',
+    0x813e : 'GL_PIXEL_TILE_BEST_ALIGNMENT_SGIX',
+    0x813f : 'GL_PIXEL_TILE_CACHE_INCREMENT_SGIX',
+    0x8140 : 'GL_PIXEL_TILE_WIDTH_SGIX',
+    0x8141 : 'GL_PIXEL_TILE_HEIGHT_SGIX',
+    0x8142 : 'GL_PIXEL_TILE_GRID_WIDTH_SGIX',
+    0x8143 : 'GL_PIXEL_TILE_GRID_HEIGHT_SGIX',
+    0x8144 : 'GL_PIXEL_TILE_GRID_DEPTH_SGIX',
+    0x8145 : 'GL_PIXEL_TILE_CACHE_SIZE_SGIX',
+    0x8146 : 'GL_FILTER4_SGIS',
+    0x8147 : 'GL_TEXTURE_FILTER4_SIZE_SGIS',
+    0x8148 : 'GL_SPRITE_SGIX',
+    0x8149 : 'GL_SPRITE_MODE_SGIX',
+    0x814a : 'GL_SPRITE_AXIS_SGIX',
+    0x814b : 'GL_SPRITE_TRANSLATION_SGIX',
+    0x814c : 'GL_SPRITE_AXIAL_SGIX',
+    0x814d : 'GL_SPRITE_OBJECT_ALIGNED_SGIX',
+    0x814e : 'GL_SPRITE_EYE_ALIGNED_SGIX',
+    0x814f : 'GL_TEXTURE_4D_BINDING_SGIS',
+    0x8150 : 'GL_IGNORE_BORDER_HP',
+    0x8151 : 'GL_CONSTANT_BORDER',
+    0x8153 : 'GL_REPLICATE_BORDER',
+    0x8154 : 'GL_CONVOLUTION_BORDER_COLOR',
+    0x8155 : 'GL_IMAGE_SCALE_X_HP',
+    0x8156 : 'GL_IMAGE_SCALE_Y_HP',
+    0x8157 : 'GL_IMAGE_TRANSLATE_X_HP',
+    0x8158 : 'GL_IMAGE_TRANSLATE_Y_HP',
+    0x8159 : 'GL_IMAGE_ROTATE_ANGLE_HP',
+    0x815a : 'GL_IMAGE_ROTATE_ORIGIN_X_HP',
+    0x815b : 'GL_IMAGE_ROTATE_ORIGIN_Y_HP',
+    0x815c : 'GL_IMAGE_MAG_FILTER_HP',
+    0x815d : 'GL_IMAGE_MIN_FILTER_HP',
+    0x815e : 'GL_IMAGE_CUBIC_WEIGHT_HP',
+    0x815f : 'GL_CUBIC_HP',
+    0x8160 : 'GL_AVERAGE_HP',
+    0x8161 : 'GL_IMAGE_TRANSFORM_2D_HP',
+    0x8162 : 'GL_POST_IMAGE_TRANSFORM_COLOR_TABLE_HP',
+    0x8163 : 'GL_PROXY_POST_IMAGE_TRANSFORM_COLOR_TABLE_HP',
+    0x8165 : 'GL_OCCLUSION_TEST_HP',
+    0x8166 : 'GL_OCCLUSION_TEST_RESULT_HP',
+    0x8167 : 'GL_TEXTURE_LIGHTING_MODE_HP',
+    0x8168 : 'GL_TEXTURE_POST_SPECULAR_HP',
+    0x8169 : 'GL_TEXTURE_PRE_SPECULAR_HP',
+    0x8170 : 'GL_LINEAR_CLIPMAP_LINEAR_SGIX',
+    0x8171 : 'GL_TEXTURE_CLIPMAP_CENTER_SGIX',
+    0x8172 : 'GL_TEXTURE_CLIPMAP_FRAME_SGIX',
+    0x8173 : 'GL_TEXTURE_CLIPMAP_OFFSET_SGIX',
+    0x8174 : 'GL_TEXTURE_CLIPMAP_VIRTUAL_DEPTH_SGIX',
+    0x8175 : 'GL_TEXTURE_CLIPMAP_LOD_OFFSET_SGIX',
+    0x8176 : 'GL_TEXTURE_CLIPMAP_DEPTH_SGIX',
+    0x8177 : 'GL_MAX_CLIPMAP_DEPTH_SGIX',
+    0x8178 : 'GL_MAX_CLIPMAP_VIRTUAL_DEPTH_SGIX',
+    0x8179 : 'GL_POST_TEXTURE_FILTER_BIAS_SGIX',
+    0x817a : 'GL_POST_TEXTURE_FILTER_SCALE_SGIX',
+    0x817b : 'GL_POST_TEXTURE_FILTER_BIAS_RANGE_SGIX',
+    0x817c : 'GL_POST_TEXTURE_FILTER_SCALE_RANGE_SGIX',
+    0x817d : 'GL_REFERENCE_PLANE_SGIX',
+    0x817e : 'GL_REFERENCE_PLANE_EQUATION_SGIX',
+    0x817f : 'GL_IR_INSTRUMENT1_SGIX',
+    0x8180 : 'GL_INSTRUMENT_BUFFER_POINTER_SGIX',
+    0x8181 : 'GL_INSTRUMENT_MEASUREMENTS_SGIX',
+    0x8182 : 'GL_LIST_PRIORITY_SGIX',
+    0x8183 : 'GL_CALLIGRAPHIC_FRAGMENT_SGIX',
+    0x8184 : 'GL_PIXEL_TEX_GEN_Q_CEILING_SGIX',
+    0x8185 : 'GL_PIXEL_TEX_GEN_Q_ROUND_SGIX',
+    0x8186 : 'GL_PIXEL_TEX_GEN_Q_FLOOR_SGIX',
+    0x8187 : 'GL_PIXEL_TEX_GEN_ALPHA_REPLACE_SGIX',
+    0x8188 : 'GL_PIXEL_TEX_GEN_ALPHA_NO_REPLACE_SGIX',
+    0x8189 : 'GL_PIXEL_TEX_GEN_ALPHA_LS_SGIX',
+    0x818a : 'GL_PIXEL_TEX_GEN_ALPHA_MS_SGIX',
+    0x818b : 'GL_FRAMEZOOM_SGIX',
+    0x818c : 'GL_FRAMEZOOM_FACTOR_SGIX',
+    0x818d : 'GL_MAX_FRAMEZOOM_FACTOR_SGIX',
+    0x818e : 'GL_TEXTURE_LOD_BIAS_S_SGIX',
+    0x818f : 'GL_TEXTURE_LOD_BIAS_T_SGIX',
+    0x8190 : 'GL_TEXTURE_LOD_BIAS_R_SGIX',
+    0x8191 : 'GL_GENERATE_MIPMAP',
+    0x8192 : 'GL_GENERATE_MIPMAP_HINT',
+    0x8194 : 'GL_GEOMETRY_DEFORMATION_SGIX',
+    0x8195 : 'GL_TEXTURE_DEFORMATION_SGIX',
+    0x8196 : 'GL_DEFORMATIONS_MASK_SGIX',
+    0x8197 : 'GL_MAX_DEFORMATION_ORDER_SGIX',
+    0x8198 : 'GL_FOG_OFFSET_SGIX',
+    0x8199 : 'GL_FOG_OFFSET_VALUE_SGIX',
+    0x819a : 'GL_TEXTURE_COMPARE_SGIX',
+    0x819b : 'GL_TEXTURE_COMPARE_OPERATOR_SGIX',
+    0x819c : 'GL_TEXTURE_LEQUAL_R_SGIX',
+    0x819d : 'GL_TEXTURE_GEQUAL_R_SGIX',
+    0x81a5 : 'GL_DEPTH_COMPONENT16',
+    0x81a6 : 'GL_DEPTH_COMPONENT24',
+    0x81a7 : 'GL_DEPTH_COMPONENT32',
+    0x81a8 : 'GL_ARRAY_ELEMENT_LOCK_FIRST_EXT',
+    0x81a9 : 'GL_ARRAY_ELEMENT_LOCK_COUNT_EXT',
+    0x81aa : 'GL_CULL_VERTEX_EXT',
+    0x81ab : 'GL_CULL_VERTEX_EYE_POSITION_EXT',
+    0x81ac : 'GL_CULL_VERTEX_OBJECT_POSITION_EXT',
+    0x81ad : 'GL_IUI_V2F_EXT',
+    0x81ae : 'GL_IUI_V3F_EXT',
+    0x81af : 'GL_IUI_N3F_V2F_EXT',
+    0x81b0 : 'GL_IUI_N3F_V3F_EXT',
+    0x81b1 : 'GL_T2F_IUI_V2F_EXT',
+    0x81b2 : 'GL_T2F_IUI_V3F_EXT',
+    0x81b3 : 'GL_T2F_IUI_N3F_V2F_EXT',
+    0x81b4 : 'GL_T2F_IUI_N3F_V3F_EXT',
+    0x81b5 : 'GL_INDEX_TEST_EXT',
+    0x81b6 : 'GL_INDEX_TEST_FUNC_EXT',
+    0x81b7 : 'GL_INDEX_TEST_REF_EXT',
+    0x81b8 : 'GL_INDEX_MATERIAL_EXT',
+    0x81b9 : 'GL_INDEX_MATERIAL_PARAMETER_EXT',
+    0x81ba : 'GL_INDEX_MATERIAL_FACE_EXT',
+    0x81bb : 'GL_YCRCB_422_SGIX',
+    0x81bc : 'GL_YCRCB_444_SGIX',
+    0x81d4 : 'GL_WRAP_BORDER_SUN',
+    0x81d5 : 'GL_UNPACK_CONSTANT_DATA_SUNX',
+    0x81d6 : 'GL_TEXTURE_CONSTANT_DATA_SUNX',
+    0x81d7 : 'GL_TRIANGLE_LIST_SUN',
+    0x81d8 : 'GL_REPLACEMENT_CODE_SUN',
+    0x81d9 : 'GL_GLOBAL_ALPHA_SUN',
+    0x81da : 'GL_GLOBAL_ALPHA_FACTOR_SUN',
+    0x81ef : 'GL_TEXTURE_COLOR_WRITEMASK_SGIS',
+    0x81f0 : 'GL_EYE_DISTANCE_TO_POINT_SGIS',
+    0x81f1 : 'GL_OBJECT_DISTANCE_TO_POINT_SGIS',
+    0x81f2 : 'GL_EYE_DISTANCE_TO_LINE_SGIS',
+    0x81f3 : 'GL_OBJECT_DISTANCE_TO_LINE_SGIS',
+    0x81f4 : 'GL_EYE_POINT_SGIS',
+    0x81f5 : 'GL_OBJECT_POINT_SGIS',
+    0x81f6 : 'GL_EYE_LINE_SGIS',
+    0x81f7 : 'GL_OBJECT_LINE_SGIS',
+    0x81f8 : 'GL_LIGHT_MODEL_COLOR_CONTROL',
+    0x81f9 : 'GL_SINGLE_COLOR',
+    0x81fa : 'GL_SEPARATE_SPECULAR_COLOR',
+    0x81fb : 'GL_SHARED_TEXTURE_PALETTE_EXT',
+    0x8200 : 'GL_TEXT_FRAGMENT_SHADER_ATI',
+    0x8210 : 'GL_FRAMEBUFFER_ATTACHMENT_COLOR_ENCODING',
+    0x8211 : 'GL_FRAMEBUFFER_ATTACHMENT_COMPONENT_TYPE',
+    0x8212 : 'GL_FRAMEBUFFER_ATTACHMENT_RED_SIZE',
+    0x8213 : 'GL_FRAMEBUFFER_ATTACHMENT_GREEN_SIZE',
+    0x8214 : 'GL_FRAMEBUFFER_ATTACHMENT_BLUE_SIZE',
+    0x8215 : 'GL_FRAMEBUFFER_ATTACHMENT_ALPHA_SIZE',
+    0x8216 : 'GL_FRAMEBUFFER_ATTACHMENT_DEPTH_SIZE',
+    0x8217 : 'GL_FRAMEBUFFER_ATTACHMENT_STENCIL_SIZE',
+    0x8218 : 'GL_FRAMEBUFFER_DEFAULT',
+    0x8219 : 'GL_FRAMEBUFFER_UNDEFINED',
+    0x821a : 'GL_DEPTH_STENCIL_ATTACHMENT',
+    0x821b : 'GL_MAJOR_VERSION',
+    0x821c : 'GL_MINOR_VERSION',
+    0x821d : 'GL_NUM_EXTENSIONS',
+    0x821e : 'GL_CONTEXT_FLAGS',
+    0x821f : 'GL_BUFFER_IMMUTABLE_STORAGE',
+    0x8220 : 'GL_BUFFER_STORAGE_FLAGS',
+    0x8221 : 'GL_PRIMITIVE_RESTART_FOR_PATCHES_SUPPORTED',
+    0x8222 : 'GL_INDEX',
+    0x8225 : 'GL_COMPRESSED_RED',
+    0x8226 : 'GL_COMPRESSED_RG',
+    0x8227 : 'GL_RG',
+    0x8228 : 'GL_RG_INTEGER',
+    0x8229 : 'GL_R8',
+    0x822a : 'GL_R16',
+    0x822b : 'GL_RG8',
+    0x822c : 'GL_RG16',
+    0x822d : 'GL_R16F',
+    0x822e : 'GL_R32F',
+    0x822f : 'GL_RG16F',
+    0x8230 : 'GL_RG32F',
+    0x8231 : 'GL_R8I',
+    0x8232 : 'GL_R8UI',
+    0x8233 : 'GL_R16I',
+    0x8234 : 'GL_R16UI',
+    0x8235 : 'GL_R32I',
+    0x8236 : 'GL_R32UI',
+    0x8237 : 'GL_RG8I',
+    0x8238 : 'GL_RG8UI',
+    0x8239 : 'GL_RG16I',
+    0x823a : 'GL_RG16UI',
+    0x823b : 'GL_RG32I',
+    0x823c : 'GL_RG32UI',
+    0x8240 : 'GL_SYNC_CL_EVENT_ARB',
+    0x8241 : 'GL_SYNC_CL_EVENT_COMPLETE_ARB',
+    0x8242 : 'GL_DEBUG_OUTPUT_SYNCHRONOUS',
+    0x8243 : 'GL_DEBUG_NEXT_LOGGED_MESSAGE_LENGTH',
+    0x8244 : 'GL_DEBUG_CALLBACK_FUNCTION',
+    0x8245 : 'GL_DEBUG_CALLBACK_USER_PARAM',
+    0x8246 : 'GL_DEBUG_SOURCE_API',
+    0x8247 : 'GL_DEBUG_SOURCE_WINDOW_SYSTEM',
+    0x8248 : 'GL_DEBUG_SOURCE_SHADER_COMPILER',
+    0x8249 : 'GL_DEBUG_SOURCE_THIRD_PARTY',
+    0x824a : 'GL_DEBUG_SOURCE_APPLICATION',
+    0x824b : 'GL_DEBUG_SOURCE_OTHER',
+    0x824c : 'GL_DEBUG_TYPE_ERROR',
+    0x824d : 'GL_DEBUG_TYPE_DEPRECATED_BEHAVIOR',
+    0x824e : 'GL_DEBUG_TYPE_UNDEFINED_BEHAVIOR',
+    0x824f : 'GL_DEBUG_TYPE_PORTABILITY',
+    0x8250 : 'GL_DEBUG_TYPE_PERFORMANCE',
+    0x8251 : 'GL_DEBUG_TYPE_OTHER',
+    0x8252 : 'GL_LOSE_CONTEXT_ON_RESET_ARB',
+    0x8253 : 'GL_GUILTY_CONTEXT_RESET_ARB',
+    0x8254 : 'GL_INNOCENT_CONTEXT_RESET_ARB',
+    0x8255 : 'GL_UNKNOWN_CONTEXT_RESET_ARB',
+    0x8256 : 'GL_RESET_NOTIFICATION_STRATEGY_ARB',
+    0x8257 : 'GL_PROGRAM_BINARY_RETRIEVABLE_HINT',
+    0x8258 : 'GL_PROGRAM_SEPARABLE',
+    0x8259 : 'GL_ACTIVE_PROGRAM',
+    0x825a : 'GL_PROGRAM_PIPELINE_BINDING',
+    0x825b : 'GL_MAX_VIEWPORTS',
+    0x825c : 'GL_VIEWPORT_SUBPIXEL_BITS',
+    0x825d : 'GL_VIEWPORT_BOUNDS_RANGE',
+    0x825e : 'GL_LAYER_PROVOKING_VERTEX',
+    0x825f : 'GL_VIEWPORT_INDEX_PROVOKING_VERTEX',
+    0x8260 : 'GL_UNDEFINED_VERTEX',
+    0x8261 : 'GL_NO_RESET_NOTIFICATION_ARB',
+    0x8262 : 'GL_MAX_COMPUTE_SHARED_MEMORY_SIZE',
+    0x8263 : 'GL_MAX_COMPUTE_UNIFORM_COMPONENTS',
+    0x8264 : 'GL_MAX_COMPUTE_ATOMIC_COUNTER_BUFFERS',
+    0x8265 : 'GL_MAX_COMPUTE_ATOMIC_COUNTERS',
+    0x8266 : 'GL_MAX_COMBINED_COMPUTE_UNIFORM_COMPONENTS',
+    0x8267 : 'GL_COMPUTE_WORK_GROUP_SIZE',
+    0x8268 : 'GL_DEBUG_TYPE_MARKER',
+    0x8269 : 'GL_DEBUG_TYPE_PUSH_GROUP',
+    0x826a : 'GL_DEBUG_TYPE_POP_GROUP',
+    0x826b : 'GL_DEBUG_SEVERITY_NOTIFICATION',
+    0x826c : 'GL_MAX_DEBUG_GROUP_STACK_DEPTH',
+    0x826d : 'GL_DEBUG_GROUP_STACK_DEPTH',
+    0x826e : 'GL_MAX_UNIFORM_LOCATIONS',
+    0x826f : 'GL_INTERNALFORMAT_SUPPORTED',
+    0x8270 : 'GL_INTERNALFORMAT_PREFERRED',
+    0x8271 : 'GL_INTERNALFORMAT_RED_SIZE',
+    0x8272 : 'GL_INTERNALFORMAT_GREEN_SIZE',
+    0x8273 : 'GL_INTERNALFORMAT_BLUE_SIZE',
+    0x8274 : 'GL_INTERNALFORMAT_ALPHA_SIZE',
+    0x8275 : 'GL_INTERNALFORMAT_DEPTH_SIZE',
+    0x8276 : 'GL_INTERNALFORMAT_STENCIL_SIZE',
+    0x8277 : 'GL_INTERNALFORMAT_SHARED_SIZE',
+    0x8278 : 'GL_INTERNALFORMAT_RED_TYPE',
+    0x8279 : 'GL_INTERNALFORMAT_GREEN_TYPE',
+    0x827a : 'GL_INTERNALFORMAT_BLUE_TYPE',
+    0x827b : 'GL_INTERNALFORMAT_ALPHA_TYPE',
+    0x827c : 'GL_INTERNALFORMAT_DEPTH_TYPE',
+    0x827d : 'GL_INTERNALFORMAT_STENCIL_TYPE',
+    0x827e : 'GL_MAX_WIDTH',
+    0x827f : 'GL_MAX_HEIGHT',
+    0x8280 : 'GL_MAX_DEPTH',
+    0x8281 : 'GL_MAX_LAYERS',
+    0x8282 : 'GL_MAX_COMBINED_DIMENSIONS',
+    0x8283 : 'GL_COLOR_COMPONENTS',
+    0x8284 : 'GL_DEPTH_COMPONENTS',
+    0x8285 : 'GL_STENCIL_COMPONENTS',
+    0x8286 : 'GL_COLOR_RENDERABLE',
+    0x8287 : 'GL_DEPTH_RENDERABLE',
+    0x8288 : 'GL_STENCIL_RENDERABLE',
+    0x8289 : 'GL_FRAMEBUFFER_RENDERABLE',
+    0x828a : 'GL_FRAMEBUFFER_RENDERABLE_LAYERED',
+    0x828b : 'GL_FRAMEBUFFER_BLEND',
+    0x828c : 'GL_READ_PIXELS',
+    0x828d : 'GL_READ_PIXELS_FORMAT',
+    0x828e : 'GL_READ_PIXELS_TYPE',
+    0x828f : 'GL_TEXTURE_IMAGE_FORMAT',
+    0x8290 : 'GL_TEXTURE_IMAGE_TYPE',
+    0x8291 : 'GL_GET_TEXTURE_IMAGE_FORMAT',
+    0x8292 : 'GL_GET_TEXTURE_IMAGE_TYPE',
+    0x8293 : 'GL_MIPMAP',
+    0x8294 : 'GL_MANUAL_GENERATE_MIPMAP',
+    0x8295 : 'GL_AUTO_GENERATE_MIPMAP',
+    0x8296 : 'GL_COLOR_ENCODING',
+    0x8297 : 'GL_SRGB_READ',
+    0x8298 : 'GL_SRGB_WRITE',
+    0x8299 : 'GL_SRGB_DECODE_ARB',
+    0x829a : 'GL_FILTER',
+    0x829b : 'GL_VERTEX_TEXTURE',
+    0x829c : 'GL_TESS_CONTROL_TEXTURE',
+    0x829d : 'GL_TESS_EVALUATION_TEXTURE',
+    0x829e : 'GL_GEOMETRY_TEXTURE',
+    0x829f : 'GL_FRAGMENT_TEXTURE',
+    0x82a0 : 'GL_COMPUTE_TEXTURE',
+    0x82a1 : 'GL_TEXTURE_SHADOW',
+    0x82a2 : 'GL_TEXTURE_GATHER',
+    0x82a3 : 'GL_TEXTURE_GATHER_SHADOW',
+    0x82a4 : 'GL_SHADER_IMAGE_LOAD',
+    0x82a5 : 'GL_SHADER_IMAGE_STORE',
+    0x82a6 : 'GL_SHADER_IMAGE_ATOMIC',
+    0x82a7 : 'GL_IMAGE_TEXEL_SIZE',
+    0x82a8 : 'GL_IMAGE_COMPATIBILITY_CLASS',
+    0x82a9 : 'GL_IMAGE_PIXEL_FORMAT',
+    0x82aa : 'GL_IMAGE_PIXEL_TYPE',
+    0x82ac : 'GL_SIMULTANEOUS_TEXTURE_AND_DEPTH_TEST',
+    0x82ad : 'GL_SIMULTANEOUS_TEXTURE_AND_STENCIL_TEST',
+    0x82ae : 'GL_SIMULTANEOUS_TEXTURE_AND_DEPTH_WRITE',
+    0x82af : 'GL_SIMULTANEOUS_TEXTURE_AND_STENCIL_WRITE',
+    0x82b1 : 'GL_TEXTURE_COMPRESSED_BLOCK_WIDTH',
+    0x82b2 : 'GL_TEXTURE_COMPRESSED_BLOCK_HEIGHT',
+    0x82b3 : 'GL_TEXTURE_COMPRESSED_BLOCK_SIZE',
+    0x82b4 : 'GL_CLEAR_BUFFER',
+    0x82b5 : 'GL_TEXTURE_VIEW',
+    0x82b6 : 'GL_VIEW_COMPATIBILITY_CLASS',
+    0x82b7 : 'GL_FULL_SUPPORT',
+    0x82b8 : 'GL_CAVEAT_SUPPORT',
+    0x82b9 : 'GL_IMAGE_CLASS_4_X_32',
+    0x82ba : 'GL_IMAGE_CLASS_2_X_32',
+    0x82bb : 'GL_IMAGE_CLASS_1_X_32',
+    0x82bc : 'GL_IMAGE_CLASS_4_X_16',
+    0x82bd : 'GL_IMAGE_CLASS_2_X_16',
+    0x82be : 'GL_IMAGE_CLASS_1_X_16',
+    0x82bf : 'GL_IMAGE_CLASS_4_X_8',
+    0x82c0 : 'GL_IMAGE_CLASS_2_X_8',
+    0x82c1 : 'GL_IMAGE_CLASS_1_X_8',
+    0x82c2 : 'GL_IMAGE_CLASS_11_11_10',
+    0x82c3 : 'GL_IMAGE_CLASS_10_10_10_2',
+    0x82c4 : 'GL_VIEW_CLASS_128_BITS',
+    0x82c5 : 'GL_VIEW_CLASS_96_BITS',
+    0x82c6 : 'GL_VIEW_CLASS_64_BITS',
+    0x82c7 : 'GL_VIEW_CLASS_48_BITS',
+    0x82c8 : 'GL_VIEW_CLASS_32_BITS',
+    0x82c9 : 'GL_VIEW_CLASS_24_BITS',
+    0x82ca : 'GL_VIEW_CLASS_16_BITS',
+    0x82cb : 'GL_VIEW_CLASS_8_BITS',
+    0x82cc : 'GL_VIEW_CLASS_S3TC_DXT1_RGB',
+    0x82cd : 'GL_VIEW_CLASS_S3TC_DXT1_RGBA',
+    0x82ce : 'GL_VIEW_CLASS_S3TC_DXT3_RGBA',
+    0x82cf : 'GL_VIEW_CLASS_S3TC_DXT5_RGBA',
+    0x82d0 : 'GL_VIEW_CLASS_RGTC1_RED',
+    0x82d1 : 'GL_VIEW_CLASS_RGTC2_RG',
+    0x82d2 : 'GL_VIEW_CLASS_BPTC_UNORM',
+    0x82d3 : 'GL_VIEW_CLASS_BPTC_FLOAT',
+    0x82d4 : 'GL_VERTEX_ATTRIB_BINDING',
+    0x82d5 : 'GL_VERTEX_ATTRIB_RELATIVE_OFFSET',
+    0x82d6 : 'GL_VERTEX_BINDING_DIVISOR',
+    0x82d7 : 'GL_VERTEX_BINDING_OFFSET',
+    0x82d8 : 'GL_VERTEX_BINDING_STRIDE',
+    0x82d9 : 'GL_MAX_VERTEX_ATTRIB_RELATIVE_OFFSET',
+    0x82da : 'GL_MAX_VERTEX_ATTRIB_BINDINGS',
+    0x82db : 'GL_TEXTURE_VIEW_MIN_LEVEL',
+    0x82dc : 'GL_TEXTURE_VIEW_NUM_LEVELS',
+    0x82dd : 'GL_TEXTURE_VIEW_MIN_LAYER',
+    0x82de : 'GL_TEXTURE_VIEW_NUM_LAYERS',
+    0x82df : 'GL_TEXTURE_IMMUTABLE_LEVELS',
+    0x82e0 : 'GL_BUFFER',
+    0x82e1 : 'GL_SHADER',
+    0x82e2 : 'GL_PROGRAM',
+    0x82e3 : 'GL_QUERY',
+    0x82e4 : 'GL_PROGRAM_PIPELINE',
+    0x82e5 : 'GL_MAX_VERTEX_ATTRIB_STRIDE',
+    0x82e6 : 'GL_SAMPLER',
+    0x82e7 : 'GL_DISPLAY_LIST',
+    0x82e8 : 'GL_MAX_LABEL_LENGTH',
+    0x82e9 : 'GL_NUM_SHADING_LANGUAGE_VERSIONS',
+    0x8310 : 'GL_DEPTH_PASS_INSTRUMENT_SGIX',
+    0x8311 : 'GL_DEPTH_PASS_INSTRUMENT_COUNTERS_SGIX',
+    0x8312 : 'GL_DEPTH_PASS_INSTRUMENT_MAX_SGIX',
+    0x8313 : 'GL_FRAGMENTS_INSTRUMENT_SGIX',
+    0x8314 : 'GL_FRAGMENTS_INSTRUMENT_COUNTERS_SGIX',
+    0x8315 : 'GL_FRAGMENTS_INSTRUMENT_MAX_SGIX',
+    0x8316 : 'GL_CONVOLUTION_HINT_SGIX',
+    0x8318 : 'GL_YCRCB_SGIX',
+    0x8319 : 'GL_YCRCBA_SGIX',
+    0x831a : 'GL_UNPACK_COMPRESSED_SIZE_SGIX',
+    0x831b : 'GL_PACK_MAX_COMPRESSED_SIZE_SGIX',
+    0x831c : 'GL_PACK_COMPRESSED_SIZE_SGIX',
+    0x831d : 'GL_SLIM8U_SGIX',
+    0x831e : 'GL_SLIM10U_SGIX',
+    0x831f : 'GL_SLIM12S_SGIX',
+    0x8320 : 'GL_ALPHA_MIN_SGIX',
+    0x8321 : 'GL_ALPHA_MAX_SGIX',
+    0x8322 : 'GL_SCALEBIAS_HINT_SGIX',
+    0x8329 : 'GL_ASYNC_MARKER_SGIX',
+    0x832b : 'GL_PIXEL_TEX_GEN_MODE_SGIX',
+    0x832c : 'GL_ASYNC_HISTOGRAM_SGIX',
+    0x832d : 'GL_MAX_ASYNC_HISTOGRAM_SGIX',
+    0x8330 : 'GL_PIXEL_TRANSFORM_2D_EXT',
+    0x8331 : 'GL_PIXEL_MAG_FILTER_EXT',
+    0x8332 : 'GL_PIXEL_MIN_FILTER_EXT',
+    0x8333 : 'GL_PIXEL_CUBIC_WEIGHT_EXT',
+    0x8334 : 'GL_CUBIC_EXT',
+    0x8335 : 'GL_AVERAGE_EXT',
+    0x8336 : 'GL_PIXEL_TRANSFORM_2D_STACK_DEPTH_EXT',
+    0x8337 : 'GL_MAX_PIXEL_TRANSFORM_2D_STACK_DEPTH_EXT',
+    0x8338 : 'GL_PIXEL_TRANSFORM_2D_MATRIX_EXT',
+    0x8349 : 'GL_FRAGMENT_MATERIAL_EXT',
+    0x834a : 'GL_FRAGMENT_NORMAL_EXT',
+    0x834c : 'GL_FRAGMENT_COLOR_EXT',
+    0x834d : 'GL_ATTENUATION_EXT',
+    0x834e : 'GL_SHADOW_ATTENUATION_EXT',
+    0x834f : 'GL_TEXTURE_APPLICATION_MODE_EXT',
+    0x8350 : 'GL_TEXTURE_LIGHT_EXT',
+    0x8351 : 'GL_TEXTURE_MATERIAL_FACE_EXT',
+    0x8352 : 'GL_TEXTURE_MATERIAL_PARAMETER_EXT',
+    0x8353 : 'GL_PIXEL_TEXTURE_SGIS',
+    0x8354 : 'GL_PIXEL_FRAGMENT_RGB_SOURCE_SGIS',
+    0x8355 : 'GL_PIXEL_FRAGMENT_ALPHA_SOURCE_SGIS',
+    0x8356 : 'GL_PIXEL_GROUP_COLOR_SGIS',
+    0x835b : 'GL_LINE_QUALITY_HINT_SGIX',
+    0x835c : 'GL_ASYNC_TEX_IMAGE_SGIX',
+    0x835d : 'GL_ASYNC_DRAW_PIXELS_SGIX',
+    0x835e : 'GL_ASYNC_READ_PIXELS_SGIX',
+    0x835f : 'GL_MAX_ASYNC_TEX_IMAGE_SGIX',
+    0x8360 : 'GL_MAX_ASYNC_DRAW_PIXELS_SGIX',
+    0x8361 : 'GL_MAX_ASYNC_READ_PIXELS_SGIX',
+    0x8362 : 'GL_UNSIGNED_BYTE_2_3_3_REV',
+    0x8363 : 'GL_UNSIGNED_SHORT_5_6_5',
+    0x8364 : 'GL_UNSIGNED_SHORT_5_6_5_REV',
+    0x8365 : 'GL_UNSIGNED_SHORT_4_4_4_4_REV',
+    0x8366 : 'GL_UNSIGNED_SHORT_1_5_5_5_REV',
+    0x8367 : 'GL_UNSIGNED_INT_8_8_8_8_REV',
+    0x8368 : 'GL_UNSIGNED_INT_2_10_10_10_REV',
+    0x8369 : 'GL_TEXTURE_MAX_CLAMP_S_SGIX',
+    0x836a : 'GL_TEXTURE_MAX_CLAMP_T_SGIX',
+    0x836b : 'GL_TEXTURE_MAX_CLAMP_R_SGIX',
+    0x8370 : 'GL_MIRRORED_REPEAT',
+    0x83a0 : 'GL_RGB_S3TC',
+    0x83a1 : 'GL_RGB4_S3TC',
+    0x83a2 : 'GL_RGBA_S3TC',
+    0x83a3 : 'GL_RGBA4_S3TC',
+    0x83a4 : 'GL_RGBA_DXT5_S3TC',
+    0x83a5 : 'GL_RGBA4_DXT5_S3TC',
+    0x83ee : 'GL_VERTEX_PRECLIP_SGIX',
+    0x83ef : 'GL_VERTEX_PRECLIP_HINT_SGIX',
+    0x83f0 : 'GL_COMPRESSED_RGB_S3TC_DXT1_EXT',
+    0x83f1 : 'GL_COMPRESSED_RGBA_S3TC_DXT1_EXT',
+    0x83f2 : 'GL_COMPRESSED_RGBA_S3TC_DXT3_ANGLE',
+    0x83f3 : 'GL_COMPRESSED_RGBA_S3TC_DXT5_ANGLE',
+    0x83f4 : 'GL_PARALLEL_ARRAYS_INTEL',
+    0x83f5 : 'GL_VERTEX_ARRAY_PARALLEL_POINTERS_INTEL',
+    0x83f6 : 'GL_NORMAL_ARRAY_PARALLEL_POINTERS_INTEL',
+    0x83f7 : 'GL_COLOR_ARRAY_PARALLEL_POINTERS_INTEL',
+    0x83f8 : 'GL_TEXTURE_COORD_ARRAY_PARALLEL_POINTERS_INTEL',
+    0x83f9 : 'GL_PERFQUERY_DONOT_FLUSH_INTEL',
+    0x83fa : 'GL_PERFQUERY_FLUSH_INTEL',
+    0x83fb : 'GL_PERFQUERY_WAIT_INTEL',
+    0x83ff : 'GL_TEXTURE_MEMORY_LAYOUT_INTEL',
+    0x8400 : 'GL_FRAGMENT_LIGHTING_SGIX',
+    0x8401 : 'GL_FRAGMENT_COLOR_MATERIAL_SGIX',
+    0x8402 : 'GL_FRAGMENT_COLOR_MATERIAL_FACE_SGIX',
+    0x8403 : 'GL_FRAGMENT_COLOR_MATERIAL_PARAMETER_SGIX',
+    0x8404 : 'GL_MAX_FRAGMENT_LIGHTS_SGIX',
+    0x8405 : 'GL_MAX_ACTIVE_LIGHTS_SGIX',
+    0x8406 : 'GL_CURRENT_RASTER_NORMAL_SGIX',
+    0x8407 : 'GL_LIGHT_ENV_MODE_SGIX',
+    0x8408 : 'GL_FRAGMENT_LIGHT_MODEL_LOCAL_VIEWER_SGIX',
+    0x8409 : 'GL_FRAGMENT_LIGHT_MODEL_TWO_SIDE_SGIX',
+    0x840a : 'GL_FRAGMENT_LIGHT_MODEL_AMBIENT_SGIX',
+    0x840b : 'GL_FRAGMENT_LIGHT_MODEL_NORMAL_INTERPOLATION_SGIX',
+    0x840c : 'GL_FRAGMENT_LIGHT0_SGIX',
+    0x840d : 'GL_FRAGMENT_LIGHT1_SGIX',
+    0x840e : 'GL_FRAGMENT_LIGHT2_SGIX',
+    0x840f : 'GL_FRAGMENT_LIGHT3_SGIX',
+    0x8410 : 'GL_FRAGMENT_LIGHT4_SGIX',
+    0x8411 : 'GL_FRAGMENT_LIGHT5_SGIX',
+    0x8412 : 'GL_FRAGMENT_LIGHT6_SGIX',
+    0x8413 : 'GL_FRAGMENT_LIGHT7_SGIX',
+    0x842c : 'GL_PACK_RESAMPLE_SGIX',
+    0x842d : 'GL_UNPACK_RESAMPLE_SGIX',
+    0x842e : 'GL_RESAMPLE_REPLICATE_SGIX',
+    0x842f : 'GL_RESAMPLE_ZERO_FILL_SGIX',
+    0x8430 : 'GL_RESAMPLE_DECIMATE_SGIX',
+    0x8439 : 'GL_TANGENT_ARRAY_EXT',
+    0x843a : 'GL_BINORMAL_ARRAY_EXT',
+    0x843b : 'GL_CURRENT_TANGENT_EXT',
+    0x843c : 'GL_CURRENT_BINORMAL_EXT',
+    0x843e : 'GL_TANGENT_ARRAY_TYPE_EXT',
+    0x843f : 'GL_TANGENT_ARRAY_STRIDE_EXT',
+    0x8440 : 'GL_BINORMAL_ARRAY_TYPE_EXT',
+    0x8441 : 'GL_BINORMAL_ARRAY_STRIDE_EXT',
+    0x8442 : 'GL_TANGENT_ARRAY_POINTER_EXT',
+    0x8443 : 'GL_BINORMAL_ARRAY_POINTER_EXT',
+    0x8444 : 'GL_MAP1_TANGENT_EXT',
+    0x8445 : 'GL_MAP2_TANGENT_EXT',
+    0x8446 : 'GL_MAP1_BINORMAL_EXT',
+    0x8447 : 'GL_MAP2_BINORMAL_EXT',
+    0x844d : 'GL_NEAREST_CLIPMAP_NEAREST_SGIX',
+    0x844e : 'GL_NEAREST_CLIPMAP_LINEAR_SGIX',
+    0x844f : 'GL_LINEAR_CLIPMAP_NEAREST_SGIX',
+    0x8450 : 'GL_FOG_COORDINATE_SOURCE',
+    0x8451 : 'GL_FOG_COORDINATE',
+    0x8452 : 'GL_FRAGMENT_DEPTH',
+    0x8453 : 'GL_CURRENT_FOG_COORDINATE',
+    0x8454 : 'GL_FOG_COORDINATE_ARRAY_TYPE',
+    0x8455 : 'GL_FOG_COORDINATE_ARRAY_STRIDE',
+    0x8456 : 'GL_FOG_COORDINATE_ARRAY_POINTER',
+    0x8457 : 'GL_FOG_COORDINATE_ARRAY',
+    0x8458 : 'GL_COLOR_SUM',
+    0x8459 : 'GL_CURRENT_SECONDARY_COLOR',
+    0x845a : 'GL_SECONDARY_COLOR_ARRAY_SIZE',
+    0x845b : 'GL_SECONDARY_COLOR_ARRAY_TYPE',
+    0x845c : 'GL_SECONDARY_COLOR_ARRAY_STRIDE',
+    0x845d : 'GL_SECONDARY_COLOR_ARRAY_POINTER',
+    0x845e : 'GL_SECONDARY_COLOR_ARRAY',
+    0x845f : 'GL_CURRENT_RASTER_SECONDARY_COLOR',
+    0x846d : 'GL_ALIASED_POINT_SIZE_RANGE',
+    0x846e : 'GL_ALIASED_LINE_WIDTH_RANGE',
+    0x8490 : 'GL_SCREEN_COORDINATES_REND',
+    0x8491 : 'GL_INVERTED_SCREEN_W_REND',
+    0x84c0 : 'GL_TEXTURE0',
+    0x84c1 : 'GL_TEXTURE1',
+    0x84c2 : 'GL_TEXTURE2',
+    0x84c3 : 'GL_TEXTURE3',
+    0x84c4 : 'GL_TEXTURE4',
+    0x84c5 : 'GL_TEXTURE5',
+    0x84c6 : 'GL_TEXTURE6',
+    0x84c7 : 'GL_TEXTURE7',
+    0x84c8 : 'GL_TEXTURE8',
+    0x84c9 : 'GL_TEXTURE9',
+    0x84ca : 'GL_TEXTURE10',
+    0x84cb : 'GL_TEXTURE11',
+    0x84cc : 'GL_TEXTURE12',
+    0x84cd : 'GL_TEXTURE13',
+    0x84ce : 'GL_TEXTURE14',
+    0x84cf : 'GL_TEXTURE15',
+    0x84d0 : 'GL_TEXTURE16',
+    0x84d1 : 'GL_TEXTURE17',
+    0x84d2 : 'GL_TEXTURE18',
+    0x84d3 : 'GL_TEXTURE19',
+    0x84d4 : 'GL_TEXTURE20',
+    0x84d5 : 'GL_TEXTURE21',
+    0x84d6 : 'GL_TEXTURE22',
+    0x84d7 : 'GL_TEXTURE23',
+    0x84d8 : 'GL_TEXTURE24',
+    0x84d9 : 'GL_TEXTURE25',
+    0x84da : 'GL_TEXTURE26',
+    0x84db : 'GL_TEXTURE27',
+    0x84dc : 'GL_TEXTURE28',
+    0x84dd : 'GL_TEXTURE29',
+    0x84de : 'GL_TEXTURE30',
+    0x84df : 'GL_TEXTURE31',
+    0x84e0 : 'GL_ACTIVE_TEXTURE',
+    0x84e1 : 'GL_CLIENT_ACTIVE_TEXTURE',
+    0x84e2 : 'GL_MAX_TEXTURE_UNITS',
+    0x84e3 : 'GL_TRANSPOSE_MODELVIEW_MATRIX',
+    0x84e4 : 'GL_TRANSPOSE_PROJECTION_MATRIX',
+    0x84e5 : 'GL_TRANSPOSE_TEXTURE_MATRIX',
+    0x84e6 : 'GL_TRANSPOSE_COLOR_MATRIX',
+    0x84e7 : 'GL_SUBTRACT',
+    0x84e8 : 'GL_MAX_RENDERBUFFER_SIZE',
+    0x84e9 : 'GL_COMPRESSED_ALPHA',
+    0x84ea : 'GL_COMPRESSED_LUMINANCE',
+    0x84eb : 'GL_COMPRESSED_LUMINANCE_ALPHA',
+    0x84ec : 'GL_COMPRESSED_INTENSITY',
+    0x84ed : 'GL_COMPRESSED_RGB',
+    0x84ee : 'GL_COMPRESSED_RGBA',
+    0x84ef : 'GL_TEXTURE_COMPRESSION_HINT',
+    0x84f0 : 'GL_UNIFORM_BLOCK_REFERENCED_BY_TESS_CONTROL_SHADER',
+    0x84f1 : 'GL_UNIFORM_BLOCK_REFERENCED_BY_TESS_EVALUATION_SHADER',
+    0x84f2 : 'GL_ALL_COMPLETED_NV',
+    0x84f3 : 'GL_FENCE_STATUS_NV',
+    0x84f4 : 'GL_FENCE_CONDITION_NV',
+    0x84f5 : 'GL_TEXTURE_RECTANGLE',
+    0x84f6 : 'GL_TEXTURE_BINDING_RECTANGLE',
+    0x84f7 : 'GL_PROXY_TEXTURE_RECTANGLE',
+    0x84f8 : 'GL_MAX_RECTANGLE_TEXTURE_SIZE',
+    0x84f9 : 'GL_DEPTH_STENCIL',
+    0x84fa : 'GL_UNSIGNED_INT_24_8',
+    0x84fd : 'GL_MAX_TEXTURE_LOD_BIAS',
+    0x84fe : 'GL_TEXTURE_MAX_ANISOTROPY_EXT',
+    0x84ff : 'GL_MAX_TEXTURE_MAX_ANISOTROPY_EXT',
+    0x8500 : 'GL_TEXTURE_FILTER_CONTROL',
+    0x8501 : 'GL_TEXTURE_LOD_BIAS',
+    0x8502 : 'GL_MODELVIEW1_STACK_DEPTH_EXT',
+    0x8503 : 'GL_COMBINE4_NV',
+    0x8504 : 'GL_MAX_SHININESS_NV',
+    0x8505 : 'GL_MAX_SPOT_EXPONENT_NV',
+    0x8506 : 'GL_MODELVIEW1_MATRIX_EXT',
+    0x8507 : 'GL_INCR_WRAP',
+    0x8508 : 'GL_DECR_WRAP',
+    0x8509 : 'GL_VERTEX_WEIGHTING_EXT',
+    0x850a : 'GL_MODELVIEW1_ARB',
+    0x850b : 'GL_CURRENT_VERTEX_WEIGHT_EXT',
+    0x850c : 'GL_VERTEX_WEIGHT_ARRAY_EXT',
+    0x850d : 'GL_VERTEX_WEIGHT_ARRAY_SIZE_EXT',
+    0x850e : 'GL_VERTEX_WEIGHT_ARRAY_TYPE_EXT',
+    0x850f : 'GL_VERTEX_WEIGHT_ARRAY_STRIDE_EXT',
+    0x8510 : 'GL_VERTEX_WEIGHT_ARRAY_POINTER_EXT',
+    0x8511 : 'GL_NORMAL_MAP',
+    0x8512 : 'GL_REFLECTION_MAP',
+    0x8513 : 'GL_TEXTURE_CUBE_MAP',
+    0x8514 : 'GL_TEXTURE_BINDING_CUBE_MAP',
+    0x8515 : 'GL_TEXTURE_CUBE_MAP_POSITIVE_X',
+    0x8516 : 'GL_TEXTURE_CUBE_MAP_NEGATIVE_X',
+    0x8517 : 'GL_TEXTURE_CUBE_MAP_POSITIVE_Y',
+    0x8518 : 'GL_TEXTURE_CUBE_MAP_NEGATIVE_Y',
+    0x8519 : 'GL_TEXTURE_CUBE_MAP_POSITIVE_Z',
+    0x851a : 'GL_TEXTURE_CUBE_MAP_NEGATIVE_Z',
+    0x851b : 'GL_PROXY_TEXTURE_CUBE_MAP',
+    0x851c : 'GL_MAX_CUBE_MAP_TEXTURE_SIZE',
+    0x851d : 'GL_VERTEX_ARRAY_RANGE_APPLE',
+    0x851e : 'GL_VERTEX_ARRAY_RANGE_LENGTH_APPLE',
+    0x851f : 'GL_VERTEX_ARRAY_STORAGE_HINT_APPLE',
+    0x8520 : 'GL_MAX_VERTEX_ARRAY_RANGE_ELEMENT_NV',
+    0x8521 : 'GL_VERTEX_ARRAY_RANGE_POINTER_APPLE',
+    0x8522 : 'GL_REGISTER_COMBINERS_NV',
+    0x8523 : 'GL_VARIABLE_A_NV',
+    0x8524 : 'GL_VARIABLE_B_NV',
+    0x8525 : 'GL_VARIABLE_C_NV',
+    0x8526 : 'GL_VARIABLE_D_NV',
+    0x8527 : 'GL_VARIABLE_E_NV',
+    0x8528 : 'GL_VARIABLE_F_NV',
+    0x8529 : 'GL_VARIABLE_G_NV',
+    0x852a : 'GL_CONSTANT_COLOR0_NV',
+    0x852b : 'GL_CONSTANT_COLOR1_NV',
+    0x852c : 'GL_PRIMARY_COLOR_NV',
+    0x852d : 'GL_SECONDARY_COLOR_NV',
+    0x852e : 'GL_SPARE0_NV',
+    0x852f : 'GL_SPARE1_NV',
+    0x8530 : 'GL_DISCARD_NV',
+    0x8531 : 'GL_E_TIMES_F_NV',
+    0x8532 : 'GL_SPARE0_PLUS_SECONDARY_COLOR_NV',
+    0x8533 : 'GL_VERTEX_ARRAY_RANGE_WITHOUT_FLUSH_NV',
+    0x8534 : 'GL_MULTISAMPLE_FILTER_HINT_NV',
+    0x8535 : 'GL_PER_STAGE_CONSTANTS_NV',
+    0x8536 : 'GL_UNSIGNED_IDENTITY_NV',
+    0x8537 : 'GL_UNSIGNED_INVERT_NV',
+    0x8538 : 'GL_EXPAND_NORMAL_NV',
+    0x8539 : 'GL_EXPAND_NEGATE_NV',
+    0x853a : 'GL_HALF_BIAS_NORMAL_NV',
+    0x853b : 'GL_HALF_BIAS_NEGATE_NV',
+    0x853c : 'GL_SIGNED_IDENTITY_NV',
+    0x853d : 'GL_SIGNED_NEGATE_NV',
+    0x853e : 'GL_SCALE_BY_TWO_NV',
+    0x853f : 'GL_SCALE_BY_FOUR_NV',
+    0x8540 : 'GL_SCALE_BY_ONE_HALF_NV',
+    0x8541 : 'GL_BIAS_BY_NEGATIVE_ONE_HALF_NV',
+    0x8542 : 'GL_COMBINER_INPUT_NV',
+    0x8543 : 'GL_COMBINER_MAPPING_NV',
+    0x8544 : 'GL_COMBINER_COMPONENT_USAGE_NV',
+    0x8545 : 'GL_COMBINER_AB_DOT_PRODUCT_NV',
+    0x8546 : 'GL_COMBINER_CD_DOT_PRODUCT_NV',
+    0x8547 : 'GL_COMBINER_MUX_SUM_NV',
+    0x8548 : 'GL_COMBINER_SCALE_NV',
+    0x8549 : 'GL_COMBINER_BIAS_NV',
+    0x854a : 'GL_COMBINER_AB_OUTPUT_NV',
+    0x854b : 'GL_COMBINER_CD_OUTPUT_NV',
+    0x854c : 'GL_COMBINER_SUM_OUTPUT_NV',
+    0x854d : 'GL_MAX_GENERAL_COMBINERS_NV',
+    0x854e : 'GL_NUM_GENERAL_COMBINERS_NV',
+    0x854f : 'GL_COLOR_SUM_CLAMP_NV',
+    0x8550 : 'GL_COMBINER0_NV',
+    0x8551 : 'GL_COMBINER1_NV',
+    0x8552 : 'GL_COMBINER2_NV',
+    0x8553 : 'GL_COMBINER3_NV',
+    0x8554 : 'GL_COMBINER4_NV',
+    0x8555 : 'GL_COMBINER5_NV',
+    0x8556 : 'GL_COMBINER6_NV',
+    0x8557 : 'GL_COMBINER7_NV',
+    0x8558 : 'GL_PRIMITIVE_RESTART_NV',
+    0x8559 : 'GL_PRIMITIVE_RESTART_INDEX_NV',
+    0x855a : 'GL_FOG_DISTANCE_MODE_NV',
+    0x855b : 'GL_EYE_RADIAL_NV',
+    0x855c : 'GL_EYE_PLANE_ABSOLUTE_NV',
+    0x855d : 'GL_EMBOSS_LIGHT_NV',
+    0x855e : 'GL_EMBOSS_CONSTANT_NV',
+    0x855f : 'GL_EMBOSS_MAP_NV',
+    0x8560 : 'GL_RED_MIN_CLAMP_INGR',
+    0x8561 : 'GL_GREEN_MIN_CLAMP_INGR',
+    0x8562 : 'GL_BLUE_MIN_CLAMP_INGR',
+    0x8563 : 'GL_ALPHA_MIN_CLAMP_INGR',
+    0x8564 : 'GL_RED_MAX_CLAMP_INGR',
+    0x8565 : 'GL_GREEN_MAX_CLAMP_INGR',
+    0x8566 : 'GL_BLUE_MAX_CLAMP_INGR',
+    0x8567 : 'GL_ALPHA_MAX_CLAMP_INGR',
+    0x8568 : 'GL_INTERLACE_READ_INGR',
+    0x8570 : 'GL_COMBINE',
+    0x8571 : 'GL_COMBINE_RGB',
+    0x8572 : 'GL_COMBINE_ALPHA',
+    0x8573 : 'GL_RGB_SCALE',
+    0x8574 : 'GL_ADD_SIGNED',
+    0x8575 : 'GL_INTERPOLATE',
+    0x8576 : 'GL_CONSTANT',
+    0x8577 : 'GL_PRIMARY_COLOR',
+    0x8578 : 'GL_PREVIOUS',
+    0x8580 : 'GL_SOURCE0_RGB',
+    0x8581 : 'GL_SOURCE1_RGB',
+    0x8582 : 'GL_SOURCE2_RGB',
+    0x8583 : 'GL_SOURCE3_RGB_NV',
+    0x8588 : 'GL_SOURCE0_ALPHA',
+    0x8589 : 'GL_SOURCE1_ALPHA',
+    0x858a : 'GL_SOURCE2_ALPHA',
+    0x858b : 'GL_SOURCE3_ALPHA_NV',
+    0x8590 : 'GL_OPERAND0_RGB',
+    0x8591 : 'GL_OPERAND1_RGB',
+    0x8592 : 'GL_OPERAND2_RGB',
+    0x8593 : 'GL_OPERAND3_RGB_NV',
+    0x8598 : 'GL_OPERAND0_ALPHA',
+    0x8599 : 'GL_OPERAND1_ALPHA',
+    0x859a : 'GL_OPERAND2_ALPHA',
+    0x859b : 'GL_OPERAND3_ALPHA_NV',
+    0x85a0 : 'GL_PACK_SUBSAMPLE_RATE_SGIX',
+    0x85a1 : 'GL_UNPACK_SUBSAMPLE_RATE_SGIX',
+    0x85a2 : 'GL_PIXEL_SUBSAMPLE_4444_SGIX',
+    0x85a3 : 'GL_PIXEL_SUBSAMPLE_2424_SGIX',
+    0x85a4 : 'GL_PIXEL_SUBSAMPLE_4242_SGIX',
+    0x85ae : 'GL_PERTURB_EXT',
+    0x85af : 'GL_TEXTURE_NORMAL_EXT',
+    0x85b0 : 'GL_LIGHT_MODEL_SPECULAR_VECTOR_APPLE',
+    0x85b1 : 'GL_TRANSFORM_HINT_APPLE',
+    0x85b2 : 'GL_UNPACK_CLIENT_STORAGE_APPLE',
+    0x85b3 : 'GL_BUFFER_OBJECT_APPLE',
+    0x85b4 : 'GL_STORAGE_CLIENT_APPLE',
+    0x85b5 : 'GL_VERTEX_ARRAY_BINDING',
+    0x85b7 : 'GL_TEXTURE_RANGE_LENGTH_APPLE',
+    0x85b8 : 'GL_TEXTURE_RANGE_POINTER_APPLE',
+    0x85b9 : 'GL_YCBCR_422_APPLE',
+    0x85ba : 'GL_UNSIGNED_SHORT_8_8_APPLE',
+    0x85bb : 'GL_UNSIGNED_SHORT_8_8_REV_APPLE',
+    0x85bc : 'GL_TEXTURE_STORAGE_HINT_APPLE',
+    0x85bd : 'GL_STORAGE_PRIVATE_APPLE',
+    0x85be : 'GL_STORAGE_CACHED_APPLE',
+    0x85bf : 'GL_STORAGE_SHARED_APPLE',
+    0x85c0 : 'GL_REPLACEMENT_CODE_ARRAY_SUN',
+    0x85c1 : 'GL_REPLACEMENT_CODE_ARRAY_TYPE_SUN',
+    0x85c2 : 'GL_REPLACEMENT_CODE_ARRAY_STRIDE_SUN',
+    0x85c3 : 'GL_REPLACEMENT_CODE_ARRAY_POINTER_SUN',
+    0x85c4 : 'GL_R1UI_V3F_SUN',
+    0x85c5 : 'GL_R1UI_C4UB_V3F_SUN',
+    0x85c6 : 'GL_R1UI_C3F_V3F_SUN',
+    0x85c7 : 'GL_R1UI_N3F_V3F_SUN',
+    0x85c8 : 'GL_R1UI_C4F_N3F_V3F_SUN',
+    0x85c9 : 'GL_R1UI_T2F_V3F_SUN',
+    0x85ca : 'GL_R1UI_T2F_N3F_V3F_SUN',
+    0x85cb : 'GL_R1UI_T2F_C4F_N3F_V3F_SUN',
+    0x85cc : 'GL_SLICE_ACCUM_SUN',
+    0x8614 : 'GL_QUAD_MESH_SUN',
+    0x8615 : 'GL_TRIANGLE_MESH_SUN',
+    0x8620 : 'GL_VERTEX_PROGRAM_ARB',
+    0x8621 : 'GL_VERTEX_STATE_PROGRAM_NV',
+    0x8622 : 'GL_VERTEX_ATTRIB_ARRAY_ENABLED',
+    0x8623 : 'GL_VERTEX_ATTRIB_ARRAY_SIZE',
+    0x8624 : 'GL_VERTEX_ATTRIB_ARRAY_STRIDE',
+    0x8625 : 'GL_VERTEX_ATTRIB_ARRAY_TYPE',
+    0x8626 : 'GL_CURRENT_VERTEX_ATTRIB',
+    0x8627 : 'GL_PROGRAM_LENGTH_ARB',
+    0x8628 : 'GL_PROGRAM_STRING_ARB',
+    0x8629 : 'GL_MODELVIEW_PROJECTION_NV',
+    0x862a : 'GL_IDENTITY_NV',
+    0x862b : 'GL_INVERSE_NV',
+    0x862c : 'GL_TRANSPOSE_NV',
+    0x862d : 'GL_INVERSE_TRANSPOSE_NV',
+    0x862e : 'GL_MAX_PROGRAM_MATRIX_STACK_DEPTH_ARB',
+    0x862f : 'GL_MAX_PROGRAM_MATRICES_ARB',
+    0x8630 : 'GL_MATRIX0_NV',
+    0x8631 : 'GL_MATRIX1_NV',
+    0x8632 : 'GL_MATRIX2_NV',
+    0x8633 : 'GL_MATRIX3_NV',
+    0x8634 : 'GL_MATRIX4_NV',
+    0x8635 : 'GL_MATRIX5_NV',
+    0x8636 : 'GL_MATRIX6_NV',
+    0x8637 : 'GL_MATRIX7_NV',
+    0x8640 : 'GL_CURRENT_MATRIX_STACK_DEPTH_ARB',
+    0x8641 : 'GL_CURRENT_MATRIX_ARB',
+    0x8642 : 'GL_VERTEX_PROGRAM_POINT_SIZE',
+    0x8643 : 'GL_VERTEX_PROGRAM_TWO_SIDE',
+    0x8644 : 'GL_PROGRAM_PARAMETER_NV',
+    0x8645 : 'GL_VERTEX_ATTRIB_ARRAY_POINTER',
+    0x8646 : 'GL_PROGRAM_TARGET_NV',
+    0x8647 : 'GL_PROGRAM_RESIDENT_NV',
+    0x8648 : 'GL_TRACK_MATRIX_NV',
+    0x8649 : 'GL_TRACK_MATRIX_TRANSFORM_NV',
+    0x864a : 'GL_VERTEX_PROGRAM_BINDING_NV',
+    0x864b : 'GL_PROGRAM_ERROR_POSITION_ARB',
+    0x864c : 'GL_OFFSET_TEXTURE_RECTANGLE_NV',
+    0x864d : 'GL_OFFSET_TEXTURE_RECTANGLE_SCALE_NV',
+    0x864e : 'GL_DOT_PRODUCT_TEXTURE_RECTANGLE_NV',
+    0x864f : 'GL_DEPTH_CLAMP',
+    0x8650 : 'GL_VERTEX_ATTRIB_ARRAY0_NV',
+    0x8651 : 'GL_VERTEX_ATTRIB_ARRAY1_NV',
+    0x8652 : 'GL_VERTEX_ATTRIB_ARRAY2_NV',
+    0x8653 : 'GL_VERTEX_ATTRIB_ARRAY3_NV',
+    0x8654 : 'GL_VERTEX_ATTRIB_ARRAY4_NV',
+    0x8655 : 'GL_VERTEX_ATTRIB_ARRAY5_NV',
+    0x8656 : 'GL_VERTEX_ATTRIB_ARRAY6_NV',
+    0x8657 : 'GL_VERTEX_ATTRIB_ARRAY7_NV',
+    0x8658 : 'GL_VERTEX_ATTRIB_ARRAY8_NV',
+    0x8659 : 'GL_VERTEX_ATTRIB_ARRAY9_NV',
+    0x865a : 'GL_VERTEX_ATTRIB_ARRAY10_NV',
+    0x865b : 'GL_VERTEX_ATTRIB_ARRAY11_NV',
+    0x865c : 'GL_VERTEX_ATTRIB_ARRAY12_NV',
+    0x865d : 'GL_VERTEX_ATTRIB_ARRAY13_NV',
+    0x865e : 'GL_VERTEX_ATTRIB_ARRAY14_NV',
+    0x865f : 'GL_VERTEX_ATTRIB_ARRAY15_NV',
+    0x8660 : 'GL_MAP1_VERTEX_ATTRIB0_4_NV',
+    0x8661 : 'GL_MAP1_VERTEX_ATTRIB1_4_NV',
+    0x8662 : 'GL_MAP1_VERTEX_ATTRIB2_4_NV',
+    0x8663 : 'GL_MAP1_VERTEX_ATTRIB3_4_NV',
+    0x8664 : 'GL_MAP1_VERTEX_ATTRIB4_4_NV',
+    0x8665 : 'GL_MAP1_VERTEX_ATTRIB5_4_NV',
+    0x8666 : 'GL_MAP1_VERTEX_ATTRIB6_4_NV',
+    0x8667 : 'GL_MAP1_VERTEX_ATTRIB7_4_NV',
+    0x8668 : 'GL_MAP1_VERTEX_ATTRIB8_4_NV',
+    0x8669 : 'GL_MAP1_VERTEX_ATTRIB9_4_NV',
+    0x866a : 'GL_MAP1_VERTEX_ATTRIB10_4_NV',
+    0x866b : 'GL_MAP1_VERTEX_ATTRIB11_4_NV',
+    0x866c : 'GL_MAP1_VERTEX_ATTRIB12_4_NV',
+    0x866d : 'GL_MAP1_VERTEX_ATTRIB13_4_NV',
+    0x866e : 'GL_MAP1_VERTEX_ATTRIB14_4_NV',
+    0x866f : 'GL_MAP1_VERTEX_ATTRIB15_4_NV',
+    0x8670 : 'GL_MAP2_VERTEX_ATTRIB0_4_NV',
+    0x8671 : 'GL_MAP2_VERTEX_ATTRIB1_4_NV',
+    0x8672 : 'GL_MAP2_VERTEX_ATTRIB2_4_NV',
+    0x8673 : 'GL_MAP2_VERTEX_ATTRIB3_4_NV',
+    0x8674 : 'GL_MAP2_VERTEX_ATTRIB4_4_NV',
+    0x8675 : 'GL_MAP2_VERTEX_ATTRIB5_4_NV',
+    0x8676 : 'GL_MAP2_VERTEX_ATTRIB6_4_NV',
+    0x8677 : 'GL_PROGRAM_BINDING_ARB',
+    0x8678 : 'GL_MAP2_VERTEX_ATTRIB8_4_NV',
+    0x8679 : 'GL_MAP2_VERTEX_ATTRIB9_4_NV',
+    0x867a : 'GL_MAP2_VERTEX_ATTRIB10_4_NV',
+    0x867b : 'GL_MAP2_VERTEX_ATTRIB11_4_NV',
+    0x867c : 'GL_MAP2_VERTEX_ATTRIB12_4_NV',
+    0x867d : 'GL_MAP2_VERTEX_ATTRIB13_4_NV',
+    0x867e : 'GL_MAP2_VERTEX_ATTRIB14_4_NV',
+    0x867f : 'GL_MAP2_VERTEX_ATTRIB15_4_NV',
+    0x86a0 : 'GL_TEXTURE_COMPRESSED_IMAGE_SIZE',
+    0x86a1 : 'GL_TEXTURE_COMPRESSED',
+    0x86a2 : 'GL_NUM_COMPRESSED_TEXTURE_FORMATS',
+    0x86a3 : 'GL_COMPRESSED_TEXTURE_FORMATS',
+    0x86a4 : 'GL_MAX_VERTEX_UNITS_ARB',
+    0x86a5 : 'GL_ACTIVE_VERTEX_UNITS_ARB',
+    0x86a6 : 'GL_WEIGHT_SUM_UNITY_ARB',
+    0x86a7 : 'GL_VERTEX_BLEND_ARB',
+    0x86a8 : 'GL_CURRENT_WEIGHT_ARB',
+    0x86a9 : 'GL_WEIGHT_ARRAY_TYPE_ARB',
+    0x86aa : 'GL_WEIGHT_ARRAY_STRIDE_ARB',
+    0x86ab : 'GL_WEIGHT_ARRAY_SIZE_ARB',
+    0x86ac : 'GL_WEIGHT_ARRAY_POINTER_ARB',
+    0x86ad : 'GL_WEIGHT_ARRAY_ARB',
+    0x86ae : 'GL_DOT3_RGB',
+    0x86af : 'GL_DOT3_RGBA',
+    0x86b0 : 'GL_COMPRESSED_RGB_FXT1_3DFX',
+    0x86b1 : 'GL_COMPRESSED_RGBA_FXT1_3DFX',
+    0x86b2 : 'GL_MULTISAMPLE_3DFX',
+    0x86b3 : 'GL_SAMPLE_BUFFERS_3DFX',
+    0x86b4 : 'GL_SAMPLES_3DFX',
+    0x86c0 : 'GL_EVAL_2D_NV',
+    0x86c1 : 'GL_EVAL_TRIANGULAR_2D_NV',
+    0x86c2 : 'GL_MAP_TESSELLATION_NV',
+    0x86c3 : 'GL_MAP_ATTRIB_U_ORDER_NV',
+    0x86c4 : 'GL_MAP_ATTRIB_V_ORDER_NV',
+    0x86c5 : 'GL_EVAL_FRACTIONAL_TESSELLATION_NV',
+    0x86c6 : 'GL_EVAL_VERTEX_ATTRIB0_NV',
+    0x86c7 : 'GL_EVAL_VERTEX_ATTRIB1_NV',
+    0x86c8 : 'GL_EVAL_VERTEX_ATTRIB2_NV',
+    0x86c9 : 'GL_EVAL_VERTEX_ATTRIB3_NV',
+    0x86ca : 'GL_EVAL_VERTEX_ATTRIB4_NV',
+    0x86cb : 'GL_EVAL_VERTEX_ATTRIB5_NV',
+    0x86cc : 'GL_EVAL_VERTEX_ATTRIB6_NV',
+    0x86cd : 'GL_EVAL_VERTEX_ATTRIB7_NV',
+    0x86ce : 'GL_EVAL_VERTEX_ATTRIB8_NV',
+    0x86cf : 'GL_EVAL_VERTEX_ATTRIB9_NV',
+    0x86d0 : 'GL_EVAL_VERTEX_ATTRIB10_NV',
+    0x86d1 : 'GL_EVAL_VERTEX_ATTRIB11_NV',
+    0x86d2 : 'GL_EVAL_VERTEX_ATTRIB12_NV',
+    0x86d3 : 'GL_EVAL_VERTEX_ATTRIB13_NV',
+    0x86d4 : 'GL_EVAL_VERTEX_ATTRIB14_NV',
+    0x86d5 : 'GL_EVAL_VERTEX_ATTRIB15_NV',
+    0x86d6 : 'GL_MAX_MAP_TESSELLATION_NV',
+    0x86d7 : 'GL_MAX_RATIONAL_EVAL_ORDER_NV',
+    0x86d8 : 'GL_MAX_PROGRAM_PATCH_ATTRIBS_NV',
+    0x86d9 : 'GL_RGBA_UNSIGNED_DOT_PRODUCT_MAPPING_NV',
+    0x86da : 'GL_UNSIGNED_INT_S8_S8_8_8_NV',
+    0x86db : 'GL_UNSIGNED_INT_8_8_S8_S8_REV_NV',
+    0x86dc : 'GL_DSDT_MAG_INTENSITY_NV',
+    0x86dd : 'GL_SHADER_CONSISTENT_NV',
+    0x86de : 'GL_TEXTURE_SHADER_NV',
+    0x86df : 'GL_SHADER_OPERATION_NV',
+    0x86e0 : 'GL_CULL_MODES_NV',
+    0x86e1 : 'GL_OFFSET_TEXTURE_2D_MATRIX_NV',
+    0x86e2 : 'GL_OFFSET_TEXTURE_2D_SCALE_NV',
+    0x86e3 : 'GL_OFFSET_TEXTURE_2D_BIAS_NV',
+    0x86e4 : 'GL_PREVIOUS_TEXTURE_INPUT_NV',
+    0x86e5 : 'GL_CONST_EYE_NV',
+    0x86e6 : 'GL_PASS_THROUGH_NV',
+    0x86e7 : 'GL_CULL_FRAGMENT_NV',
+    0x86e8 : 'GL_OFFSET_TEXTURE_2D_NV',
+    0x86e9 : 'GL_DEPENDENT_AR_TEXTURE_2D_NV',
+    0x86ea : 'GL_DEPENDENT_GB_TEXTURE_2D_NV',
+    0x86eb : 'GL_SURFACE_STATE_NV',
+    0x86ec : 'GL_DOT_PRODUCT_NV',
+    0x86ed : 'GL_DOT_PRODUCT_DEPTH_REPLACE_NV',
+    0x86ee : 'GL_DOT_PRODUCT_TEXTURE_2D_NV',
+    0x86ef : 'GL_DOT_PRODUCT_TEXTURE_3D_NV',
+    0x86f0 : 'GL_DOT_PRODUCT_TEXTURE_CUBE_MAP_NV',
+    0x86f1 : 'GL_DOT_PRODUCT_DIFFUSE_CUBE_MAP_NV',
+    0x86f2 : 'GL_DOT_PRODUCT_REFLECT_CUBE_MAP_NV',
+    0x86f3 : 'GL_DOT_PRODUCT_CONST_EYE_REFLECT_CUBE_MAP_NV',
+    0x86f4 : 'GL_HILO_NV',
+    0x86f5 : 'GL_DSDT_NV',
+    0x86f6 : 'GL_DSDT_MAG_NV',
+    0x86f7 : 'GL_DSDT_MAG_VIB_NV',
+    0x86f8 : 'GL_HILO16_NV',
+    0x86f9 : 'GL_SIGNED_HILO_NV',
+    0x86fa : 'GL_SIGNED_HILO16_NV',
+    0x86fb : 'GL_SIGNED_RGBA_NV',
+    0x86fc : 'GL_SIGNED_RGBA8_NV',
+    0x86fd : 'GL_SURFACE_REGISTERED_NV',
+    0x86fe : 'GL_SIGNED_RGB_NV',
+    0x86ff : 'GL_SIGNED_RGB8_NV',
+    0x8700 : 'GL_SURFACE_MAPPED_NV',
+    0x8701 : 'GL_SIGNED_LUMINANCE_NV',
+    0x8702 : 'GL_SIGNED_LUMINANCE8_NV',
+    0x8703 : 'GL_SIGNED_LUMINANCE_ALPHA_NV',
+    0x8704 : 'GL_SIGNED_LUMINANCE8_ALPHA8_NV',
+    0x8705 : 'GL_SIGNED_ALPHA_NV',
+    0x8706 : 'GL_SIGNED_ALPHA8_NV',
+    0x8707 : 'GL_SIGNED_INTENSITY_NV',
+    0x8708 : 'GL_SIGNED_INTENSITY8_NV',
+    0x8709 : 'GL_DSDT8_NV',
+    0x870a : 'GL_DSDT8_MAG8_NV',
+    0x870b : 'GL_DSDT8_MAG8_INTENSITY8_NV',
+    0x870c : 'GL_SIGNED_RGB_UNSIGNED_ALPHA_NV',
+    0x870d : 'GL_SIGNED_RGB8_UNSIGNED_ALPHA8_NV',
+    0x870e : 'GL_HI_SCALE_NV',
+    0x870f : 'GL_LO_SCALE_NV',
+    0x8710 : 'GL_DS_SCALE_NV',
+    0x8711 : 'GL_DT_SCALE_NV',
+    0x8712 : 'GL_MAGNITUDE_SCALE_NV',
+    0x8713 : 'GL_VIBRANCE_SCALE_NV',
+    0x8714 : 'GL_HI_BIAS_NV',
+    0x8715 : 'GL_LO_BIAS_NV',
+    0x8716 : 'GL_DS_BIAS_NV',
+    0x8717 : 'GL_DT_BIAS_NV',
+    0x8718 : 'GL_MAGNITUDE_BIAS_NV',
+    0x8719 : 'GL_VIBRANCE_BIAS_NV',
+    0x871a : 'GL_TEXTURE_BORDER_VALUES_NV',
+    0x871b : 'GL_TEXTURE_HI_SIZE_NV',
+    0x871c : 'GL_TEXTURE_LO_SIZE_NV',
+    0x871d : 'GL_TEXTURE_DS_SIZE_NV',
+    0x871e : 'GL_TEXTURE_DT_SIZE_NV',
+    0x871f : 'GL_TEXTURE_MAG_SIZE_NV',
+    0x8722 : 'GL_MODELVIEW2_ARB',
+    0x8723 : 'GL_MODELVIEW3_ARB',
+    0x8724 : 'GL_MODELVIEW4_ARB',
+    0x8725 : 'GL_MODELVIEW5_ARB',
+    0x8726 : 'GL_MODELVIEW6_ARB',
+    0x8727 : 'GL_MODELVIEW7_ARB',
+    0x8728 : 'GL_MODELVIEW8_ARB',
+    0x8729 : 'GL_MODELVIEW9_ARB',
+    0x872a : 'GL_MODELVIEW10_ARB',
+    0x872b : 'GL_MODELVIEW11_ARB',
+    0x872c : 'GL_MODELVIEW12_ARB',
+    0x872d : 'GL_MODELVIEW13_ARB',
+    0x872e : 'GL_MODELVIEW14_ARB',
+    0x872f : 'GL_MODELVIEW15_ARB',
+    0x8730 : 'GL_MODELVIEW16_ARB',
+    0x8731 : 'GL_MODELVIEW17_ARB',
+    0x8732 : 'GL_MODELVIEW18_ARB',
+    0x8733 : 'GL_MODELVIEW19_ARB',
+    0x8734 : 'GL_MODELVIEW20_ARB',
+    0x8735 : 'GL_MODELVIEW21_ARB',
+    0x8736 : 'GL_MODELVIEW22_ARB',
+    0x8737 : 'GL_MODELVIEW23_ARB',
+    0x8738 : 'GL_MODELVIEW24_ARB',
+    0x8739 : 'GL_MODELVIEW25_ARB',
+    0x873a : 'GL_MODELVIEW26_ARB',
+    0x873b : 'GL_MODELVIEW27_ARB',
+    0x873c : 'GL_MODELVIEW28_ARB',
+    0x873d : 'GL_MODELVIEW29_ARB',
+    0x873e : 'GL_MODELVIEW30_ARB',
+    0x873f : 'GL_MODELVIEW31_ARB',
+    0x8740 : 'GL_DOT3_RGB_EXT',
+    0x8741 : 'GL_DOT3_RGBA_EXT',
+    0x8742 : 'GL_MIRROR_CLAMP_EXT',
+    0x8743 : 'GL_MIRROR_CLAMP_TO_EDGE',
+    0x8744 : 'GL_MODULATE_ADD_ATI',
+    0x8745 : 'GL_MODULATE_SIGNED_ADD_ATI',
+    0x8746 : 'GL_MODULATE_SUBTRACT_ATI',
+    0x874a : 'GL_SET_AMD',
+    0x874b : 'GL_REPLACE_VALUE_AMD',
+    0x874c : 'GL_STENCIL_OP_VALUE_AMD',
+    0x874d : 'GL_STENCIL_BACK_OP_VALUE_AMD',
+    0x874e : 'GL_VERTEX_ATTRIB_ARRAY_LONG',
+    0x874f : 'GL_OCCLUSION_QUERY_EVENT_MASK_AMD',
+    0x8750 : 'GL_DEPTH_STENCIL_MESA',
+    0x8751 : 'GL_UNSIGNED_INT_24_8_MESA',
+    0x8752 : 'GL_UNSIGNED_INT_8_24_REV_MESA',
+    0x8753 : 'GL_UNSIGNED_SHORT_15_1_MESA',
+    0x8754 : 'GL_UNSIGNED_SHORT_1_15_REV_MESA',
+    0x8755 : 'GL_TRACE_MASK_MESA',
+    0x8756 : 'GL_TRACE_NAME_MESA',
+    0x8757 : 'GL_YCBCR_MESA',
+    0x8758 : 'GL_PACK_INVERT_MESA',
+    0x8759 : 'GL_DEBUG_OBJECT_MESA',
+    0x875a : 'GL_DEBUG_PRINT_MESA',
+    0x875b : 'GL_DEBUG_ASSERT_MESA',
+    0x875c : 'GL_PROXY_TEXTURE_2D_STACK_MESAX',
+    0x875d : 'GL_TEXTURE_1D_STACK_BINDING_MESAX',
+    0x875e : 'GL_TEXTURE_2D_STACK_BINDING_MESAX',
+    0x8760 : 'GL_STATIC_ATI',
+    0x8761 : 'GL_DYNAMIC_ATI',
+    0x8762 : 'GL_PRESERVE_ATI',
+    0x8763 : 'GL_DISCARD_ATI',
+    0x8764 : 'GL_BUFFER_SIZE',
+    0x8765 : 'GL_BUFFER_USAGE',
+    0x8766 : 'GL_ARRAY_OBJECT_BUFFER_ATI',
+    0x8767 : 'GL_ARRAY_OBJECT_OFFSET_ATI',
+    0x8768 : 'GL_ELEMENT_ARRAY_ATI',
+    0x8769 : 'GL_ELEMENT_ARRAY_TYPE_ATI',
+    0x876a : 'GL_ELEMENT_ARRAY_POINTER_ATI',
+    0x876b : 'GL_MAX_VERTEX_STREAMS_ATI',
+    0x876c : 'GL_VERTEX_STREAM0_ATI',
+    0x876d : 'GL_VERTEX_STREAM1_ATI',
+    0x876e : 'GL_VERTEX_STREAM2_ATI',
+    0x876f : 'GL_VERTEX_STREAM3_ATI',
+    0x8770 : 'GL_VERTEX_STREAM4_ATI',
+    0x8771 : 'GL_VERTEX_STREAM5_ATI',
+    0x8772 : 'GL_VERTEX_STREAM6_ATI',
+    0x8773 : 'GL_VERTEX_STREAM7_ATI',
+    0x8774 : 'GL_VERTEX_SOURCE_ATI',
+    0x8775 : 'GL_BUMP_ROT_MATRIX_ATI',
+    0x8776 : 'GL_BUMP_ROT_MATRIX_SIZE_ATI',
+    0x8777 : 'GL_BUMP_NUM_TEX_UNITS_ATI',
+    0x8778 : 'GL_BUMP_TEX_UNITS_ATI',
+    0x8779 : 'GL_DUDV_ATI',
+    0x877a : 'GL_DU8DV8_ATI',
+    0x877b : 'GL_BUMP_ENVMAP_ATI',
+    0x877c : 'GL_BUMP_TARGET_ATI',
+    0x8780 : 'GL_VERTEX_SHADER_EXT',
+    0x8781 : 'GL_VERTEX_SHADER_BINDING_EXT',
+    0x8782 : 'GL_OP_INDEX_EXT',
+    0x8783 : 'GL_OP_NEGATE_EXT',
+    0x8784 : 'GL_OP_DOT3_EXT',
+    0x8785 : 'GL_OP_DOT4_EXT',
+    0x8786 : 'GL_OP_MUL_EXT',
+    0x8787 : 'GL_OP_ADD_EXT',
+    0x8788 : 'GL_OP_MADD_EXT',
+    0x8789 : 'GL_OP_FRAC_EXT',
+    0x878a : 'GL_OP_MAX_EXT',
+    0x878b : 'GL_OP_MIN_EXT',
+    0x878c : 'GL_OP_SET_GE_EXT',
+    0x878d : 'GL_OP_SET_LT_EXT',
+    0x878e : 'GL_OP_CLAMP_EXT',
+    0x878f : 'GL_OP_FLOOR_EXT',
+    0x8790 : 'GL_OP_ROUND_EXT',
+    0x8791 : 'GL_OP_EXP_BASE_2_EXT',
+    0x8792 : 'GL_OP_LOG_BASE_2_EXT',
+    0x8793 : 'GL_OP_POWER_EXT',
+    0x8794 : 'GL_OP_RECIP_EXT',
+    0x8795 : 'GL_OP_RECIP_SQRT_EXT',
+    0x8796 : 'GL_OP_SUB_EXT',
+    0x8797 : 'GL_OP_CROSS_PRODUCT_EXT',
+    0x8798 : 'GL_OP_MULTIPLY_MATRIX_EXT',
+    0x8799 : 'GL_OP_MOV_EXT',
+    0x879a : 'GL_OUTPUT_VERTEX_EXT',
+    0x879b : 'GL_OUTPUT_COLOR0_EXT',
+    0x879c : 'GL_OUTPUT_COLOR1_EXT',
+    0x879d : 'GL_OUTPUT_TEXTURE_COORD0_EXT',
+    0x879e : 'GL_OUTPUT_TEXTURE_COORD1_EXT',
+    0x879f : 'GL_OUTPUT_TEXTURE_COORD2_EXT',
+    0x87a0 : 'GL_OUTPUT_TEXTURE_COORD3_EXT',
+    0x87a1 : 'GL_OUTPUT_TEXTURE_COORD4_EXT',
+    0x87a2 : 'GL_OUTPUT_TEXTURE_COORD5_EXT',
+    0x87a3 : 'GL_OUTPUT_TEXTURE_COORD6_EXT',
+    0x87a4 : 'GL_OUTPUT_TEXTURE_COORD7_EXT',
+    0x87a5 : 'GL_OUTPUT_TEXTURE_COORD8_EXT',
+    0x87a6 : 'GL_OUTPUT_TEXTURE_COORD9_EXT',
+    0x87a7 : 'GL_OUTPUT_TEXTURE_COORD10_EXT',
+    0x87a8 : 'GL_OUTPUT_TEXTURE_COORD11_EXT',
+    0x87a9 : 'GL_OUTPUT_TEXTURE_COORD12_EXT',
+    0x87aa : 'GL_OUTPUT_TEXTURE_COORD13_EXT',
+    0x87ab : 'GL_OUTPUT_TEXTURE_COORD14_EXT',
+    0x87ac : 'GL_OUTPUT_TEXTURE_COORD15_EXT',
+    0x87ad : 'GL_OUTPUT_TEXTURE_COORD16_EXT',
+    0x87ae : 'GL_OUTPUT_TEXTURE_COORD17_EXT',
+    0x87af : 'GL_OUTPUT_TEXTURE_COORD18_EXT',
+    0x87b0 : 'GL_OUTPUT_TEXTURE_COORD19_EXT',
+    0x87b1 : 'GL_OUTPUT_TEXTURE_COORD20_EXT',
+    0x87b2 : 'GL_OUTPUT_TEXTURE_COORD21_EXT',
+    0x87b3 : 'GL_OUTPUT_TEXTURE_COORD22_EXT',
+    0x87b4 : 'GL_OUTPUT_TEXTURE_COORD23_EXT',
+    0x87b5 : 'GL_OUTPUT_TEXTURE_COORD24_EXT',
+    0x87b6 : 'GL_OUTPUT_TEXTURE_COORD25_EXT',
+    0x87b7 : 'GL_OUTPUT_TEXTURE_COORD26_EXT',
+    0x87b8 : 'GL_OUTPUT_TEXTURE_COORD27_EXT',
+    0x87b9 : 'GL_OUTPUT_TEXTURE_COORD28_EXT',
+    0x87ba : 'GL_OUTPUT_TEXTURE_COORD29_EXT',
+    0x87bb : 'GL_OUTPUT_TEXTURE_COORD30_EXT',
+    0x87bc : 'GL_OUTPUT_TEXTURE_COORD31_EXT',
+    0x87bd : 'GL_OUTPUT_FOG_EXT',
+    0x87be : 'GL_SCALAR_EXT',
+    0x87bf : 'GL_VECTOR_EXT',
+    0x87c0 : 'GL_MATRIX_EXT',
+    0x87c1 : 'GL_VARIANT_EXT',
+    0x87c2 : 'GL_INVARIANT_EXT',
+    0x87c3 : 'GL_LOCAL_CONSTANT_EXT',
+    0x87c4 : 'GL_LOCAL_EXT',
+    0x87c5 : 'GL_MAX_VERTEX_SHADER_INSTRUCTIONS_EXT',
+    0x87c6 : 'GL_MAX_VERTEX_SHADER_VARIANTS_EXT',
+    0x87c7 : 'GL_MAX_VERTEX_SHADER_INVARIANTS_EXT',
+    0x87c8 : 'GL_MAX_VERTEX_SHADER_LOCAL_CONSTANTS_EXT',
+    0x87c9 : 'GL_MAX_VERTEX_SHADER_LOCALS_EXT',
+    0x87ca : 'GL_MAX_OPTIMIZED_VERTEX_SHADER_INSTRUCTIONS_EXT',
+    0x87cb : 'GL_MAX_OPTIMIZED_VERTEX_SHADER_VARIANTS_EXT',
+    0x87cc : 'GL_MAX_OPTIMIZED_VERTEX_SHADER_LOCAL_CONSTANTS_EXT',
+    0x87cd : 'GL_MAX_OPTIMIZED_VERTEX_SHADER_INVARIANTS_EXT',
+    0x87ce : 'GL_MAX_OPTIMIZED_VERTEX_SHADER_LOCALS_EXT',
+    0x87cf : 'GL_VERTEX_SHADER_INSTRUCTIONS_EXT',
+    0x87d0 : 'GL_VERTEX_SHADER_VARIANTS_EXT',
+    0x87d1 : 'GL_VERTEX_SHADER_INVARIANTS_EXT',
+    0x87d2 : 'GL_VERTEX_SHADER_LOCAL_CONSTANTS_EXT',
+    0x87d3 : 'GL_VERTEX_SHADER_LOCALS_EXT',
+    0x87d4 : 'GL_VERTEX_SHADER_OPTIMIZED_EXT',
+    0x87d5 : 'GL_X_EXT',
+    0x87d6 : 'GL_Y_EXT',
+    0x87d7 : 'GL_Z_EXT',
+    0x87d8 : 'GL_W_EXT',
+    0x87d9 : 'GL_NEGATIVE_X_EXT',
+    0x87da : 'GL_NEGATIVE_Y_EXT',
+    0x87db : 'GL_NEGATIVE_Z_EXT',
+    0x87dc : 'GL_NEGATIVE_W_EXT',
+    0x87dd : 'GL_ZERO_EXT',
+    0x87de : 'GL_ONE_EXT',
+    0x87df : 'GL_NEGATIVE_ONE_EXT',
+    0x87e0 : 'GL_NORMALIZED_RANGE_EXT',
+    0x87e1 : 'GL_FULL_RANGE_EXT',
+    0x87e2 : 'GL_CURRENT_VERTEX_EXT',
+    0x87e3 : 'GL_MVP_MATRIX_EXT',
+    0x87e4 : 'GL_VARIANT_VALUE_EXT',
+    0x87e5 : 'GL_VARIANT_DATATYPE_EXT',
+    0x87e6 : 'GL_VARIANT_ARRAY_STRIDE_EXT',
+    0x87e7 : 'GL_VARIANT_ARRAY_TYPE_EXT',
+    0x87e8 : 'GL_VARIANT_ARRAY_EXT',
+    0x87e9 : 'GL_VARIANT_ARRAY_POINTER_EXT',
+    0x87ea : 'GL_INVARIANT_VALUE_EXT',
+    0x87eb : 'GL_INVARIANT_DATATYPE_EXT',
+    0x87ec : 'GL_LOCAL_CONSTANT_VALUE_EXT',
+    0x87ed : 'GL_LOCAL_CONSTANT_DATATYPE_EXT',
+    0x87ee : 'GL_ATC_RGBA_INTERPOLATED_ALPHA_AMD',
+    0x87f0 : 'GL_PN_TRIANGLES_ATI',
+    0x87f1 : 'GL_MAX_PN_TRIANGLES_TESSELATION_LEVEL_ATI',
+    0x87f2 : 'GL_PN_TRIANGLES_POINT_MODE_ATI',
+    0x87f3 : 'GL_PN_TRIANGLES_NORMAL_MODE_ATI',
+    0x87f4 : 'GL_PN_TRIANGLES_TESSELATION_LEVEL_ATI',
+    0x87f5 : 'GL_PN_TRIANGLES_POINT_MODE_LINEAR_ATI',
+    0x87f6 : 'GL_PN_TRIANGLES_POINT_MODE_CUBIC_ATI',
+    0x87f7 : 'GL_PN_TRIANGLES_NORMAL_MODE_LINEAR_ATI',
+    0x87f8 : 'GL_PN_TRIANGLES_NORMAL_MODE_QUADRATIC_ATI',
+    0x87f9 : 'GL_3DC_X_AMD',
+    0x87fa : 'GL_3DC_XY_AMD',
+    0x87fb : 'GL_VBO_FREE_MEMORY_ATI',
+    0x87fc : 'GL_TEXTURE_FREE_MEMORY_ATI',
+    0x87fd : 'GL_RENDERBUFFER_FREE_MEMORY_ATI',
+    0x87fe : 'GL_NUM_PROGRAM_BINARY_FORMATS',
+    0x87ff : 'GL_PROGRAM_BINARY_FORMATS',
+    0x8800 : 'GL_STENCIL_BACK_FUNC',
+    0x8801 : 'GL_STENCIL_BACK_FAIL',
+    0x8802 : 'GL_STENCIL_BACK_PASS_DEPTH_FAIL',
+    0x8803 : 'GL_STENCIL_BACK_PASS_DEPTH_PASS',
+    0x8804 : 'GL_FRAGMENT_PROGRAM_ARB',
+    0x8805 : 'GL_PROGRAM_ALU_INSTRUCTIONS_ARB',
+    0x8806 : 'GL_PROGRAM_TEX_INSTRUCTIONS_ARB',
+    0x8807 : 'GL_PROGRAM_TEX_INDIRECTIONS_ARB',
+    0x8808 : 'GL_PROGRAM_NATIVE_ALU_INSTRUCTIONS_ARB',
+    0x8809 : 'GL_PROGRAM_NATIVE_TEX_INSTRUCTIONS_ARB',
+    0x880a : 'GL_PROGRAM_NATIVE_TEX_INDIRECTIONS_ARB',
+    0x880b : 'GL_MAX_PROGRAM_ALU_INSTRUCTIONS_ARB',
+    0x880c : 'GL_MAX_PROGRAM_TEX_INSTRUCTIONS_ARB',
+    0x880d : 'GL_MAX_PROGRAM_TEX_INDIRECTIONS_ARB',
+    0x880e : 'GL_MAX_PROGRAM_NATIVE_ALU_INSTRUCTIONS_ARB',
+    0x880f : 'GL_MAX_PROGRAM_NATIVE_TEX_INSTRUCTIONS_ARB',
+    0x8810 : 'GL_MAX_PROGRAM_NATIVE_TEX_INDIRECTIONS_ARB',
+    0x8814 : 'GL_RGBA32F',
+    0x8815 : 'GL_RGB32F',
+    0x8816 : 'GL_ALPHA32F_ARB',
+    0x8817 : 'GL_INTENSITY32F_ARB',
+    0x8818 : 'GL_LUMINANCE32F_ARB',
+    0x8819 : 'GL_LUMINANCE_ALPHA32F_ARB',
+    0x881a : 'GL_RGBA16F',
+    0x881b : 'GL_RGB16F',
+    0x881c : 'GL_ALPHA16F_ARB',
+    0x881d : 'GL_INTENSITY16F_ARB',
+    0x881e : 'GL_LUMINANCE16F_ARB',
+    0x881f : 'GL_LUMINANCE_ALPHA16F_ARB',
+    0x8820 : 'GL_RGBA_FLOAT_MODE_ARB',
+    0x8823 : 'GL_WRITEONLY_RENDERING_QCOM',
+    0x8824 : 'GL_MAX_DRAW_BUFFERS',
+    0x8825 : 'GL_DRAW_BUFFER0',
+    0x8826 : 'GL_DRAW_BUFFER1',
+    0x8827 : 'GL_DRAW_BUFFER2',
+    0x8828 : 'GL_DRAW_BUFFER3',
+    0x8829 : 'GL_DRAW_BUFFER4',
+    0x882a : 'GL_DRAW_BUFFER5',
+    0x882b : 'GL_DRAW_BUFFER6',
+    0x882c : 'GL_DRAW_BUFFER7',
+    0x882d : 'GL_DRAW_BUFFER8',
+    0x882e : 'GL_DRAW_BUFFER9',
+    0x882f : 'GL_DRAW_BUFFER10',
+    0x8830 : 'GL_DRAW_BUFFER11',
+    0x8831 : 'GL_DRAW_BUFFER12',
+    0x8832 : 'GL_DRAW_BUFFER13',
+    0x8833 : 'GL_DRAW_BUFFER14',
+    0x8834 : 'GL_DRAW_BUFFER15',
+    0x8835 : 'GL_COLOR_CLEAR_UNCLAMPED_VALUE_ATI',
+    0x8837 : 'GL_COMPRESSED_LUMINANCE_ALPHA_3DC_ATI',
+    0x883d : 'GL_BLEND_EQUATION_ALPHA',
+    0x883f : 'GL_SUBSAMPLE_DISTANCE_AMD',
+    0x8840 : 'GL_MATRIX_PALETTE_ARB',
+    0x8841 : 'GL_MAX_MATRIX_PALETTE_STACK_DEPTH_ARB',
+    0x8842 : 'GL_MAX_PALETTE_MATRICES_ARB',
+    0x8843 : 'GL_CURRENT_PALETTE_MATRIX_ARB',
+    0x8844 : 'GL_MATRIX_INDEX_ARRAY_ARB',
+    0x8845 : 'GL_CURRENT_MATRIX_INDEX_ARB',
+    0x8846 : 'GL_MATRIX_INDEX_ARRAY_SIZE_ARB',
+    0x8847 : 'GL_MATRIX_INDEX_ARRAY_TYPE_ARB',
+    0x8848 : 'GL_MATRIX_INDEX_ARRAY_STRIDE_ARB',
+    0x8849 : 'GL_MATRIX_INDEX_ARRAY_POINTER_ARB',
+    0x884a : 'GL_TEXTURE_DEPTH_SIZE',
+    0x884b : 'GL_DEPTH_TEXTURE_MODE',
+    0x884c : 'GL_TEXTURE_COMPARE_MODE',
+    0x884d : 'GL_TEXTURE_COMPARE_FUNC',
+    0x884e : 'GL_COMPARE_R_TO_TEXTURE',
+    0x884f : 'GL_TEXTURE_CUBE_MAP_SEAMLESS',
+    0x8850 : 'GL_OFFSET_PROJECTIVE_TEXTURE_2D_NV',
+    0x8851 : 'GL_OFFSET_PROJECTIVE_TEXTURE_2D_SCALE_NV',
+    0x8852 : 'GL_OFFSET_PROJECTIVE_TEXTURE_RECTANGLE_NV',
+    0x8853 : 'GL_OFFSET_PROJECTIVE_TEXTURE_RECTANGLE_SCALE_NV',
+    0x8854 : 'GL_OFFSET_HILO_TEXTURE_2D_NV',
+    0x8855 : 'GL_OFFSET_HILO_TEXTURE_RECTANGLE_NV',
+    0x8856 : 'GL_OFFSET_HILO_PROJECTIVE_TEXTURE_2D_NV',
+    0x8857 : 'GL_OFFSET_HILO_PROJECTIVE_TEXTURE_RECTANGLE_NV',
+    0x8858 : 'GL_DEPENDENT_HILO_TEXTURE_2D_NV',
+    0x8859 : 'GL_DEPENDENT_RGB_TEXTURE_3D_NV',
+    0x885a : 'GL_DEPENDENT_RGB_TEXTURE_CUBE_MAP_NV',
+    0x885b : 'GL_DOT_PRODUCT_PASS_THROUGH_NV',
+    0x885c : 'GL_DOT_PRODUCT_TEXTURE_1D_NV',
+    0x885d : 'GL_DOT_PRODUCT_AFFINE_DEPTH_REPLACE_NV',
+    0x885e : 'GL_HILO8_NV',
+    0x885f : 'GL_SIGNED_HILO8_NV',
+    0x8860 : 'GL_FORCE_BLUE_TO_ONE_NV',
+    0x8861 : 'GL_POINT_SPRITE',
+    0x8862 : 'GL_COORD_REPLACE',
+    0x8863 : 'GL_POINT_SPRITE_R_MODE_NV',
+    0x8864 : 'GL_QUERY_COUNTER_BITS',
+    0x8865 : 'GL_CURRENT_QUERY',
+    0x8866 : 'GL_QUERY_RESULT',
+    0x8867 : 'GL_QUERY_RESULT_AVAILABLE',
+    0x8868 : 'GL_MAX_FRAGMENT_PROGRAM_LOCAL_PARAMETERS_NV',
+    0x8869 : 'GL_MAX_VERTEX_ATTRIBS',
+    0x886a : 'GL_VERTEX_ATTRIB_ARRAY_NORMALIZED',
+    0x886c : 'GL_MAX_TESS_CONTROL_INPUT_COMPONENTS',
+    0x886d : 'GL_MAX_TESS_EVALUATION_INPUT_COMPONENTS',
+    0x886e : 'GL_DEPTH_STENCIL_TO_RGBA_NV',
+    0x886f : 'GL_DEPTH_STENCIL_TO_BGRA_NV',
+    0x8870 : 'GL_FRAGMENT_PROGRAM_NV',
+    0x8871 : 'GL_MAX_TEXTURE_COORDS',
+    0x8872 : 'GL_MAX_TEXTURE_IMAGE_UNITS',
+    0x8873 : 'GL_FRAGMENT_PROGRAM_BINDING_NV',
+    0x8874 : 'GL_PROGRAM_ERROR_STRING_ARB',
+    0x8875 : 'GL_PROGRAM_FORMAT_ASCII_ARB',
+    0x8876 : 'GL_PROGRAM_FORMAT_ARB',
+    0x8878 : 'GL_WRITE_PIXEL_DATA_RANGE_NV',
+    0x8879 : 'GL_READ_PIXEL_DATA_RANGE_NV',
+    0x887a : 'GL_WRITE_PIXEL_DATA_RANGE_LENGTH_NV',
+    0x887b : 'GL_READ_PIXEL_DATA_RANGE_LENGTH_NV',
+    0x887c : 'GL_WRITE_PIXEL_DATA_RANGE_POINTER_NV',
+    0x887d : 'GL_READ_PIXEL_DATA_RANGE_POINTER_NV',
+    0x887f : 'GL_GEOMETRY_SHADER_INVOCATIONS',
+    0x8880 : 'GL_FLOAT_R_NV',
+    0x8881 : 'GL_FLOAT_RG_NV',
+    0x8882 : 'GL_FLOAT_RGB_NV',
+    0x8883 : 'GL_FLOAT_RGBA_NV',
+    0x8884 : 'GL_FLOAT_R16_NV',
+    0x8885 : 'GL_FLOAT_R32_NV',
+    0x8886 : 'GL_FLOAT_RG16_NV',
+    0x8887 : 'GL_FLOAT_RG32_NV',
+    0x8888 : 'GL_FLOAT_RGB16_NV',
+    0x8889 : 'GL_FLOAT_RGB32_NV',
+    0x888a : 'GL_FLOAT_RGBA16_NV',
+    0x888b : 'GL_FLOAT_RGBA32_NV',
+    0x888c : 'GL_TEXTURE_FLOAT_COMPONENTS_NV',
+    0x888d : 'GL_FLOAT_CLEAR_COLOR_VALUE_NV',
+    0x888e : 'GL_FLOAT_RGBA_MODE_NV',
+    0x888f : 'GL_TEXTURE_UNSIGNED_REMAP_MODE_NV',
+    0x8890 : 'GL_DEPTH_BOUNDS_TEST_EXT',
+    0x8891 : 'GL_DEPTH_BOUNDS_EXT',
+    0x8892 : 'GL_ARRAY_BUFFER',
+    0x8893 : 'GL_ELEMENT_ARRAY_BUFFER',
+    0x8894 : 'GL_ARRAY_BUFFER_BINDING',
+    0x8895 : 'GL_ELEMENT_ARRAY_BUFFER_BINDING',
+    0x8896 : 'GL_VERTEX_ARRAY_BUFFER_BINDING',
+    0x8897 : 'GL_NORMAL_ARRAY_BUFFER_BINDING',
+    0x8898 : 'GL_COLOR_ARRAY_BUFFER_BINDING',
+    0x8899 : 'GL_INDEX_ARRAY_BUFFER_BINDING',
+    0x889a : 'GL_TEXTURE_COORD_ARRAY_BUFFER_BINDING',
+    0x889b : 'GL_EDGE_FLAG_ARRAY_BUFFER_BINDING',
+    0x889c : 'GL_SECONDARY_COLOR_ARRAY_BUFFER_BINDING',
+    0x889d : 'GL_FOG_COORDINATE_ARRAY_BUFFER_BINDING_ARB',
+    0x889e : 'GL_WEIGHT_ARRAY_BUFFER_BINDING',
+    0x889f : 'GL_VERTEX_ATTRIB_ARRAY_BUFFER_BINDING',
+    0x88a0 : 'GL_PROGRAM_INSTRUCTIONS_ARB',
+    0x88a1 : 'GL_MAX_PROGRAM_INSTRUCTIONS_ARB',
+    0x88a2 : 'GL_PROGRAM_NATIVE_INSTRUCTIONS_ARB',
+    0x88a3 : 'GL_MAX_PROGRAM_NATIVE_INSTRUCTIONS_ARB',
+    0x88a4 : 'GL_PROGRAM_TEMPORARIES_ARB',
+    0x88a5 : 'GL_MAX_PROGRAM_TEMPORARIES_ARB',
+    0x88a6 : 'GL_PROGRAM_NATIVE_TEMPORARIES_ARB',
+    0x88a7 : 'GL_MAX_PROGRAM_NATIVE_TEMPORARIES_ARB',
+    0x88a8 : 'GL_PROGRAM_PARAMETERS_ARB',
+    0x88a9 : 'GL_MAX_PROGRAM_PARAMETERS_ARB',
+    0x88aa : 'GL_PROGRAM_NATIVE_PARAMETERS_ARB',
+    0x88ab : 'GL_MAX_PROGRAM_NATIVE_PARAMETERS_ARB',
+    0x88ac : 'GL_PROGRAM_ATTRIBS_ARB',
+    0x88ad : 'GL_MAX_PROGRAM_ATTRIBS_ARB',
+    0x88ae : 'GL_PROGRAM_NATIVE_ATTRIBS_ARB',
+    0x88af : 'GL_MAX_PROGRAM_NATIVE_ATTRIBS_ARB',
+    0x88b0 : 'GL_PROGRAM_ADDRESS_REGISTERS_ARB',
+    0x88b1 : 'GL_MAX_PROGRAM_ADDRESS_REGISTERS_ARB',
+    0x88b2 : 'GL_PROGRAM_NATIVE_ADDRESS_REGISTERS_ARB',
+    0x88b3 : 'GL_MAX_PROGRAM_NATIVE_ADDRESS_REGISTERS_ARB',
+    0x88b4 : 'GL_MAX_PROGRAM_LOCAL_PARAMETERS_ARB',
+    0x88b5 : 'GL_MAX_PROGRAM_ENV_PARAMETERS_ARB',
+    0x88b6 : 'GL_PROGRAM_UNDER_NATIVE_LIMITS_ARB',
+    0x88b7 : 'GL_TRANSPOSE_CURRENT_MATRIX_ARB',
+    0x88b8 : 'GL_READ_ONLY',
+    0x88b9 : 'GL_WRITE_ONLY',
+    0x88ba : 'GL_READ_WRITE',
+    0x88bb : 'GL_BUFFER_ACCESS',
+    0x88bc : 'GL_BUFFER_MAPPED',
+    0x88bd : 'GL_BUFFER_MAP_POINTER',
+    0x88be : 'GL_WRITE_DISCARD_NV',
+    0x88bf : 'GL_TIME_ELAPSED',
+    0x88c0 : 'GL_MATRIX0_ARB',
+    0x88c1 : 'GL_MATRIX1_ARB',
+    0x88c2 : 'GL_MATRIX2_ARB',
+    0x88c3 : 'GL_MATRIX3_ARB',
+    0x88c4 : 'GL_MATRIX4_ARB',
+    0x88c5 : 'GL_MATRIX5_ARB',
+    0x88c6 : 'GL_MATRIX6_ARB',
+    0x88c7 : 'GL_MATRIX7_ARB',
+    0x88c8 : 'GL_MATRIX8_ARB',
+    0x88c9 : 'GL_MATRIX9_ARB',
+    0x88ca : 'GL_MATRIX10_ARB',
+    0x88cb : 'GL_MATRIX11_ARB',
+    0x88cc : 'GL_MATRIX12_ARB',
+    0x88cd : 'GL_MATRIX13_ARB',
+    0x88ce : 'GL_MATRIX14_ARB',
+    0x88cf : 'GL_MATRIX15_ARB',
+    0x88d0 : 'GL_MATRIX16_ARB',
+    0x88d1 : 'GL_MATRIX17_ARB',
+    0x88d2 : 'GL_MATRIX18_ARB',
+    0x88d3 : 'GL_MATRIX19_ARB',
+    0x88d4 : 'GL_MATRIX20_ARB',
+    0x88d5 : 'GL_MATRIX21_ARB',
+    0x88d6 : 'GL_MATRIX22_ARB',
+    0x88d7 : 'GL_MATRIX23_ARB',
+    0x88d8 : 'GL_MATRIX24_ARB',
+    0x88d9 : 'GL_MATRIX25_ARB',
+    0x88da : 'GL_MATRIX26_ARB',
+    0x88db : 'GL_MATRIX27_ARB',
+    0x88dc : 'GL_MATRIX28_ARB',
+    0x88dd : 'GL_MATRIX29_ARB',
+    0x88de : 'GL_MATRIX30_ARB',
+    0x88df : 'GL_MATRIX31_ARB',
+    0x88e0 : 'GL_STREAM_DRAW',
+    0x88e1 : 'GL_STREAM_READ',
+    0x88e2 : 'GL_STREAM_COPY',
+    0x88e4 : 'GL_STATIC_DRAW',
+    0x88e5 : 'GL_STATIC_READ',
+    0x88e6 : 'GL_STATIC_COPY',
+    0x88e8 : 'GL_DYNAMIC_DRAW',
+    0x88e9 : 'GL_DYNAMIC_READ',
+    0x88ea : 'GL_DYNAMIC_COPY',
+    0x88eb : 'GL_PIXEL_PACK_BUFFER',
+    0x88ec : 'GL_PIXEL_UNPACK_BUFFER',
+    0x88ed : 'GL_PIXEL_PACK_BUFFER_BINDING',
+    0x88ee : 'GL_ETC1_SRGB8_NV',
+    0x88ef : 'GL_PIXEL_UNPACK_BUFFER_BINDING',
+    0x88f0 : 'GL_DEPTH24_STENCIL8',
+    0x88f1 : 'GL_TEXTURE_STENCIL_SIZE',
+    0x88f2 : 'GL_STENCIL_TAG_BITS_EXT',
+    0x88f3 : 'GL_STENCIL_CLEAR_TAG_VALUE_EXT',
+    0x88f4 : 'GL_MAX_PROGRAM_EXEC_INSTRUCTIONS_NV',
+    0x88f5 : 'GL_MAX_PROGRAM_CALL_DEPTH_NV',
+    0x88f6 : 'GL_MAX_PROGRAM_IF_DEPTH_NV',
+    0x88f7 : 'GL_MAX_PROGRAM_LOOP_DEPTH_NV',
+    0x88f8 : 'GL_MAX_PROGRAM_LOOP_COUNT_NV',
+    0x88f9 : 'GL_SRC1_COLOR',
+    0x88fa : 'GL_ONE_MINUS_SRC1_COLOR',
+    0x88fb : 'GL_ONE_MINUS_SRC1_ALPHA',
+    0x88fc : 'GL_MAX_DUAL_SOURCE_DRAW_BUFFERS',
+    0x88fd : 'GL_VERTEX_ATTRIB_ARRAY_INTEGER',
+    0x88fe : 'GL_VERTEX_ATTRIB_ARRAY_DIVISOR',
+    0x88ff : 'GL_MAX_ARRAY_TEXTURE_LAYERS',
+    0x8904 : 'GL_MIN_PROGRAM_TEXEL_OFFSET',
+    0x8905 : 'GL_MAX_PROGRAM_TEXEL_OFFSET',
+    0x8906 : 'GL_PROGRAM_ATTRIB_COMPONENTS_NV',
+    0x8907 : 'GL_PROGRAM_RESULT_COMPONENTS_NV',
+    0x8908 : 'GL_MAX_PROGRAM_ATTRIB_COMPONENTS_NV',
+    0x8909 : 'GL_MAX_PROGRAM_RESULT_COMPONENTS_NV',
+    0x8910 : 'GL_STENCIL_TEST_TWO_SIDE_EXT',
+    0x8911 : 'GL_ACTIVE_STENCIL_FACE_EXT',
+    0x8912 : 'GL_MIRROR_CLAMP_TO_BORDER_EXT',
+    0x8914 : 'GL_SAMPLES_PASSED',
+    0x8916 : 'GL_GEOMETRY_VERTICES_OUT',
+    0x8917 : 'GL_GEOMETRY_INPUT_TYPE',
+    0x8918 : 'GL_GEOMETRY_OUTPUT_TYPE',
+    0x8919 : 'GL_SAMPLER_BINDING',
+    0x891a : 'GL_CLAMP_VERTEX_COLOR',
+    0x891b : 'GL_CLAMP_FRAGMENT_COLOR',
+    0x891c : 'GL_CLAMP_READ_COLOR',
+    0x891d : 'GL_FIXED_ONLY',
+    0x891e : 'GL_TESS_CONTROL_PROGRAM_NV',
+    0x891f : 'GL_TESS_EVALUATION_PROGRAM_NV',
+    0x8920 : 'GL_FRAGMENT_SHADER_ATI',
+    0x8921 : 'GL_REG_0_ATI',
+    0x8922 : 'GL_REG_1_ATI',
+    0x8923 : 'GL_REG_2_ATI',
+    0x8924 : 'GL_REG_3_ATI',
+    0x8925 : 'GL_REG_4_ATI',
+    0x8926 : 'GL_REG_5_ATI',
+    0x8927 : 'GL_REG_6_ATI',
+    0x8928 : 'GL_REG_7_ATI',
+    0x8929 : 'GL_REG_8_ATI',
+    0x892a : 'GL_REG_9_ATI',
+    0x892b : 'GL_REG_10_ATI',
+    0x892c : 'GL_REG_11_ATI',
+    0x892d : 'GL_REG_12_ATI',
+    0x892e : 'GL_REG_13_ATI',
+    0x892f : 'GL_REG_14_ATI',
+    0x8930 : 'GL_REG_15_ATI',
+    0x8931 : 'GL_REG_16_ATI',
+    0x8932 : 'GL_REG_17_ATI',
+    0x8933 : 'GL_REG_18_ATI',
+    0x8934 : 'GL_REG_19_ATI',
+    0x8935 : 'GL_REG_20_ATI',
+    0x8936 : 'GL_REG_21_ATI',
+    0x8937 : 'GL_REG_22_ATI',
+    0x8938 : 'GL_REG_23_ATI',
+    0x8939 : 'GL_REG_24_ATI',
+    0x893a : 'GL_REG_25_ATI',
+    0x893b : 'GL_REG_26_ATI',
+    0x893c : 'GL_REG_27_ATI',
+    0x893d : 'GL_REG_28_ATI',
+    0x893e : 'GL_REG_29_ATI',
+    0x893f : 'GL_REG_30_ATI',
+    0x8940 : 'GL_REG_31_ATI',
+    0x8941 : 'GL_CON_0_ATI',
+    0x8942 : 'GL_CON_1_ATI',
+    0x8943 : 'GL_CON_2_ATI',
+    0x8944 : 'GL_CON_3_ATI',
+    0x8945 : 'GL_CON_4_ATI',
+    0x8946 : 'GL_CON_5_ATI',
+    0x8947 : 'GL_CON_6_ATI',
+    0x8948 : 'GL_CON_7_ATI',
+    0x8949 : 'GL_CON_8_ATI',
+    0x894a : 'GL_CON_9_ATI',
+    0x894b : 'GL_CON_10_ATI',
+    0x894c : 'GL_CON_11_ATI',
+    0x894d : 'GL_CON_12_ATI',
+    0x894e : 'GL_CON_13_ATI',
+    0x894f : 'GL_CON_14_ATI',
+    0x8950 : 'GL_CON_15_ATI',
+    0x8951 : 'GL_CON_16_ATI',
+    0x8952 : 'GL_CON_17_ATI',
+    0x8953 : 'GL_CON_18_ATI',
+    0x8954 : 'GL_CON_19_ATI',
+    0x8955 : 'GL_CON_20_ATI',
+    0x8956 : 'GL_CON_21_ATI',
+    0x8957 : 'GL_CON_22_ATI',
+    0x8958 : 'GL_CON_23_ATI',
+    0x8959 : 'GL_CON_24_ATI',
+    0x895a : 'GL_CON_25_ATI',
+    0x895b : 'GL_CON_26_ATI',
+    0x895c : 'GL_CON_27_ATI',
+    0x895d : 'GL_CON_28_ATI',
+    0x895e : 'GL_CON_29_ATI',
+    0x895f : 'GL_CON_30_ATI',
+    0x8960 : 'GL_CON_31_ATI',
+    0x8961 : 'GL_MOV_ATI',
+    0x8963 : 'GL_ADD_ATI',
+    0x8964 : 'GL_MUL_ATI',
+    0x8965 : 'GL_SUB_ATI',
+    0x8966 : 'GL_DOT3_ATI',
+    0x8967 : 'GL_DOT4_ATI',
+    0x8968 : 'GL_MAD_ATI',
+    0x8969 : 'GL_LERP_ATI',
+    0x896a : 'GL_CND_ATI',
+    0x896b : 'GL_CND0_ATI',
+    0x896c : 'GL_DOT2_ADD_ATI',
+    0x896d : 'GL_SECONDARY_INTERPOLATOR_ATI',
+    0x896e : 'GL_NUM_FRAGMENT_REGISTERS_ATI',
+    0x896f : 'GL_NUM_FRAGMENT_CONSTANTS_ATI',
+    0x8970 : 'GL_NUM_PASSES_ATI',
+    0x8971 : 'GL_NUM_INSTRUCTIONS_PER_PASS_ATI',
+    0x8972 : 'GL_NUM_INSTRUCTIONS_TOTAL_ATI',
+    0x8973 : 'GL_NUM_INPUT_INTERPOLATOR_COMPONENTS_ATI',
+    0x8974 : 'GL_NUM_LOOPBACK_COMPONENTS_ATI',
+    0x8975 : 'GL_COLOR_ALPHA_PAIRING_ATI',
+    0x8976 : 'GL_SWIZZLE_STR_ATI',
+    0x8977 : 'GL_SWIZZLE_STQ_ATI',
+    0x8978 : 'GL_SWIZZLE_STR_DR_ATI',
+    0x8979 : 'GL_SWIZZLE_STQ_DQ_ATI',
+    0x897a : 'GL_SWIZZLE_STRQ_ATI',
+    0x897b : 'GL_SWIZZLE_STRQ_DQ_ATI',
+    0x8980 : 'GL_INTERLACE_OML',
+    0x8981 : 'GL_INTERLACE_READ_OML',
+    0x8982 : 'GL_FORMAT_SUBSAMPLE_24_24_OML',
+    0x8983 : 'GL_FORMAT_SUBSAMPLE_244_244_OML',
+    0x8984 : 'GL_PACK_RESAMPLE_OML',
+    0x8985 : 'GL_UNPACK_RESAMPLE_OML',
+    0x8986 : 'GL_RESAMPLE_REPLICATE_OML',
+    0x8987 : 'GL_RESAMPLE_ZERO_FILL_OML',
+    0x8988 : 'GL_RESAMPLE_AVERAGE_OML',
+    0x8989 : 'GL_RESAMPLE_DECIMATE_OML',
+    0x898a : 'GL_POINT_SIZE_ARRAY_TYPE_OES',
+    0x898b : 'GL_POINT_SIZE_ARRAY_STRIDE_OES',
+    0x898c : 'GL_POINT_SIZE_ARRAY_POINTER_OES',
+    0x898d : 'GL_MODELVIEW_MATRIX_FLOAT_AS_INT_BITS_OES',
+    0x898e : 'GL_PROJECTION_MATRIX_FLOAT_AS_INT_BITS_OES',
+    0x898f : 'GL_TEXTURE_MATRIX_FLOAT_AS_INT_BITS_OES',
+    0x8a00 : 'GL_VERTEX_ATTRIB_MAP1_APPLE',
+    0x8a01 : 'GL_VERTEX_ATTRIB_MAP2_APPLE',
+    0x8a02 : 'GL_VERTEX_ATTRIB_MAP1_SIZE_APPLE',
+    0x8a03 : 'GL_VERTEX_ATTRIB_MAP1_COEFF_APPLE',
+    0x8a04 : 'GL_VERTEX_ATTRIB_MAP1_ORDER_APPLE',
+    0x8a05 : 'GL_VERTEX_ATTRIB_MAP1_DOMAIN_APPLE',
+    0x8a06 : 'GL_VERTEX_ATTRIB_MAP2_SIZE_APPLE',
+    0x8a07 : 'GL_VERTEX_ATTRIB_MAP2_COEFF_APPLE',
+    0x8a08 : 'GL_VERTEX_ATTRIB_MAP2_ORDER_APPLE',
+    0x8a09 : 'GL_VERTEX_ATTRIB_MAP2_DOMAIN_APPLE',
+    0x8a0a : 'GL_DRAW_PIXELS_APPLE',
+    0x8a0b : 'GL_FENCE_APPLE',
+    0x8a0c : 'GL_ELEMENT_ARRAY_APPLE',
+    0x8a0d : 'GL_ELEMENT_ARRAY_TYPE_APPLE',
+    0x8a0e : 'GL_ELEMENT_ARRAY_POINTER_APPLE',
+    0x8a0f : 'GL_COLOR_FLOAT_APPLE',
+    0x8a11 : 'GL_UNIFORM_BUFFER',
+    0x8a12 : 'GL_BUFFER_SERIALIZED_MODIFY_APPLE',
+    0x8a13 : 'GL_BUFFER_FLUSHING_UNMAP_APPLE',
+    0x8a14 : 'GL_AUX_DEPTH_STENCIL_APPLE',
+    0x8a15 : 'GL_PACK_ROW_BYTES_APPLE',
+    0x8a16 : 'GL_UNPACK_ROW_BYTES_APPLE',
+    0x8a19 : 'GL_RELEASED_APPLE',
+    0x8a1a : 'GL_VOLATILE_APPLE',
+    0x8a1b : 'GL_RETAINED_APPLE',
+    0x8a1c : 'GL_UNDEFINED_APPLE',
+    0x8a1d : 'GL_PURGEABLE_APPLE',
+    0x8a1f : 'GL_RGB_422_APPLE',
+    0x8a28 : 'GL_UNIFORM_BUFFER_BINDING',
+    0x8a29 : 'GL_UNIFORM_BUFFER_START',
+    0x8a2a : 'GL_UNIFORM_BUFFER_SIZE',
+    0x8a2b : 'GL_MAX_VERTEX_UNIFORM_BLOCKS',
+    0x8a2c : 'GL_MAX_GEOMETRY_UNIFORM_BLOCKS',
+    0x8a2d : 'GL_MAX_FRAGMENT_UNIFORM_BLOCKS',
+    0x8a2e : 'GL_MAX_COMBINED_UNIFORM_BLOCKS',
+    0x8a2f : 'GL_MAX_UNIFORM_BUFFER_BINDINGS',
+    0x8a30 : 'GL_MAX_UNIFORM_BLOCK_SIZE',
+    0x8a31 : 'GL_MAX_COMBINED_VERTEX_UNIFORM_COMPONENTS',
+    0x8a32 : 'GL_MAX_COMBINED_GEOMETRY_UNIFORM_COMPONENTS',
+    0x8a33 : 'GL_MAX_COMBINED_FRAGMENT_UNIFORM_COMPONENTS',
+    0x8a34 : 'GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT',
+    0x8a35 : 'GL_ACTIVE_UNIFORM_BLOCK_MAX_NAME_LENGTH',
+    0x8a36 : 'GL_ACTIVE_UNIFORM_BLOCKS',
+    0x8a37 : 'GL_UNIFORM_TYPE',
+    0x8a38 : 'GL_UNIFORM_SIZE',
+    0x8a39 : 'GL_UNIFORM_NAME_LENGTH',
+    0x8a3a : 'GL_UNIFORM_BLOCK_INDEX',
+    0x8a3b : 'GL_UNIFORM_OFFSET',
+    0x8a3c : 'GL_UNIFORM_ARRAY_STRIDE',
+    0x8a3d : 'GL_UNIFORM_MATRIX_STRIDE',
+    0x8a3e : 'GL_UNIFORM_IS_ROW_MAJOR',
+    0x8a3f : 'GL_UNIFORM_BLOCK_BINDING',
+    0x8a40 : 'GL_UNIFORM_BLOCK_DATA_SIZE',
+    0x8a41 : 'GL_UNIFORM_BLOCK_NAME_LENGTH',
+    0x8a42 : 'GL_UNIFORM_BLOCK_ACTIVE_UNIFORMS',
+    0x8a43 : 'GL_UNIFORM_BLOCK_ACTIVE_UNIFORM_INDICES',
+    0x8a44 : 'GL_UNIFORM_BLOCK_REFERENCED_BY_VERTEX_SHADER',
+    0x8a45 : 'GL_UNIFORM_BLOCK_REFERENCED_BY_GEOMETRY_SHADER',
+    0x8a46 : 'GL_UNIFORM_BLOCK_REFERENCED_BY_FRAGMENT_SHADER',
+    0x8a48 : 'GL_TEXTURE_SRGB_DECODE_EXT',
+    0x8a49 : 'GL_DECODE_EXT',
+    0x8a4a : 'GL_SKIP_DECODE_EXT',
+    0x8a4f : 'GL_PROGRAM_PIPELINE_OBJECT_EXT',
+    0x8a51 : 'GL_RGB_RAW_422_APPLE',
+    0x8a52 : 'GL_FRAGMENT_SHADER_DISCARDS_SAMPLES_EXT',
+    0x8a53 : 'GL_SYNC_OBJECT_APPLE',
+    0x8a54 : 'GL_COMPRESSED_SRGB_PVRTC_2BPPV1_EXT',
+    0x8a55 : 'GL_COMPRESSED_SRGB_PVRTC_4BPPV1_EXT',
+    0x8a56 : 'GL_COMPRESSED_SRGB_ALPHA_PVRTC_2BPPV1_EXT',
+    0x8a57 : 'GL_COMPRESSED_SRGB_ALPHA_PVRTC_4BPPV1_EXT',
+    0x8b30 : 'GL_FRAGMENT_SHADER',
+    0x8b31 : 'GL_VERTEX_SHADER',
+    0x8b40 : 'GL_PROGRAM_OBJECT_ARB',
+    0x8b48 : 'GL_SHADER_OBJECT_ARB',
+    0x8b49 : 'GL_MAX_FRAGMENT_UNIFORM_COMPONENTS',
+    0x8b4a : 'GL_MAX_VERTEX_UNIFORM_COMPONENTS',
+    0x8b4b : 'GL_MAX_VARYING_FLOATS',
+    0x8b4c : 'GL_MAX_VERTEX_TEXTURE_IMAGE_UNITS',
+    0x8b4d : 'GL_MAX_COMBINED_TEXTURE_IMAGE_UNITS',
+    0x8b4e : 'GL_OBJECT_TYPE_ARB',
+    0x8b4f : 'GL_SHADER_TYPE',
+    0x8b50 : 'GL_FLOAT_VEC2',
+    0x8b51 : 'GL_FLOAT_VEC3',
+    0x8b52 : 'GL_FLOAT_VEC4',
+    0x8b53 : 'GL_INT_VEC2',
+    0x8b54 : 'GL_INT_VEC3',
+    0x8b55 : 'GL_INT_VEC4',
+    0x8b56 : 'GL_BOOL',
+    0x8b57 : 'GL_BOOL_VEC2',
+    0x8b58 : 'GL_BOOL_VEC3',
+    0x8b59 : 'GL_BOOL_VEC4',
+    0x8b5a : 'GL_FLOAT_MAT2',
+    0x8b5b : 'GL_FLOAT_MAT3',
+    0x8b5c : 'GL_FLOAT_MAT4',
+    0x8b5d : 'GL_SAMPLER_1D',
+    0x8b5e : 'GL_SAMPLER_2D',
+    0x8b5f : 'GL_SAMPLER_3D',
+    0x8b60 : 'GL_SAMPLER_CUBE',
+    0x8b61 : 'GL_SAMPLER_1D_SHADOW',
+    0x8b62 : 'GL_SAMPLER_2D_SHADOW',
+    0x8b63 : 'GL_SAMPLER_2D_RECT',
+    0x8b64 : 'GL_SAMPLER_2D_RECT_SHADOW',
+    0x8b65 : 'GL_FLOAT_MAT2x3',
+    0x8b66 : 'GL_FLOAT_MAT2x4',
+    0x8b67 : 'GL_FLOAT_MAT3x2',
+    0x8b68 : 'GL_FLOAT_MAT3x4',
+    0x8b69 : 'GL_FLOAT_MAT4x2',
+    0x8b6a : 'GL_FLOAT_MAT4x3',
+    0x8b80 : 'GL_DELETE_STATUS',
+    0x8b81 : 'GL_COMPILE_STATUS',
+    0x8b82 : 'GL_LINK_STATUS',
+    0x8b83 : 'GL_VALIDATE_STATUS',
+    0x8b84 : 'GL_INFO_LOG_LENGTH',
+    0x8b85 : 'GL_ATTACHED_SHADERS',
+    0x8b86 : 'GL_ACTIVE_UNIFORMS',
+    0x8b87 : 'GL_ACTIVE_UNIFORM_MAX_LENGTH',
+    0x8b88 : 'GL_SHADER_SOURCE_LENGTH',
+    0x8b89 : 'GL_ACTIVE_ATTRIBUTES',
+    0x8b8a : 'GL_ACTIVE_ATTRIBUTE_MAX_LENGTH',
+    0x8b8b : 'GL_FRAGMENT_SHADER_DERIVATIVE_HINT',
+    0x8b8c : 'GL_SHADING_LANGUAGE_VERSION',
+    0x8b8d : 'GL_CURRENT_PROGRAM',
+    0x8b90 : 'GL_PALETTE4_RGB8_OES',
+    0x8b91 : 'GL_PALETTE4_RGBA8_OES',
+    0x8b92 : 'GL_PALETTE4_R5_G6_B5_OES',
+    0x8b93 : 'GL_PALETTE4_RGBA4_OES',
+    0x8b94 : 'GL_PALETTE4_RGB5_A1_OES',
+    0x8b95 : 'GL_PALETTE8_RGB8_OES',
+    0x8b96 : 'GL_PALETTE8_RGBA8_OES',
+    0x8b97 : 'GL_PALETTE8_R5_G6_B5_OES',
+    0x8b98 : 'GL_PALETTE8_RGBA4_OES',
+    0x8b99 : 'GL_PALETTE8_RGB5_A1_OES',
+    0x8b9a : 'GL_IMPLEMENTATION_COLOR_READ_TYPE',
+    0x8b9b : 'GL_IMPLEMENTATION_COLOR_READ_FORMAT',
+    0x8b9c : 'GL_POINT_SIZE_ARRAY_OES',
+    0x8b9d : 'GL_TEXTURE_CROP_RECT_OES',
+    0x8b9e : 'GL_MATRIX_INDEX_ARRAY_BUFFER_BINDING_OES',
+    0x8b9f : 'GL_POINT_SIZE_ARRAY_BUFFER_BINDING_OES',
+    0x8bb0 : 'GL_FRAGMENT_PROGRAM_POSITION_MESA',
+    0x8bb1 : 'GL_FRAGMENT_PROGRAM_CALLBACK_MESA',
+    0x8bb2 : 'GL_FRAGMENT_PROGRAM_CALLBACK_FUNC_MESA',
+    0x8bb3 : 'GL_FRAGMENT_PROGRAM_CALLBACK_DATA_MESA',
+    0x8bb4 : 'GL_VERTEX_PROGRAM_POSITION_MESA',
+    0x8bb5 : 'GL_VERTEX_PROGRAM_CALLBACK_MESA',
+    0x8bb6 : 'GL_VERTEX_PROGRAM_CALLBACK_FUNC_MESA',
+    0x8bb7 : 'GL_VERTEX_PROGRAM_CALLBACK_DATA_MESA',
+    0x8bc0 : 'GL_COUNTER_TYPE_AMD',
+    0x8bc1 : 'GL_COUNTER_RANGE_AMD',
+    0x8bc2 : 'GL_UNSIGNED_INT64_AMD',
+    0x8bc3 : 'GL_PERCENTAGE_AMD',
+    0x8bc4 : 'GL_PERFMON_RESULT_AVAILABLE_AMD',
+    0x8bc5 : 'GL_PERFMON_RESULT_SIZE_AMD',
+    0x8bc6 : 'GL_PERFMON_RESULT_AMD',
+    0x8bd2 : 'GL_TEXTURE_WIDTH_QCOM',
+    0x8bd3 : 'GL_TEXTURE_HEIGHT_QCOM',
+    0x8bd4 : 'GL_TEXTURE_DEPTH_QCOM',
+    0x8bd5 : 'GL_TEXTURE_INTERNAL_FORMAT_QCOM',
+    0x8bd6 : 'GL_TEXTURE_FORMAT_QCOM',
+    0x8bd7 : 'GL_TEXTURE_TYPE_QCOM',
+    0x8bd8 : 'GL_TEXTURE_IMAGE_VALID_QCOM',
+    0x8bd9 : 'GL_TEXTURE_NUM_LEVELS_QCOM',
+    0x8bda : 'GL_TEXTURE_TARGET_QCOM',
+    0x8bdb : 'GL_TEXTURE_OBJECT_VALID_QCOM',
+    0x8bdc : 'GL_STATE_RESTORE',
+    0x8c00 : 'GL_COMPRESSED_RGB_PVRTC_4BPPV1_IMG',
+    0x8c01 : 'GL_COMPRESSED_RGB_PVRTC_2BPPV1_IMG',
+    0x8c02 : 'GL_COMPRESSED_RGBA_PVRTC_4BPPV1_IMG',
+    0x8c03 : 'GL_COMPRESSED_RGBA_PVRTC_2BPPV1_IMG',
+    0x8c04 : 'GL_MODULATE_COLOR_IMG',
+    0x8c05 : 'GL_RECIP_ADD_SIGNED_ALPHA_IMG',
+    0x8c06 : 'GL_TEXTURE_ALPHA_MODULATE_IMG',
+    0x8c07 : 'GL_FACTOR_ALPHA_MODULATE_IMG',
+    0x8c08 : 'GL_FRAGMENT_ALPHA_MODULATE_IMG',
+    0x8c09 : 'GL_ADD_BLEND_IMG',
+    0x8c0a : 'GL_SGX_BINARY_IMG',
+    0x8c10 : 'GL_TEXTURE_RED_TYPE',
+    0x8c11 : 'GL_TEXTURE_GREEN_TYPE',
+    0x8c12 : 'GL_TEXTURE_BLUE_TYPE',
+    0x8c13 : 'GL_TEXTURE_ALPHA_TYPE',
+    0x8c14 : 'GL_TEXTURE_LUMINANCE_TYPE',
+    0x8c15 : 'GL_TEXTURE_INTENSITY_TYPE',
+    0x8c16 : 'GL_TEXTURE_DEPTH_TYPE',
+    0x8c17 : 'GL_UNSIGNED_NORMALIZED',
+    0x8c18 : 'GL_TEXTURE_1D_ARRAY',
+    0x8c19 : 'GL_PROXY_TEXTURE_1D_ARRAY',
+    0x8c1a : 'GL_TEXTURE_2D_ARRAY',
+    0x8c1b : 'GL_PROXY_TEXTURE_2D_ARRAY',
+    0x8c1c : 'GL_TEXTURE_BINDING_1D_ARRAY',
+    0x8c1d : 'GL_TEXTURE_BINDING_2D_ARRAY',
+    0x8c26 : 'GL_GEOMETRY_PROGRAM_NV',
+    0x8c27 : 'GL_MAX_PROGRAM_OUTPUT_VERTICES_NV',
+    0x8c28 : 'GL_MAX_PROGRAM_TOTAL_OUTPUT_COMPONENTS_NV',
+    0x8c29 : 'GL_MAX_GEOMETRY_TEXTURE_IMAGE_UNITS',
+    0x8c2a : 'GL_TEXTURE_BUFFER',
+    0x8c2b : 'GL_MAX_TEXTURE_BUFFER_SIZE',
+    0x8c2c : 'GL_TEXTURE_BINDING_BUFFER',
+    0x8c2d : 'GL_TEXTURE_BUFFER_DATA_STORE_BINDING',
+    0x8c2e : 'GL_TEXTURE_BUFFER_FORMAT_ARB',
+    0x8c2f : 'GL_ANY_SAMPLES_PASSED',
+    0x8c36 : 'GL_SAMPLE_SHADING',
+    0x8c37 : 'GL_MIN_SAMPLE_SHADING_VALUE',
+    0x8c3a : 'GL_R11F_G11F_B10F',
+    0x8c3b : 'GL_UNSIGNED_INT_10F_11F_11F_REV',
+    0x8c3c : 'GL_RGBA_SIGNED_COMPONENTS_EXT',
+    0x8c3d : 'GL_RGB9_E5',
+    0x8c3e : 'GL_UNSIGNED_INT_5_9_9_9_REV',
+    0x8c3f : 'GL_TEXTURE_SHARED_SIZE',
+    0x8c40 : 'GL_SRGB',
+    0x8c41 : 'GL_SRGB8',
+    0x8c42 : 'GL_SRGB_ALPHA',
+    0x8c43 : 'GL_SRGB8_ALPHA8',
+    0x8c44 : 'GL_SLUMINANCE_ALPHA',
+    0x8c45 : 'GL_SLUMINANCE8_ALPHA8',
+    0x8c46 : 'GL_SLUMINANCE',
+    0x8c47 : 'GL_SLUMINANCE8',
+    0x8c48 : 'GL_COMPRESSED_SRGB',
+    0x8c49 : 'GL_COMPRESSED_SRGB_ALPHA',
+    0x8c4a : 'GL_COMPRESSED_SLUMINANCE',
+    0x8c4b : 'GL_COMPRESSED_SLUMINANCE_ALPHA',
+    0x8c4c : 'GL_COMPRESSED_SRGB_S3TC_DXT1_EXT',
+    0x8c4d : 'GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT1_EXT',
+    0x8c4e : 'GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT3_EXT',
+    0x8c4f : 'GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT5_EXT',
+    0x8c70 : 'GL_COMPRESSED_LUMINANCE_LATC1_EXT',
+    0x8c71 : 'GL_COMPRESSED_SIGNED_LUMINANCE_LATC1_EXT',
+    0x8c72 : 'GL_COMPRESSED_LUMINANCE_ALPHA_LATC2_EXT',
+    0x8c73 : 'GL_COMPRESSED_SIGNED_LUMINANCE_ALPHA_LATC2_EXT',
+    0x8c74 : 'GL_TESS_CONTROL_PROGRAM_PARAMETER_BUFFER_NV',
+    0x8c75 : 'GL_TESS_EVALUATION_PROGRAM_PARAMETER_BUFFER_NV',
+    0x8c76 : 'GL_TRANSFORM_FEEDBACK_VARYING_MAX_LENGTH',
+    0x8c77 : 'GL_BACK_PRIMARY_COLOR_NV',
+    0x8c78 : 'GL_BACK_SECONDARY_COLOR_NV',
+    0x8c79 : 'GL_TEXTURE_COORD_NV',
+    0x8c7a : 'GL_CLIP_DISTANCE_NV',
+    0x8c7b : 'GL_VERTEX_ID_NV',
+    0x8c7c : 'GL_PRIMITIVE_ID_NV',
+    0x8c7d : 'GL_GENERIC_ATTRIB_NV',
+    0x8c7e : 'GL_TRANSFORM_FEEDBACK_ATTRIBS_NV',
+    0x8c7f : 'GL_TRANSFORM_FEEDBACK_BUFFER_MODE',
+    0x8c80 : 'GL_MAX_TRANSFORM_FEEDBACK_SEPARATE_COMPONENTS',
+    0x8c81 : 'GL_ACTIVE_VARYINGS_NV',
+    0x8c82 : 'GL_ACTIVE_VARYING_MAX_LENGTH_NV',
+    0x8c83 : 'GL_TRANSFORM_FEEDBACK_VARYINGS',
+    0x8c84 : 'GL_TRANSFORM_FEEDBACK_BUFFER_START',
+    0x8c85 : 'GL_TRANSFORM_FEEDBACK_BUFFER_SIZE',
+    0x8c86 : 'GL_TRANSFORM_FEEDBACK_RECORD_NV',
+    0x8c87 : 'GL_PRIMITIVES_GENERATED',
+    0x8c88 : 'GL_TRANSFORM_FEEDBACK_PRIMITIVES_WRITTEN',
+    0x8c89 : 'GL_RASTERIZER_DISCARD',
+    0x8c8a : 'GL_MAX_TRANSFORM_FEEDBACK_INTERLEAVED_COMPONENTS',
+    0x8c8b : 'GL_MAX_TRANSFORM_FEEDBACK_SEPARATE_ATTRIBS',
+    0x8c8c : 'GL_INTERLEAVED_ATTRIBS',
+    0x8c8d : 'GL_SEPARATE_ATTRIBS',
+    0x8c8e : 'GL_TRANSFORM_FEEDBACK_BUFFER',
+    0x8c8f : 'GL_TRANSFORM_FEEDBACK_BUFFER_BINDING',
+    0x8c92 : 'GL_ATC_RGB_AMD',
+    0x8c93 : 'GL_ATC_RGBA_EXPLICIT_ALPHA_AMD',
+    0x8ca0 : 'GL_POINT_SPRITE_COORD_ORIGIN',
+    0x8ca1 : 'GL_LOWER_LEFT',
+    0x8ca2 : 'GL_UPPER_LEFT',
+    0x8ca3 : 'GL_STENCIL_BACK_REF',
+    0x8ca4 : 'GL_STENCIL_BACK_VALUE_MASK',
+    0x8ca5 : 'GL_STENCIL_BACK_WRITEMASK',
+    0x8ca6 : 'GL_FRAMEBUFFER_BINDING',
+    0x8ca7 : 'GL_RENDERBUFFER_BINDING',
+    0x8ca8 : 'GL_READ_FRAMEBUFFER',
+    0x8ca9 : 'GL_DRAW_FRAMEBUFFER',
+    0x8caa : 'GL_READ_FRAMEBUFFER_BINDING',
+    0x8cab : 'GL_RENDERBUFFER_SAMPLES',
+    0x8cac : 'GL_DEPTH_COMPONENT32F',
+    0x8cad : 'GL_DEPTH32F_STENCIL8',
+    0x8cd0 : 'GL_FRAMEBUFFER_ATTACHMENT_OBJECT_TYPE',
+    0x8cd1 : 'GL_FRAMEBUFFER_ATTACHMENT_OBJECT_NAME',
+    0x8cd2 : 'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LEVEL',
+    0x8cd3 : 'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_CUBE_MAP_FACE',
+    0x8cd4 : 'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_3D_ZOFFSET_EXT',
+    0x8cd5 : 'GL_FRAMEBUFFER_COMPLETE',
+    0x8cd6 : 'GL_FRAMEBUFFER_INCOMPLETE_ATTACHMENT',
+    0x8cd7 : 'GL_FRAMEBUFFER_INCOMPLETE_MISSING_ATTACHMENT',
+    0x8cd9 : 'GL_FRAMEBUFFER_INCOMPLETE_DIMENSIONS',
+    0x8cda : 'GL_FRAMEBUFFER_INCOMPLETE_FORMATS_EXT',
+    0x8cdb : 'GL_FRAMEBUFFER_INCOMPLETE_DRAW_BUFFER',
+    0x8cdc : 'GL_FRAMEBUFFER_INCOMPLETE_READ_BUFFER',
+    0x8cdd : 'GL_FRAMEBUFFER_UNSUPPORTED',
+    0x8cdf : 'GL_MAX_COLOR_ATTACHMENTS',
+    0x8ce0 : 'GL_COLOR_ATTACHMENT0',
+    0x8ce1 : 'GL_COLOR_ATTACHMENT1',
+    0x8ce2 : 'GL_COLOR_ATTACHMENT2',
+    0x8ce3 : 'GL_COLOR_ATTACHMENT3',
+    0x8ce4 : 'GL_COLOR_ATTACHMENT4',
+    0x8ce5 : 'GL_COLOR_ATTACHMENT5',
+    0x8ce6 : 'GL_COLOR_ATTACHMENT6',
+    0x8ce7 : 'GL_COLOR_ATTACHMENT7',
+    0x8ce8 : 'GL_COLOR_ATTACHMENT8',
+    0x8ce9 : 'GL_COLOR_ATTACHMENT9',
+    0x8cea : 'GL_COLOR_ATTACHMENT10',
+    0x8ceb : 'GL_COLOR_ATTACHMENT11',
+    0x8cec : 'GL_COLOR_ATTACHMENT12',
+    0x8ced : 'GL_COLOR_ATTACHMENT13',
+    0x8cee : 'GL_COLOR_ATTACHMENT14',
+    0x8cef : 'GL_COLOR_ATTACHMENT15',
+    0x8d00 : 'GL_DEPTH_ATTACHMENT',
+    0x8d20 : 'GL_STENCIL_ATTACHMENT',
+    0x8d40 : 'GL_FRAMEBUFFER',
+    0x8d41 : 'GL_RENDERBUFFER',
+    0x8d42 : 'GL_RENDERBUFFER_WIDTH',
+    0x8d43 : 'GL_RENDERBUFFER_HEIGHT',
+    0x8d44 : 'GL_RENDERBUFFER_INTERNAL_FORMAT',
+    0x8d46 : 'GL_STENCIL_INDEX1',
+    0x8d47 : 'GL_STENCIL_INDEX4',
+    0x8d48 : 'GL_STENCIL_INDEX8',
+    0x8d49 : 'GL_STENCIL_INDEX16',
+    0x8d50 : 'GL_RENDERBUFFER_RED_SIZE',
+    0x8d51 : 'GL_RENDERBUFFER_GREEN_SIZE',
+    0x8d52 : 'GL_RENDERBUFFER_BLUE_SIZE',
+    0x8d53 : 'GL_RENDERBUFFER_ALPHA_SIZE',
+    0x8d54 : 'GL_RENDERBUFFER_DEPTH_SIZE',
+    0x8d55 : 'GL_RENDERBUFFER_STENCIL_SIZE',
+    0x8d56 : 'GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE',
+    0x8d57 : 'GL_MAX_SAMPLES',
+    0x8d60 : 'GL_TEXTURE_GEN_STR_OES',
+    0x8d61 : 'GL_HALF_FLOAT_OES',
+    0x8d62 : 'GL_RGB565_OES',
+    0x8d64 : 'GL_ETC1_RGB8_OES',
+    0x8d65 : 'GL_TEXTURE_EXTERNAL_OES',
+    0x8d66 : 'GL_SAMPLER_EXTERNAL_OES',
+    0x8d67 : 'GL_TEXTURE_BINDING_EXTERNAL_OES',
+    0x8d68 : 'GL_REQUIRED_TEXTURE_IMAGE_UNITS_OES',
+    0x8d69 : 'GL_PRIMITIVE_RESTART_FIXED_INDEX',
+    0x8d6a : 'GL_ANY_SAMPLES_PASSED_CONSERVATIVE',
+    0x8d6b : 'GL_MAX_ELEMENT_INDEX',
+    0x8d6c : 'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_SAMPLES_EXT',
+    0x8d70 : 'GL_RGBA32UI',
+    0x8d71 : 'GL_RGB32UI',
+    0x8d72 : 'GL_ALPHA32UI_EXT',
+    0x8d73 : 'GL_INTENSITY32UI_EXT',
+    0x8d74 : 'GL_LUMINANCE32UI_EXT',
+    0x8d75 : 'GL_LUMINANCE_ALPHA32UI_EXT',
+    0x8d76 : 'GL_RGBA16UI',
+    0x8d77 : 'GL_RGB16UI',
+    0x8d78 : 'GL_ALPHA16UI_EXT',
+    0x8d79 : 'GL_INTENSITY16UI_EXT',
+    0x8d7a : 'GL_LUMINANCE16UI_EXT',
+    0x8d7b : 'GL_LUMINANCE_ALPHA16UI_EXT',
+    0x8d7c : 'GL_RGBA8UI',
+    0x8d7d : 'GL_RGB8UI',
+    0x8d7e : 'GL_ALPHA8UI_EXT',
+    0x8d7f : 'GL_INTENSITY8UI_EXT',
+    0x8d80 : 'GL_LUMINANCE8UI_EXT',
+    0x8d81 : 'GL_LUMINANCE_ALPHA8UI_EXT',
+    0x8d82 : 'GL_RGBA32I',
+    0x8d83 : 'GL_RGB32I',
+    0x8d84 : 'GL_ALPHA32I_EXT',
+    0x8d85 : 'GL_INTENSITY32I_EXT',
+    0x8d86 : 'GL_LUMINANCE32I_EXT',
+    0x8d87 : 'GL_LUMINANCE_ALPHA32I_EXT',
+    0x8d88 : 'GL_RGBA16I',
+    0x8d89 : 'GL_RGB16I',
+    0x8d8a : 'GL_ALPHA16I_EXT',
+    0x8d8b : 'GL_INTENSITY16I_EXT',
+    0x8d8c : 'GL_LUMINANCE16I_EXT',
+    0x8d8d : 'GL_LUMINANCE_ALPHA16I_EXT',
+    0x8d8e : 'GL_RGBA8I',
+    0x8d8f : 'GL_RGB8I',
+    0x8d90 : 'GL_ALPHA8I_EXT',
+    0x8d91 : 'GL_INTENSITY8I_EXT',
+    0x8d92 : 'GL_LUMINANCE8I_EXT',
+    0x8d93 : 'GL_LUMINANCE_ALPHA8I_EXT',
+    0x8d94 : 'GL_RED_INTEGER',
+    0x8d95 : 'GL_GREEN_INTEGER',
+    0x8d96 : 'GL_BLUE_INTEGER',
+    0x8d97 : 'GL_ALPHA_INTEGER',
+    0x8d98 : 'GL_RGB_INTEGER',
+    0x8d99 : 'GL_RGBA_INTEGER',
+    0x8d9a : 'GL_BGR_INTEGER',
+    0x8d9b : 'GL_BGRA_INTEGER',
+    0x8d9c : 'GL_LUMINANCE_INTEGER_EXT',
+    0x8d9d : 'GL_LUMINANCE_ALPHA_INTEGER_EXT',
+    0x8d9e : 'GL_RGBA_INTEGER_MODE_EXT',
+    0x8d9f : 'GL_INT_2_10_10_10_REV',
+    0x8da0 : 'GL_MAX_PROGRAM_PARAMETER_BUFFER_BINDINGS_NV',
+    0x8da1 : 'GL_MAX_PROGRAM_PARAMETER_BUFFER_SIZE_NV',
+    0x8da2 : 'GL_VERTEX_PROGRAM_PARAMETER_BUFFER_NV',
+    0x8da3 : 'GL_GEOMETRY_PROGRAM_PARAMETER_BUFFER_NV',
+    0x8da4 : 'GL_FRAGMENT_PROGRAM_PARAMETER_BUFFER_NV',
+    0x8da5 : 'GL_MAX_PROGRAM_GENERIC_ATTRIBS_NV',
+    0x8da6 : 'GL_MAX_PROGRAM_GENERIC_RESULTS_NV',
+    0x8da7 : 'GL_FRAMEBUFFER_ATTACHMENT_LAYERED',
+    0x8da8 : 'GL_FRAMEBUFFER_INCOMPLETE_LAYER_TARGETS',
+    0x8da9 : 'GL_FRAMEBUFFER_INCOMPLETE_LAYER_COUNT_ARB',
+    0x8daa : 'GL_LAYER_NV',
+    0x8dab : 'GL_DEPTH_COMPONENT32F_NV',
+    0x8dac : 'GL_DEPTH32F_STENCIL8_NV',
+    0x8dad : 'GL_FLOAT_32_UNSIGNED_INT_24_8_REV',
+    0x8dae : 'GL_SHADER_INCLUDE_ARB',
+    0x8daf : 'GL_DEPTH_BUFFER_FLOAT_MODE_NV',
+    0x8db9 : 'GL_FRAMEBUFFER_SRGB',
+    0x8dba : 'GL_FRAMEBUFFER_SRGB_CAPABLE_EXT',
+    0x8dbb : 'GL_COMPRESSED_RED_RGTC1',
+    0x8dbc : 'GL_COMPRESSED_SIGNED_RED_RGTC1',
+    0x8dbd : 'GL_COMPRESSED_RED_GREEN_RGTC2_EXT',
+    0x8dbe : 'GL_COMPRESSED_SIGNED_RED_GREEN_RGTC2_EXT',
+    0x8dc0 : 'GL_SAMPLER_1D_ARRAY',
+    0x8dc1 : 'GL_SAMPLER_2D_ARRAY',
+    0x8dc2 : 'GL_SAMPLER_BUFFER',
+    0x8dc3 : 'GL_SAMPLER_1D_ARRAY_SHADOW',
+    0x8dc4 : 'GL_SAMPLER_2D_ARRAY_SHADOW',
+    0x8dc5 : 'GL_SAMPLER_CUBE_SHADOW',
+    0x8dc6 : 'GL_UNSIGNED_INT_VEC2',
+    0x8dc7 : 'GL_UNSIGNED_INT_VEC3',
+    0x8dc8 : 'GL_UNSIGNED_INT_VEC4',
+    0x8dc9 : 'GL_INT_SAMPLER_1D',
+    0x8dca : 'GL_INT_SAMPLER_2D',
+    0x8dcb : 'GL_INT_SAMPLER_3D',
+    0x8dcc : 'GL_INT_SAMPLER_CUBE',
+    0x8dcd : 'GL_INT_SAMPLER_2D_RECT',
+    0x8dce : 'GL_INT_SAMPLER_1D_ARRAY',
+    0x8dcf : 'GL_INT_SAMPLER_2D_ARRAY',
+    0x8dd0 : 'GL_INT_SAMPLER_BUFFER',
+    0x8dd1 : 'GL_UNSIGNED_INT_SAMPLER_1D',
+    0x8dd2 : 'GL_UNSIGNED_INT_SAMPLER_2D',
+    0x8dd3 : 'GL_UNSIGNED_INT_SAMPLER_3D',
+    0x8dd4 : 'GL_UNSIGNED_INT_SAMPLER_CUBE',
+    0x8dd5 : 'GL_UNSIGNED_INT_SAMPLER_2D_RECT',
+    0x8dd6 : 'GL_UNSIGNED_INT_SAMPLER_1D_ARRAY',
+    0x8dd7 : 'GL_UNSIGNED_INT_SAMPLER_2D_ARRAY',
+    0x8dd8 : 'GL_UNSIGNED_INT_SAMPLER_BUFFER',
+    0x8dd9 : 'GL_GEOMETRY_SHADER',
+    0x8dda : 'GL_GEOMETRY_VERTICES_OUT_ARB',
+    0x8ddb : 'GL_GEOMETRY_INPUT_TYPE_ARB',
+    0x8ddc : 'GL_GEOMETRY_OUTPUT_TYPE_ARB',
+    0x8ddd : 'GL_MAX_GEOMETRY_VARYING_COMPONENTS_ARB',
+    0x8dde : 'GL_MAX_VERTEX_VARYING_COMPONENTS_ARB',
+    0x8ddf : 'GL_MAX_GEOMETRY_UNIFORM_COMPONENTS',
+    0x8de0 : 'GL_MAX_GEOMETRY_OUTPUT_VERTICES',
+    0x8de1 : 'GL_MAX_GEOMETRY_TOTAL_OUTPUT_COMPONENTS',
+    0x8de2 : 'GL_MAX_VERTEX_BINDABLE_UNIFORMS_EXT',
+    0x8de3 : 'GL_MAX_FRAGMENT_BINDABLE_UNIFORMS_EXT',
+    0x8de4 : 'GL_MAX_GEOMETRY_BINDABLE_UNIFORMS_EXT',
+    0x8de5 : 'GL_ACTIVE_SUBROUTINES',
+    0x8de6 : 'GL_ACTIVE_SUBROUTINE_UNIFORMS',
+    0x8de7 : 'GL_MAX_SUBROUTINES',
+    0x8de8 : 'GL_MAX_SUBROUTINE_UNIFORM_LOCATIONS',
+    0x8de9 : 'GL_NAMED_STRING_LENGTH_ARB',
+    0x8dea : 'GL_NAMED_STRING_TYPE_ARB',
+    0x8ded : 'GL_MAX_BINDABLE_UNIFORM_SIZE_EXT',
+    0x8dee : 'GL_UNIFORM_BUFFER_EXT',
+    0x8def : 'GL_UNIFORM_BUFFER_BINDING_EXT',
+    0x8df0 : 'GL_LOW_FLOAT',
+    0x8df1 : 'GL_MEDIUM_FLOAT',
+    0x8df2 : 'GL_HIGH_FLOAT',
+    0x8df3 : 'GL_LOW_INT',
+    0x8df4 : 'GL_MEDIUM_INT',
+    0x8df5 : 'GL_HIGH_INT',
+    0x8df6 : 'GL_UNSIGNED_INT_10_10_10_2_OES',
+    0x8df7 : 'GL_INT_10_10_10_2_OES',
+    0x8df8 : 'GL_SHADER_BINARY_FORMATS',
+    0x8df9 : 'GL_NUM_SHADER_BINARY_FORMATS',
+    0x8dfa : 'GL_SHADER_COMPILER',
+    0x8dfb : 'GL_MAX_VERTEX_UNIFORM_VECTORS',
+    0x8dfc : 'GL_MAX_VARYING_VECTORS',
+    0x8dfd : 'GL_MAX_FRAGMENT_UNIFORM_VECTORS',
+    0x8e10 : 'GL_RENDERBUFFER_COLOR_SAMPLES_NV',
+    0x8e11 : 'GL_MAX_MULTISAMPLE_COVERAGE_MODES_NV',
+    0x8e12 : 'GL_MULTISAMPLE_COVERAGE_MODES_NV',
+    0x8e13 : 'GL_QUERY_WAIT',
+    0x8e14 : 'GL_QUERY_NO_WAIT',
+    0x8e15 : 'GL_QUERY_BY_REGION_WAIT',
+    0x8e16 : 'GL_QUERY_BY_REGION_NO_WAIT',
+    0x8e1e : 'GL_MAX_COMBINED_TESS_CONTROL_UNIFORM_COMPONENTS',
+    0x8e1f : 'GL_MAX_COMBINED_TESS_EVALUATION_UNIFORM_COMPONENTS',
+    0x8e20 : 'GL_COLOR_SAMPLES_NV',
+    0x8e22 : 'GL_TRANSFORM_FEEDBACK',
+    0x8e23 : 'GL_TRANSFORM_FEEDBACK_BUFFER_PAUSED',
+    0x8e24 : 'GL_TRANSFORM_FEEDBACK_BUFFER_ACTIVE',
+    0x8e25 : 'GL_TRANSFORM_FEEDBACK_BINDING',
+    0x8e26 : 'GL_FRAME_NV',
+    0x8e27 : 'GL_FIELDS_NV',
+    0x8e28 : 'GL_TIMESTAMP',
+    0x8e29 : 'GL_NUM_FILL_STREAMS_NV',
+    0x8e2a : 'GL_PRESENT_TIME_NV',
+    0x8e2b : 'GL_PRESENT_DURATION_NV',
+    0x8e2c : 'GL_DEPTH_COMPONENT16_NONLINEAR_NV',
+    0x8e2d : 'GL_PROGRAM_MATRIX_EXT',
+    0x8e2e : 'GL_TRANSPOSE_PROGRAM_MATRIX_EXT',
+    0x8e2f : 'GL_PROGRAM_MATRIX_STACK_DEPTH_EXT',
+    0x8e42 : 'GL_TEXTURE_SWIZZLE_R',
+    0x8e43 : 'GL_TEXTURE_SWIZZLE_G',
+    0x8e44 : 'GL_TEXTURE_SWIZZLE_B',
+    0x8e45 : 'GL_TEXTURE_SWIZZLE_A',
+    0x8e46 : 'GL_TEXTURE_SWIZZLE_RGBA',
+    0x8e47 : 'GL_ACTIVE_SUBROUTINE_UNIFORM_LOCATIONS',
+    0x8e48 : 'GL_ACTIVE_SUBROUTINE_MAX_LENGTH',
+    0x8e49 : 'GL_ACTIVE_SUBROUTINE_UNIFORM_MAX_LENGTH',
+    0x8e4a : 'GL_NUM_COMPATIBLE_SUBROUTINES',
+    0x8e4b : 'GL_COMPATIBLE_SUBROUTINES',
+    0x8e4c : 'GL_QUADS_FOLLOW_PROVOKING_VERTEX_CONVENTION',
+    0x8e4d : 'GL_FIRST_VERTEX_CONVENTION',
+    0x8e4e : 'GL_LAST_VERTEX_CONVENTION',
+    0x8e4f : 'GL_PROVOKING_VERTEX',
+    0x8e50 : 'GL_SAMPLE_POSITION',
+    0x8e51 : 'GL_SAMPLE_MASK',
+    0x8e52 : 'GL_SAMPLE_MASK_VALUE',
+    0x8e53 : 'GL_TEXTURE_BINDING_RENDERBUFFER_NV',
+    0x8e54 : 'GL_TEXTURE_RENDERBUFFER_DATA_STORE_BINDING_NV',
+    0x8e55 : 'GL_TEXTURE_RENDERBUFFER_NV',
+    0x8e56 : 'GL_SAMPLER_RENDERBUFFER_NV',
+    0x8e57 : 'GL_INT_SAMPLER_RENDERBUFFER_NV',
+    0x8e58 : 'GL_UNSIGNED_INT_SAMPLER_RENDERBUFFER_NV',
+    0x8e59 : 'GL_MAX_SAMPLE_MASK_WORDS',
+    0x8e5a : 'GL_MAX_GEOMETRY_SHADER_INVOCATIONS',
+    0x8e5b : 'GL_MIN_FRAGMENT_INTERPOLATION_OFFSET',
+    0x8e5c : 'GL_MAX_FRAGMENT_INTERPOLATION_OFFSET',
+    0x8e5d : 'GL_FRAGMENT_INTERPOLATION_OFFSET_BITS',
+    0x8e5e : 'GL_MIN_PROGRAM_TEXTURE_GATHER_OFFSET',
+    0x8e5f : 'GL_MAX_PROGRAM_TEXTURE_GATHER_OFFSET',
+    0x8e70 : 'GL_MAX_TRANSFORM_FEEDBACK_BUFFERS',
+    0x8e71 : 'GL_MAX_VERTEX_STREAMS',
+    0x8e72 : 'GL_PATCH_VERTICES',
+    0x8e73 : 'GL_PATCH_DEFAULT_INNER_LEVEL',
+    0x8e74 : 'GL_PATCH_DEFAULT_OUTER_LEVEL',
+    0x8e75 : 'GL_TESS_CONTROL_OUTPUT_VERTICES',
+    0x8e76 : 'GL_TESS_GEN_MODE',
+    0x8e77 : 'GL_TESS_GEN_SPACING',
+    0x8e78 : 'GL_TESS_GEN_VERTEX_ORDER',
+    0x8e79 : 'GL_TESS_GEN_POINT_MODE',
+    0x8e7a : 'GL_ISOLINES',
+    0x8e7b : 'GL_FRACTIONAL_ODD',
+    0x8e7c : 'GL_FRACTIONAL_EVEN',
+    0x8e7d : 'GL_MAX_PATCH_VERTICES',
+    0x8e7e : 'GL_MAX_TESS_GEN_LEVEL',
+    0x8e7f : 'GL_MAX_TESS_CONTROL_UNIFORM_COMPONENTS',
+    0x8e80 : 'GL_MAX_TESS_EVALUATION_UNIFORM_COMPONENTS',
+    0x8e81 : 'GL_MAX_TESS_CONTROL_TEXTURE_IMAGE_UNITS',
+    0x8e82 : 'GL_MAX_TESS_EVALUATION_TEXTURE_IMAGE_UNITS',
+    0x8e83 : 'GL_MAX_TESS_CONTROL_OUTPUT_COMPONENTS',
+    0x8e84 : 'GL_MAX_TESS_PATCH_COMPONENTS',
+    0x8e85 : 'GL_MAX_TESS_CONTROL_TOTAL_OUTPUT_COMPONENTS',
+    0x8e86 : 'GL_MAX_TESS_EVALUATION_OUTPUT_COMPONENTS',
+    0x8e87 : 'GL_TESS_EVALUATION_SHADER',
+    0x8e88 : 'GL_TESS_CONTROL_SHADER',
+    0x8e89 : 'GL_MAX_TESS_CONTROL_UNIFORM_BLOCKS',
+    0x8e8a : 'GL_MAX_TESS_EVALUATION_UNIFORM_BLOCKS',
+    0x8e8c : 'GL_COMPRESSED_RGBA_BPTC_UNORM',
+    0x8e8d : 'GL_COMPRESSED_SRGB_ALPHA_BPTC_UNORM',
+    0x8e8e : 'GL_COMPRESSED_RGB_BPTC_SIGNED_FLOAT',
+    0x8e8f : 'GL_COMPRESSED_RGB_BPTC_UNSIGNED_FLOAT',
+    0x8ed0 : 'GL_COVERAGE_COMPONENT_NV',
+    0x8ed1 : 'GL_COVERAGE_COMPONENT4_NV',
+    0x8ed2 : 'GL_COVERAGE_ATTACHMENT_NV',
+    0x8ed3 : 'GL_COVERAGE_BUFFERS_NV',
+    0x8ed4 : 'GL_COVERAGE_SAMPLES_NV',
+    0x8ed5 : 'GL_COVERAGE_ALL_FRAGMENTS_NV',
+    0x8ed6 : 'GL_COVERAGE_EDGE_FRAGMENTS_NV',
+    0x8ed7 : 'GL_COVERAGE_AUTOMATIC_NV',
+    0x8f1d : 'GL_BUFFER_GPU_ADDRESS_NV',
+    0x8f1e : 'GL_VERTEX_ATTRIB_ARRAY_UNIFIED_NV',
+    0x8f1f : 'GL_ELEMENT_ARRAY_UNIFIED_NV',
+    0x8f20 : 'GL_VERTEX_ATTRIB_ARRAY_ADDRESS_NV',
+    0x8f21 : 'GL_VERTEX_ARRAY_ADDRESS_NV',
+    0x8f22 : 'GL_NORMAL_ARRAY_ADDRESS_NV',
+    0x8f23 : 'GL_COLOR_ARRAY_ADDRESS_NV',
+    0x8f24 : 'GL_INDEX_ARRAY_ADDRESS_NV',
+    0x8f25 : 'GL_TEXTURE_COORD_ARRAY_ADDRESS_NV',
+    0x8f26 : 'GL_EDGE_FLAG_ARRAY_ADDRESS_NV',
+    0x8f27 : 'GL_SECONDARY_COLOR_ARRAY_ADDRESS_NV',
+    0x8f28 : 'GL_FOG_COORD_ARRAY_ADDRESS_NV',
+    0x8f29 : 'GL_ELEMENT_ARRAY_ADDRESS_NV',
+    0x8f2a : 'GL_VERTEX_ATTRIB_ARRAY_LENGTH_NV',
+    0x8f2b : 'GL_VERTEX_ARRAY_LENGTH_NV',
+    0x8f2c : 'GL_NORMAL_ARRAY_LENGTH_NV',
+    0x8f2d : 'GL_COLOR_ARRAY_LENGTH_NV',
+    0x8f2e : 'GL_INDEX_ARRAY_LENGTH_NV',
+    0x8f2f : 'GL_TEXTURE_COORD_ARRAY_LENGTH_NV',
+    0x8f30 : 'GL_EDGE_FLAG_ARRAY_LENGTH_NV',
+    0x8f31 : 'GL_SECONDARY_COLOR_ARRAY_LENGTH_NV',
+    0x8f32 : 'GL_FOG_COORD_ARRAY_LENGTH_NV',
+    0x8f33 : 'GL_ELEMENT_ARRAY_LENGTH_NV',
+    0x8f34 : 'GL_GPU_ADDRESS_NV',
+    0x8f35 : 'GL_MAX_SHADER_BUFFER_ADDRESS_NV',
+    0x8f36 : 'GL_COPY_READ_BUFFER',
+    0x8f37 : 'GL_COPY_WRITE_BUFFER',
+    0x8f38 : 'GL_MAX_IMAGE_UNITS',
+    0x8f39 : 'GL_MAX_COMBINED_IMAGE_UNITS_AND_FRAGMENT_OUTPUTS',
+    0x8f3a : 'GL_IMAGE_BINDING_NAME',
+    0x8f3b : 'GL_IMAGE_BINDING_LEVEL',
+    0x8f3c : 'GL_IMAGE_BINDING_LAYERED',
+    0x8f3d : 'GL_IMAGE_BINDING_LAYER',
+    0x8f3e : 'GL_IMAGE_BINDING_ACCESS',
+    0x8f3f : 'GL_DRAW_INDIRECT_BUFFER',
+    0x8f40 : 'GL_DRAW_INDIRECT_UNIFIED_NV',
+    0x8f41 : 'GL_DRAW_INDIRECT_ADDRESS_NV',
+    0x8f42 : 'GL_DRAW_INDIRECT_LENGTH_NV',
+    0x8f43 : 'GL_DRAW_INDIRECT_BUFFER_BINDING',
+    0x8f44 : 'GL_MAX_PROGRAM_SUBROUTINE_PARAMETERS_NV',
+    0x8f45 : 'GL_MAX_PROGRAM_SUBROUTINE_NUM_NV',
+    0x8f46 : 'GL_DOUBLE_MAT2',
+    0x8f47 : 'GL_DOUBLE_MAT3',
+    0x8f48 : 'GL_DOUBLE_MAT4',
+    0x8f49 : 'GL_DOUBLE_MAT2x3',
+    0x8f4a : 'GL_DOUBLE_MAT2x4',
+    0x8f4b : 'GL_DOUBLE_MAT3x2',
+    0x8f4c : 'GL_DOUBLE_MAT3x4',
+    0x8f4d : 'GL_DOUBLE_MAT4x2',
+    0x8f4e : 'GL_DOUBLE_MAT4x3',
+    0x8f4f : 'GL_VERTEX_BINDING_BUFFER',
+    0x8f60 : 'GL_MALI_SHADER_BINARY_ARM',
+    0x8f61 : 'GL_MALI_PROGRAM_BINARY_ARM',
+    0x8f63 : 'GL_MAX_SHADER_PIXEL_LOCAL_STORAGE_FAST_SIZE_EXT',
+    0x8f64 : 'GL_SHADER_PIXEL_LOCAL_STORAGE_EXT',
+    0x8f65 : 'GL_FETCH_PER_SAMPLE_ARM',
+    0x8f66 : 'GL_FRAGMENT_SHADER_FRAMEBUFFER_FETCH_MRT_ARM',
+    0x8f67 : 'GL_MAX_SHADER_PIXEL_LOCAL_STORAGE_SIZE_EXT',
+    0x8f90 : 'GL_RED_SNORM',
+    0x8f91 : 'GL_RG_SNORM',
+    0x8f92 : 'GL_RGB_SNORM',
+    0x8f93 : 'GL_RGBA_SNORM',
+    0x8f94 : 'GL_R8_SNORM',
+    0x8f95 : 'GL_RG8_SNORM',
+    0x8f96 : 'GL_RGB8_SNORM',
+    0x8f97 : 'GL_RGBA8_SNORM',
+    0x8f98 : 'GL_R16_SNORM',
+    0x8f99 : 'GL_RG16_SNORM',
+    0x8f9a : 'GL_RGB16_SNORM',
+    0x8f9b : 'GL_RGBA16_SNORM',
+    0x8f9c : 'GL_SIGNED_NORMALIZED',
+    0x8f9d : 'GL_PRIMITIVE_RESTART',
+    0x8f9e : 'GL_PRIMITIVE_RESTART_INDEX',
+    0x8f9f : 'GL_MAX_PROGRAM_TEXTURE_GATHER_COMPONENTS_ARB',
+    0x8fa0 : 'GL_PERFMON_GLOBAL_MODE_QCOM',
+    0x8fb0 : 'GL_BINNING_CONTROL_HINT_QCOM',
+    0x8fb1 : 'GL_CPU_OPTIMIZED_QCOM',
+    0x8fb2 : 'GL_GPU_OPTIMIZED_QCOM',
+    0x8fb3 : 'GL_RENDER_DIRECT_TO_FRAMEBUFFER_QCOM',
+    0x8fbb : 'GL_GPU_DISJOINT_EXT',
+    0x8fc4 : 'GL_SHADER_BINARY_VIV',
+    0x8fe0 : 'GL_INT8_NV',
+    0x8fe1 : 'GL_INT8_VEC2_NV',
+    0x8fe2 : 'GL_INT8_VEC3_NV',
+    0x8fe3 : 'GL_INT8_VEC4_NV',
+    0x8fe4 : 'GL_INT16_NV',
+    0x8fe5 : 'GL_INT16_VEC2_NV',
+    0x8fe6 : 'GL_INT16_VEC3_NV',
+    0x8fe7 : 'GL_INT16_VEC4_NV',
+    0x8fe9 : 'GL_INT64_VEC2_NV',
+    0x8fea : 'GL_INT64_VEC3_NV',
+    0x8feb : 'GL_INT64_VEC4_NV',
+    0x8fec : 'GL_UNSIGNED_INT8_NV',
+    0x8fed : 'GL_UNSIGNED_INT8_VEC2_NV',
+    0x8fee : 'GL_UNSIGNED_INT8_VEC3_NV',
+    0x8fef : 'GL_UNSIGNED_INT8_VEC4_NV',
+    0x8ff0 : 'GL_UNSIGNED_INT16_NV',
+    0x8ff1 : 'GL_UNSIGNED_INT16_VEC2_NV',
+    0x8ff2 : 'GL_UNSIGNED_INT16_VEC3_NV',
+    0x8ff3 : 'GL_UNSIGNED_INT16_VEC4_NV',
+    0x8ff5 : 'GL_UNSIGNED_INT64_VEC2_NV',
+    0x8ff6 : 'GL_UNSIGNED_INT64_VEC3_NV',
+    0x8ff7 : 'GL_UNSIGNED_INT64_VEC4_NV',
+    0x8ff8 : 'GL_FLOAT16_NV',
+    0x8ff9 : 'GL_FLOAT16_VEC2_NV',
+    0x8ffa : 'GL_FLOAT16_VEC3_NV',
+    0x8ffb : 'GL_FLOAT16_VEC4_NV',
+    0x8ffc : 'GL_DOUBLE_VEC2',
+    0x8ffd : 'GL_DOUBLE_VEC3',
+    0x8ffe : 'GL_DOUBLE_VEC4',
+    0x9001 : 'GL_SAMPLER_BUFFER_AMD',
+    0x9002 : 'GL_INT_SAMPLER_BUFFER_AMD',
+    0x9003 : 'GL_UNSIGNED_INT_SAMPLER_BUFFER_AMD',
+    0x9004 : 'GL_TESSELLATION_MODE_AMD',
+    0x9005 : 'GL_TESSELLATION_FACTOR_AMD',
+    0x9006 : 'GL_DISCRETE_AMD',
+    0x9007 : 'GL_CONTINUOUS_AMD',
+    0x9009 : 'GL_TEXTURE_CUBE_MAP_ARRAY',
+    0x900a : 'GL_TEXTURE_BINDING_CUBE_MAP_ARRAY',
+    0x900b : 'GL_PROXY_TEXTURE_CUBE_MAP_ARRAY',
+    0x900c : 'GL_SAMPLER_CUBE_MAP_ARRAY',
+    0x900d : 'GL_SAMPLER_CUBE_MAP_ARRAY_SHADOW',
+    0x900e : 'GL_INT_SAMPLER_CUBE_MAP_ARRAY',
+    0x900f : 'GL_UNSIGNED_INT_SAMPLER_CUBE_MAP_ARRAY',
+    0x9010 : 'GL_ALPHA_SNORM',
+    0x9011 : 'GL_LUMINANCE_SNORM',
+    0x9012 : 'GL_LUMINANCE_ALPHA_SNORM',
+    0x9013 : 'GL_INTENSITY_SNORM',
+    0x9014 : 'GL_ALPHA8_SNORM',
+    0x9015 : 'GL_LUMINANCE8_SNORM',
+    0x9016 : 'GL_LUMINANCE8_ALPHA8_SNORM',
+    0x9017 : 'GL_INTENSITY8_SNORM',
+    0x9018 : 'GL_ALPHA16_SNORM',
+    0x9019 : 'GL_LUMINANCE16_SNORM',
+    0x901a : 'GL_LUMINANCE16_ALPHA16_SNORM',
+    0x901b : 'GL_INTENSITY16_SNORM',
+    0x901c : 'GL_FACTOR_MIN_AMD',
+    0x901d : 'GL_FACTOR_MAX_AMD',
+    0x901e : 'GL_DEPTH_CLAMP_NEAR_AMD',
+    0x901f : 'GL_DEPTH_CLAMP_FAR_AMD',
+    0x9020 : 'GL_VIDEO_BUFFER_NV',
+    0x9021 : 'GL_VIDEO_BUFFER_BINDING_NV',
+    0x9022 : 'GL_FIELD_UPPER_NV',
+    0x9023 : 'GL_FIELD_LOWER_NV',
+    0x9024 : 'GL_NUM_VIDEO_CAPTURE_STREAMS_NV',
+    0x9025 : 'GL_NEXT_VIDEO_CAPTURE_BUFFER_STATUS_NV',
+    0x9026 : 'GL_VIDEO_CAPTURE_TO_422_SUPPORTED_NV',
+    0x9027 : 'GL_LAST_VIDEO_CAPTURE_STATUS_NV',
+    0x9028 : 'GL_VIDEO_BUFFER_PITCH_NV',
+    0x9029 : 'GL_VIDEO_COLOR_CONVERSION_MATRIX_NV',
+    0x902a : 'GL_VIDEO_COLOR_CONVERSION_MAX_NV',
+    0x902b : 'GL_VIDEO_COLOR_CONVERSION_MIN_NV',
+    0x902c : 'GL_VIDEO_COLOR_CONVERSION_OFFSET_NV',
+    0x902d : 'GL_VIDEO_BUFFER_INTERNAL_FORMAT_NV',
+    0x902e : 'GL_PARTIAL_SUCCESS_NV',
+    0x902f : 'GL_SUCCESS_NV',
+    0x9030 : 'GL_FAILURE_NV',
+    0x9031 : 'GL_YCBYCR8_422_NV',
+    0x9032 : 'GL_YCBAYCR8A_4224_NV',
+    0x9033 : 'GL_Z6Y10Z6CB10Z6Y10Z6CR10_422_NV',
+    0x9034 : 'GL_Z6Y10Z6CB10Z6A10Z6Y10Z6CR10Z6A10_4224_NV',
+    0x9035 : 'GL_Z4Y12Z4CB12Z4Y12Z4CR12_422_NV',
+    0x9036 : 'GL_Z4Y12Z4CB12Z4A12Z4Y12Z4CR12Z4A12_4224_NV',
+    0x9037 : 'GL_Z4Y12Z4CB12Z4CR12_444_NV',
+    0x9038 : 'GL_VIDEO_CAPTURE_FRAME_WIDTH_NV',
+    0x9039 : 'GL_VIDEO_CAPTURE_FRAME_HEIGHT_NV',
+    0x903a : 'GL_VIDEO_CAPTURE_FIELD_UPPER_HEIGHT_NV',
+    0x903b : 'GL_VIDEO_CAPTURE_FIELD_LOWER_HEIGHT_NV',
+    0x903c : 'GL_VIDEO_CAPTURE_SURFACE_ORIGIN_NV',
+    0x9045 : 'GL_TEXTURE_COVERAGE_SAMPLES_NV',
+    0x9046 : 'GL_TEXTURE_COLOR_SAMPLES_NV',
+    0x9047 : 'GL_GPU_MEMORY_INFO_DEDICATED_VIDMEM_NVX',
+    0x9048 : 'GL_GPU_MEMORY_INFO_TOTAL_AVAILABLE_MEMORY_NVX',
+    0x9049 : 'GL_GPU_MEMORY_INFO_CURRENT_AVAILABLE_VIDMEM_NVX',
+    0x904a : 'GL_GPU_MEMORY_INFO_EVICTION_COUNT_NVX',
+    0x904b : 'GL_GPU_MEMORY_INFO_EVICTED_MEMORY_NVX',
+    0x904c : 'GL_IMAGE_1D',
+    0x904d : 'GL_IMAGE_2D',
+    0x904e : 'GL_IMAGE_3D',
+    0x904f : 'GL_IMAGE_2D_RECT',
+    0x9050 : 'GL_IMAGE_CUBE',
+    0x9051 : 'GL_IMAGE_BUFFER',
+    0x9052 : 'GL_IMAGE_1D_ARRAY',
+    0x9053 : 'GL_IMAGE_2D_ARRAY',
+    0x9054 : 'GL_IMAGE_CUBE_MAP_ARRAY',
+    0x9055 : 'GL_IMAGE_2D_MULTISAMPLE',
+    0x9056 : 'GL_IMAGE_2D_MULTISAMPLE_ARRAY',
+    0x9057 : 'GL_INT_IMAGE_1D',
+    0x9058 : 'GL_INT_IMAGE_2D',
+    0x9059 : 'GL_INT_IMAGE_3D',
+    0x905a : 'GL_INT_IMAGE_2D_RECT',
+    0x905b : 'GL_INT_IMAGE_CUBE',
+    0x905c : 'GL_INT_IMAGE_BUFFER',
+    0x905d : 'GL_INT_IMAGE_1D_ARRAY',
+    0x905e : 'GL_INT_IMAGE_2D_ARRAY',
+    0x905f : 'GL_INT_IMAGE_CUBE_MAP_ARRAY',
+    0x9060 : 'GL_INT_IMAGE_2D_MULTISAMPLE',
+    0x9061 : 'GL_INT_IMAGE_2D_MULTISAMPLE_ARRAY',
+    0x9062 : 'GL_UNSIGNED_INT_IMAGE_1D',
+    0x9063 : 'GL_UNSIGNED_INT_IMAGE_2D',
+    0x9064 : 'GL_UNSIGNED_INT_IMAGE_3D',
+    0x9065 : 'GL_UNSIGNED_INT_IMAGE_2D_RECT',
+    0x9066 : 'GL_UNSIGNED_INT_IMAGE_CUBE',
+    0x9067 : 'GL_UNSIGNED_INT_IMAGE_BUFFER',
+    0x9068 : 'GL_UNSIGNED_INT_IMAGE_1D_ARRAY',
+    0x9069 : 'GL_UNSIGNED_INT_IMAGE_2D_ARRAY',
+    0x906a : 'GL_UNSIGNED_INT_IMAGE_CUBE_MAP_ARRAY',
+    0x906b : 'GL_UNSIGNED_INT_IMAGE_2D_MULTISAMPLE',
+    0x906c : 'GL_UNSIGNED_INT_IMAGE_2D_MULTISAMPLE_ARRAY',
+    0x906d : 'GL_MAX_IMAGE_SAMPLES',
+    0x906e : 'GL_IMAGE_BINDING_FORMAT',
+    0x906f : 'GL_RGB10_A2UI',
+    0x9070 : 'GL_PATH_FORMAT_SVG_NV',
+    0x9071 : 'GL_PATH_FORMAT_PS_NV',
+    0x9072 : 'GL_STANDARD_FONT_NAME_NV',
+    0x9073 : 'GL_SYSTEM_FONT_NAME_NV',
+    0x9074 : 'GL_FILE_NAME_NV',
+    0x9075 : 'GL_PATH_STROKE_WIDTH_NV',
+    0x9076 : 'GL_PATH_END_CAPS_NV',
+    0x9077 : 'GL_PATH_INITIAL_END_CAP_NV',
+    0x9078 : 'GL_PATH_TERMINAL_END_CAP_NV',
+    0x9079 : 'GL_PATH_JOIN_STYLE_NV',
+    0x907a : 'GL_PATH_MITER_LIMIT_NV',
+    0x907b : 'GL_PATH_DASH_CAPS_NV',
+    0x907c : 'GL_PATH_INITIAL_DASH_CAP_NV',
+    0x907d : 'GL_PATH_TERMINAL_DASH_CAP_NV',
+    0x907e : 'GL_PATH_DASH_OFFSET_NV',
+    0x907f : 'GL_PATH_CLIENT_LENGTH_NV',
+    0x9080 : 'GL_PATH_FILL_MODE_NV',
+    0x9081 : 'GL_PATH_FILL_MASK_NV',
+    0x9082 : 'GL_PATH_FILL_COVER_MODE_NV',
+    0x9083 : 'GL_PATH_STROKE_COVER_MODE_NV',
+    0x9084 : 'GL_PATH_STROKE_MASK_NV',
+    0x9088 : 'GL_COUNT_UP_NV',
+    0x9089 : 'GL_COUNT_DOWN_NV',
+    0x908a : 'GL_PATH_OBJECT_BOUNDING_BOX_NV',
+    0x908b : 'GL_CONVEX_HULL_NV',
+    0x908d : 'GL_BOUNDING_BOX_NV',
+    0x908e : 'GL_TRANSLATE_X_NV',
+    0x908f : 'GL_TRANSLATE_Y_NV',
+    0x9090 : 'GL_TRANSLATE_2D_NV',
+    0x9091 : 'GL_TRANSLATE_3D_NV',
+    0x9092 : 'GL_AFFINE_2D_NV',
+    0x9094 : 'GL_AFFINE_3D_NV',
+    0x9096 : 'GL_TRANSPOSE_AFFINE_2D_NV',
+    0x9098 : 'GL_TRANSPOSE_AFFINE_3D_NV',
+    0x909a : 'GL_UTF8_NV',
+    0x909b : 'GL_UTF16_NV',
+    0x909c : 'GL_BOUNDING_BOX_OF_BOUNDING_BOXES_NV',
+    0x909d : 'GL_PATH_COMMAND_COUNT_NV',
+    0x909e : 'GL_PATH_COORD_COUNT_NV',
+    0x909f : 'GL_PATH_DASH_ARRAY_COUNT_NV',
+    0x90a0 : 'GL_PATH_COMPUTED_LENGTH_NV',
+    0x90a1 : 'GL_PATH_FILL_BOUNDING_BOX_NV',
+    0x90a2 : 'GL_PATH_STROKE_BOUNDING_BOX_NV',
+    0x90a3 : 'GL_SQUARE_NV',
+    0x90a4 : 'GL_ROUND_NV',
+    0x90a5 : 'GL_TRIANGULAR_NV',
+    0x90a6 : 'GL_BEVEL_NV',
+    0x90a7 : 'GL_MITER_REVERT_NV',
+    0x90a8 : 'GL_MITER_TRUNCATE_NV',
+    0x90a9 : 'GL_SKIP_MISSING_GLYPH_NV',
+    0x90aa : 'GL_USE_MISSING_GLYPH_NV',
+    0x90ab : 'GL_PATH_ERROR_POSITION_NV',
+    0x90ac : 'GL_PATH_FOG_GEN_MODE_NV',
+    0x90ad : 'GL_ACCUM_ADJACENT_PAIRS_NV',
+    0x90ae : 'GL_ADJACENT_PAIRS_NV',
+    0x90af : 'GL_FIRST_TO_REST_NV',
+    0x90b0 : 'GL_PATH_GEN_MODE_NV',
+    0x90b1 : 'GL_PATH_GEN_COEFF_NV',
+    0x90b2 : 'GL_PATH_GEN_COLOR_FORMAT_NV',
+    0x90b3 : 'GL_PATH_GEN_COMPONENTS_NV',
+    0x90b4 : 'GL_PATH_DASH_OFFSET_RESET_NV',
+    0x90b5 : 'GL_MOVE_TO_RESETS_NV',
+    0x90b6 : 'GL_MOVE_TO_CONTINUES_NV',
+    0x90b7 : 'GL_PATH_STENCIL_FUNC_NV',
+    0x90b8 : 'GL_PATH_STENCIL_REF_NV',
+    0x90b9 : 'GL_PATH_STENCIL_VALUE_MASK_NV',
+    0x90ba : 'GL_SCALED_RESOLVE_FASTEST_EXT',
+    0x90bb : 'GL_SCALED_RESOLVE_NICEST_EXT',
+    0x90bc : 'GL_MIN_MAP_BUFFER_ALIGNMENT',
+    0x90bd : 'GL_PATH_STENCIL_DEPTH_OFFSET_FACTOR_NV',
+    0x90be : 'GL_PATH_STENCIL_DEPTH_OFFSET_UNITS_NV',
+    0x90bf : 'GL_PATH_COVER_DEPTH_FUNC_NV',
+    0x90c7 : 'GL_IMAGE_FORMAT_COMPATIBILITY_TYPE',
+    0x90c8 : 'GL_IMAGE_FORMAT_COMPATIBILITY_BY_SIZE',
+    0x90c9 : 'GL_IMAGE_FORMAT_COMPATIBILITY_BY_CLASS',
+    0x90ca : 'GL_MAX_VERTEX_IMAGE_UNIFORMS',
+    0x90cb : 'GL_MAX_TESS_CONTROL_IMAGE_UNIFORMS',
+    0x90cc : 'GL_MAX_TESS_EVALUATION_IMAGE_UNIFORMS',
+    0x90cd : 'GL_MAX_GEOMETRY_IMAGE_UNIFORMS',
+    0x90ce : 'GL_MAX_FRAGMENT_IMAGE_UNIFORMS',
+    0x90cf : 'GL_MAX_COMBINED_IMAGE_UNIFORMS',
+    0x90d0 : 'GL_MAX_DEEP_3D_TEXTURE_WIDTH_HEIGHT_NV',
+    0x90d1 : 'GL_MAX_DEEP_3D_TEXTURE_DEPTH_NV',
+    0x90d2 : 'GL_SHADER_STORAGE_BUFFER',
+    0x90d3 : 'GL_SHADER_STORAGE_BUFFER_BINDING',
+    0x90d4 : 'GL_SHADER_STORAGE_BUFFER_START',
+    0x90d5 : 'GL_SHADER_STORAGE_BUFFER_SIZE',
+    0x90d6 : 'GL_MAX_VERTEX_SHADER_STORAGE_BLOCKS',
+    0x90d7 : 'GL_MAX_GEOMETRY_SHADER_STORAGE_BLOCKS',
+    0x90d8 : 'GL_MAX_TESS_CONTROL_SHADER_STORAGE_BLOCKS',
+    0x90d9 : 'GL_MAX_TESS_EVALUATION_SHADER_STORAGE_BLOCKS',
+    0x90da : 'GL_MAX_FRAGMENT_SHADER_STORAGE_BLOCKS',
+    0x90db : 'GL_MAX_COMPUTE_SHADER_STORAGE_BLOCKS',
+    0x90dc : 'GL_MAX_COMBINED_SHADER_STORAGE_BLOCKS',
+    0x90dd : 'GL_MAX_SHADER_STORAGE_BUFFER_BINDINGS',
+    0x90de : 'GL_MAX_SHADER_STORAGE_BLOCK_SIZE',
+    0x90df : 'GL_SHADER_STORAGE_BUFFER_OFFSET_ALIGNMENT',
+    0x90e1 : 'GL_SYNC_X11_FENCE_EXT',
+    0x90ea : 'GL_DEPTH_STENCIL_TEXTURE_MODE',
+    0x90eb : 'GL_MAX_COMPUTE_WORK_GROUP_INVOCATIONS',
+    0x90ec : 'GL_UNIFORM_BLOCK_REFERENCED_BY_COMPUTE_SHADER',
+    0x90ed : 'GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_COMPUTE_SHADER',
+    0x90ee : 'GL_DISPATCH_INDIRECT_BUFFER',
+    0x90ef : 'GL_DISPATCH_INDIRECT_BUFFER_BINDING',
+    0x90f0 : 'GL_COLOR_ATTACHMENT_EXT',
+    0x90f1 : 'GL_MULTIVIEW_EXT',
+    0x90f2 : 'GL_MAX_MULTIVIEW_BUFFERS_EXT',
+    0x90f3 : 'GL_CONTEXT_ROBUST_ACCESS_EXT',
+    0x90fb : 'GL_COMPUTE_PROGRAM_NV',
+    0x90fc : 'GL_COMPUTE_PROGRAM_PARAMETER_BUFFER_NV',
+    0x9100 : 'GL_TEXTURE_2D_MULTISAMPLE',
+    0x9101 : 'GL_PROXY_TEXTURE_2D_MULTISAMPLE',
+    0x9102 : 'GL_TEXTURE_2D_MULTISAMPLE_ARRAY',
+    0x9103 : 'GL_PROXY_TEXTURE_2D_MULTISAMPLE_ARRAY',
+    0x9104 : 'GL_TEXTURE_BINDING_2D_MULTISAMPLE',
+    0x9105 : 'GL_TEXTURE_BINDING_2D_MULTISAMPLE_ARRAY',
+    0x9106 : 'GL_TEXTURE_SAMPLES',
+    0x9107 : 'GL_TEXTURE_FIXED_SAMPLE_LOCATIONS',
+    0x9108 : 'GL_SAMPLER_2D_MULTISAMPLE',
+    0x9109 : 'GL_INT_SAMPLER_2D_MULTISAMPLE',
+    0x910a : 'GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE',
+    0x910b : 'GL_SAMPLER_2D_MULTISAMPLE_ARRAY',
+    0x910c : 'GL_INT_SAMPLER_2D_MULTISAMPLE_ARRAY',
+    0x910d : 'GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE_ARRAY',
+    0x910e : 'GL_MAX_COLOR_TEXTURE_SAMPLES',
+    0x910f : 'GL_MAX_DEPTH_TEXTURE_SAMPLES',
+    0x9110 : 'GL_MAX_INTEGER_SAMPLES',
+    0x9111 : 'GL_MAX_SERVER_WAIT_TIMEOUT',
+    0x9112 : 'GL_OBJECT_TYPE',
+    0x9113 : 'GL_SYNC_CONDITION',
+    0x9114 : 'GL_SYNC_STATUS',
+    0x9115 : 'GL_SYNC_FLAGS',
+    0x9116 : 'GL_SYNC_FENCE',
+    0x9117 : 'GL_SYNC_GPU_COMMANDS_COMPLETE',
+    0x9118 : 'GL_UNSIGNALED',
+    0x9119 : 'GL_SIGNALED',
+    0x911a : 'GL_ALREADY_SIGNALED',
+    0x911b : 'GL_TIMEOUT_EXPIRED',
+    0x911c : 'GL_CONDITION_SATISFIED',
+    0x911d : 'GL_WAIT_FAILED',
+    0x911f : 'GL_BUFFER_ACCESS_FLAGS',
+    0x9120 : 'GL_BUFFER_MAP_LENGTH',
+    0x9121 : 'GL_BUFFER_MAP_OFFSET',
+    0x9122 : 'GL_MAX_VERTEX_OUTPUT_COMPONENTS',
+    0x9123 : 'GL_MAX_GEOMETRY_INPUT_COMPONENTS',
+    0x9124 : 'GL_MAX_GEOMETRY_OUTPUT_COMPONENTS',
+    0x9125 : 'GL_MAX_FRAGMENT_INPUT_COMPONENTS',
+    0x9126 : 'GL_CONTEXT_PROFILE_MASK',
+    0x9127 : 'GL_UNPACK_COMPRESSED_BLOCK_WIDTH',
+    0x9128 : 'GL_UNPACK_COMPRESSED_BLOCK_HEIGHT',
+    0x9129 : 'GL_UNPACK_COMPRESSED_BLOCK_DEPTH',
+    0x912a : 'GL_UNPACK_COMPRESSED_BLOCK_SIZE',
+    0x912b : 'GL_PACK_COMPRESSED_BLOCK_WIDTH',
+    0x912c : 'GL_PACK_COMPRESSED_BLOCK_HEIGHT',
+    0x912d : 'GL_PACK_COMPRESSED_BLOCK_DEPTH',
+    0x912e : 'GL_PACK_COMPRESSED_BLOCK_SIZE',
+    0x912f : 'GL_TEXTURE_IMMUTABLE_FORMAT',
+    0x9130 : 'GL_SGX_PROGRAM_BINARY_IMG',
+    0x9133 : 'GL_RENDERBUFFER_SAMPLES_IMG',
+    0x9134 : 'GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE_IMG',
+    0x9135 : 'GL_MAX_SAMPLES_IMG',
+    0x9136 : 'GL_TEXTURE_SAMPLES_IMG',
+    0x9137 : 'GL_COMPRESSED_RGBA_PVRTC_2BPPV2_IMG',
+    0x9138 : 'GL_COMPRESSED_RGBA_PVRTC_4BPPV2_IMG',
+    0x9143 : 'GL_MAX_DEBUG_MESSAGE_LENGTH',
+    0x9144 : 'GL_MAX_DEBUG_LOGGED_MESSAGES',
+    0x9145 : 'GL_DEBUG_LOGGED_MESSAGES',
+    0x9146 : 'GL_DEBUG_SEVERITY_HIGH',
+    0x9147 : 'GL_DEBUG_SEVERITY_MEDIUM',
+    0x9148 : 'GL_DEBUG_SEVERITY_LOW',
+    0x9149 : 'GL_DEBUG_CATEGORY_API_ERROR_AMD',
+    0x914a : 'GL_DEBUG_CATEGORY_WINDOW_SYSTEM_AMD',
+    0x914b : 'GL_DEBUG_CATEGORY_DEPRECATION_AMD',
+    0x914c : 'GL_DEBUG_CATEGORY_UNDEFINED_BEHAVIOR_AMD',
+    0x914d : 'GL_DEBUG_CATEGORY_PERFORMANCE_AMD',
+    0x914e : 'GL_DEBUG_CATEGORY_SHADER_COMPILER_AMD',
+    0x914f : 'GL_DEBUG_CATEGORY_APPLICATION_AMD',
+    0x9150 : 'GL_DEBUG_CATEGORY_OTHER_AMD',
+    0x9151 : 'GL_BUFFER_OBJECT_EXT',
+    0x9152 : 'GL_PERFORMANCE_MONITOR_AMD',
+    0x9153 : 'GL_QUERY_OBJECT_AMD',
+    0x9154 : 'GL_VERTEX_ARRAY_OBJECT_AMD',
+    0x9155 : 'GL_SAMPLER_OBJECT_AMD',
+    0x9160 : 'GL_EXTERNAL_VIRTUAL_MEMORY_BUFFER_AMD',
+    0x9192 : 'GL_QUERY_BUFFER',
+    0x9193 : 'GL_QUERY_BUFFER_BINDING',
+    0x9194 : 'GL_QUERY_RESULT_NO_WAIT',
+    0x9195 : 'GL_VIRTUAL_PAGE_SIZE_X_ARB',
+    0x9196 : 'GL_VIRTUAL_PAGE_SIZE_Y_ARB',
+    0x9197 : 'GL_VIRTUAL_PAGE_SIZE_Z_ARB',
+    0x9198 : 'GL_MAX_SPARSE_TEXTURE_SIZE_ARB',
+    0x9199 : 'GL_MAX_SPARSE_3D_TEXTURE_SIZE_ARB',
+    0x919a : 'GL_MAX_SPARSE_ARRAY_TEXTURE_LAYERS_ARB',
+    0x919b : 'GL_MIN_SPARSE_LEVEL_ARB',
+    0x919c : 'GL_MIN_LOD_WARNING_AMD',
+    0x919d : 'GL_TEXTURE_BUFFER_OFFSET',
+    0x919e : 'GL_TEXTURE_BUFFER_SIZE',
+    0x919f : 'GL_TEXTURE_BUFFER_OFFSET_ALIGNMENT',
+    0x91a0 : 'GL_STREAM_RASTERIZATION_AMD',
+    0x91a4 : 'GL_VERTEX_ELEMENT_SWIZZLE_AMD',
+    0x91a5 : 'GL_VERTEX_ID_SWIZZLE_AMD',
+    0x91a6 : 'GL_TEXTURE_SPARSE_ARB',
+    0x91a7 : 'GL_VIRTUAL_PAGE_SIZE_INDEX_ARB',
+    0x91a8 : 'GL_NUM_VIRTUAL_PAGE_SIZES_ARB',
+    0x91a9 : 'GL_SPARSE_TEXTURE_FULL_ARRAY_CUBE_MIPMAPS_ARB',
+    0x91b9 : 'GL_COMPUTE_SHADER',
+    0x91bb : 'GL_MAX_COMPUTE_UNIFORM_BLOCKS',
+    0x91bc : 'GL_MAX_COMPUTE_TEXTURE_IMAGE_UNITS',
+    0x91bd : 'GL_MAX_COMPUTE_IMAGE_UNIFORMS',
+    0x91be : 'GL_MAX_COMPUTE_WORK_GROUP_COUNT',
+    0x91bf : 'GL_MAX_COMPUTE_WORK_GROUP_SIZE',
+    0x9240 : 'GL_UNPACK_FLIP_Y_WEBGL',
+    0x9241 : 'GL_UNPACK_PREMULTIPLY_ALPHA_WEBGL',
+    0x9242 : 'GL_CONTEXT_LOST_WEBGL',
+    0x9243 : 'GL_UNPACK_COLORSPACE_CONVERSION_WEBGL',
+    0x9244 : 'GL_BROWSER_DEFAULT_WEBGL',
+    0x9250 : 'GL_SHADER_BINARY_DMP',
+    0x9260 : 'GL_GCCSO_SHADER_BINARY_FJ',
+    0x9270 : 'GL_COMPRESSED_R11_EAC',
+    0x9271 : 'GL_COMPRESSED_SIGNED_R11_EAC',
+    0x9272 : 'GL_COMPRESSED_RG11_EAC',
+    0x9273 : 'GL_COMPRESSED_SIGNED_RG11_EAC',
+    0x9274 : 'GL_COMPRESSED_RGB8_ETC2',
+    0x9275 : 'GL_COMPRESSED_SRGB8_ETC2',
+    0x9276 : 'GL_COMPRESSED_RGB8_PUNCHTHROUGH_ALPHA1_ETC2',
+    0x9277 : 'GL_COMPRESSED_SRGB8_PUNCHTHROUGH_ALPHA1_ETC2',
+    0x9278 : 'GL_COMPRESSED_RGBA8_ETC2_EAC',
+    0x9279 : 'GL_COMPRESSED_SRGB8_ALPHA8_ETC2_EAC',
+    0x9280 : 'GL_BLEND_PREMULTIPLIED_SRC_NV',
+    0x9281 : 'GL_BLEND_OVERLAP_NV',
+    0x9282 : 'GL_UNCORRELATED_NV',
+    0x9283 : 'GL_DISJOINT_NV',
+    0x9284 : 'GL_CONJOINT_NV',
+    0x9285 : 'GL_BLEND_ADVANCED_COHERENT_KHR',
+    0x9286 : 'GL_SRC_NV',
+    0x9287 : 'GL_DST_NV',
+    0x9288 : 'GL_SRC_OVER_NV',
+    0x9289 : 'GL_DST_OVER_NV',
+    0x928a : 'GL_SRC_IN_NV',
+    0x928b : 'GL_DST_IN_NV',
+    0x928c : 'GL_SRC_OUT_NV',
+    0x928d : 'GL_DST_OUT_NV',
+    0x928e : 'GL_SRC_ATOP_NV',
+    0x928f : 'GL_DST_ATOP_NV',
+    0x9291 : 'GL_PLUS_NV',
+    0x9292 : 'GL_PLUS_DARKER_NV',
+    0x9294 : 'GL_MULTIPLY_KHR',
+    0x9295 : 'GL_SCREEN_KHR',
+    0x9296 : 'GL_OVERLAY_KHR',
+    0x9297 : 'GL_DARKEN_KHR',
+    0x9298 : 'GL_LIGHTEN_KHR',
+    0x9299 : 'GL_COLORDODGE_KHR',
+    0x929a : 'GL_COLORBURN_KHR',
+    0x929b : 'GL_HARDLIGHT_KHR',
+    0x929c : 'GL_SOFTLIGHT_KHR',
+    0x929e : 'GL_DIFFERENCE_KHR',
+    0x929f : 'GL_MINUS_NV',
+    0x92a0 : 'GL_EXCLUSION_KHR',
+    0x92a1 : 'GL_CONTRAST_NV',
+    0x92a3 : 'GL_INVERT_RGB_NV',
+    0x92a4 : 'GL_LINEARDODGE_NV',
+    0x92a5 : 'GL_LINEARBURN_NV',
+    0x92a6 : 'GL_VIVIDLIGHT_NV',
+    0x92a7 : 'GL_LINEARLIGHT_NV',
+    0x92a8 : 'GL_PINLIGHT_NV',
+    0x92a9 : 'GL_HARDMIX_NV',
+    0x92ad : 'GL_HSL_HUE_KHR',
+    0x92ae : 'GL_HSL_SATURATION_KHR',
+    0x92af : 'GL_HSL_COLOR_KHR',
+    0x92b0 : 'GL_HSL_LUMINOSITY_KHR',
+    0x92b1 : 'GL_PLUS_CLAMPED_NV',
+    0x92b2 : 'GL_PLUS_CLAMPED_ALPHA_NV',
+    0x92b3 : 'GL_MINUS_CLAMPED_NV',
+    0x92b4 : 'GL_INVERT_OVG_NV',
+    0x92c0 : 'GL_ATOMIC_COUNTER_BUFFER',
+    0x92c1 : 'GL_ATOMIC_COUNTER_BUFFER_BINDING',
+    0x92c2 : 'GL_ATOMIC_COUNTER_BUFFER_START',
+    0x92c3 : 'GL_ATOMIC_COUNTER_BUFFER_SIZE',
+    0x92c4 : 'GL_ATOMIC_COUNTER_BUFFER_DATA_SIZE',
+    0x92c5 : 'GL_ATOMIC_COUNTER_BUFFER_ACTIVE_ATOMIC_COUNTERS',
+    0x92c6 : 'GL_ATOMIC_COUNTER_BUFFER_ACTIVE_ATOMIC_COUNTER_INDICES',
+    0x92c7 : 'GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_VERTEX_SHADER',
+    0x92c8 : 'GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_TESS_CONTROL_SHADER',
+    0x92c9 : 'GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_TESS_EVALUATION_SHADER',
+    0x92ca : 'GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_GEOMETRY_SHADER',
+    0x92cb : 'GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_FRAGMENT_SHADER',
+    0x92cc : 'GL_MAX_VERTEX_ATOMIC_COUNTER_BUFFERS',
+    0x92cd : 'GL_MAX_TESS_CONTROL_ATOMIC_COUNTER_BUFFERS',
+    0x92ce : 'GL_MAX_TESS_EVALUATION_ATOMIC_COUNTER_BUFFERS',
+    0x92cf : 'GL_MAX_GEOMETRY_ATOMIC_COUNTER_BUFFERS',
+    0x92d0 : 'GL_MAX_FRAGMENT_ATOMIC_COUNTER_BUFFERS',
+    0x92d1 : 'GL_MAX_COMBINED_ATOMIC_COUNTER_BUFFERS',
+    0x92d2 : 'GL_MAX_VERTEX_ATOMIC_COUNTERS',
+    0x92d3 : 'GL_MAX_TESS_CONTROL_ATOMIC_COUNTERS',
+    0x92d4 : 'GL_MAX_TESS_EVALUATION_ATOMIC_COUNTERS',
+    0x92d5 : 'GL_MAX_GEOMETRY_ATOMIC_COUNTERS',
+    0x92d6 : 'GL_MAX_FRAGMENT_ATOMIC_COUNTERS',
+    0x92d7 : 'GL_MAX_COMBINED_ATOMIC_COUNTERS',
+    0x92d8 : 'GL_MAX_ATOMIC_COUNTER_BUFFER_SIZE',
+    0x92d9 : 'GL_ACTIVE_ATOMIC_COUNTER_BUFFERS',
+    0x92da : 'GL_UNIFORM_ATOMIC_COUNTER_BUFFER_INDEX',
+    0x92db : 'GL_UNSIGNED_INT_ATOMIC_COUNTER',
+    0x92dc : 'GL_MAX_ATOMIC_COUNTER_BUFFER_BINDINGS',
+    0x92e0 : 'GL_DEBUG_OUTPUT',
+    0x92e1 : 'GL_UNIFORM',
+    0x92e2 : 'GL_UNIFORM_BLOCK',
+    0x92e3 : 'GL_PROGRAM_INPUT',
+    0x92e4 : 'GL_PROGRAM_OUTPUT',
+    0x92e5 : 'GL_BUFFER_VARIABLE',
+    0x92e6 : 'GL_SHADER_STORAGE_BLOCK',
+    0x92e7 : 'GL_IS_PER_PATCH',
+    0x92e8 : 'GL_VERTEX_SUBROUTINE',
+    0x92e9 : 'GL_TESS_CONTROL_SUBROUTINE',
+    0x92ea : 'GL_TESS_EVALUATION_SUBROUTINE',
+    0x92eb : 'GL_GEOMETRY_SUBROUTINE',
+    0x92ec : 'GL_FRAGMENT_SUBROUTINE',
+    0x92ed : 'GL_COMPUTE_SUBROUTINE',
+    0x92ee : 'GL_VERTEX_SUBROUTINE_UNIFORM',
+    0x92ef : 'GL_TESS_CONTROL_SUBROUTINE_UNIFORM',
+    0x92f0 : 'GL_TESS_EVALUATION_SUBROUTINE_UNIFORM',
+    0x92f1 : 'GL_GEOMETRY_SUBROUTINE_UNIFORM',
+    0x92f2 : 'GL_FRAGMENT_SUBROUTINE_UNIFORM',
+    0x92f3 : 'GL_COMPUTE_SUBROUTINE_UNIFORM',
+    0x92f4 : 'GL_TRANSFORM_FEEDBACK_VARYING',
+    0x92f5 : 'GL_ACTIVE_RESOURCES',
+    0x92f6 : 'GL_MAX_NAME_LENGTH',
+    0x92f7 : 'GL_MAX_NUM_ACTIVE_VARIABLES',
+    0x92f8 : 'GL_MAX_NUM_COMPATIBLE_SUBROUTINES',
+    0x92f9 : 'GL_NAME_LENGTH',
+    0x92fa : 'GL_TYPE',
+    0x92fb : 'GL_ARRAY_SIZE',
+    0x92fc : 'GL_OFFSET',
+    0x92fd : 'GL_BLOCK_INDEX',
+    0x92fe : 'GL_ARRAY_STRIDE',
+    0x92ff : 'GL_MATRIX_STRIDE',
+    0x9300 : 'GL_IS_ROW_MAJOR',
+    0x9301 : 'GL_ATOMIC_COUNTER_BUFFER_INDEX',
+    0x9302 : 'GL_BUFFER_BINDING',
+    0x9303 : 'GL_BUFFER_DATA_SIZE',
+    0x9304 : 'GL_NUM_ACTIVE_VARIABLES',
+    0x9305 : 'GL_ACTIVE_VARIABLES',
+    0x9306 : 'GL_REFERENCED_BY_VERTEX_SHADER',
+    0x9307 : 'GL_REFERENCED_BY_TESS_CONTROL_SHADER',
+    0x9308 : 'GL_REFERENCED_BY_TESS_EVALUATION_SHADER',
+    0x9309 : 'GL_REFERENCED_BY_GEOMETRY_SHADER',
+    0x930a : 'GL_REFERENCED_BY_FRAGMENT_SHADER',
+    0x930b : 'GL_REFERENCED_BY_COMPUTE_SHADER',
+    0x930c : 'GL_TOP_LEVEL_ARRAY_SIZE',
+    0x930d : 'GL_TOP_LEVEL_ARRAY_STRIDE',
+    0x930e : 'GL_LOCATION',
+    0x930f : 'GL_LOCATION_INDEX',
+    0x9310 : 'GL_FRAMEBUFFER_DEFAULT_WIDTH',
+    0x9311 : 'GL_FRAMEBUFFER_DEFAULT_HEIGHT',
+    0x9312 : 'GL_FRAMEBUFFER_DEFAULT_LAYERS',
+    0x9313 : 'GL_FRAMEBUFFER_DEFAULT_SAMPLES',
+    0x9314 : 'GL_FRAMEBUFFER_DEFAULT_FIXED_SAMPLE_LOCATIONS',
+    0x9315 : 'GL_MAX_FRAMEBUFFER_WIDTH',
+    0x9316 : 'GL_MAX_FRAMEBUFFER_HEIGHT',
+    0x9317 : 'GL_MAX_FRAMEBUFFER_LAYERS',
+    0x9318 : 'GL_MAX_FRAMEBUFFER_SAMPLES',
+    0x9339 : 'GL_WARP_SIZE_NV',
+    0x933a : 'GL_WARPS_PER_SM_NV',
+    0x933b : 'GL_SM_COUNT_NV',
+    0x9344 : 'GL_MAX_COMPUTE_VARIABLE_GROUP_INVOCATIONS_ARB',
+    0x9345 : 'GL_MAX_COMPUTE_VARIABLE_GROUP_SIZE_ARB',
+    0x934a : 'GL_LOCATION_COMPONENT',
+    0x934b : 'GL_TRANSFORM_FEEDBACK_BUFFER_INDEX',
+    0x934c : 'GL_TRANSFORM_FEEDBACK_BUFFER_STRIDE',
+    0x9365 : 'GL_CLEAR_TEXTURE',
+    0x9380 : 'GL_NUM_SAMPLE_COUNTS',
+    0x93a0 : 'GL_TRANSLATED_SHADER_SOURCE_LENGTH_ANGLE',
+    0x93a1 : 'GL_BGRA8_EXT',
+    0x93a2 : 'GL_TEXTURE_USAGE_ANGLE',
+    0x93a3 : 'GL_FRAMEBUFFER_ATTACHMENT_ANGLE',
+    0x93a4 : 'GL_PACK_REVERSE_ROW_ORDER_ANGLE',
+    0x93a6 : 'GL_PROGRAM_BINARY_ANGLE',
+    0x93b0 : 'GL_COMPRESSED_RGBA_ASTC_4x4_KHR',
+    0x93b1 : 'GL_COMPRESSED_RGBA_ASTC_5x4_KHR',
+    0x93b2 : 'GL_COMPRESSED_RGBA_ASTC_5x5_KHR',
+    0x93b3 : 'GL_COMPRESSED_RGBA_ASTC_6x5_KHR',
+    0x93b4 : 'GL_COMPRESSED_RGBA_ASTC_6x6_KHR',
+    0x93b5 : 'GL_COMPRESSED_RGBA_ASTC_8x5_KHR',
+    0x93b6 : 'GL_COMPRESSED_RGBA_ASTC_8x6_KHR',
+    0x93b7 : 'GL_COMPRESSED_RGBA_ASTC_8x8_KHR',
+    0x93b8 : 'GL_COMPRESSED_RGBA_ASTC_10x5_KHR',
+    0x93b9 : 'GL_COMPRESSED_RGBA_ASTC_10x6_KHR',
+    0x93ba : 'GL_COMPRESSED_RGBA_ASTC_10x8_KHR',
+    0x93bb : 'GL_COMPRESSED_RGBA_ASTC_10x10_KHR',
+    0x93bc : 'GL_COMPRESSED_RGBA_ASTC_12x10_KHR',
+    0x93bd : 'GL_COMPRESSED_RGBA_ASTC_12x12_KHR',
+    0x93c0 : 'GL_COMPRESSED_RGBA_ASTC_3x3x3_OES',
+    0x93c1 : 'GL_COMPRESSED_RGBA_ASTC_4x3x3_OES',
+    0x93c2 : 'GL_COMPRESSED_RGBA_ASTC_4x4x3_OES',
+    0x93c3 : 'GL_COMPRESSED_RGBA_ASTC_4x4x4_OES',
+    0x93c4 : 'GL_COMPRESSED_RGBA_ASTC_5x4x4_OES',
+    0x93c5 : 'GL_COMPRESSED_RGBA_ASTC_5x5x4_OES',
+    0x93c6 : 'GL_COMPRESSED_RGBA_ASTC_5x5x5_OES',
+    0x93c7 : 'GL_COMPRESSED_RGBA_ASTC_6x5x5_OES',
+    0x93c8 : 'GL_COMPRESSED_RGBA_ASTC_6x6x5_OES',
+    0x93c9 : 'GL_COMPRESSED_RGBA_ASTC_6x6x6_OES',
+    0x93d0 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4_KHR',
+    0x93d1 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x4_KHR',
+    0x93d2 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5_KHR',
+    0x93d3 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x5_KHR',
+    0x93d4 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6_KHR',
+    0x93d5 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x5_KHR',
+    0x93d6 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x6_KHR',
+    0x93d7 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x8_KHR',
+    0x93d8 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x5_KHR',
+    0x93d9 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x6_KHR',
+    0x93da : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x8_KHR',
+    0x93db : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x10_KHR',
+    0x93dc : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x10_KHR',
+    0x93dd : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x12_KHR',
+    0x93e0 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_3x3x3_OES',
+    0x93e1 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x3x3_OES',
+    0x93e2 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4x3_OES',
+    0x93e3 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4x4_OES',
+    0x93e4 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x4x4_OES',
+    0x93e5 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5x4_OES',
+    0x93e6 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5x5_OES',
+    0x93e7 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x5x5_OES',
+    0x93e8 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6x5_OES',
+    0x93e9 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6x6_OES',
+    0x93f0 : 'GL_COMPRESSED_SRGB_ALPHA_PVRTC_2BPPV2_IMG',
+    0x93f1 : 'GL_COMPRESSED_SRGB_ALPHA_PVRTC_4BPPV2_IMG',
+    0x94f0 : 'GL_PERFQUERY_COUNTER_EVENT_INTEL',
+    0x94f1 : 'GL_PERFQUERY_COUNTER_DURATION_NORM_INTEL',
+    0x94f2 : 'GL_PERFQUERY_COUNTER_DURATION_RAW_INTEL',
+    0x94f3 : 'GL_PERFQUERY_COUNTER_THROUGHPUT_INTEL',
+    0x94f4 : 'GL_PERFQUERY_COUNTER_RAW_INTEL',
+    0x94f5 : 'GL_PERFQUERY_COUNTER_TIMESTAMP_INTEL',
+    0x94f8 : 'GL_PERFQUERY_COUNTER_DATA_UINT32_INTEL',
+    0x94f9 : 'GL_PERFQUERY_COUNTER_DATA_UINT64_INTEL',
+    0x94fa : 'GL_PERFQUERY_COUNTER_DATA_FLOAT_INTEL',
+    0x94fb : 'GL_PERFQUERY_COUNTER_DATA_DOUBLE_INTEL',
+    0x94fc : 'GL_PERFQUERY_COUNTER_DATA_BOOL32_INTEL',
+    0x94fd : 'GL_PERFQUERY_QUERY_NAME_LENGTH_MAX_INTEL',
+    0x94fe : 'GL_PERFQUERY_COUNTER_NAME_LENGTH_MAX_INTEL',
+    0x94ff : 'GL_PERFQUERY_COUNTER_DESC_LENGTH_MAX_INTEL',
+    0x9500 : 'GL_PERFQUERY_GPA_EXTENDED_COUNTERS_INTEL',
+    0xffff : 'GL_TRACE_ALL_BITS_MESA',
+    0x10000 : 'GL_EVAL_BIT',
+    0x19262 : 'GL_RASTER_POSITION_UNCLIPPED_IBM',
+    0x1a1f8 : 'GL_PREFER_DOUBLEBUFFER_HINT_PGI',
+    0x1a1fd : 'GL_CONSERVE_MEMORY_HINT_PGI',
+    0x1a1fe : 'GL_RECLAIM_MEMORY_HINT_PGI',
+    0x1a202 : 'GL_NATIVE_GRAPHICS_HANDLE_PGI',
+    0x1a203 : 'GL_NATIVE_GRAPHICS_BEGIN_HINT_PGI',
+    0x1a204 : 'GL_NATIVE_GRAPHICS_END_HINT_PGI',
+    0x1a20c : 'GL_ALWAYS_FAST_HINT_PGI',
+    0x1a20d : 'GL_ALWAYS_SOFT_HINT_PGI',
+    0x1a20e : 'GL_ALLOW_DRAW_OBJ_HINT_PGI',
+    0x1a20f : 'GL_ALLOW_DRAW_WIN_HINT_PGI',
+    0x1a210 : 'GL_ALLOW_DRAW_FRG_HINT_PGI',
+    0x1a211 : 'GL_ALLOW_DRAW_MEM_HINT_PGI',
+    0x1a216 : 'GL_STRICT_DEPTHFUNC_HINT_PGI',
+    0x1a217 : 'GL_STRICT_LIGHTING_HINT_PGI',
+    0x1a218 : 'GL_STRICT_SCISSOR_HINT_PGI',
+    0x1a219 : 'GL_FULL_STIPPLE_HINT_PGI',
+    0x1a220 : 'GL_CLIP_NEAR_HINT_PGI',
+    0x1a221 : 'GL_CLIP_FAR_HINT_PGI',
+    0x1a222 : 'GL_WIDE_LINE_HINT_PGI',
+    0x1a223 : 'GL_BACK_NORMALS_HINT_PGI',
+    0x1a22a : 'GL_VERTEX_DATA_HINT_PGI',
+    0x1a22b : 'GL_VERTEX_CONSISTENT_HINT_PGI',
+    0x1a22c : 'GL_MATERIAL_SIDE_HINT_PGI',
+    0x1a22d : 'GL_MAX_VERTEX_HINT_PGI',
+    0x20000 : 'GL_LIST_BIT',
+    0x40000 : 'GL_TEXTURE_BIT',
+    0x80000 : 'GL_SCISSOR_BIT',
+    0x100000 : 'GL_MAT_AMBIENT_BIT_PGI',
+    0x103050 : 'GL_CULL_VERTEX_IBM',
+    0x103060 : 'GL_ALL_STATIC_DATA_IBM',
+    0x103061 : 'GL_STATIC_VERTEX_ARRAY_IBM',
+    0x103070 : 'GL_VERTEX_ARRAY_LIST_IBM',
+    0x103071 : 'GL_NORMAL_ARRAY_LIST_IBM',
+    0x103072 : 'GL_COLOR_ARRAY_LIST_IBM',
+    0x103073 : 'GL_INDEX_ARRAY_LIST_IBM',
+    0x103074 : 'GL_TEXTURE_COORD_ARRAY_LIST_IBM',
+    0x103075 : 'GL_EDGE_FLAG_ARRAY_LIST_IBM',
+    0x103076 : 'GL_FOG_COORDINATE_ARRAY_LIST_IBM',
+    0x103077 : 'GL_SECONDARY_COLOR_ARRAY_LIST_IBM',
+    0x103080 : 'GL_VERTEX_ARRAY_LIST_STRIDE_IBM',
+    0x103081 : 'GL_NORMAL_ARRAY_LIST_STRIDE_IBM',
+    0x103082 : 'GL_COLOR_ARRAY_LIST_STRIDE_IBM',
+    0x103083 : 'GL_INDEX_ARRAY_LIST_STRIDE_IBM',
+    0x103084 : 'GL_TEXTURE_COORD_ARRAY_LIST_STRIDE_IBM',
+    0x103085 : 'GL_EDGE_FLAG_ARRAY_LIST_STRIDE_IBM',
+    0x103086 : 'GL_FOG_COORDINATE_ARRAY_LIST_STRIDE_IBM',
+    0x103087 : 'GL_SECONDARY_COLOR_ARRAY_LIST_STRIDE_IBM',
+    0x200000 : 'GL_MAT_AMBIENT_AND_DIFFUSE_BIT_PGI',
+    0x400000 : 'GL_MAT_DIFFUSE_BIT_PGI',
+    0x800000 : 'GL_MAT_EMISSION_BIT_PGI',
+    0x1000000 : 'GL_MAT_COLOR_INDEXES_BIT_PGI',
+    0x2000000 : 'GL_MAT_SHININESS_BIT_PGI',
+    0x4000000 : 'GL_MAT_SPECULAR_BIT_PGI',
+    0x8000000 : 'GL_NORMAL_BIT_PGI',
+    0x10000000 : 'GL_TEXCOORD1_BIT_PGI',
+    0x20000000 : 'GL_MULTISAMPLE_BIT',
+    0x40000000 : 'GL_TEXCOORD3_BIT_PGI',
+    0x80000000 : 'GL_TEXCOORD4_BIT_PGI',
+    0xffffffff : 'GL_ALL_ATTRIB_BITS',
+    0xffffffffffffffff : 'GL_TIMEOUT_IGNORED',
+}
@@ -43,13 +43,13 @@ https://android.googlesource.com/platform/sdk/+/f51d3b0/eclipse/plugins/com.andr
     The trace is written as network-order header plus payload
 """
 
-import errno
 import os
 import socket
 import struct
 
 import scriptine
 
+import gltrace
 import utils
 
 #
@@ -61,20 +61,17 @@ def os_system(cmd):
     if (os.system(cmd) != 0):
         raise Exception("Exception running command %s" % repr(cmd))
 
-def socket_recv(sock, buffer_size):
+class SocketFile(object):
     """!
-    Really blocking recv
+    Read-only file-like wrapper of a socket that returns the data as soon as
+    it's received, instead of blocking until the requested size is available
+    as socket.makefile does
     """
-    buffer_data = ""
-    while (buffer_size != 0):
-        b = sock.recv(buffer_size)
-        if (b == ""):
-            raise OSError(errno.EPIPE, 'Broken pipe')
-        buffer_size -= len(b)
-        buffer_data = buffer_data + b
-
-    return buffer_data
+    def __init__(self, sock):
+        self.sock = sock
 
+    def read(self, size):
+        return self.sock.recv(size)
 
 def capture_command(trace_filepath = "glcap.gltrace",
                     store_fb_on_swap = False,
@@ -86,7 +83,8 @@ def capture_command(trace_filepath = "glcap.gltrace",
     The application must be started before invoking the capture.
 
     :param trace_filepath: Path to the destination GL trace. Terminate in .gz
-                           for compression
+                           for compression or in .bgz for blocked compression
+                           (seekable and faster to decompress)
     :param store_fb_on_swap: Store the framebuffer contents in the trace on every
                            eglSwapBuffers call
     :param store_fb_on_draw: Store the framebuffer contents in the trace on every
@@ -125,24 +123,12 @@ def capture_command(trace_filepath = "glcap.gltrace",
     trace_socket.send(struct.pack("!i", flags))
 
     # Read the trace
+    # Packet length is read in little endian and written to file in network
+    # order
     with utils.xopen(trace_filepath, "wb") as f:
-        while (True):
-            try:
-                packet_length = socket_recv(trace_socket, 4)
-            except OSError as e:
-                if (e.errno != errno.EPIPE):
-                    raise
-                else:
-                    break
-
-            # Packet length is read in little endian
-            packet_length = struct.unpack("<I", packet_length)
-            packet_length = packet_length[0]
-            packet_data = socket_recv(trace_socket, packet_length)
-
-            # Packet length is written to file in network order
-            f.write(struct.pack("!i", packet_length))
-            f.write(packet_data)
+        for packet_data in gltrace.iter_trace_messages(SocketFile(trace_socket),
+                                                       header_format = "<I"):
+            gltrace.write_trace_message(f, packet_data)
 
 if (__name__ == "__main__"):
     scriptine.run()
\ No newline at end of file
@@ -0,0 +1,617 @@
+#!/usr/bin/env python
+
+# Copyright 2014 Antonio Tejada
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""!
+Fast decoder specialised for the GLMessage schema in gltrace.proto.
+
+The generated gltrace_pb2 classes create one Python object per element of
+repeated fields, which dominates the decoding of vertex and texture heavy
+traces. This decoder returns objects with the same fields as gltrace_pb2's
+GLMessage but
+- floatValue and intValue are array.array, float runs are converted in bulk
+- rawBytes are memoryview slices of the serialized message (zero copy)
+
+Select it with get_message_decoder("fast") and verify it against gltrace_pb2
+with
+    gldecode.py verify --trace-filepath=foo.gltrace.gz
+"""
+
+import array
+import collections
+import logging
+import multiprocessing
+import struct
+
+import gltrace
+from gltrace import gltrace_pb2
+import utils
+
+logger = logging.getLogger(__name__)
+
+# Wire tags (field number << 3 | wire type) of the GLMessage and DataType
+# fields, see gltrace.proto
+GLMESSAGE_CONTEXT_ID = (1 << 3) | 0
+GLMESSAGE_START_TIME = (2 << 3) | 0
+GLMESSAGE_DURATION = (3 << 3) | 0
+GLMESSAGE_FUNCTION = (4 << 3) | 0
+GLMESSAGE_ARGS = (5 << 3) | 2
+GLMESSAGE_RETURN_VALUE = (6 << 3) | 2
+GLMESSAGE_FB = (7 << 3) | 2
+GLMESSAGE_THREADTIME = (8 << 3) | 0
+
+DATATYPE_TYPE = (1 << 3) | 0
+DATATYPE_IS_ARRAY = (2 << 3) | 0
+DATATYPE_INT_VALUE = (3 << 3) | 0
+DATATYPE_INT_VALUE_PACKED = (3 << 3) | 2
+DATATYPE_FLOAT_VALUE = (4 << 3) | 5
+DATATYPE_FLOAT_VALUE_PACKED = (4 << 3) | 2
+DATATYPE_CHAR_VALUE = (5 << 3) | 2
+DATATYPE_RAW_BYTES = (6 << 3) | 2
+DATATYPE_BOOL_VALUE = (7 << 3) | 0
+DATATYPE_BOOL_VALUE_PACKED = (7 << 3) | 2
+DATATYPE_INT64_VALUE = (8 << 3) | 0
+DATATYPE_INT64_VALUE_PACKED = (8 << 3) | 2
+
+FRAMEBUFFER_WIDTH = (1 << 3) | 0
+FRAMEBUFFER_HEIGHT = (2 << 3) | 0
+FRAMEBUFFER_CONTENTS = (3 << 3) | 2
+
+# Element size of non-packed repeated floats: 1-byte tag plus 4-byte float
+FLOAT_STRIDE = 5
+
+# Number of messages sent to a decoding process at a time, big enough to
+# amortize the interprocess overhead and small enough to keep the pipeline busy
+DECODE_CHUNK_SIZE = 1024
+
+class DecodeError(Exception):
+    pass
+
+class DataType(object):
+    """!
+    Same fields as gltrace_pb2.GLMessage.DataType
+    """
+    __slots__ = ["type", "isArray", "intValue", "floatValue", "charValue",
+                 "rawBytes", "boolValue", "int64Value"]
+
+    def __init__(self):
+        self.type = gltrace_pb2.GLMessage.DataType.VOID
+        self.isArray = False
+        self.intValue = array.array("i")
+        self.floatValue = array.array("f")
+        self.charValue = []
+        self.rawBytes = []
+        self.boolValue = []
+        self.int64Value = []
+
+    def __str__(self):
+        return "type: %d isArray: %s intValue: %s floatValue: %s charValue: %s rawBytes: %s boolValue: %s int64Value: %s" % (
+            self.type, self.isArray, list(self.intValue), list(self.floatValue),
+            self.charValue, [len(b) for b in self.rawBytes], self.boolValue,
+            self.int64Value)
+
+    def __reduce__(self):
+        # Pickle as a plain tuple with the arrays as strings, the default
+        # pickling of __slots__ objects is several times slower than decoding
+        return (make_datatype, (self.type, self.isArray, self.intValue.tostring(),
+                                self.floatValue.tostring(), self.charValue,
+                                self.rawBytes, self.boolValue, self.int64Value))
+
+def make_datatype(type, isArray, intValue, floatValue, charValue, rawBytes,
+                  boolValue, int64Value):
+    """!
+    Unpickle a DataType, see DataType.__reduce__
+    """
+    datatype = DataType.__new__(DataType)
+    datatype.type = type
+    datatype.isArray = isArray
+    datatype.intValue = array.array("i", intValue)
+    datatype.floatValue = array.array("f", floatValue)
+    datatype.charValue = charValue
+    datatype.rawBytes = rawBytes
+    datatype.boolValue = boolValue
+    datatype.int64Value = int64Value
+    return datatype
+
+class FrameBuffer(object):
+    """!
+    Same fields as gltrace_pb2.GLMessage.FrameBuffer
+    """
+    __slots__ = ["width", "height", "contents"]
+
+    def __init__(self):
+        self.width = 0
+        self.height = 0
+        self.contents = []
+
+    def __reduce__(self):
+        return (make_framebuffer, (self.width, self.height, self.contents))
+
+def make_framebuffer(width, height, contents):
+    """!
+    Unpickle a FrameBuffer, see FrameBuffer.__reduce__
+    """
+    fb = FrameBuffer.__new__(FrameBuffer)
+    fb.width = width
+    fb.height = height
+    fb.contents = contents
+    return fb
+
+class GLMessage(object):
+    """!
+    Same fields as gltrace_pb2.GLMessage
+    """
+    __slots__ = ["context_id", "start_time", "duration", "function", "args",
+                 "returnValue", "fb", "threadtime"]
+
+    def __init__(self):
+        self.context_id = None
+        self.start_time = None
+        self.duration = None
+        self.function = None
+        self.args = []
+        self.returnValue = DataType()
+        self.fb = FrameBuffer()
+        self.threadtime = 0
+
+    def __str__(self):
+        lines = ["context_id: %d start_time: %d duration: %d function: %d threadtime: %d" %
+                 (self.context_id, self.start_time, self.duration, self.function,
+                  self.threadtime)]
+        lines.extend(["args { %s }" % arg for arg in self.args])
+        lines.append("returnValue { %s }" % self.returnValue)
+        return "\n".join(lines)
+
+    def __reduce__(self):
+        return (make_message, (self.context_id, self.start_time, self.duration,
+                               self.function, self.args, self.returnValue,
+                               self.fb, self.threadtime))
+
+def make_message(context_id, start_time, duration, function, args, returnValue,
+                 fb, threadtime):
+    """!
+    Unpickle a GLMessage, see GLMessage.__reduce__
+    """
+    msg = GLMessage.__new__(GLMessage)
+    msg.context_id = context_id
+    msg.start_time = start_time
+    msg.duration = duration
+    msg.function = function
+    msg.args = args
+    msg.returnValue = returnValue
+    msg.fb = fb
+    msg.threadtime = threadtime
+    return msg
+
+def decode_varint(data, offset):
+    value = 0
+    shift = 0
+    while True:
+        b = data[offset]
+        offset += 1
+        value |= (b & 0x7f) << shift
+        if (b < 0x80):
+            return (value, offset)
+        shift += 7
+
+def to_int32(value):
+    # Negative int32 are sign-extended to 64 bits
+    if (value >= 0x80000000):
+        value = ((value + 0x80000000) & 0xffffffff) - 0x80000000
+    return value
+
+def to_int64(value):
+    if (value >= (1 << 63)):
+        value -= (1 << 64)
+    return value
+
+def skip_field(data, offset, wire_type):
+    if (wire_type == 0):
+        return decode_varint(data, offset)[1]
+    elif (wire_type == 1):
+        return offset + 8
+    elif (wire_type == 2):
+        (length, offset) = decode_varint(data, offset)
+        return offset + length
+    elif (wire_type == 5):
+        return offset + 4
+    raise DecodeError("Unsupported wire type %d" % wire_type)
+
+def decode_float_run(data, offset, end, floats):
+    """!
+    Append to floats the run of non-packed floats starting at offset (which
+    points to a float tag) and return the offset after the run.
+
+    The run is de-interleaved from its tags with extended slices instead of
+    unpacking each float.
+    """
+    # Tags of the run, every FLOAT_STRIDE bytes
+    tags = data[offset:end:FLOAT_STRIDE]
+    count = len(tags) - len(tags.lstrip(chr(DATATYPE_FLOAT_VALUE)))
+    # The last element may be cut if the message is truncated
+    if (offset + count * FLOAT_STRIDE > end):
+        raise DecodeError("Truncated float value")
+    run_end = offset + count * FLOAT_STRIDE
+    values = bytearray(count * 4)
+    for byte_index in xrange(4):
+        values[byte_index::4] = data[offset + 1 + byte_index:run_end:FLOAT_STRIDE]
+    floats.fromstring(str(values))
+    if (floats.itemsize != 4): # pragma: no cover
+        raise DecodeError("Unsupported float size")
+    if (struct.pack("=I", 1) != struct.pack("<I", 1)): # pragma: no cover
+        # Floats are little endian on the wire
+        floats.byteswap()
+
+    return run_end
+
+def decode_int_run(data, offset, end, ints):
+    """!
+    Append to ints the run of non-packed int32 starting at offset (which
+    points to an int tag) and return the offset after the run.
+    """
+    # Fast path for runs of single-byte varints (small ints, eg index
+    # buffers with less than 128 vertices or most enums)
+    pairs = data[offset:end:2]
+    count = len(pairs) - len(pairs.lstrip(chr(DATATYPE_INT_VALUE)))
+    if (count > 0):
+        values = data[offset + 1:min(offset + 2 * count, end):2]
+        # Use the slow path for the whole run if there's any multi-byte varint
+        if ((len(values) == count) and (max(values) < 0x80)):
+            ints.extend(values)
+            offset += 2 * count
+
+    while ((offset < end) and (data[offset] == DATATYPE_INT_VALUE)):
+        (value, offset) = decode_varint(data, offset + 1)
+        ints.append(to_int32(value))
+
+    return offset
+
+def decode_datatype(data, buffer, offset, end):
+    """!
+    Decode the DataType between offset and end of the bytearray data,
+    rawBytes are sliced from the memoryview buffer
+    """
+    datatype = DataType()
+    while (offset < end):
+        tag = data[offset]
+        if (tag < 0x80):
+            offset += 1
+        else:
+            (tag, offset) = decode_varint(data, offset)
+
+        if (tag == DATATYPE_FLOAT_VALUE):
+            offset = decode_float_run(data, offset - 1, end, datatype.floatValue)
+
+        elif (tag == DATATYPE_INT_VALUE):
+            offset = decode_int_run(data, offset - 1, end, datatype.intValue)
+
+        elif (tag == DATATYPE_TYPE):
+            (value, offset) = decode_varint(data, offset)
+            datatype.type = value
+
+        elif (tag == DATATYPE_IS_ARRAY):
+            (value, offset) = decode_varint(data, offset)
+            datatype.isArray = (value != 0)
+
+        elif (tag == DATATYPE_RAW_BYTES):
+            (length, offset) = decode_varint(data, offset)
+            if (offset + length > end):
+                raise DecodeError("Truncated rawBytes")
+            datatype.rawBytes.append(buffer[offset:offset + length])
+            offset += length
+
+        elif (tag == DATATYPE_CHAR_VALUE):
+            (length, offset) = decode_varint(data, offset)
+            if (offset + length > end):
+                raise DecodeError("Truncated charValue")
+            datatype.charValue.append(str(data[offset:offset + length]))
+            offset += length
+
+        elif (tag == DATATYPE_BOOL_VALUE):
+            (value, offset) = decode_varint(data, offset)
+            datatype.boolValue.append(value != 0)
+
+        elif (tag == DATATYPE_INT64_VALUE):
+            (value, offset) = decode_varint(data, offset)
+            datatype.int64Value.append(to_int64(value))
+
+        elif (tag == DATATYPE_FLOAT_VALUE_PACKED):
+            (length, offset) = decode_varint(data, offset)
+            floats = array.array("f", str(data[offset:offset + length]))
+            if (struct.pack("=I", 1) != struct.pack("<I", 1)): # pragma: no cover
+                floats.byteswap()
+            datatype.floatValue.extend(floats)
+            offset += length
+
+        elif (tag in [DATATYPE_INT_VALUE_PACKED, DATATYPE_BOOL_VALUE_PACKED,
+                      DATATYPE_INT64_VALUE_PACKED]):
+            (length, offset) = decode_varint(data, offset)
+            packed_end = offset + length
+            while (offset < packed_end):
+                (value, offset) = decode_varint(data, offset)
+                if (tag == DATATYPE_INT_VALUE_PACKED):
+                    datatype.intValue.append(to_int32(value))
+                elif (tag == DATATYPE_BOOL_VALUE_PACKED):
+                    datatype.boolValue.append(value != 0)
+                else:
+                    datatype.int64Value.append(to_int64(value))
+
+        else:
+            offset = skip_field(data, offset, tag & 0x7)
+
+    if (offset != end):
+        raise DecodeError("Truncated DataType")
+
+    return datatype
+
+def decode_framebuffer(data, offset, end):
+    fb = FrameBuffer()
+    while (offset < end):
+        (tag, offset) = decode_varint(data, offset)
+        if (tag == FRAMEBUFFER_WIDTH):
+            (value, offset) = decode_varint(data, offset)
+            fb.width = to_int32(value)
+        elif (tag == FRAMEBUFFER_HEIGHT):
+            (value, offset) = decode_varint(data, offset)
+            fb.height = to_int32(value)
+        elif (tag == FRAMEBUFFER_CONTENTS):
+            (length, offset) = decode_varint(data, offset)
+            fb.contents.append(str(data[offset:offset + length]))
+            offset += length
+        else:
+            offset = skip_field(data, offset, tag & 0x7)
+
+    if (offset != end):
+        raise DecodeError("Truncated FrameBuffer")
+
+    return fb
+
+def decode_message(buffer):
+    """!
+    Decode a serialized GLMessage, drop-in replacement of
+    gltrace_pb2.GLMessage.FromString
+    """
+    buffer = memoryview(buffer)
+    data = bytearray(buffer)
+    end = len(data)
+    msg = GLMessage()
+    offset = 0
+    try:
+        while (offset < end):
+            tag = data[offset]
+            if (tag < 0x80):
+                offset += 1
+            else:
+                (tag, offset) = decode_varint(data, offset)
+
+            if (tag in [GLMESSAGE_ARGS, GLMESSAGE_RETURN_VALUE, GLMESSAGE_FB]):
+                (length, offset) = decode_varint(data, offset)
+                if (offset + length > end):
+                    raise DecodeError("Truncated submessage")
+                if (tag == GLMESSAGE_ARGS):
+                    msg.args.append(decode_datatype(data, buffer, offset, offset + length))
+                elif (tag == GLMESSAGE_RETURN_VALUE):
+                    msg.returnValue = decode_datatype(data, buffer, offset, offset + length)
+                else:
+                    msg.fb = decode_framebuffer(data, offset, offset + length)
+                offset += length
+
+            elif (tag == GLMESSAGE_CONTEXT_ID):
+                (value, offset) = decode_varint(data, offset)
+                msg.context_id = to_int32(value)
+
+            elif (tag == GLMESSAGE_START_TIME):
+                (value, offset) = decode_varint(data, offset)
+                msg.start_time = to_int64(value)
+
+            elif (tag == GLMESSAGE_DURATION):
+                (value, offset) = decode_varint(data, offset)
+                msg.duration = to_int32(value)
+
+            elif (tag == GLMESSAGE_FUNCTION):
+                (value, offset) = decode_varint(data, offset)
+                msg.function = value
+
+            elif (tag == GLMESSAGE_THREADTIME):
+                (value, offset) = decode_varint(data, offset)
+                msg.threadtime = to_int32(value)
+
+            else:
+                offset = skip_field(data, offset, tag & 0x7)
+
+    except IndexError:
+        raise DecodeError("Truncated message")
+
+    if (offset != end):
+        raise DecodeError("Truncated message")
+
+    # Same as gltrace_pb2, fail if the required fields are missing
+    if ((msg.context_id is None) or (msg.start_time is None) or
+        (msg.duration is None) or (msg.function is None)):
+        raise DecodeError("Message is missing required fields")
+
+    return msg
+
+def get_message_decoder(name):
+    """!
+    Return the function to decode serialized GLMessages.
+
+    @param name: "protobuf" for the generated gltrace_pb2 module or "fast" for
+           the specialised decoder in this module
+    """
+    if (name == "protobuf"):
+        return gltrace_pb2.GLMessage.FromString
+    elif (name == "fast"):
+        return decode_message
+    raise Exception("Unknown message decoder %s" % name)
+
+def detach_message(msg):
+    """!
+    Replace the memoryviews in a decoded message with strings so the message
+    can be pickled and no longer references the serialized buffer, messages
+    already detached are left as they are
+    """
+    for datatype in msg.args + [msg.returnValue]:
+        datatype.rawBytes = [b.tobytes() if isinstance(b, memoryview) else b
+                             for b in datatype.rawBytes]
+    return msg
+
+def decode_chunk(decoder_name, buffers):
+    """!
+    Decode a chunk of serialized GLMessages, this is the function run by the
+    decoding processes, so it needs to be at the module top level.
+
+    @return tuple with the list of decoded messages and a boolean with whether
+            the decoding stopped because of a decode error
+    """
+    decode = get_message_decoder(decoder_name)
+    msgs = []
+    for buffer in buffers:
+        try:
+            msg = decode(buffer)
+        except:
+            return (msgs, True)
+        if (decoder_name == "fast"):
+            detach_message(msg)
+        msgs.append(msg)
+
+    return (msgs, False)
+
+def iter_decoded_messages(buffers, decoder_name = "protobuf", processes = 1,
+                          chunk_size = DECODE_CHUNK_SIZE):
+    """!
+    Decode serialized GLMessages, yielding them in trace order.
+
+    With more than one process, chunks of messages are decoded on a
+    multiprocessing pool while the caller consumes the previous ones. The
+    number of chunks in flight is bounded to twice the number of processes so
+    big traces are not read into memory ahead of the consumer.
+
+    Decoding stops at the first message that fails to decode (eg the trace is
+    truncated because the app was terminated).
+
+    @param buffers: iterable of serialized GLMessages, eg from
+           gltrace.iter_trace_messages
+    @param decoder_name: decoder to use, see get_message_decoder. Decoded
+           gltrace_pb2 messages are serialized again to be sent back from the
+           decoding processes, so only the "fast" decoder benefits from
+           multiple processes.
+    @param processes: number of decoding processes, None to use all the CPUs
+           or 1 to decode in the calling process
+    """
+    if (processes is None):
+        processes = multiprocessing.cpu_count()
+
+    if (processes <= 1):
+        decode = get_message_decoder(decoder_name)
+        for buffer in buffers:
+            logger.debug("unpacked %d bytes" % len(buffer))
+            try:
+                msg = decode(buffer)
+            except:
+                logger.warning("Decode error, truncated protobuff, trace will be incomplete")
+                break
+            yield msg
+        return
+
+    pool = multiprocessing.Pool(processes)
+    try:
+        pending_chunks = collections.deque()
+        chunk = []
+        decode_error = False
+        buffers = iter(buffers)
+        while (not decode_error):
+            # Fill the pipeline, then wait for the oldest chunk to be decoded
+            # before sending the next one
+            while ((len(pending_chunks) < 2 * processes) and (buffers is not None)):
+                for buffer in buffers:
+                    chunk.append(buffer.tobytes() if isinstance(buffer, memoryview) else buffer)
+                    if (len(chunk) >= chunk_size):
+                        break
+                else:
+                    buffers = None
+                if (len(chunk) > 0):
+                    pending_chunks.append(pool.apply_async(decode_chunk,
+                                                           (decoder_name, chunk)))
+                    chunk = []
+
+            if (len(pending_chunks) == 0):
+                break
+
+            (msgs, decode_error) = pending_chunks.popleft().get()
+            for msg in msgs:
+                yield msg
+
+        if (decode_error):
+            logger.warning("Decode error, truncated protobuff, trace will be incomplete")
+
+    finally:
+        # Also called when the caller closes the generator before the end, so
+        # no worker or chunk in flight outlives the iteration
+        pool.terminate()
+        pool.join()
+
+def get_datatype_fields(datatype):
+    """!
+    Return the fields of a DataType as comparable plain Python values
+    """
+    return (datatype.type, datatype.isArray, list(datatype.intValue),
+            list(datatype.floatValue), list(datatype.charValue),
+            [str(b) if not isinstance(b, memoryview) else b.tobytes() for b in datatype.rawBytes],
+            list(datatype.boolValue), list(datatype.int64Value))
+
+def get_message_fields(msg):
+    """!
+    Return the fields of a GLMessage as comparable plain Python values
+    """
+    return (msg.context_id, msg.start_time, msg.duration, msg.function,
+            [get_datatype_fields(arg) for arg in msg.args],
+            get_datatype_fields(msg.returnValue),
+            (msg.fb.width, msg.fb.height, list(msg.fb.contents)),
+            msg.threadtime)
+
+def verify_command(trace_filepath = "_out/test.gltrace.gz"):
+    """
+    Decode a trace with both the protobuf and the fast decoders and fail if
+    they don't decode the same values.
+
+    :param trace_filepath: Path to the OpenGL ES trace file
+    """
+    message_count = 0
+    with utils.xopen(trace_filepath) as trace:
+        for buffer in gltrace.iter_trace_messages(trace):
+            try:
+                expected_msg = gltrace_pb2.GLMessage.FromString(buffer)
+            except:
+                logger.warning("Decode error, truncated protobuff, stopping verification")
+                break
+            msg = decode_message(buffer)
+            if (get_message_fields(msg) != get_message_fields(expected_msg)):
+                raise Exception("Mismatch decoding message %d, expected\n%s\nfound\n%s" %
+                                (message_count, expected_msg, msg))
+            message_count += 1
+
+    logger.info("Verified %d messages" % message_count)
+
+if (__name__ == "__main__"): # pragma: no cover
+    import scriptine
+
+    logging_format = "%(asctime).23s %(levelname)s:%(filename)s(%(lineno)d) [%(thread)d]: %(message)s"
+    logger_handler = logging.StreamHandler()
+    logger_handler.setFormatter(logging.Formatter(logging_format))
+    logger.addHandler(logger_handler)
+    logger.setLevel(logging.INFO)
+
+    scriptine.run()
@@ -19,91 +19,226 @@
 
 # https://cvs.khronos.org/svn/repos/ogl/trunk/doc/registry/public/api/gl.xml
 
+import array
+import cPickle
 import ctypes
 import errno
 import hashlib
+import imp
+import json
 import logging
 import os
+import Queue
 import re
+import shutil
 import string
 import struct
 import sys
-import xml.etree.ElementTree
+import threading
+import time
+import zlib
 
+import gldecode
+import gltrace
+from gltrace import gltrace_pb2
 import utils
 
 logger = logging.getLogger(__name__)
 
-PROTOBUFF_DIR = "external/google"
-sys.path.append(os.path.join(sys.path[0],PROTOBUFF_DIR))
-# XXX This is so when invoked from the test dir it can find the protobuf, fix
-#     in a more elgant way
-sys.path.append(os.path.join(sys.path[0],"..", PROTOBUFF_DIR))
-try:
-    import gltrace_pb2
-except ImportError as error:
-    logger.error(error)
-    logger.error("Protobuf Python package not found (install with 'pip protobuf') or "
-                 "the protobuff gltrace Python module %s/gltrace_pb2.py doesn't exist, "
-                 "generate it with\n"
-                 "  %s/protoc %s/gltrace.proto --python_out=%s" %
-                 (PROTOBUFF_DIR, PROTOBUFF_DIR, PROTOBUFF_DIR, PROTOBUFF_DIR))
-    # XXX Generate it automatically?
-    sys.exit()
+# Functions that don't modify any state the replay needs later on, these are
+# dropped before the start frame without generating any code for them. The rest
+# of functions before the start frame are still needed to create the objects and
+# set the state of the replayed frames.
+SETUP_SKIPPED_FUNCTIONS = [
+    "glCheckFramebufferStatus",
+    "glDiscardFramebufferEXT",
+    "glFinish",
+    "glFlush",
+    "glGetActiveAttrib",
+    "glGetActiveUniform",
+    "glGetAttachedShaders",
+    "glGetBooleanv",
+    "glGetBufferParameteriv",
+    "glGetError",
+    "glGetFloatv",
+    "glGetFramebufferAttachmentParameteriv",
+    "glGetIntegerv",
+    "glGetProgramInfoLog",
+    "glGetProgramiv",
+    "glGetRenderbufferParameteriv",
+    "glGetShaderInfoLog",
+    "glGetShaderPrecisionFormat",
+    "glGetShaderSource",
+    "glGetShaderiv",
+    "glGetString",
+    "glGetTexParameterfv",
+    "glGetTexParameteriv",
+    "glGetUniformfv",
+    "glGetUniformiv",
+    "glGetVertexAttribPointerv",
+    "glGetVertexAttribfv",
+    "glGetVertexAttribiv",
+    "glInsertEventMarkerEXT",
+    "glInvalidateFramebuffer",
+    "glIsBuffer",
+    "glIsEnabled",
+    "glIsFramebuffer",
+    "glIsProgram",
+    "glIsRenderbuffer",
+    "glIsShader",
+    "glIsTexture",
+    "glPopGroupMarkerEXT",
+    "glPushGroupMarkerEXT",
+    "glReadPixels",
+    "glValidateProgram",
+]
+
+# Functions drawing to the bound framebuffer, these are dropped before the start
+# frame only while the default framebuffer is bound. The draws to other
+# framebuffers are kept, as they can render the textures used by the replayed
+# frames.
+# Note glVertexAttribPointerData is the client array data of the draw call that
+# follows it
+SETUP_SKIPPED_DRAW_FUNCTIONS = [
+    "glClear",
+    "glDrawArrays",
+    "glDrawElements",
+    "glVertexAttribPointerData",
+]
+
+GL_XML_FILEPATH = "external/khronos/gl.xml"
+
+# Some values are not present in gles, override them after reading the xml, as
+# (table, value, enum name), a None enum name removes the value and a None value
+# removes the table
+# XXX Do this with an XML?
+# XXX Review if there's a better way of filtering out non-gles2 defines
+#     or translating to gles2-friendly ones when parsing global and local
+#     namespaces
+# XXX Missing masks like GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT
+TRANSLATION_OVERRIDES = [
+    # GetPName contains GL_BLEND_EQUATION_EXT, the global namespace has the
+    # gles2-aware GL_BLEND_EQUATION, remove it from the GetPName namespace
+    ("GetPName", 0x8009, None),
+    # GL_DRAW_FRAMEBUFFER_BINDING is not gles2, but GL_FRAMEBUFFER_BINDING is
+    ("global", 0x8ca6, "GL_FRAMEBUFFER_BINDING"),
+    # Make sure low numbers are set properly (Eg GL_CURRENT_BIT overrides GL_ONE, etc)
+    ("global", 0, "GL_ZERO"),
+    ("global", 1, "GL_ONE"),
+    # Remove the BlendEquationModeEXT table, as it's in the global namespace
+    # without the EXT
+    ("BlendEquationModeEXT", None, None),
+]
+
+# Cache of the translation machinery generated from the xml, next to the xml
+TRANSLATION_CACHE_EXTENSION = ".translations"
+# Increment when changing how the translation machinery is generated from the
+# xml, so stale caches are rebuilt
+TRANSLATION_CACHE_VERSION = 1
+
+def get_gl_xml_filepath():
+    # XXX This is so it can be executed from the tests directory, find a
+    #     way of making this transparent
+    if (not os.path.exists(GL_XML_FILEPATH)):
+        return os.path.join("..", GL_XML_FILEPATH)
+    return GL_XML_FILEPATH
+
+# Lazily built translation machinery, memoised next to the xml
+TRANSLATION_REGISTRY_CACHE_EXTENSION = ".functions"
+
+# Python module with the translation machinery generated from the xml, next to
+# the xml, regenerate with "build.py translations"
+TRANSLATION_MODULE_FILENAME = "gl_translations.py"
+
+# Groups not used for lookups, their params are passed as literals
+UNTRANSLATED_GROUPS = [None, "ColorF", "CheckedIn32", "CheckedFloat32"]
+
+def update_translation_if_better(translation_table, group_name, enum_name, enum_value):
+    # Favor non-extension names over extension names, as the extensions
+    # may not be present in the gles headers and cause build failures
+    # XXX Review if there's a better way of filtering out non-gles2 defines
+    #     when parsing the global namespace
+    if ((enum_value not in translation_table) or
+        (re.match(".*_NV$|.*_ATI$|.*_3DFX$|.*_SGIS$|.*_INTEL$|.*_IMG|.*_QCOM",
+                  translation_table[enum_value]) is not None)):
+        logger.debug("Inserting translation in %s for %s as 0x%x" %
+                     (group_name, enum_name, enum_value))
+        translation_table.update({ enum_value : enum_name })
+    else:
+        logger.debug("Not inserting translation in %s for %s as 0x%x due to already-existing to %s" %
+                     (group_name, enum_name, enum_value, translation_table[enum_value]))
 
-def update_translation_machinery_from_xml(translation_tables, translation_lookups):
-    # XXX Pickle this to disk so it doesn't need to be parsed every time, takes 29s
-    #     under the profiler
-
-    def update_translation_overrides(translation_tables):
-        # Some values are not present in gles, override them here
-        # XXX Do this with an XML?
-        # XXX Review if there's a better way of filtering out non-gles2 defines
-        #     or translating to gles2-friendly ones when parsing global and local
-        #     namespaces
-
-        # GetPName contains GL_BLEND_EQUATION_EXT, the global namespace has the
-        # gles2-aware GL_BLEND_EQUATION, remove it from the GetPName namespace
-        del translation_tables['GetPName'][0x8009]
-        # GL_DRAW_FRAMEBUFFER_BINDING is not gles2, but GL_FRAMEBUFFER_BINDING is
-        translation_tables['global'][0x8ca6] = "GL_FRAMEBUFFER_BINDING"
-        # Make sure low numbers are set properly (Eg GL_CURRENT_BIT overrides GL_ONE, etc)
-        translation_tables['global'][0] = "GL_ZERO"
-        translation_tables['global'][1] = "GL_ONE"
-        # XXX Missing masks like GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT
-        # Remove the BlendEquationModeEXT table, as it's in the global namespace
-        # without the EXT
-        del translation_tables['BlendEquationModeEXT']
-
-    def update_translation_if_better(translation_table, group_name, enum_name, enum_value):
-        # Favor non-extension names over extension names, as the extensions
-        # may not be present in the gles headers and cause build failures
-        # XXX Review if there's a better way of filtering out non-gles2 defines
-        #     when parsing the global namespace
-        if ((enum_value not in translation_table) or
-            (re.match(".*_NV$|.*_ATI$|.*_3DFX$|.*_SGIS$|.*_INTEL$|.*_IMG|.*_QCOM",
-                      translation_table[enum_value]) is not None)):
-            logger.debug("Inserting translation in %s for %s as 0x%x" %
-                         (group_name, enum_name, enum_value))
-            translation_table.update({ enum_value : enum_name })
+def update_translation_overrides(table_name, translation_table):
+    """!
+    Apply the TRANSLATION_OVERRIDES of the given table
+
+    @return the table or None if the table is overridden to be removed
+    """
+    for (override_table_name, enum_value, enum_name) in TRANSLATION_OVERRIDES:
+        if (override_table_name != table_name):
+            continue
+        if (enum_value is None):
+            return None
+        elif (enum_name is None):
+            del translation_table[enum_value]
         else:
-            logger.debug("Not inserting translation in %s for %s as 0x%x due to already-existing to %s" %
-                         (group_name, enum_name, enum_value, translation_table[enum_value]))
+            translation_table[enum_value] = enum_name
+    return translation_table
 
-    logger.info("Updating translation machinery from xml")
+class TranslationRegistry(object):
+    """!
+    Translation machinery of gl.xml built one function or group at a time.
 
-    # pre-fill the translation tables with enums
-    GL_XML_FILEPATH = "external/khronos/gl.xml"
-    # XXX This is so it can be executed from the tests directory, find a
-    #     way of making this transparent
-    if (not os.path.exists(GL_XML_FILEPATH)):
-        GL_XML_FILEPATH = os.path.join("..", GL_XML_FILEPATH)
-    with utils.xopen(GL_XML_FILEPATH, "r") as xml_file:
-        tree = xml.etree.ElementTree.parse(xml_file)
+    The xml is only parsed the first time something not memoised is needed.
+    When using a cache, the memoised functions and groups are stored next to
+    the xml so following runs don't need to parse the xml for the functions
+    they have already seen.
+    """
+    def __init__(self, use_cache = False):
+        self.gl_xml_filepath = get_gl_xml_filepath()
+        self.registry = None
+        self.required_commands = None
+        self.cache_filepath = None
+        self.cache_key = None
+        self.dirty = False
+        # Memoised values, None if not in the xml
+        # Per command list of (param index, group name)
+        self.commands = {}
+        # Per group translation table
+        self.groups = {}
+        self.global_table = None
+
+        if (use_cache):
+            self.cache_filepath = self.gl_xml_filepath + TRANSLATION_REGISTRY_CACHE_EXTENSION
+            self.cache_key = get_translation_cache_key(self.gl_xml_filepath, {}, {})
+            try:
+                with open(self.cache_filepath, "rb") as f:
+                    (cached_key, commands, groups, global_table) = cPickle.load(f)
+                if (cached_key == self.cache_key):
+                    logger.info("Using translation registry cache %s" % self.cache_filepath)
+                    self.commands = commands
+                    self.groups = groups
+                    self.global_table = global_table
+            except (IOError, EOFError, ValueError, TypeError, cPickle.UnpicklingError) as e:
+                logger.info("Translation registry cache %s can't be read: %s" %
+                            (self.cache_filepath, e))
+
+    def parse(self):
+        if (self.registry is not None):
+            return
+
+        # Import ElementTree here instead of at module level, glparse only needs
+        # it when the translations can't be taken from the translation module
+        # or the caches
+        try:
+            import xml.etree.cElementTree as ElementTree
+        except ImportError: # pragma: no cover
+            import xml.etree.ElementTree as ElementTree
+
+        logger.info("Parsing %s" % self.gl_xml_filepath)
+        with utils.xopen(self.gl_xml_filepath, "r") as xml_file:
+            tree = ElementTree.parse(xml_file)
 
-        # For every GLES 2 function, get the enumerants and fill the translation table
-        # Get all the GLES2 features
-        registry = tree.getroot()
         # From the registry hangs
         # - groups with the possible types of each group
         # - types
@@ -113,125 +248,827 @@ def update_translation_machinery_from_xml(translation_tables, translation_lookup
         #       - required commands,
         #       - types,
         # - extensions
+        self.registry = tree.getroot()
+
         # Get all the gles2 2.0 commands (note ES 3.0 is also regarded as gles2 api)
         # XXX May be it's better just to insert all the groups no matter the api?
         # XXX Note this leaves out lots of functions (glPointerAttrib...) whose enums
         #     are post-patched later using the global table (which is necessary anyway
         #     because many groups are not defined eg VertexAttribEnum)
-        logger.info("Updating translation machinery gles2 namespace")
-        for required_command in registry.findall("./feature[@api='gles2'][@number='2.0']/require/command"):
-            # Insert the command and the enum mappings it accepts for
-            # each argument
-            command_name = required_command.get('name')
-            logger.debug("Creating translation machinery for function %s" % command_name)
-
-            # Fetch the command information
-            # ElementTree XPath doesn't support [text()=]
-            commands = registry.iterfind("./commands/command")
-            params = None
-            for command in commands:
-                if (command.findtext('./proto/name') == command_name):
-                    params = command.iterfind("./param")
-                    break
-
-            if (params is None):
-                continue
-
-            for param_index, param in enumerate(params):
-                group_name = param.get('group')
+        if (self.required_commands is None):
+            self.required_commands = [required_command.get('name') for required_command in
+                                      self.registry.findall("./feature[@api='gles2'][@number='2.0']/require/command")]
+
+        # Index the commands, groups and enums by name in a single pass, instead
+        # of scanning the whole registry for each one. Keep the first element
+        # with a given name, same as ElementTree's find
+        logger.info("Indexing registry")
+        self.commands_by_name = {}
+        for command in self.registry.iterfind("./commands/command"):
+            self.commands_by_name.setdefault(command.findtext('./proto/name'), command)
+        self.groups_by_name = {}
+        for group in self.registry.iterfind("./groups/group"):
+            self.groups_by_name.setdefault(group.get('name'), group)
+        self.enums_by_name = {}
+        for enum in self.registry.iterfind("./enums/enum"):
+            self.enums_by_name.setdefault(enum.get('name'), enum)
+
+    def get_required_commands(self):
+        """!
+        Names of the GLES2 commands, in xml order
+        """
+        if (self.required_commands is None):
+            self.parse()
+        return self.required_commands
+
+    def get_command(self, command_name):
+        """!
+        Return the list of (param index, group name) of a GLES2 command or None
+        if the command is not a GLES2 command
+        """
+        try:
+            return self.commands[command_name]
+        except KeyError:
+            pass
 
-                logger.debug("Found param %s" % param.findtext('./name'))
+        params = None
+        if (command_name in self.get_required_commands()):
+            self.parse()
+            command = self.commands_by_name.get(command_name)
+            if (command is not None):
+                params = [(param_index, param.get('group')) for (param_index, param) in
+                          enumerate(command.iterfind("./param"))]
+
+        self.commands[command_name] = params
+        self.dirty = True
+        return params
+
+    def get_group(self, group_name):
+        """!
+        Return the translation table of a group or None if the group doesn't
+        exist or is overridden to be removed
+        """
+        try:
+            return self.groups[group_name]
+        except KeyError:
+            pass
 
-                try:
-                    translation_lookup = translation_lookups[command_name]
-                except KeyError:
-                    translation_lookup = {}
-                    translation_lookups[command_name] = translation_lookup
-
-                # Don't insert the element if already there, as this would override
-                # the id translation tables (eg this happens with glBindTexture
-                # because the "texture" parameter is defined as part of the
-                # group "Texture")
-                if (param_index in translation_lookup):
-                    logger.debug("Not inserting already-existing lookup %s" %
-                                 translation_lookup[param_index])
-                    continue
-
-                logger.debug("Inserting lookup for %s %s" % (command_name, translation_lookup))
-
-                # Lookup the right field depending on the type
-                # XXX This is not very nice, it's dependent on the types defined
-                #     in the xml, maybe this should be done "at the other side"
-                #     when we get the trace item
+        self.parse()
+        translation_table = None
+        group = self.groups_by_name.get(group_name)
+        # Some groups (TextureUnit) have the translation in the global
+        # namespace
+        if (group is not None):
+            logger.debug("Creating translation machinery for group %s" % group_name)
+
+            translation_table = {}
+            # For every enum in the group, get the value and insert it as a
+            # possible translation
+            for group_enum in group.findall("./enum"):
+                enum_name = group_enum.get('name')
+
+                # Get the enum value
+                enum = self.enums_by_name.get(enum_name)
                 if (group_name == "Boolean"):
-                    field_name = "boolValue"
+                    enum_value = bool(int(enum.get('value')))
                 else:
-                    # XXX Missing looking up floats?
-                    field_name = "intValue"
-
-                # XXX Another dependency on the xml types, move this to the other side
-                #     as above
-                if (group_name not in [None, "ColorF", "CheckedIn32", "CheckedFloat32"]):
-                    translation_lookup.update(
-                        { param_index : { "field" : field_name, "table" : group_name } }
-                    )
-
-                # Don't insert the group if there was no group (eg the type wasn't
-                # enum) or if it has already been inserted
-                if ((group_name is not None) and (group_name not in translation_tables)):
-                    logger.debug("Creating translation machinery for parameter %s" % param.findtext('./name'))
-
-                    group = registry.find("./groups/group[@name='%s']" % group_name)
-
-                    # Some groups (TextureUnit) have the translation in the global
-                    # namespace
-                    if (group is not None):
-                        logger.debug("Creating translation machinery for group %s" % group_name)
-
-                        translation_table = {}
-                        translation_tables[group_name] = translation_table
-
-                        # For every enum in the group, get the value and insert it as a
-                        # possible translation
-                        group_enums = group.findall("./enum")
-                        for group_enum in group_enums:
-                            enum_name = group_enum.get('name')
-
-                            # Get the enum value
-                            enum = registry.find("./enums/enum[@name='%s']" % enum_name)
-                            if (field_name == "boolValue"):
-                                enum_value = bool(int(enum.get('value')))
-                            else:
-                                enum_value = int(enum.get('value'), 16)
-
-                            update_translation_if_better(translation_table, group_name, enum_name, enum_value)
-
-        # Insert all the enums without group enums in the global table so they can
-        # be used as fall-back when a translation is not found in the group
-        logger.info("Updating translation machinery global namespace")
-        translation_table = translation_tables['global']
-        for enum in registry.findall("./enums/enum"):
-            if (enum.get('group', None) is None):
-                enum_value = int(enum.get('value'), 16)
-                enum_name = enum.get('name')
-                update_translation_if_better(translation_table, 'global', enum_name, enum_value)
-
-    logger.debug("Doing manual overrides")
-    update_translation_overrides(translation_tables)
+                    enum_value = int(enum.get('value'), 16)
+
+                update_translation_if_better(translation_table, group_name, enum_name, enum_value)
+
+            translation_table = update_translation_overrides(group_name, translation_table)
+
+        self.groups[group_name] = translation_table
+        self.dirty = True
+        return translation_table
+
+    def get_global(self):
+        """!
+        Return the translation table with all the enums without group, used as
+        fall-back when a translation is not found in the group
+        """
+        if (self.global_table is None):
+            self.parse()
+            logger.info("Updating translation machinery global namespace")
+            translation_table = {}
+            for enum in self.registry.findall("./enums/enum"):
+                if (enum.get('group', None) is None):
+                    enum_value = int(enum.get('value'), 16)
+                    enum_name = enum.get('name')
+                    update_translation_if_better(translation_table, 'global', enum_name, enum_value)
+            self.global_table = update_translation_overrides('global', translation_table)
+            self.dirty = True
+
+        return self.global_table
+
+    def update_from_module(self, translation_module):
+        """!
+        Memoise the GLES2 commands and their groups from a module written by
+        generate_translation_module, so they don't need parsing the xml
+        """
+        self.required_commands = translation_module.REQUIRED_COMMANDS
+        self.commands.update(translation_module.COMMANDS)
+        self.groups.update(translation_module.GROUPS)
+        self.global_table = translation_module.GLOBAL
+
+    def save(self):
+        """!
+        Update the cache if there are new memoised values
+        """
+        if ((self.cache_filepath is None) or (not self.dirty)):
+            return
+
+        # Write to a temporary file and rename so concurrent runs never see a
+        # partial cache
+        try:
+            temp_filepath = "%s.%d" % (self.cache_filepath, os.getpid())
+            with open(temp_filepath, "wb") as f:
+                cPickle.dump((self.cache_key, self.commands, self.groups,
+                              self.global_table), f, cPickle.HIGHEST_PROTOCOL)
+            if (os.path.exists(self.cache_filepath)):
+                os.remove(self.cache_filepath)
+            os.rename(temp_filepath, self.cache_filepath)
+            self.dirty = False
+            logger.info("Wrote translation registry cache %s" % self.cache_filepath)
+        except (IOError, OSError) as e:
+            logger.warning("Unable to write translation registry cache %s: %s" %
+                           (self.cache_filepath, e))
+
+def update_translation_machinery_for_function(translation_registry, command_name,
+                                              translation_tables, translation_lookups):
+    """!
+    Insert the lookups of a function and the translation tables they use
+
+    Lookups already in translation_lookups are not overwritten (eg the
+    "texture" parameter of glBindTexture is defined in the xml as part of the
+    group "Texture" but it needs to use the id translation table)
+    """
+    params = translation_registry.get_command(command_name)
+    if (params is None):
+        return
+
+    logger.debug("Creating translation machinery for function %s" % command_name)
+    for (param_index, group_name) in params:
+        try:
+            translation_lookup = translation_lookups[command_name]
+        except KeyError:
+            translation_lookup = {}
+            translation_lookups[command_name] = translation_lookup
+
+        if (param_index in translation_lookup):
+            logger.debug("Not inserting already-existing lookup %s" %
+                         translation_lookup[param_index])
+            continue
+
+        # Lookup the right field depending on the type
+        # XXX This is not very nice, it's dependent on the types defined
+        #     in the xml, maybe this should be done "at the other side"
+        #     when we get the trace item
+        if (group_name == "Boolean"):
+            field_name = "boolValue"
+        else:
+            # XXX Missing looking up floats?
+            field_name = "intValue"
+
+        # XXX Another dependency on the xml types, move this to the other side
+        #     as above
+        if (group_name not in UNTRANSLATED_GROUPS):
+            translation_lookup.update(
+                { param_index : { "field" : field_name, "table" : group_name } }
+            )
+
+        # Don't insert the group if there was no group (eg the type wasn't
+        # enum) or if it has already been inserted
+        if ((group_name is not None) and (group_name not in translation_tables)):
+            translation_table = translation_registry.get_group(group_name)
+            if (translation_table is not None):
+                # Copy so the memoised table is not modified
+                translation_tables[group_name] = dict(translation_table)
+
+def update_translation_machinery_from_registry(translation_registry,
+                                              translation_tables,
+                                              translation_lookups):
+    # For every GLES 2 function, get the enumerants and fill the translation table
+    logger.info("Updating translation machinery gles2 namespace")
+    for command_name in translation_registry.get_required_commands():
+        update_translation_machinery_for_function(translation_registry, command_name,
+                                                  translation_tables, translation_lookups)
+
+    # Insert all the enums without group enums in the global table so they can
+    # be used as fall-back when a translation is not found in the group
+    translation_tables['global'].update(translation_registry.get_global())
+
+def update_translation_machinery_from_xml(translation_tables, translation_lookups):
+    # XXX This takes 29s under the profiler, use
+    #     update_translation_machinery_from_cache instead
+    logger.info("Updating translation machinery from xml")
+
+    update_translation_machinery_from_registry(TranslationRegistry(),
+                                               translation_tables,
+                                               translation_lookups)
+
+def get_translation_cache_key(gl_xml_filepath, translation_tables, translation_lookups):
+    """!
+    Hash of everything the translation machinery generated from the xml
+    depends on: the xml contents, the overrides and the initial tables and
+    lookups
+
+    The line endings of the xml are normalised, so the key is the same
+    whether the xml was checked out with LF or CRLF line endings
+    """
+    h = hashlib.sha1()
+    with open(gl_xml_filepath, "rb") as f:
+        h.update(f.read().replace("\r\n", "\n"))
+    h.update(json.dumps([TRANSLATION_CACHE_VERSION, TRANSLATION_OVERRIDES,
+                         translation_tables, translation_lookups], sort_keys = True))
+    return h.hexdigest()
+
+def update_translation_machinery_from_cache(translation_tables, translation_lookups):
+    """!
+    Same as update_translation_machinery_from_xml, but use the cache file next
+    to the xml if it's up to date, otherwise parse the xml and update the cache.
+    """
+    gl_xml_filepath = get_gl_xml_filepath()
+    cache_filepath = gl_xml_filepath + TRANSLATION_CACHE_EXTENSION
+    cache_key = get_translation_cache_key(gl_xml_filepath, translation_tables,
+                                          translation_lookups)
+
+    try:
+        with open(cache_filepath, "rb") as f:
+            (cached_key, cached_tables, cached_lookups) = cPickle.load(f)
+        if (cached_key == cache_key):
+            logger.info("Updating translation machinery from cache %s" % cache_filepath)
+            translation_tables.clear()
+            translation_tables.update(cached_tables)
+            translation_lookups.clear()
+            translation_lookups.update(cached_lookups)
+            return
+        logger.info("Translation cache %s is stale" % cache_filepath)
+    except (IOError, EOFError, ValueError, TypeError, cPickle.UnpicklingError) as e:
+        logger.info("Translation cache %s can't be read: %s" % (cache_filepath, e))
+
+    update_translation_machinery_from_xml(translation_tables, translation_lookups)
+
+    # Write to a temporary file and rename so concurrent runs never see a
+    # partial cache
+    # XXX This could fail if the xml directory is read-only, the cache is just
+    #     not used in that case
+    try:
+        temp_filepath = "%s.%d" % (cache_filepath, os.getpid())
+        with open(temp_filepath, "wb") as f:
+            cPickle.dump((cache_key, translation_tables, translation_lookups), f,
+                         cPickle.HIGHEST_PROTOCOL)
+        if (os.path.exists(cache_filepath)):
+            os.remove(cache_filepath)
+        os.rename(temp_filepath, cache_filepath)
+        logger.info("Wrote translation cache %s" % cache_filepath)
+    except (IOError, OSError) as e:
+        logger.warning("Unable to write translation cache %s: %s" % (cache_filepath, e))
 
     logger.info("Updated translation machinery")
 
+def get_translation_module_filepath():
+    return os.path.join(os.path.dirname(get_gl_xml_filepath()),
+                        TRANSLATION_MODULE_FILENAME)
+
+def generate_translation_module(module_filepath = None):
+    """!
+    Write a Python module with the GLES2 commands, group tables and global
+    table of the xml (with the overrides applied) as literals, so they can be
+    imported without parsing the xml
+
+    @param module_filepath: Path of the module to write, None to write it next
+           to the xml
+    """
+    if (module_filepath is None):
+        module_filepath = get_translation_module_filepath()
+
+    gl_xml_filepath = get_gl_xml_filepath()
+    translation_registry = TranslationRegistry()
+    required_commands = translation_registry.get_required_commands()
+    commands = {}
+    groups = {}
+    for command_name in required_commands:
+        params = translation_registry.get_command(command_name)
+        commands[command_name] = params
+        for (param_index, group_name) in (params or []):
+            if ((group_name is not None) and (group_name not in groups)):
+                groups[group_name] = translation_registry.get_group(group_name)
+
+    def format_table(prefix, translation_table, indent, suffix):
+        if (translation_table is None):
+            return ["%sNone%s" % (prefix, suffix)]
+        lines = ["%s{" % prefix]
+        for (enum_value, enum_name) in sorted(translation_table.iteritems()):
+            if (isinstance(enum_value, bool)):
+                lines.append("%s%r : %r," % (indent, enum_value, enum_name))
+            else:
+                lines.append("%s%s : %r," % (indent, hex(enum_value).rstrip("L"),
+                                             enum_name))
+        lines.append("%s}%s" % (indent[4:], suffix))
+        return lines
+
+    lines = [
+        "# Generated by glparse.generate_translation_module from %s, don't edit" %
+            os.path.basename(gl_xml_filepath),
+        "# Regenerate with \"build.py translations\"",
+        "",
+        "# Key of the xml and overrides this was generated from, see",
+        "# glparse.get_translation_cache_key",
+        "TRANSLATION_KEY = %r" % get_translation_cache_key(gl_xml_filepath, {}, {}),
+        "",
+        "REQUIRED_COMMANDS = ["
+    ]
+    lines.extend(["    %r," % command_name for command_name in required_commands])
+    lines.append("]")
+    lines.append("")
+    lines.append("COMMANDS = {")
+    lines.extend(["    %r : %r," % (command_name, params) for (command_name, params)
+                  in sorted(commands.iteritems())])
+    lines.append("}")
+    lines.append("")
+    lines.append("GROUPS = {")
+    for (group_name, translation_table) in sorted(groups.iteritems()):
+        lines.extend(format_table("    %r : " % group_name, translation_table,
+                                  " " * 8, ","))
+    lines.append("}")
+    lines.append("")
+    lines.extend(format_table("GLOBAL = ", translation_registry.get_global(),
+                              " " * 4, ""))
+
+    logger.info("Writing translation module %s" % module_filepath)
+    with open(module_filepath, "w") as f:
+        for line in lines:
+            f.writelines([line, "\n"])
+
+def load_translation_module():
+    """!
+    Import the module written by generate_translation_module
+
+    @return the module or None if it doesn't exist or is stale
+    """
+    module_filepath = get_translation_module_filepath()
+    if (not os.path.exists(module_filepath)):
+        logger.info("Translation module %s not found" % module_filepath)
+        return None
+
+    translation_module = imp.load_source("gl_translations", module_filepath)
+    if (translation_module.TRANSLATION_KEY !=
+        get_translation_cache_key(get_gl_xml_filepath(), {}, {})):
+        logger.warning("Translation module %s is stale, regenerate it with "
+                       "\"build.py translations\"" % module_filepath)
+        return None
+
+    return translation_module
+
+def update_translation_machinery_from_module(translation_tables, translation_lookups):
+    """!
+    Same as update_translation_machinery_from_xml, but use the module written
+    by generate_translation_module
+
+    @return True if the module was used, False if it doesn't exist or is stale
+    """
+    translation_module = load_translation_module()
+    if (translation_module is None):
+        return False
+
+    logger.info("Updating translation machinery from module %s" %
+                translation_module.__file__)
+    translation_registry = TranslationRegistry()
+    translation_registry.update_from_module(translation_module)
+    update_translation_machinery_from_registry(translation_registry,
+                                               translation_tables,
+                                               translation_lookups)
+
+    return True
+
+def pack_values(pack_type, values):
+    """!
+    Pack the values with the given native struct format character in one go,
+    returning the same bytes as packing and joining them one by one
+
+    @param values: list, protobuf repeated field or array.array of values
+    """
+    # The fast decoder already stores floats as native array.array("f")
+    if (isinstance(values, array.array) and (values.typecode == pack_type)):
+        return values.tostring()
+    return struct.pack("%d%s" % (len(values), pack_type), *values)
+
+# C literal of every byte value, same as hex() generates
+BYTE_LITERALS = [hex(value) for value in xrange(256)]
+
+def format_byte_literals(data):
+    """!
+    Return the comma-separated C literals of the bytes of a string in one go,
+    same as joining hex(ord(b)) of every byte
+    """
+    return string.join(map(BYTE_LITERALS.__getitem__, bytearray(data)), ", ")
+
+def format_literals(values):
+    """!
+    Return the comma-separated C literals of a sequence of ints or floats in
+    one go, same as joining str() of every value
+    """
+    return string.join(map(str, values), ", ")
+
 def hash_asset(asset_bytes):
     hash = hashlib.md5()
     hash.update(asset_bytes)
 
     return hash.digest()
 
+def link_or_copy_file(src_filepath, dst_filepath):
+    """!
+    Hard link src_filepath as dst_filepath, copying it if links are not
+    supported or across filesystems
+    """
+    if (os.path.exists(dst_filepath)):
+        os.remove(dst_filepath)
+    try:
+        os.link(src_filepath, dst_filepath)
+    except (AttributeError, OSError):
+        shutil.copyfile(src_filepath, dst_filepath)
+
+# Maximum number of asset writes queued to the AssetWriter threads, bounds the
+# memory held by the pending assets
+ASSET_WRITER_QUEUE_SIZE = 64
+
+class AssetWriter(object):
+    """!
+    Write asset files on background threads, so the code generation doesn't
+    stall on the disk (file writes release the GIL).
+
+    Each filepath is only written once, so it must always be given the same
+    contents. Errors writing are raised on the calling thread by the next
+    write, flush or close.
+    """
+    def __init__(self, num_threads, queue_size = ASSET_WRITER_QUEUE_SIZE):
+        self.jobs = Queue.Queue(queue_size)
+        self.filepaths = set()
+        self.exc_info = None
+        self.threads = []
+        for i in xrange(num_threads):
+            thread = threading.Thread(target = self.write_jobs, name = "asset_writer_%d" % i)
+            thread.daemon = True
+            thread.start()
+            self.threads.append(thread)
+
+    def write_jobs(self):
+        while True:
+            job = self.jobs.get()
+            try:
+                if (job is None):
+                    return
+                (filepath, asset_bytes, atomic) = job
+                # Don't bother writing once an error has been found
+                if (self.exc_info is None):
+                    write_asset_file(filepath, asset_bytes, None, atomic)
+            except:
+                # Re-raise on the calling thread
+                self.exc_info = sys.exc_info()
+            finally:
+                self.jobs.task_done()
+
+    def raise_error(self):
+        if (self.exc_info is not None):
+            exc_info = self.exc_info
+            raise exc_info[0], exc_info[1], exc_info[2]
+
+    def write(self, filepath, asset_bytes, atomic = False):
+        """!
+        Queue writing the contents to the file, blocking if the queue is full
+
+        @param atomic: see write_asset_file
+        """
+        self.raise_error()
+        if (filepath in self.filepaths):
+            return
+        self.filepaths.add(filepath)
+        self.jobs.put((filepath, asset_bytes, atomic))
+
+    def flush(self):
+        """!
+        Wait for the queued writes to finish
+        """
+        self.jobs.join()
+        self.raise_error()
+
+    def close(self):
+        """!
+        Wait for the queued writes to finish and stop the threads
+        """
+        for thread in self.threads:
+            self.jobs.put(None)
+        for thread in self.threads:
+            thread.join()
+        self.raise_error()
+
+def write_asset_file(filepath, asset_bytes, asset_writer = None, atomic = False):
+    """!
+    Write the asset file, in the background if an AssetWriter is given
+
+    @param atomic: Write to a temporary file and rename it into place, so other
+           processes never see the file partially written. An existing file is
+           kept, so it must have the same contents (eg content-addressed files)
+    """
+    if (asset_writer is not None):
+        asset_writer.write(filepath, asset_bytes, atomic)
+    elif (atomic):
+        temp_filepath = "%s.%d" % (filepath, os.getpid())
+        with open(temp_filepath, "wb") as f:
+            f.write(asset_bytes)
+        try:
+            os.rename(temp_filepath, filepath)
+        except OSError:
+            # Renaming over an existing file fails on Windows, another process
+            # already wrote the file
+            os.remove(temp_filepath)
+            if (not os.path.exists(filepath)):
+                raise
+    else:
+        with open(filepath, "wb") as f:
+            f.write(asset_bytes)
+
+# Extension added to the compressed asset files, openAndGetAssetBuffer inflates
+# the assets with this extension
+ASSET_COMPRESSED_EXTENSION = ".zlib"
+# Don't bother compressing small assets
+ASSET_COMPRESSION_MIN_SIZE = 4096
+# Only keep the compressed asset if it's at most this ratio of the original
+ASSET_COMPRESSION_MAX_RATIO = 0.9
+ASSET_COMPRESSION_LEVEL = 6
+# Header of the compressed assets with the uncompressed size, followed by the
+# zlib stream
+ASSET_COMPRESSION_HEADER_FORMAT = "<I"
+
+class AssetCompressor(object):
+    """!
+    Compress the assets that are big and compressible enough, keeping the
+    statistics of the bytes saved and of the time to inflate them on the host
+    (as an estimate of the time to inflate them on the device).
+    """
+    def __init__(self, min_size = ASSET_COMPRESSION_MIN_SIZE,
+                 max_ratio = ASSET_COMPRESSION_MAX_RATIO,
+                 level = ASSET_COMPRESSION_LEVEL):
+        self.min_size = min_size
+        self.max_ratio = max_ratio
+        self.level = level
+
+        self.num_assets = 0
+        self.num_compressed = 0
+        self.bytes = 0
+        self.compressed_bytes = 0
+        self.inflate_time = 0.0
+
+    def compress(self, asset_bytes, asset_filename):
+        """!
+        Return the contents and filename to store the asset with, compressed
+        and with ASSET_COMPRESSED_EXTENSION if worth it
+        """
+        self.num_assets += 1
+        self.bytes += len(asset_bytes)
+        if (len(asset_bytes) < self.min_size):
+            self.compressed_bytes += len(asset_bytes)
+            return (asset_bytes, asset_filename)
+
+        compressed_bytes = zlib.compress(asset_bytes, self.level)
+        if (len(compressed_bytes) > len(asset_bytes) * self.max_ratio):
+            self.compressed_bytes += len(asset_bytes)
+            return (asset_bytes, asset_filename)
+
+        start_time = time.time()
+        zlib.decompress(compressed_bytes)
+        self.inflate_time += time.time() - start_time
+
+        compressed_bytes = struct.pack(ASSET_COMPRESSION_HEADER_FORMAT, len(asset_bytes)) + compressed_bytes
+        self.num_compressed += 1
+        self.compressed_bytes += len(compressed_bytes)
+
+        return (compressed_bytes, asset_filename + ASSET_COMPRESSED_EXTENSION)
+
+    def get_report_lines(self):
+        """!
+        Return the lines of the report of bytes saved and inflate time
+        """
+        lines = ["Compressed %d of %d assets" % (self.num_compressed, self.num_assets)]
+        lines.append("Asset bytes %d, stored %d, saved %d (%.1f%%)" %
+                     (self.bytes, self.compressed_bytes, self.bytes - self.compressed_bytes,
+                      (100.0 * (self.bytes - self.compressed_bytes) / self.bytes) if (self.bytes > 0) else 0.0))
+        lines.append("Inflate time on the host %.3f ms" % (self.inflate_time * 1000.0))
+
+        return lines
+
+class AssetStore(object):
+    """!
+    Content-addressed store of asset files that persists across runs, so
+    regenerating a replayer (or generating one for another trace of the same
+    app) doesn't rewrite the assets it already has.
+
+    The files are named after the hash of their contents, so the runs sharing a
+    store (eg concurrent builds) always agree on the contents of each file and
+    don't need an index. The files are written atomically, so a file in the
+    store is never seen partially written.
+
+    The files needed by a run are then linked (or copied) into the assets dir
+    with export.
+    """
+    def __init__(self, store_dir, asset_writer = None):
+        self.store_dir = store_dir
+        self.asset_writer = asset_writer
+        # Filenames of the store used by this run
+        self.used_filenames = set()
+        self.num_writes = 0
+        self.num_hits = 0
+
+        try:
+            os.makedirs(store_dir)
+        except OSError as e:
+            if (e.errno != errno.EEXIST):
+                raise
+
+    def add(self, asset_bytes, extension = ""):
+        """!
+        Return the filename in the store with the given contents, writing it to
+        the store only if it's not there already
+
+        @param extension: extension of the filename
+        """
+        asset_filename = "asset_%s%s" % (hashlib.sha1(asset_bytes).hexdigest(), extension)
+        if ((asset_filename in self.used_filenames) or
+            os.path.exists(os.path.join(self.store_dir, asset_filename))):
+            self.num_hits += 1
+        else:
+            write_asset_file(os.path.join(self.store_dir, asset_filename), asset_bytes,
+                             self.asset_writer, True)
+            self.num_writes += 1
+        self.used_filenames.add(asset_filename)
+
+        return asset_filename
+
+    def export(self, assets_dir):
+        """!
+        Link or copy the files used by this run into the assets dir
+        """
+        if (self.asset_writer is not None):
+            self.asset_writer.flush()
+        for asset_filename in self.used_filenames:
+            link_or_copy_file(os.path.join(self.store_dir, asset_filename),
+                              os.path.join(assets_dir, asset_filename))
+        logger.info("Exported %d assets from the asset store, %d written, %d reused" %
+                    (len(self.used_filenames), self.num_writes, self.num_hits))
+
+# Asset with all the payloads when packing assets
+ASSET_PACK_FILENAME = "asset_pack"
+# Alignment in bytes of each payload in the asset pack, so float and int
+# payloads can be used in place
+ASSET_PACK_ALIGNMENT = 16
+
+# Content-defined chunking of the packed assets, the chunk ends are found with
+# a gear rolling hash (see FastCDC), so inserting or changing bytes only
+# changes the chunks around the change
+# Chunks are at least this size, except the last one of each payload
+ASSET_CHUNK_MIN_SIZE = 2048
+# Chunks are cut when the low bits of the hash are zero, 8KB on average after
+# the minimum size
+ASSET_CHUNK_HASH_MASK = (1 << 13) - 1
+ASSET_CHUNK_MAX_SIZE = 65536
+# Random value for each byte value to add to the hash, deterministic so the
+# chunks are the same across runs
+ASSET_CHUNK_GEAR = [struct.unpack("<I", hashlib.md5(chr(value)).digest()[:4])[0]
+                    for value in xrange(256)]
+
+def get_chunk_ends(data):
+    """!
+    Return the list of the end offsets of the content-defined chunks of the
+    string
+    """
+    data = bytearray(data)
+    gear = ASSET_CHUNK_GEAR
+    mask = ASSET_CHUNK_HASH_MASK
+    chunk_ends = []
+    chunk_start = 0
+    while (chunk_start < len(data)):
+        chunk_end = min(chunk_start + ASSET_CHUNK_MAX_SIZE, len(data))
+        # Don't bother hashing the minimum size, the hash only depends on the
+        # last 32 bytes anyway
+        hash = 0
+        for i in xrange(chunk_start + ASSET_CHUNK_MIN_SIZE, chunk_end):
+            hash = ((hash << 1) + gear[data[i]]) & 0xffffffff
+            if ((hash & mask) == 0):
+                chunk_end = i + 1
+                break
+        chunk_ends.append(chunk_end)
+        chunk_start = chunk_end
+
+    return chunk_ends
+
+class AssetPack(object):
+    """!
+    Single asset with the payloads appended one after the other, aligned to
+    ASSET_PACK_ALIGNMENT and coalesced by content.
+
+    The replayer maps the pack once with getPackedAssetBuffer and gets the
+    payloads by offset and length, instead of opening one asset per payload.
+
+    When chunking, the payloads are split into content-defined chunks (see
+    get_chunk_ends) and only the chunks not in the pack are appended, so
+    payloads that are mostly the same (eg re-uploaded atlases or streaming
+    vertex buffers) share most of their chunks. The replayer reassembles the
+    payloads of more than one chunk with getChunkedAssetBuffer.
+    """
+    def __init__(self, filepath, chunk = False):
+        self.filepath = filepath
+        self.file = open(filepath, "wb")
+        self.size = 0
+        self.chunk = chunk
+        # Tuples of (offset, length) chunks indexed by the hash of the payload
+        self.payloads = {}
+        # (offset, length) chunks indexed by the hash of the contents
+        self.chunks = {}
+        # Names of the global variables with the offsets and lengths of the
+        # chunks indexed by the tuple of chunks, see allocate_asset
+        self.chunk_list_names = {}
+
+        self.payload_bytes = 0
+        self.chunk_bytes = 0
+
+    def append(self, data):
+        padding = -self.size % ASSET_PACK_ALIGNMENT
+        if (padding != 0):
+            self.file.write("\0" * padding)
+        chunk = (self.size + padding, len(data))
+        self.file.write(data)
+        self.size = chunk[0] + chunk[1]
+        self.chunk_bytes += len(data)
+
+        return chunk
+
+    def add(self, asset_bytes):
+        """!
+        Return the tuple of (offset, length) chunks of the given contents in
+        the pack, appending the chunks that are not there already.
+
+        There's a single chunk when not chunking.
+        """
+        self.payload_bytes += len(asset_bytes)
+        asset_hash = hash_asset(asset_bytes)
+        # XXX This assumes there are no collisions
+        try:
+            return self.payloads[asset_hash]
+        except KeyError:
+            pass
+
+        if (self.chunk):
+            chunk_ends = get_chunk_ends(asset_bytes)
+        else:
+            chunk_ends = [len(asset_bytes)]
+
+        chunks = []
+        chunk_start = 0
+        for chunk_end in chunk_ends:
+            if (chunk_end - chunk_start == len(asset_bytes)):
+                chunk_bytes = asset_bytes
+                chunk_hash = asset_hash
+            else:
+                chunk_bytes = asset_bytes[chunk_start:chunk_end]
+                chunk_hash = hash_asset(chunk_bytes)
+            try:
+                chunk = self.chunks[chunk_hash]
+            except KeyError:
+                chunk = self.append(chunk_bytes)
+                self.chunks[chunk_hash] = chunk
+            chunks.append(chunk)
+            chunk_start = chunk_end
+
+        chunks = tuple(chunks)
+        self.payloads[asset_hash] = chunks
+
+        return chunks
+
+    def close(self):
+        self.file.close()
+        logger.info("Packed %d assets in %d bytes" % (len(self.payloads), self.size))
+        if (self.chunk):
+            logger.info("Chunked %d bytes of assets into %d chunks with %d bytes, dedup ratio %.2f" %
+                        (self.payload_bytes, len(self.chunks), self.chunk_bytes,
+                         (float(self.payload_bytes) / self.chunk_bytes) if (self.chunk_bytes > 0) else 1.0))
+
 def allocate_asset(allocated_assets, allocated_asset_filenames, assets_dir,
                    asset_buffer_ptr, asset_filename, asset_buffer_ptr_type,
-                   asset_variable_ptr, asset_bytes, global_decls):
+                   asset_variable_ptr, asset_bytes, global_decls,
+                   asset_store = None, asset_pack = None, asset_writer = None,
+                   asset_compressor = None):
     """!
     Register the given asset and unregister
+
+    @param asset_store: AssetStore to store the asset in, None to write it to
+            assets_dir as asset_filename
+    @param asset_pack: AssetPack to append the asset to instead of writing it
+            to its own file
+    @param asset_writer: AssetWriter to write the asset file in the background,
+            None to write it before returning
+    @param asset_compressor: AssetCompressor to compress the asset file with,
+            None to store it uncompressed
     """
     # Free a possible asset allocated to this id
     # XXX Hash the assets and reuse them if they have the same content?
@@ -254,17 +1091,61 @@ def allocate_asset(allocated_assets, allocated_asset_filenames, assets_dir,
         global_decls.append("%s %s = NULL" % (asset_buffer_ptr_type, asset_buffer_ptr))
     allocated_assets.add(asset_variable_ptr)
 
-    asset_hash = hash_asset(asset_bytes)
-    # XXX This assumes there are no collisions
-    # XXX This should be done for all assets, not just for asset files
-    try:
-        asset_filename = allocated_asset_filenames[asset_hash]
-    except KeyError:
-        allocated_asset_filenames[asset_hash] = asset_filename
+    if (asset_pack is not None):
+        chunks = asset_pack.add(asset_bytes)
+        if (len(chunks) == 1):
+            (offset, length) = chunks[0]
+            code.append('getPackedAssetBuffer(%s, %d, %d, &%s, (const void**) &%s)' %
+                        ("param_DrawState_ptr_0", offset, length, asset_variable_ptr,
+                         asset_buffer_ptr))
+
+        else:
+            # Declare the offsets and lengths of the chunks once per list of
+            # chunks
+            try:
+                chunk_list_name = asset_pack.chunk_list_names[chunks]
+            except KeyError:
+                chunk_list_name = ("global_const_unsigned_int_ptr_chunks%d" %
+                                   len(asset_pack.chunk_list_names))
+                asset_pack.chunk_list_names[chunks] = chunk_list_name
+                global_decls.append("static const unsigned int %s[%d] = {%s}" %
+                                    (chunk_list_name, len(chunks) * 2,
+                                     format_literals([value for chunk in chunks for value in chunk])))
+            code.append('getChunkedAssetBuffer(%s, %s, %d, %d, &%s, (const void**) &%s)' %
+                        ("param_DrawState_ptr_0", chunk_list_name, len(chunks),
+                         len(asset_bytes), asset_variable_ptr, asset_buffer_ptr))
+
+        return code
+
+    elif (asset_store is not None):
+        if (asset_compressor is not None):
+            # Don't compress again the assets already stored by this run
+            asset_hash = hash_asset(asset_bytes)
+            try:
+                asset_filename = allocated_asset_filenames[asset_hash]
+            except KeyError:
+                (asset_bytes, extension) = asset_compressor.compress(asset_bytes, "")
+                asset_filename = asset_store.add(asset_bytes, extension)
+                allocated_asset_filenames[asset_hash] = asset_filename
+        else:
+            asset_filename = asset_store.add(asset_bytes)
 
-    # Save the asset to a file
-    with open(os.path.join(assets_dir, asset_filename), "wb") as f:
-        f.write(asset_bytes)
+    else:
+        asset_hash = hash_asset(asset_bytes)
+        # XXX This assumes there are no collisions
+        # XXX This should be done for all assets, not just for asset files
+        try:
+            # Already saved with the same contents, reuse that file
+            asset_filename = allocated_asset_filenames[asset_hash]
+        except KeyError:
+            if (asset_compressor is not None):
+                (asset_bytes, asset_filename) = asset_compressor.compress(asset_bytes,
+                                                                          asset_filename)
+            allocated_asset_filenames[asset_hash] = asset_filename
+
+            # Save the asset to a file
+            write_asset_file(os.path.join(assets_dir, asset_filename), asset_bytes,
+                             asset_writer)
 
     # Generate the instructions to load that asset
     # XXX Change the asset manager to global so it makes deinlining less verbose?
@@ -293,28 +1174,1301 @@ def free_asset(allocated_assets, asset_variable_ptr, asset_buffer_ptr):
     return ["closeAsset(%s)" % asset_variable_ptr,
             "%s = NULL" % asset_variable_ptr, "%s = NULL" % asset_buffer_ptr]
 
+class CodeWriter(object):
+    """!
+    Collect the code generated by glparse in memory, the frames in the order
+    they are written.
+
+    The lines of the program are available in lines after calling close.
+    """
+    def __init__(self):
+        # Objects with an append method, see FileCodeWriter
+        self.global_decls = []
+        self.frame_count = 0
+        self.frames = []
+        self.lines = None
+
+    def get_frame_lines(self, code):
+        lines = ["void frame%s(DrawState* param_DrawState_ptr_0)" % self.frame_count]
+        lines.append("{")
+        for line in code:
+            lines.append("    %s;" % line)
+        lines.append("}")
+        self.frame_count += 1
+
+        return lines
+
+    def write_frame(self, code):
+        """!
+        Write the function of the next frame with the given code lines
+        """
+        self.frames.extend(self.get_frame_lines(code))
+
+    def get_draw_lines(self):
+        # Generate the code that calls each frame
+        lines = ["void draw(DrawState* param_DrawState_ptr_0)"]
+        lines.append("{")
+        lines.append("    switch (param_DrawState_ptr_0->frame_limit)")
+        lines.append("    {")
+        for frame_index in xrange(self.frame_count):
+            lines.append("        case %d: " % frame_index)
+            lines.append("            frame%d(param_DrawState_ptr_0);" % frame_index)
+            lines.append("        break;")
+        lines.append("        default: ")
+        lines.append('            LOGI("Reached frame %d end of replay, exiting", param_DrawState_ptr_0->frame_limit);')
+        lines.append('            exit(EXIT_SUCCESS);')
+        lines.append("    }")
+        lines.append("}")
+        lines.append("")
+
+        return lines
+
+    def close(self):
+        """!
+        Generate the program with the global declarations, the frames and the
+        function that calls each frame
+        """
+        lines = ["%s;" % decl for decl in self.global_decls]
+        lines.append("")
+        lines.extend(self.frames)
+        lines.extend(self.get_draw_lines())
+        self.lines = lines
+        self.global_decls = None
+        self.frames = None
+
+class FileDeclarations(object):
+    """!
+    List-like object that writes the appended declarations to a file
+    """
+    def __init__(self, f):
+        self.file = f
+
+    def append(self, decl):
+        self.file.write("%s;\n" % decl)
+
+class FileCodeWriter(CodeWriter):
+    """!
+    Write the code generated by glparse to a file as it's generated, so the
+    memory doesn't grow with the trace length.
+
+    Each frame is written to a temporary frames file when it's complete and
+    the global declarations to a temporary declarations file. When closing,
+    both are concatenated into the final file followed by the draw function.
+    """
+    def __init__(self, filepath):
+        super(FileCodeWriter, self).__init__()
+        self.filepath = filepath
+        self.decls_filepath = filepath + ".decls"
+        self.frames_filepath = filepath + ".frames"
+        self.decls_file = open(self.decls_filepath, "w")
+        self.frames_file = open(self.frames_filepath, "w")
+        self.global_decls = FileDeclarations(self.decls_file)
+        self.frames = None
+
+    def write_frame(self, code):
+        for line in self.get_frame_lines(code):
+            self.frames_file.writelines([line, "\n"])
+
+    def close(self):
+        self.decls_file.close()
+        self.frames_file.close()
+
+        with open(self.filepath, "w") as f:
+            with open(self.decls_filepath, "r") as decls_file:
+                shutil.copyfileobj(decls_file, f)
+            f.write("\n")
+            with open(self.frames_filepath, "r") as frames_file:
+                shutil.copyfileobj(frames_file, f)
+            for line in self.get_draw_lines():
+                f.writelines([line, "\n"])
+
+        os.remove(self.decls_filepath)
+        os.remove(self.frames_filepath)
+        self.global_decls = None
+
+class ParseState(object):
+    """!
+    State of glparse shared with the fixups and the argument formatters
+
+    function_name, function_string, args_strings, preamble_strings and code
+    are set for every message, the rest is kept across messages
+    """
+    def __init__(self, assets_dir, global_decls, generate_empty_textures = False,
+                 asset_store = None, asset_pack = None, asset_writer = None,
+                 asset_compressor = None):
+        self.function_name = None
+        self.function_string = None
+        self.args_strings = None
+        self.preamble_strings = None
+        self.code = None
+
+        self.assets_dir = assets_dir
+        self.asset_store = asset_store
+        self.asset_pack = asset_pack
+        self.asset_writer = asset_writer
+        self.asset_compressor = asset_compressor
+        self.global_decls = global_decls
+        self.generate_empty_textures = generate_empty_textures
+
+        # XXX Use min/max asset sizes for shaders?
+        # XXX Move many of these to parameters or a config object
+        self.use_assets_for_shaders = True
+
+        self.use_assets_for_floats = True
+        # Don't bother storing small floats in assets
+        self.min_float_asset_size_in_floats = 64
+        # Don't blow the stack if inlining floats
+        self.max_float_inlined_size_in_floats = 512
+
+        self.use_assets_for_ints = True
+        # Don't bother storing small ints in assets
+        self.min_int_asset_size_in_bytes = 256
+        # Don't blow the stack if inlining ints
+        self.max_int_inlined_size_in_bytes = 2048
+
+        # Number of temporary variables that have been allocated, we need this
+        # so we don't generate a variable with the same name twice
+        self.num_allocated_vars = 0
+        self.allocated_assets = set()
+        # Asset filenames indexed by the hash of the contents
+        # This is used for asset file coalescing (point two different assets to the
+        # same file if they have the same contents)
+        self.allocated_asset_filenames = {}
+
+        # XXX These should probably be in some state-dependent table so it gets
+        #     switched in and out (or in some framebuffer-dependent state?)
+        # Currently bound framebuffer
+        self.current_framebuffer = 0
+        # Current and max viewport state
+        self.current_viewport_x = 0
+        self.current_viewport_y = 0
+        self.current_viewport_width = 0
+        self.current_viewport_height = 0
+        self.max_viewport_width = 0
+        self.max_viewport_height = 0
+        # Current and max scissor state
+        self.current_scissor_x = 0
+        self.current_scissor_y = 0
+        self.current_scissor_width = 0
+        self.current_scissor_height = 0
+        self.max_scissor_width = 0
+        self.max_scissor_height = 0
+
+class FunctionDispatch(object):
+    """!
+    Entry of the dispatch table indexed by Function enum number, see
+    build_dispatch_table
+    """
+    __slots__ = ["name", "insertion", "lookup", "fixups"]
+
+    def __init__(self, name, insertion, lookup, fixups):
+        self.name = name
+        # Translation insertion and lookup specs of the function, indexed by
+        # argument index
+        self.insertion = insertion
+        self.lookup = lookup
+        # Fixups to call once per message before generating the code, empty
+        # if the function doesn't need any
+        self.fixups = fixups
+
+# Functions setting context state only used by the draws and clears, so only the
+# last value set before a draw or before the start frame is needed, see
+# SetupCollapser. Indexed by function name, each entry has
+# the name of the state and the indices of the arguments selecting which part
+# of the state the call sets
+# Note glHint and glPixelStorei are not here since they affect the mipmap
+# generation and the uploads, and the glVertexAttrib*fv are not here since
+# their fixup can ignore them
+SETUP_STATE_FUNCTIONS = {
+    "glBlendColor" : ("glBlendColor", ()),
+    "glBlendEquation" : ("glBlendEquation", ()),
+    "glBlendEquationSeparate" : ("glBlendEquationSeparate", ()),
+    "glBlendFunc" : ("glBlendFunc", ()),
+    "glBlendFuncSeparate" : ("glBlendFuncSeparate", ()),
+    "glClearColor" : ("glClearColor", ()),
+    "glClearDepthf" : ("glClearDepthf", ()),
+    "glClearStencil" : ("glClearStencil", ()),
+    "glColorMask" : ("glColorMask", ()),
+    "glCullFace" : ("glCullFace", ()),
+    "glDepthFunc" : ("glDepthFunc", ()),
+    "glDepthMask" : ("glDepthMask", ()),
+    "glDepthRangef" : ("glDepthRangef", ()),
+    "glDisable" : ("glEnable", (0,)),
+    "glEnable" : ("glEnable", (0,)),
+    "glFrontFace" : ("glFrontFace", ()),
+    "glLineWidth" : ("glLineWidth", ()),
+    "glPolygonOffset" : ("glPolygonOffset", ()),
+    "glSampleCoverage" : ("glSampleCoverage", ()),
+    "glScissor" : ("glScissor", ()),
+    "glStencilFunc" : ("glStencilFunc", ()),
+    "glStencilFuncSeparate" : ("glStencilFuncSeparate", (0,)),
+    "glStencilMask" : ("glStencilMask", ()),
+    "glStencilMaskSeparate" : ("glStencilMaskSeparate", (0,)),
+    "glStencilOp" : ("glStencilOp", ()),
+    "glStencilOpSeparate" : ("glStencilOpSeparate", (0,)),
+    "glVertexAttrib1f" : ("glVertexAttrib", (0,)),
+    "glVertexAttrib2f" : ("glVertexAttrib", (0,)),
+    "glVertexAttrib3f" : ("glVertexAttrib", (0,)),
+    "glVertexAttrib4f" : ("glVertexAttrib", (0,)),
+    "glViewport" : ("glViewport", ()),
+}
+
+# Functions binding objects, the last argument is the object and the rest
+# select the binding point
+SETUP_BIND_FUNCTIONS = set([
+    "glActiveTexture",
+    "glBindBuffer",
+    "glBindFramebuffer",
+    "glBindRenderbuffer",
+    "glBindTexture",
+    "glUseProgram",
+])
+
+# Functions reading the contents of any texture or buffer, the contents
+# uploaded before them can't be dropped
+SETUP_READ_FUNCTIONS = {
+    "glBlitFramebuffer" : "texture",
+    "glCopyBufferSubData" : "buffer",
+    "glCopyTexImage2D" : "texture",
+    "glCopyTexSubImage2D" : "texture",
+}
+
+# Functions drawing with the current state and objects, the calls before them
+# can't be dropped
+SETUP_DRAW_FUNCTIONS = set([
+    "glClear",
+    "glClearBufferfi",
+    "glClearBufferfv",
+    "glClearBufferiv",
+    "glClearBufferuiv",
+    "glDrawArrays",
+    "glDrawArraysInstanced",
+    "glDrawElements",
+    "glDrawElementsInstanced",
+    "glDrawRangeElements",
+])
+
+GL_TEXTURE0 = 0x84C0
+GL_TEXTURE_CUBE_MAP = 0x8513
+GL_TEXTURE_CUBE_MAP_POSITIVE_X = 0x8515
+GL_TEXTURE_CUBE_MAP_NEGATIVE_Z = 0x851A
+GL_ELEMENT_ARRAY_BUFFER = 0x8893
+
+class SetupCollapser(object):
+    """!
+    Drop the messages before the start frame that are superseded by a later
+    message before the start frame, so the setup code of the first replayed
+    frame grows with the state of the app and not with the number of frames
+    before the start frame.
+
+    A call is superseded when a later call sets the same state:
+    - the context state only used by the draws, see SETUP_STATE_FUNCTIONS
+    - the uniforms of a program
+    - the vertex attrib arrays of a vertex array object
+    - the texture parameters
+    - the uploads of a texture level or buffer, or of the same region of them
+    - the bindings, if nothing used the binding in between
+
+    Nothing before a draw is superseded, as the draw used it (the draws before
+    the start frame are only kept when drawing to a framebuffer other than the
+    default one, see SETUP_SKIPPED_DRAW_FUNCTIONS).
+
+    The messages are collapsed before generating their code, so no code or
+    assets are generated for the superseded messages, only the time to read
+    and decode the frames before the start frame grows with the number of
+    frames. See iter_setup_messages.
+    """
+    def __init__(self):
+        # Messages added, None for the dropped ones
+        self.messages = []
+        # Indices of the messages setting the context state, indexed by key
+        self.states = {}
+        # Indices of the messages setting the state of each object, indexed by
+        # (kind, name) and then by key
+        self.objects = {}
+        # Object bound to each binding point, indexed by (context, function
+        # name) and the arguments of the bind function selecting the binding
+        # point
+        self.bindings = {}
+        # Index of the binds not used yet, indexed like bindings
+        self.pending_binds = {}
+        self.dropped_count = 0
+
+    def get_int_arg(self, msg, arg_index):
+        arg = msg.args[arg_index]
+        if (len(arg.intValue) > 0):
+            return arg.intValue[0]
+        else:
+            return arg.int64Value[0]
+
+    def get_bound_texture(self, context, target):
+        unit = self.bindings.get((context, "glActiveTexture"), GL_TEXTURE0)
+        if (GL_TEXTURE_CUBE_MAP_POSITIVE_X <= target <= GL_TEXTURE_CUBE_MAP_NEGATIVE_Z):
+            target = GL_TEXTURE_CUBE_MAP
+        return self.bindings.get((context, "glBindTexture", unit, target), 0)
+
+    def drop(self, message_index):
+        if (self.messages[message_index] is not None):
+            self.messages[message_index] = None
+            self.dropped_count += 1
+
+    def supersede(self, indices, key, message_index):
+        """!
+        Drop the messages stored in indices with the given key and store the
+        given message index instead
+        """
+        for superseded_index in indices.get(key, []):
+            self.drop(superseded_index)
+        indices[key] = [message_index]
+
+    def add(self, msg, function_name):
+        """!
+        Add a message before the start frame, dropping the messages it
+        supersedes
+        """
+        message_index = len(self.messages)
+        self.messages.append(msg)
+        context = msg.context_id
+
+        try:
+            (state_name, arg_indices) = SETUP_STATE_FUNCTIONS[function_name]
+        except KeyError:
+            pass
+        else:
+            key = (context, state_name) + tuple([self.get_int_arg(msg, arg_index)
+                                                 for arg_index in arg_indices])
+            # The context state doesn't use the bindings, don't clear the
+            # pending binds
+            self.supersede(self.states, key, message_index)
+            return
+
+        if (function_name in SETUP_BIND_FUNCTIONS):
+            key = (context, function_name)
+            if (function_name == "glBindTexture"):
+                # The texture is bound to the active texture unit, which is
+                # now used
+                key += (self.bindings.get((context, "glActiveTexture"), GL_TEXTURE0),)
+                self.pending_binds.pop((context, "glActiveTexture"), None)
+            key += tuple([self.get_int_arg(msg, arg_index)
+                          for arg_index in xrange(len(msg.args) - 1)])
+            try:
+                self.drop(self.pending_binds[key])
+            except KeyError:
+                pass
+            self.pending_binds[key] = message_index
+            self.bindings[key] = self.get_int_arg(msg, len(msg.args) - 1)
+            return
+
+        if (function_name in SETUP_DRAW_FUNCTIONS):
+            self.states.clear()
+            self.objects.clear()
+
+        # Any other function may use the bindings
+        self.pending_binds.clear()
+
+        indices = None
+        key = None
+        if (function_name.startswith("glUniform") and
+            (function_name != "glUniformBlockBinding")):
+            program = self.bindings.get((context, "glUseProgram"), 0)
+            indices = self.objects.setdefault(("program", program), {})
+            # Select the location and, for the array versions, the count
+            if (function_name.endswith("v")):
+                key = (function_name, self.get_int_arg(msg, 0), self.get_int_arg(msg, 1))
+            else:
+                key = (function_name, self.get_int_arg(msg, 0))
+
+        elif (function_name in ["glVertexAttribPointer", "glVertexAttribIPointer",
+                                "glEnableVertexAttribArray", "glDisableVertexAttribArray",
+                                "glVertexAttribDivisor"]):
+            vertex_array = self.bindings.get((context, "glBindVertexArray"), 0)
+            indices = self.objects.setdefault(("vertex_array", context, vertex_array), {})
+            key = (function_name.replace("Disable", "Enable"), self.get_int_arg(msg, 0))
+
+        elif (function_name in ["glBindVertexArray", "glBindVertexArrayOES"]):
+            self.bindings[(context, "glBindVertexArray")] = self.get_int_arg(msg, 0)
+            # The element array buffer binding is part of the vertex array
+            self.bindings.pop((context, "glBindBuffer", GL_ELEMENT_ARRAY_BUFFER), None)
+
+        elif (function_name in ["glTexParameterf", "glTexParameterfv",
+                                "glTexParameteri", "glTexParameteriv"]):
+            texture = self.get_bound_texture(context, self.get_int_arg(msg, 0))
+            if (texture != 0):
+                indices = self.objects.setdefault(("texture", texture), {})
+                key = ("glTexParameter", self.get_int_arg(msg, 1))
+
+        elif (function_name in ["glTexImage2D", "glCompressedTexImage2D",
+                                "glTexSubImage2D", "glCompressedTexSubImage2D"]):
+            target = self.get_int_arg(msg, 0)
+            texture = self.get_bound_texture(context, target)
+            if (texture != 0):
+                indices = self.objects.setdefault(("texture", texture), {})
+                # A new image of the level supersedes all the uploads to the
+                # level, a subimage supersedes the uploads to the same region
+                key = ("level", target, self.get_int_arg(msg, 1))
+                if ("SubImage" in function_name):
+                    indices.setdefault(key, []).append(message_index)
+                    key = ("region", ) + tuple([self.get_int_arg(msg, arg_index)
+                                                for arg_index in xrange(6)])
+
+        elif (function_name in ["glBufferData", "glBufferSubData"]):
+            buffer_name = self.bindings.get((context, "glBindBuffer", self.get_int_arg(msg, 0)), 0)
+            if (buffer_name != 0):
+                indices = self.objects.setdefault(("buffer", buffer_name), {})
+                # New data supersedes all the uploads to the buffer, subdata
+                # supersedes the uploads to the same region
+                key = ("data", )
+                if (function_name == "glBufferSubData"):
+                    indices.setdefault(key, []).append(message_index)
+                    key = ("region", self.get_int_arg(msg, 1), self.get_int_arg(msg, 2))
+
+        elif (function_name in ["glGenerateMipmap", "glGenerateMipmapOES"]):
+            # Uses the uploads to the texture
+            texture = self.get_bound_texture(context, self.get_int_arg(msg, 0))
+            self.objects.pop(("texture", texture), None)
+
+        elif (function_name in SETUP_READ_FUNCTIONS):
+            kind = SETUP_READ_FUNCTIONS[function_name]
+            for object_key in self.objects.keys():
+                if (object_key[0] == kind):
+                    del self.objects[object_key]
+
+        elif (function_name in ["glDeleteTextures", "glDeleteBuffers", "glDeleteProgram"]):
+            # The name can be reused by a new object, don't let its calls
+            # supersede the calls of the deleted object
+            if (function_name == "glDeleteProgram"):
+                object_keys = [("program", self.get_int_arg(msg, 0))]
+            elif (function_name == "glDeleteTextures"):
+                object_keys = [("texture", name) for name in msg.args[1].intValue]
+            else:
+                object_keys = [("buffer", name) for name in msg.args[1].intValue]
+            for object_key in object_keys:
+                self.objects.pop(object_key, None)
+
+        if (indices is not None):
+            self.supersede(indices, key, message_index)
+
+    def collapse(self):
+        """!
+        Return the list of messages added without the ones dropped
+        """
+        logger.info("Dropped %d superseded calls before the start frame" %
+                    self.dropped_count)
+        return [msg for msg in self.messages if msg is not None]
+
+def iter_setup_messages(msgs, dispatch_table, start_frame, detach_messages = False):
+    """!
+    Collapse the decoded messages before the start frame with a SetupCollapser,
+    yielding the messages not superseded once the start frame is reached (or
+    the messages end), followed by the rest of messages.
+
+    The eglSwapBuffers before the start frame are dropped, so the messages not
+    superseded are replayed as part of the start frame.
+
+    @param msgs: iterable of decoded messages, eg from
+           gldecode.iter_decoded_messages
+    @param dispatch_table: dispatch table to get the function names from, see
+           build_dispatch_table
+    @param detach_messages: detach the messages before holding them until the
+           start frame, see gldecode.detach_message, so they don't keep the
+           serialized buffers they were decoded from alive
+    """
+    setup_collapser = SetupCollapser()
+    msgs = iter(msgs)
+    frame_count = 0
+    for msg in msgs:
+        if (msg.function == gltrace.EGL_SWAP_BUFFERS):
+            frame_count += 1
+            logger.info("Collapsing frame %d" % frame_count)
+            if (frame_count >= start_frame):
+                break
+            continue
+        if (detach_messages):
+            gldecode.detach_message(msg)
+        setup_collapser.add(msg, dispatch_table[msg.function].name)
+
+    for msg in setup_collapser.collapse():
+        yield msg
+    # Don't hold the messages before the start frame while yielding the rest
+    setup_collapser = None
+
+    for msg in msgs:
+        yield msg
+
+# Fixups indexed by function name, see register_fixup
+FIXUPS = {}
+
+def register_fixup(function_names, fixup):
+    """!
+    Register a fixup to call for every message of the given functions before
+    generating its code.
+
+    This is used to work around capture bugs (eg args that the trace stores as
+    ints but are pointers) and to track or override the state of the replay,
+    and can be called from outside glparse to handle new capture quirks.
+
+    The fixup is called as fixup(state, msg) with the ParseState, can patch
+    the message in place and returns True if the message must be ignored, in
+    which case the fixups after it are not called.
+
+    The fixups of a function are called in registration order. They must be
+    registered before calling glparse, which builds the dispatch table when it
+    starts.
+    """
+    for function_name in function_names:
+        FIXUPS.setdefault(function_name, []).append(fixup)
+
+def build_dispatch_table(translation_insertions, translation_lookups):
+    """!
+    Return a list indexed by Function enum number with the FunctionDispatch of
+    each function, so the main loop doesn't need to look up by function name
+
+    Numbers not in the Function enum are None
+    """
+    function_enum_type = gltrace_pb2.GLMessage.DESCRIPTOR.enum_types_by_name['Function']
+    dispatch_table = [None] * (max(function_enum_type.values_by_number) + 1)
+    for value in function_enum_type.values:
+        dispatch_table[value.number] = FunctionDispatch(
+            value.name, translation_insertions.get(value.name, {}),
+            translation_lookups.get(value.name, {}),
+            tuple(FIXUPS.get(value.name, [])))
+
+    return dispatch_table
+
+def ignore_vertex_attrib_fv(state, msg):
+    if (not msg.args[1].isArray):
+        # WAR: glVertexAttrib4fv doesn't provide data, ignore it
+        logger.warning("Ignoring glVertexAttribNv function as the trace doesn't provide the value")
+        logger.debug(msg)
+        return True
+
+def ignore_get_active_uniform(state, msg):
+    logger.warning("Ignoring glGetActiveUniform as the trace doesn't provide a pointer")
+    logger.debug(msg)
+    return True
+
+def ignore_discard_framebuffer(state, msg):
+    # WAR: glDiscardFrameBufferEXT doesn't provide the frambufferse to
+    #      discard, ignore
+    logger.warning("Ignoring glDiscardFrameBufferEXT as the trace doesn't provide the value")
+    logger.debug(msg)
+    return True
+
+def ignore_get_tex_parameter(state, msg):
+    # glGetTexParameterXX provides an int as destination instead of a pointer, ignore.
+    # XXX Is this an error in the capture or in glparse?
+    logger.warning("Ignoring glGetTexParameterXX function as the trace doesn't provide a pointer")
+    logger.debug(msg)
+    return True
+
+def ignore_get_vertex_attribfv(state, msg):
+    # glGetVertexAttribfv(GL_CURRENT_VERTEX_ATTRIB, ) provides an int as destination instead of a pointer, ignore.
+    logger.warning("Ignoring glGetVertexAttribfv function as the trace doesn't provide a pointer")
+    logger.debug(msg)
+    return True
+
+def fixup_bind_framebuffer(state, msg):
+    state.current_framebuffer = msg.args[1].intValue[0]
+    # Always reset the viewport and scissor when switching
+    # framebuffers, as it could have the scaled version set
+    if (state.current_framebuffer == 0):
+        state.code.append("glScaledViewport(%d, %d, %d, %d)" %
+            (state.current_viewport_x,
+             state.current_viewport_y,
+             state.current_viewport_width,
+             state.current_viewport_height))
+        state.code.append("glScaledScissor(%d, %d, %d, %d)" %
+            (state.current_scissor_x,
+             state.current_scissor_y,
+             state.current_scissor_width,
+             state.current_scissor_height))
+    else:
+        state.code.append("glViewport(%d, %d, %d, %d)" %
+            (state.current_viewport_x,
+             state.current_viewport_y,
+             state.current_viewport_width,
+             state.current_viewport_height))
+        state.code.append("glScissor(%d, %d, %d, %d)" %
+            (state.current_scissor_x,
+             state.current_scissor_y,
+             state.current_scissor_width,
+             state.current_scissor_height))
+
+def fixup_viewport(state, msg):
+    # Collect the maximum viewport so it can be scaled when
+    # framebuffer 0 is bound
+    # XXX Optionally, this could scale all framebuffers, not just
+    #     framebuffer 0
+    state.current_viewport_x = msg.args[0].intValue[0]
+    state.current_viewport_y = msg.args[1].intValue[0]
+    state.current_viewport_width = msg.args[2].intValue[0]
+    state.current_viewport_height = msg.args[3].intValue[0]
+
+    # Use the first call as heuristic to framebuffer 0 width and
+    # height
+    # XXX Viewport size tracking should be smarter, it
+    #     should track the viewport size just before rendering to
+    #     framebuffer 0, not just when calling glViewport, but
+    #     some apps may even use bigger viewport sizes when they
+    #     do that, so it's not fail-proof
+    # XXX A known offender is GTAVC, where the first viewport
+    #     is not the full one. A later viewport inside the trace
+    #     is full.
+    if (state.max_viewport_height == 0):
+        state.max_viewport_width = state.current_viewport_width
+        state.max_viewport_height = state.current_viewport_height
+
+    # We need to scale the viewport if rendering to framebuffer 0
+    if (state.current_framebuffer == 0):
+        state.function_string = "glScaledViewport"
+
+def fixup_scissor(state, msg):
+    # Collect the maximum scissor so it can be scaled when
+    # framebuffer 0 is bound
+    # XXX Optionally, this could scale all framebuffers, not just
+    #     framebuffer 0
+    state.current_scissor_x = msg.args[0].intValue[0]
+    state.current_scissor_y = msg.args[1].intValue[0]
+    state.current_scissor_width = msg.args[2].intValue[0]
+    state.current_scissor_height = msg.args[3].intValue[0]
+
+    # Use the first call as heuristic to framebuffer 0 width and
+    # height
+    # XXX scissor size tracking should be smarter, it
+    #     should track the scissor size just before rendering to
+    #     framebuffer 0, not just when calling glScissor, but
+    #     some apps may even use bigger scissor sizes when they
+    #     do that, so it's not fail-proof
+    if (state.max_scissor_height == 0):
+        state.max_scissor_width = state.current_scissor_width
+        state.max_scissor_height = state.current_scissor_height
+
+    # We need to scale the scissor if rendering to framebuffer 0
+    if (state.current_framebuffer == 0):
+        state.function_string = "glScaledScissor"
+
+def fixup_enable_disable(state, msg):
+    # Allow overriding dithering
+    if (msg.args[0].intValue[0] == 0x0BD0):
+        if (state.function_name == "glDisable"):
+            state.function_string = "glOverriddenDisable"
+        else:
+            state.function_string = "glOverriddenEnable"
+        state.args_strings.append("param_DrawState_ptr_0")
+
+def fixup_get_vertex_attribiv(state, msg):
+    # XXX The trace sends intValue with isArray false
+    logger.debug("Patching function %s" % state.function_name)
+    msg.args[2].isArray = True
+
+def fixup_get_active_attrib(state, msg):
+    # WAR: The trace sends an extra int with some index?
+    if (len(msg.args) > 7):
+        del msg.args[7]
+
+def fixup_draw_elements(state, msg):
+    if (not msg.args[3].isArray):
+        # When using index buffers, the last parameter can be an offset
+        # instead of an array of indices, convert to pointer to void
+        # to prevent gcc warnings
+        msg.args[3].type = gltrace_pb2.GLMessage.DataType.VOID
+
+def fixup_get_floatv(state, msg):
+    # XXX The trace sends a single float array, but the spec says two
+    #     elements
+    msg.args[1].floatValue.append(0.0)
+
+def fixup_get_info_log(state, msg):
+    # WAR: the two last glGetShader/ProgramInfoLog arguments in the
+    #      trace are ints instead array of int and array of char,
+    #      convert to those
+    max_length = msg.args[1].intValue[0]
+    logger.debug("Found shader_info_log_max_length %d" % max_length)
+    # Convert to pointer to int
+    msg.args[2].isArray = True
+    # Convert to pointer to char
+    msg.args[3].isArray = True
+    msg.args[3].charValue.append("?" * max_length)
+
+def fixup_get_attached_shaders(state, msg):
+    # WAR: The last two parameters are ints instead of pointers,
+    #      convert to those and set the count (second parametre) to 1,
+    #      since the result is not necessary and the trace doesn't
+    #      contain it
+    # XXX Alternatively we could get the size from the second argument
+    #     and create arrays of that size, but the result is not used
+    #     at replay time anyway so ignore it.
+    msg.args[1].intValue[0] = 1
+    msg.args[2].isArray = True
+    msg.args[3].isArray = True
+
+def fixup_get_shader_precision_format(state, msg):
+    # WAR: The last two parameters should be pointers but the trace
+    #      makes them ints
+    msg.args[2].isArray = True
+    msg.args[3].isArray = True
+
+def fixup_invalidate_framebuffer(state, msg):
+    # WAR: The last two parameters should be pointers but the trace
+    #      makes them ints
+    msg.args[2].isArray = True
+
+def fixup_get_vertex_attrib_pointerv(state, msg):
+    # WAR: the last parameter in the trace is an INT instead of a pointer
+    #      to pointer, convert to pointer to int
+    msg.args[2].isArray = True
+    msg.args[2].type = gltrace_pb2.GLMessage.DataType.VOID
+
+def fixup_vertex_attrib_pointer(state, msg):
+    # the last parameter in the trace is an INT instead of a pointer,
+    # convert to pointer
+    msg.args[5].type = gltrace_pb2.GLMessage.DataType.VOID
+
+def fixup_shader_source(state, msg):
+    # The trace uses CHAR array, remove the array as a special case
+    # to signify that it's an array of char arrays
+    msg.args[2].isArray = False
+
+    # Always set the length pointer to zero, as we don't need it
+    # and passing random pointers causes errors otherwise
+    arg = msg.args[3]
+    if (len(arg.intValue) > 0):
+        arg.intValue[0] = 0
+    else:
+        arg.int64Value[0] = 0
+
+def fixup_vertex_attrib_pointer_data(state, msg):
+    # The C function only understands a few types, make sure we catch
+    # this issue at trace generation time
+    # GL_BYTE, GL_UNSIGNED_BYTE, GL_SHORT, GL_UNSIGNED_SHORT, GL_FIXED, GL_FLOAT
+    if (msg.args[2].intValue[0] not in [0x1400, 0x1401, 0x1402, 0x1403, 0x140C, 0x1406]):
+        raise Exception("Unhandled type 0x%x in message %s" % (msg.args[2].intValue[0], msg))
+
+def fixup_tex_parameteri(state, msg):
+    # glTexParameteri has an INT as last parameter but in real life
+    # it's always an ENUM
+    # Switch to ENUM so it gets translated
+    msg.args[2].type = gltrace_pb2.GLMessage.DataType.ENUM
+
+# Index of the texture data argument of the texture upload functions
+TEXTURE_DATA_ARG_INDICES = {
+    "glTexImage2D" : 8,
+    "glTexSubImage2D" : 8,
+    "glTexImage3D" : 9,
+    "glTexSubImage3D" : 10,
+    "glCompressedTexImage2D" : 7,
+    "glCompressedTexSubImage2D" : 8,
+}
+
+def fixup_texture_data(state, msg):
+    arg = msg.args[TEXTURE_DATA_ARG_INDICES[state.function_name]]
+
+    # If the trace contains pointers instead of rawBytes, it means
+    # the trace was generated without texture data, force all textures
+    # to empty to prevent access violations when accessing stale pointers
+    if ((not state.generate_empty_textures) and
+        ((len(arg.rawBytes) == 0) and (
+            ((len(arg.intValue) > 0) and (arg.intValue[0] != 0)) or
+            ((len(arg.int64Value) > 0) and (arg.int64Value[0] != 0))))
+         ):
+        logger.warning("Trace doesn't contain texture data for %s, forcing texture to empty" %
+            state.function_name)
+        logger.debug(msg)
+        # Don't just set generate_empty_textures, as some traces have
+        # normal texture data but not compressed data
+        arg.type = gltrace_pb2.GLMessage.DataType.VOID
+        arg.isArray = False
+        if (len(arg.int64Value) != 0):
+            arg.int64Value[0] = 0
+        else:
+            arg.intValue[0] = 0
+
+    if (state.generate_empty_textures):
+        # Set the texture pointer to NULL
+        arg.type = gltrace_pb2.GLMessage.DataType.VOID
+        arg.isArray = False
+        arg.intValue[0] = 0
+
+register_fixup(["glVertexAttrib1fv", "glVertexAttrib2fv", "glVertexAttrib3fv",
+                "glVertexAttrib4fv"], ignore_vertex_attrib_fv)
+register_fixup(["glGetActiveUniform"], ignore_get_active_uniform)
+register_fixup(["glDiscardFramebufferEXT"], ignore_discard_framebuffer)
+register_fixup(["glGetTexParameteriv", "glGetTexParameterfv"], ignore_get_tex_parameter)
+register_fixup(["glGetVertexAttribfv"], ignore_get_vertex_attribfv)
+register_fixup(["glBindFramebuffer"], fixup_bind_framebuffer)
+register_fixup(["glViewport"], fixup_viewport)
+register_fixup(["glScissor"], fixup_scissor)
+register_fixup(["glDisable", "glEnable"], fixup_enable_disable)
+register_fixup(["glGetVertexAttribiv"], fixup_get_vertex_attribiv)
+register_fixup(["glGetActiveAttrib"], fixup_get_active_attrib)
+register_fixup(["glDrawElements"], fixup_draw_elements)
+register_fixup(["glGetFloatv"], fixup_get_floatv)
+register_fixup(["glGetShaderInfoLog", "glGetProgramInfoLog"], fixup_get_info_log)
+register_fixup(["glGetAttachedShaders"], fixup_get_attached_shaders)
+register_fixup(["glGetShaderPrecisionFormat"], fixup_get_shader_precision_format)
+register_fixup(["glInvalidateFramebuffer"], fixup_invalidate_framebuffer)
+register_fixup(["glGetVertexAttribPointerv"], fixup_get_vertex_attrib_pointerv)
+register_fixup(["glVertexAttribPointer"], fixup_vertex_attrib_pointer)
+register_fixup(["glShaderSource"], fixup_shader_source)
+register_fixup(["glVertexAttribPointerData"], fixup_vertex_attrib_pointer_data)
+register_fixup(["glTexParameteri"], fixup_tex_parameteri)
+register_fixup(TEXTURE_DATA_ARG_INDICES.keys(), fixup_texture_data)
+
+def format_float_array_arg(state, msg, arg, translated_value):
+    # When all of intValue, floatValue and isArray are set, a pointer is
+    # passed in with existing float contents
+    # This is used for glUniformMatrix4fv, etc
+    # This is also used for glGetFloatv, etc so it cannot be declared
+    # const
+    if ((state.use_assets_for_floats and
+        (len(arg.floatValue) > state.min_float_asset_size_in_floats)) or
+        (len(arg.floatValue) > state.max_float_inlined_size_in_floats)):
+        arg_name = "global_float_ptr_F"
+        asset_filename = "float_asset_%d" % state.num_allocated_vars
+
+        # Allocate one asset specifically for floats, since the pointer
+        # variable declaration is keyed off the asset variable name
+
+        state.preamble_strings.extend(allocate_asset(state.allocated_assets,
+                                                     state.allocated_asset_filenames,
+                                                     state.assets_dir,
+                                                     arg_name,
+                                                     asset_filename,
+                                                     "float*",
+                                                     "global_AAsset_ptr_F",
+                                                     pack_values("f", arg.floatValue),
+                                                     state.global_decls,
+                                                     asset_store = state.asset_store,
+                                                     asset_pack = state.asset_pack,
+                                                     asset_writer = state.asset_writer,
+                                                     asset_compressor = state.asset_compressor))
+
+    else:
+        # XXX Change this to use the global pointer?
+        arg_name = "local_float_ptr_%d" % state.num_allocated_vars
+        state.preamble_strings.append("float %s[] = { %s }" % (
+            arg_name,
+            format_literals(arg.floatValue)))
+
+    state.num_allocated_vars += 1
+
+    return arg_name
+
+def format_raw_bytes_arg(state, msg, arg, translated_value):
+    # When rawbytes is set, initialized data is passed in
+    # (glTexSubImage2D, glTexImage2D with BYTE, glBufferData with VOID, etc)
+    # Note isArray is set to False when NULLing textures, so those don't get
+    # here
+    if ((state.use_assets_for_ints and
+        (len(arg.rawBytes[0]) > state.min_int_asset_size_in_bytes)) or
+        (len(arg.rawBytes[0]) > state.max_int_inlined_size_in_bytes)):
+        asset_filename = "int_asset_%d" % state.num_allocated_vars
+
+        if (state.function_name == "glVertexAttribPointerData"):
+            arg_name = "global_const_unsigned_int_ptr_%d" % msg.args[0].intValue[0]
+
+            state.preamble_strings.extend(allocate_asset(state.allocated_assets,
+                                                         state.allocated_asset_filenames,
+                                                         state.assets_dir,
+                                                         arg_name,
+                                                         asset_filename,
+                                                         "const unsigned int*",
+                                                         "global_AAsset_ptr_%d" % msg.args[0].intValue[0],
+                                                         arg.rawBytes[0],
+                                                         state.global_decls,
+                                                         asset_store = state.asset_store,
+                                                         asset_pack = state.asset_pack,
+                                                         asset_writer = state.asset_writer,
+                                                         asset_compressor = state.asset_compressor))
+            # The asset will be freed when it's allocated again with
+            # that name
+            # XXX Need to free the assets at the end of the trace
+        else:
+            arg_name = "global_const_unsigned_int_ptr_I"
+            # Allocate one asset specifically for ints, since the pointer
+            # variable declaration is keyed off the asset variable name
+            state.preamble_strings.extend(allocate_asset(state.allocated_assets,
+                                                         state.allocated_asset_filenames,
+                                                         state.assets_dir,
+                                                         arg_name,
+                                                         asset_filename,
+                                                         "const unsigned int*",
+                                                         "global_AAsset_ptr_I",
+                                                         arg.rawBytes[0],
+                                                         state.global_decls,
+                                                         asset_store = state.asset_store,
+                                                         asset_pack = state.asset_pack,
+                                                         asset_writer = state.asset_writer,
+                                                         asset_compressor = state.asset_compressor))
+            # This is a short-lived asset only used in this GL call, could
+            # be freed after the call, but that complicates the asset
+            # variable declaration, so we just free it the next time
+            # an asset with this name is allocated
+    else:
+        # XXX Change this to use the global pointer?
+        arg_name = "local_const_char_ptr_%d" % state.num_allocated_vars
+        state.preamble_strings.append("const char %s[%d] = { %s }" % (
+            arg_name,
+            len(arg.rawBytes[0]),
+            format_byte_literals(arg.rawBytes[0])))
+
+    state.num_allocated_vars += 1
+
+    return arg_name
+
+def format_value_array_arg(state, msg, arg, translated_value):
+    # When isArray is set, the parameter is passed by reference and
+    # contains a return value, which is held in the xxxValue part
+    # Those need to be stored in variables in case they are used
+    # in the future
+    # One special case is glDrawElements, where an array is passed in,
+    # but with values already
+    # XXX We actually don't need to initialize the arrays passed by reference
+    #     can we tell the difference between glGenTextures and glDrawElements?
+    # Note booleans have both len(intValue) and len(boolValue) greater
+    # than zero
+
+    # XXX Missing initializers for all but charvalue?
+    if (len(arg.boolValue) > 0):
+        var_name = "local_boolean_ptr_%d" % state.num_allocated_vars
+        state.preamble_strings.append("GLboolean %s[%d]" % (var_name , len(arg.boolValue)))
+    elif (len(arg.charValue) > 0):
+        var_name = "local_char_ptr_%d" % state.num_allocated_vars
+        if ("\n" in arg.charValue[0]):
+            initializer = '"\\\n  %s\\n"' % arg.charValue[0].replace("\n", "\\\n  ")
+        else:
+            initializer = '"%s"' % arg.charValue[0]
+        state.preamble_strings.append("GLchar %s[] = %s" % (var_name, initializer))
+    elif ((len(arg.intValue) > 0) or (len(arg.int64Value) > 0)):
+        if (len(arg.intValue) > 0):
+            argIntValue = arg.intValue
+        else:
+            argIntValue = arg.int64Value
+        if (arg.type == gltrace_pb2.GLMessage.DataType.VOID):
+            var_name = "local_void_ptr_%d" % state.num_allocated_vars
+            # the parser patches some pointers to void from INTs to
+            # VOID
+            state.preamble_strings.append("GLvoid* %s[1]" % var_name)
+        else:
+            # This is used for generating texture ids, buffer ids, etc,
+            # so it needs to preserve the data across invocations,
+            # store in global variables
+            # XXX Where else is static needed?
+            # XXX This is not true for cases like glGetProgram/ShaderInfoLog
+            #     probably others?
+            # Remove the local prefix
+            var_name = "global_unsigned_int_ptr_%d" % state.num_allocated_vars
+            var_type = "GLuint"
+            var_size = 4
+            pack_type = "I"
+            # glDrawElements can use different element sizes, use
+            # the proper type
+            # XXX Is there any other function with different int sizes?
+            if (state.function_name == "glDrawElements"):
+
+                # GL_UNSIGNED_SHORT 0x1403
+                if (msg.args[2].intValue[0] == 0x1403):
+                    var_size = 2
+                    var_type = "GLushort"
+                    var_name = "global_GLushort_ptr_%d" % state.num_allocated_vars
+                    pack_type = "H"
+
+                # GL_UNSIGNED_BYTE 0x1401
+                elif (msg.args[2].intValue[0] == 0x1401):
+                    var_type = "GLubyte"
+                    var_name = "global_GLubyte_ptr_%d" % state.num_allocated_vars
+                    var_size = 1
+                    pack_type = "B"
+
+                else:
+                    raise Exception("unhandled glDrawElements element type 0x%x" % msg.args[2].intValue[0])
+
+            var_size *= len(argIntValue)
+
+            # Using assets is specially important in the case of
+            # glDrawElements, although is not special-cased here,
+            # it will use whatever min/max check is done on integer
+            # assets
+            if ((state.use_assets_for_ints and
+                (var_size > state.min_int_asset_size_in_bytes)) or
+                (var_size > state.max_int_inlined_size_in_bytes)):
+                # Store in a short-lived asset if for glDrawElements index
+                # buffer and above the minimum asset size
+                var_name = "global_const_unsigned_int_ptr_I"
+                asset_filename = "int_asset_%d" % state.num_allocated_vars
+                # Allocate one asset specifically for ints, since the pointer
+                # variable declaration is keyed off the asset variable name
+                state.preamble_strings.extend(allocate_asset(state.allocated_assets,
+                                                             state.allocated_asset_filenames,
+                                                             state.assets_dir,
+                                                             var_name,
+                                                             asset_filename,
+                                                             "const %s*" % var_type,
+                                                             "global_AAsset_ptr_I",
+                                                             pack_values(pack_type, argIntValue),
+                                                             state.global_decls,
+                                                             asset_store = state.asset_store,
+                                                             asset_pack = state.asset_pack,
+                                                             asset_writer = state.asset_writer,
+                                                             asset_compressor = state.asset_compressor))
+                # This is a short-lived asset only used in this GL call, could
+                # be freed after the call, but that complicates the asset
+                # variable declaration, so we just free it the next time
+                # an asset with this name is allocated
+
+            else:
+                # XXX This can be moved to a local for glDrawElements
+                #     only, but would that make things harder for the
+                #     inliner?
+                state.global_decls.append("static %s %s[%d] = {%s}" %
+                            (var_type, var_name , len(argIntValue),
+                             format_literals(argIntValue)))
+    else:
+        raise Exception("unhandled array argument %s for %s" % (arg, msg))
+
+    state.num_allocated_vars += 1
+
+    return var_name
+
+def format_shader_source_arg(state, msg, arg, translated_value):
+    # charValue with isArray set to false is only used for the
+    # special case of glSetShaderSource, in which case we need
+    # a pointer to pointer to const chars (const qualifier is not
+    # ignored across pointers)
+    if (state.use_assets_for_shaders):
+        asset_filename = "char_asset_%d" % state.num_allocated_vars
+        arg_name = "global_const_char_ptr_C"
+        # Allocate one asset specifically for chars, since the pointer
+        # variable declaration is keyed off the asset variable name
+        # Note we zero-terminate the string as required by
+        # glSetShaderSource when length is NULL
+        state.preamble_strings.extend(allocate_asset(state.allocated_assets,
+                                                     state.allocated_asset_filenames,
+                                                     state.assets_dir,
+                                                     arg_name,
+                                                     asset_filename,
+                                                     "GLchar const *",
+                                                     "global_AAsset_ptr_C",
+                                                     arg.charValue[0] + "\0",
+                                                     state.global_decls,
+                                                     asset_store = state.asset_store,
+                                                     asset_pack = state.asset_pack,
+                                                     asset_writer = state.asset_writer,
+                                                     asset_compressor = state.asset_compressor))
+        # glSetShaderSource requires a pointer to pointer
+        arg_name = "&%s" % arg_name
+    else:
+        # XXX Change this to use the global pointer?
+        arg_name = "local_char_ptr_%d" % state.num_allocated_vars
+        if ("\n" in arg.charValue[0]):
+            initializer = '"\\\n  %s\\n"' % arg.charValue[0].replace("\n", "\\n\\\n  ")
+        else:
+            initializer = '"%s"' % arg.charValue[0]
+
+        state.preamble_strings.append("const GLchar* %s[] = {%s} " % (
+            arg_name,
+            initializer))
+
+    state.num_allocated_vars += 1
+
+    return arg_name
+
+def format_scalar_arg(state, msg, arg, translated_value):
+    """!
+    Format an argument passed by value or a translated array, probing the
+    payload in order of priority
+    """
+    if (len(arg.charValue) > 0):
+        return format_shader_source_arg(state, msg, arg, translated_value)
+
+    elif (len(arg.int64Value) > 0):
+        if (translated_value is not None):
+            return str(translated_value)
+        else:
+            return "(GLvoid*) 0x%x" % ctypes.c_uint32(arg.int64Value[0]).value
+
+    elif (len(arg.intValue) > 0):
+        # XXX Don't hard-code this only to intValues
+        if (translated_value is not None):
+            return str(translated_value)
+        else:
+            if (arg.type == gltrace_pb2.GLMessage.DataType.ENUM):
+                return hex(arg.intValue[0])
+            elif (arg.type == gltrace_pb2.GLMessage.DataType.VOID):
+                return "(GLvoid*) 0x%x" % ctypes.c_uint32(arg.intValue[0]).value
+            else:
+                return str(arg.intValue[0])
+
+    elif (len(arg.floatValue) > 0):
+        return str(arg.floatValue[0])
+
+    elif (len(arg.boolValue) > 0):
+        if (translated_value is not None):
+            return str(translated_value)
+        else:
+            if (arg.boolValue[0]):
+                return "GL_TRUE"
+            else:
+                return "GL_FALSE"
+
+    else:
+        raise Exception("unhandled argument %s" % arg)
+
+# The formatters below are specialised for the payload that goes with each
+# DataType, they fall back to format_scalar_arg if the payload is not the
+# expected one (eg the fixups patch some INT arguments to VOID) so the
+# generated code is the same
+
+def format_int_arg(state, msg, arg, translated_value):
+    values = arg.intValue
+    if ((not values) or arg.int64Value or arg.charValue):
+        return format_scalar_arg(state, msg, arg, translated_value)
+    if (translated_value is not None):
+        return str(translated_value)
+    return str(values[0])
+
+def format_enum_arg(state, msg, arg, translated_value):
+    values = arg.intValue
+    if ((not values) or arg.int64Value or arg.charValue):
+        return format_scalar_arg(state, msg, arg, translated_value)
+    if (translated_value is not None):
+        return str(translated_value)
+    return hex(values[0])
+
+def format_void_arg(state, msg, arg, translated_value):
+    values = arg.intValue
+    if ((not values) or arg.int64Value or arg.charValue):
+        return format_scalar_arg(state, msg, arg, translated_value)
+    if (translated_value is not None):
+        return str(translated_value)
+    return "(GLvoid*) 0x%x" % ctypes.c_uint32(values[0]).value
+
+def format_float_arg(state, msg, arg, translated_value):
+    values = arg.floatValue
+    if ((not values) or arg.intValue or arg.int64Value or arg.charValue):
+        return format_scalar_arg(state, msg, arg, translated_value)
+    return str(values[0])
+
+# Formatters of the arguments passed by value indexed by DataType, the types
+# without a specialised formatter use format_scalar_arg
+SCALAR_ARG_FORMATTERS = [format_scalar_arg] * (max(gltrace_pb2.GLMessage.DataType.Type.values()) + 1)
+SCALAR_ARG_FORMATTERS[gltrace_pb2.GLMessage.DataType.INT] = format_int_arg
+SCALAR_ARG_FORMATTERS[gltrace_pb2.GLMessage.DataType.ENUM] = format_enum_arg
+SCALAR_ARG_FORMATTERS[gltrace_pb2.GLMessage.DataType.VOID] = format_void_arg
+SCALAR_ARG_FORMATTERS[gltrace_pb2.GLMessage.DataType.FLOAT] = format_float_arg
+
+def get_arg_formatter(arg, translated_value):
+    """!
+    Return the function to format the given argument, called as
+    formatter(state, msg, arg, translated_value) it returns the string to
+    pass as argument in the generated code, adding any necessary declarations
+    to the preamble of the call or to the global declarations.
+    """
+    if (not arg.isArray):
+        return SCALAR_ARG_FORMATTERS[arg.type]
+
+    # Keep in order, some options have higher priority than others
+    if (len(arg.floatValue) > 0):
+        return format_float_array_arg
+
+    elif (len(arg.rawBytes) > 0):
+        return format_raw_bytes_arg
+
+    elif (translated_value is None):
+        return format_value_array_arg
+
+    else:
+        # Translated array values (eg glDeleteTextures) have already been put
+        # into a single array variable, so they don't need to be redeclared
+        # here
+        return format_scalar_arg
+
 # XXX Missing other parameters like asset file vs. variable size threshold
-def glparse(trace_filepath, output_dir, assets_dir, gl_contexts_to_trace):
+def glparse(trace_filepath, output_dir, assets_dir, gl_contexts_to_trace,
+            use_trace_index = False, message_decoder = "protobuf",
+            decode_processes = 1, read_ahead = 0,
+            read_block_size = gltrace.TRACE_BLOCK_SIZE, start_frame = 0,
+            end_frame = None, lazy_translations = False, code_writer = None,
+            asset_store_dir = None, pack_assets = False,
+            asset_writer_threads = 0, compress_assets = False,
+            chunk_assets = False, decompress_processes = 1):
     """!
     @param gl_contexts_to_trace: *list* of *integers* with the contexts to trace
             or None to trace all.
+    @param use_trace_index: Use the trace's index sidecar file (building it if
+            necessary) to skip the messages of ignored contexts without
+            decoding them.
+    @param message_decoder: "protobuf" to decode the messages with the
+            generated gltrace_pb2 module or "fast" to use the specialised
+            decoder in gldecode.py
+    @param decode_processes: Number of processes to decode the messages in
+            parallel with the code generation, None to use all the CPUs
+    @param read_ahead: Number of batches of messages to read ahead on a
+            background thread, overlapping the decompression with the code
+            generation, 0 to read on the calling thread
+    @param read_block_size: Size in bytes of each read on the trace file
+    @param start_frame: First frame to replay, the frames before it only
+            generate the setup code (object creation, uploads, state) into the
+            first replayed frame, see SETUP_SKIPPED_FUNCTIONS and
+            SetupCollapser. The draws before it are only kept when drawing to
+            a framebuffer other than the default one, so the textures rendered
+            to are still produced, but the contents of the default framebuffer
+            (eg when the app doesn't clear it every frame) are lost, see
+            SETUP_SKIPPED_DRAW_FUNCTIONS
+    @param end_frame: Last frame to replay (inclusive), None for all
+    @param lazy_translations: Build the enum translations of each function
+            from gl.xml the first time the function is found in the trace,
+            memoising them next to gl.xml for following runs, instead of
+            building them for all the GLES2 functions up front
+    @param code_writer: CodeWriter to write the generated code to as it's
+            generated (eg a FileCodeWriter), None to return the list of lines
+            of the generated code
+    @param asset_store_dir: Directory of the AssetStore to keep the assets in
+            across runs, linking the ones used into assets_dir, None to write
+            the assets directly into assets_dir
+    @param pack_assets: Append the assets to a single ASSET_PACK_FILENAME
+            asset in assets_dir, see AssetPack
+    @param asset_writer_threads: Number of threads to write the asset files in
+            the background, overlapping the disk I/O with the code generation,
+            0 to write them on the calling thread
+    @param compress_assets: Compress the asset files that are big and
+            compressible enough, see AssetCompressor, the replayer inflates
+            them when loading them
+    @param chunk_assets: Pack the assets splitting them in content-defined
+            chunks and storing each chunk once, see AssetPack
+    @param decompress_processes: Number of processes to decompress blocked
+            gzip traces with, None to use all the CPUs. These run alongside
+            the decode_processes, so raising both can oversubscribe the CPUs
     """
-    # Number of temporary variables that have been allocated, we need this
-    # so we don't generate a variable with the same name twice
-    num_allocated_vars = 0
-    allocated_assets = set()
-    # Asset filenames indexed by the hash of the contents
-    # This is used for asset file coalescing (point two different assets to the
-    # same file if they have the same contents)
-    allocated_asset_filenames = {}
-
     logger.info("Tracing file %s" % trace_filepath)
     logger.info("Output dir %s" % output_dir)
     logger.info("Assets dir %s" % assets_dir)
     logger.info("Tracing contexts %s" % gl_contexts_to_trace)
+    logger.info("Using trace index %s" % use_trace_index)
+    logger.info("Using message decoder %s" % message_decoder)
+    logger.info("Using decode processes %s" % decode_processes)
+    logger.info("Using decompress processes %s" % decompress_processes)
+    logger.info("Using read ahead %d" % read_ahead)
+    logger.info("Replaying frames %d to %s" % (start_frame, end_frame))
+    logger.info("Using lazy translations %s" % lazy_translations)
+    logger.info("Using asset store %s" % asset_store_dir)
+    logger.info("Packing assets %s" % pack_assets)
+    logger.info("Using asset writer threads %d" % asset_writer_threads)
+    logger.info("Compressing assets %s" % compress_assets)
+    logger.info("Chunking assets %s" % chunk_assets)
+
+    # Chunks are stored in the asset pack
+    pack_assets = pack_assets or chunk_assets
+
+    if ((asset_store_dir is not None) and pack_assets):
+        raise Exception("Asset store and asset packing can't be used together")
+    if (compress_assets and pack_assets):
+        raise Exception("Asset compression and asset packing can't be used together")
+    if ((end_frame is not None) and (end_frame < start_frame)):
+        raise Exception("End frame %d is before start frame %d" % (end_frame, start_frame))
 
     logger.info("Starting")
-    trace = utils.xopen(trace_filepath)
+    trace = utils.xopen(trace_filepath, processes = decompress_processes)
 
     # Every argument can be optionally translated using a translation table
     # Each translation table contains:
@@ -487,83 +2641,109 @@ def glparse(trace_filepath, output_dir, assets_dir, gl_contexts_to_trace):
 
     max_frame_count = sys.maxint
     ##max_frame_count = 250
+    if (end_frame is not None):
+        max_frame_count = end_frame + 1
     # This can be disabled to save ~5s of time
     # XXX This needs fixing so it doesn't use global tables with enums that gles2
     #     doesn't have
     use_human_friendly_gl_enums = True
 
-    # XXX Use min/max asset sizes for shaders?
-    # XXX Move many of these to parameters or a config object
-    use_assets_for_shaders = True
-
-    use_assets_for_floats = True
-    # Don't bother storing small floats in assets
-    min_float_asset_size_in_floats = 64
-    # Don't blow the stack if inlining floats
-    max_float_inlined_size_in_floats = 512
-
-    use_assets_for_ints = True
-    # Don't bother storing small ints in assets
-    min_int_asset_size_in_bytes = 256
-    # Don't blow the stack if inlining ints
-    max_int_inlined_size_in_bytes = 2048
-
     generate_empty_textures = False
     insert_glfinish_after_gl_functions = False
     insert_alog_after_gl_functions = False
+    translation_registry = None
+    translated_functions = set()
     if (use_human_friendly_gl_enums):
-        update_translation_machinery_from_xml(translation_tables, translation_lookups)
+        if (lazy_translations):
+            translation_registry = TranslationRegistry(use_cache = True)
+            translation_module = load_translation_module()
+            if (translation_module is not None):
+                translation_registry.update_from_module(translation_module)
+            translation_tables['global'].update(translation_registry.get_global())
+        elif (not update_translation_machinery_from_module(translation_tables,
+                                                           translation_lookups)):
+            update_translation_machinery_from_cache(translation_tables, translation_lookups)
 
     logger.info("Starting trace parsing")
 
     current_state = { 'program' : None, 'context' : None }
     frame_count = 0
-    function_enum_type = gltrace_pb2.GLMessage.DESCRIPTOR.enum_types_by_name['Function']
+    dispatch_table = build_dispatch_table(translation_insertions, translation_lookups)
     code = []
-    code_frames = [code]
-    global_decls = []
-
-    # XXX These should probably be in some state-dependent table so it gets
-    #     switched in and out (or in some framebuffer-dependent state?)
-    # Currently bound framebuffer
-    current_framebuffer = 0
-    # Current and max viewport state
-    current_viewport_x = 0
-    current_viewport_y = 0
-    current_viewport_width = 0
-    current_viewport_height = 0
-    max_viewport_width = 0
-    max_viewport_height = 0
-    # Current and max scissor state
-    current_scissor_x = 0
-    current_scissor_y = 0
-    current_scissor_width = 0
-    current_scissor_height = 0
-    max_scissor_width = 0
-    max_scissor_height = 0
-
-    while True:
-        buffer_length = trace.read(4)
-        if (buffer_length == ""):
-            break
-        buffer_length = struct.unpack('!i', buffer_length)[0]
-        logger.debug("unpacked %d bytes" % buffer_length)
-        buffer = trace.read(buffer_length)
-        try:
-            # The protobuff will be truncated if the app was terminated, etc
-            # ignore the exception
-            msg = gltrace_pb2.GLMessage.FromString(buffer)
-        except:
-            logger.warning("Decode error, truncated protobuff, trace will be incomplete")
-            break
-
+    if (code_writer is None):
+        code_writer = CodeWriter()
+        return_lines = True
+    else:
+        return_lines = False
+    global_decls = code_writer.global_decls
+
+    asset_writer = None
+    if (asset_writer_threads > 0):
+        asset_writer = AssetWriter(asset_writer_threads)
+    asset_store = None
+    if (asset_store_dir is not None):
+        asset_store = AssetStore(asset_store_dir, asset_writer)
+    asset_pack = None
+    if (pack_assets):
+        asset_pack = AssetPack(os.path.join(assets_dir, ASSET_PACK_FILENAME),
+                               chunk_assets)
+    asset_compressor = None
+    if (compress_assets):
+        asset_compressor = AssetCompressor()
+    state = ParseState(assets_dir, global_decls, generate_empty_textures,
+                       asset_store, asset_pack, asset_writer, asset_compressor)
+
+    if (use_trace_index):
+        trace_index = gltrace.load_trace_index(trace_filepath, decompress_processes)
+        logger.info("Trace has %d frames in the traced contexts" %
+                    gltrace.count_frames(trace_index, gl_contexts_to_trace))
+        messages = gltrace.iter_indexed_messages(trace, trace_index,
+                                                 gl_contexts_to_trace,
+                                                 block_size = read_block_size)
+    else:
+        # Drop the messages of ignored contexts before decoding them
+        messages = gltrace.iter_filtered_messages(
+            gltrace.iter_trace_messages(trace, read_block_size),
+            gl_contexts_to_trace)
+
+    if (start_frame > 0):
+        # Drop the messages not needed for setup before decoding them
+        messages = gltrace.iter_frame_window_messages(messages, start_frame,
+                                                      SETUP_SKIPPED_FUNCTIONS,
+                                                      SETUP_SKIPPED_DRAW_FUNCTIONS)
+
+    if (read_ahead > 0):
+        messages = gltrace.iter_read_ahead_messages(messages, read_ahead)
+
+    # The decoding will stop at the first truncated protobuff if the app was
+    # terminated, etc
+    decoded_messages = gldecode.iter_decoded_messages(messages, message_decoder,
+                                                      decode_processes)
+    msgs = decoded_messages
+    if (start_frame > 0):
+        # Drop the superseded messages before the start frame before generating
+        # their code and assets, the rest are replayed in the start frame
+        msgs = iter_setup_messages(decoded_messages, dispatch_table, start_frame,
+                                   message_decoder == "fast")
+        frame_count = start_frame
+    for msg in msgs:
         assert None is logger.debug("Found message %s" % msg)
 
-        function_name = function_enum_type.values_by_number[msg.function].name
+        dispatch = dispatch_table[msg.function]
+        function_name = dispatch.name
         function_string = function_name
 
         logger.debug("Found function %s" % function_name)
 
+        if ((translation_registry is not None) and
+            (function_name not in translated_functions)):
+            translated_functions.add(function_name)
+            update_translation_machinery_for_function(translation_registry,
+                                                      function_name,
+                                                      translation_tables,
+                                                      translation_lookups)
+            dispatch.lookup = translation_lookups.get(function_name, {})
+
         if ((gl_contexts_to_trace is not None) and (msg.context_id not in gl_contexts_to_trace)):
             logger.warning("Ignoring function %s for ignored context %d" %
                 (function_name, msg.context_id))
@@ -579,46 +2759,28 @@ def glparse(trace_filepath, output_dir, assets_dir, gl_contexts_to_trace):
             logger.info("Parsing frame %d" % frame_count)
             if (frame_count >= max_frame_count):
                 break
-            # Create a new code[] list and append a reference to it in the
-            # code_frames list. Future modifications of code[] will be reflected
-            # in code_frames[] automatically
+            # Write the frame and start a new code[] list, so only the code
+            # of the current frame is kept in memory
+            code_writer.write_frame(code)
             code = []
-            code_frames.append(code)
-            continue
-
-        if ((function_name in ["glVertexAttrib1fv",
-                               "glVertexAttrib2fv",
-                               "glVertexAttrib3fv",
-                               "glVertexAttrib4fv"]) and not msg.args[1].isArray):
-            # WAR: glVertexAttrib4fv doesn't provide data, ignore it
-            logger.warning("Ignoring glVertexAttribNv function as the trace doesn't provide the value")
-            logger.debug(msg)
             continue
 
-        if (function_name == "glGetActiveUniform"):
-            logger.warning("Ignoring glGetActiveUniform as the trace doesn't provide a pointer")
-            logger.debug(msg)
-            continue
-
-        if (function_name == "glDiscardFramebufferEXT"):
-            # WAR: glDiscardFrameBufferEXT doesn't provide the frambufferse to
-            #      discard, ignore
-            logger.warning("Ignoring glDiscardFrameBufferEXT as the trace doesn't provide the value")
-            logger.debug(msg)
-            continue
-
-        if ((function_name in ["glGetTexParameteriv", "glGetTexParameterfv"])):
-            # glGetTexParameterXX provides an int as destination instead of a pointer, ignore.
-            # XXX Is this an error in the capture or in glparse?
-            logger.warning("Ignoring glGetTexParameterXX function as the trace doesn't provide a pointer")
-            logger.debug(msg)
-            continue
-
-        if ((function_name in ["glGetVertexAttribfv"])):
-            # glGetVertexAttribfv(GL_CURRENT_VERTEX_ATTRIB, ) provides an int as destination instead of a pointer, ignore.
-            logger.warning("Ignoring glGetVertexAttribfv function as the trace doesn't provide a pointer")
-            logger.debug(msg)
-            continue
+        state.function_name = function_name
+        state.function_string = function_string
+        state.args_strings = args_strings
+        state.preamble_strings = preamble_strings
+        state.code = code
+
+        if (dispatch.fixups):
+            # Patch or ignore the message
+            ignore_message = False
+            for fixup in dispatch.fixups:
+                if (fixup(state, msg)):
+                    ignore_message = True
+                    break
+            if (ignore_message):
+                continue
+            function_string = state.function_string
 
         if (function_name == "eglMakeCurrent"):
             # First and only parameter is context index
@@ -657,8 +2819,8 @@ def glparse(trace_filepath, output_dir, assets_dir, gl_contexts_to_trace):
 
             logger.debug("Switched current uniforms to %s" % table_name)
 
-        translation_insertion = translation_insertions.get(function_name, {})
-        translation_lookup = translation_lookups.get(function_name, {})
+        translation_insertion = dispatch.insertion
+        translation_lookup = dispatch.lookup
 
         for arg_index, arg in enumerate(msg.args):
 
@@ -666,271 +2828,6 @@ def glparse(trace_filepath, output_dir, assets_dir, gl_contexts_to_trace):
             # only do it in debug
             assert None is logger.debug("Found arg %s" % str(arg))
 
-            # Patch wrong functions
-            # XXX Use function code rather than function name
-
-            if (function_name == "glBindFramebuffer"):
-                if (arg_index == 1):
-                    current_framebuffer = arg.intValue[0]
-                    # Always reset the viewport and scissor when switching
-                    # framebuffers, as it could have the scaled version set
-                    if (current_framebuffer == 0):
-                        code.append("glScaledViewport(%d, %d, %d, %d)" %
-                            (current_viewport_x,
-                             current_viewport_y,
-                             current_viewport_width,
-                             current_viewport_height))
-                        code.append("glScaledScissor(%d, %d, %d, %d)" %
-                            (current_scissor_x,
-                             current_scissor_y,
-                             current_scissor_width,
-                             current_scissor_height))
-                    else:
-                        code.append("glViewport(%d, %d, %d, %d)" %
-                            (current_viewport_x,
-                             current_viewport_y,
-                             current_viewport_width,
-                             current_viewport_height))
-                        code.append("glScissor(%d, %d, %d, %d)" %
-                            (current_scissor_x,
-                             current_scissor_y,
-                             current_scissor_width,
-                             current_scissor_height))
-
-            elif (function_name == "glViewport"):
-                # Collect the maximum viewport so it can be scaled when
-                # framebuffer 0 is bound
-                # XXX Optionally, this could scale all framebuffers, not just
-                #     framebuffer 0
-                if (arg_index == 0):
-                    current_viewport_x = arg.intValue[0]
-
-                elif (arg_index == 1):
-                    current_viewport_y = arg.intValue[0]
-
-                elif (arg_index == 2):
-                    current_viewport_width = arg.intValue[0]
-
-                elif (arg_index == 3):
-                    current_viewport_height = arg.intValue[0]
-                    # Use the first call as heuristic to framebuffer 0 width and
-                    # height
-                    # XXX Viewport size tracking should be smarter, it
-                    #     should track the viewport size just before rendering to
-                    #     framebuffer 0, not just when calling glViewport, but
-                    #     some apps may even use bigger viewport sizes when they
-                    #     do that, so it's not fail-proof
-                    # XXX A known offender is GTAVC, where the first viewport
-                    #     is not the full one. A later viewport inside the trace
-                    #     is full.
-                    if (max_viewport_height == 0):
-                        max_viewport_width = current_viewport_width
-                        max_viewport_height = current_viewport_height
-
-                    # We need to scale the viewport if rendering to framebuffer 0
-                    if (current_framebuffer == 0):
-                        function_string = "glScaledViewport"
-
-            elif (function_name == "glScissor"):
-                # Collect the maximum scissor so it can be scaled when
-                # framebuffer 0 is bound
-                # XXX Optionally, this could scale all framebuffers, not just
-                #     framebuffer 0
-                if (arg_index == 0):
-                    current_scissor_x = arg.intValue[0]
-
-                elif (arg_index == 1):
-                    current_scissor_y = arg.intValue[0]
-
-                elif (arg_index == 2):
-                    current_scissor_width = arg.intValue[0]
-
-                elif (arg_index == 3):
-                    current_scissor_height = arg.intValue[0]
-                    # Use the first call as heuristic to framebuffer 0 width and
-                    # height
-                    # XXX scissor size tracking should be smarter, it
-                    #     should track the scissor size just before rendering to
-                    #     framebuffer 0, not just when calling glScissor, but
-                    #     some apps may even use bigger scissor sizes when they
-                    #     do that, so it's not fail-proof
-                    if (max_scissor_height == 0):
-                        max_scissor_width = current_scissor_width
-                        max_scissor_height = current_scissor_height
-
-                    # We need to scale the scissor if rendering to framebuffer 0
-                    if (current_framebuffer == 0):
-                        function_string = "glScaledScissor"
-
-            elif (function_name == "glDisable"):
-                # Allow overriding dithering
-                if (arg.intValue[0] == 0x0BD0):
-                    function_string = "glOverriddenDisable"
-                    args_strings.append("param_DrawState_ptr_0")
-
-            elif (function_name == "glEnable"):
-                # Allow overriding dithering
-                if (arg.intValue[0] == 0x0BD0):
-                    function_string = "glOverriddenEnable"
-                    args_strings.append("param_DrawState_ptr_0")
-
-            elif ((function_name == "glGetVertexAttribiv") and (arg_index == 2)):
-                # XXX The trace sends intValue with isArray false
-                logger.debug("Patching function %s" % function_name)
-                arg.isArray = True
-
-            elif ((function_name == "glGetActiveUniform") and (arg_index == 7)):
-                # WAR: The trace sends an extra int with some index?
-                continue
-
-            elif ((function_name == "glGetActiveAttrib") and (arg_index == 7)):
-                # WAR: The trace sends an extra int with some index?
-                continue
-
-            elif ((function_name == "glDrawElements") and (arg_index == 3)):
-                if (not arg.isArray):
-                    # When using index buffers, the last parameter can be an offset
-                    # instead of an array of indices, convert to pointer to void
-                    # to prevent gcc warnings
-                    arg.type = gltrace_pb2.GLMessage.DataType.VOID
-
-            elif (function_name == "glGetFloatv"):
-                if (arg_index == 0):
-                    is_aliased_point_size_range = True
-                elif ((arg_index == 1) and (is_aliased_point_size_range)):
-                    # XXX The trace sends a single float array, but the spec says two
-                    #     elements
-                    is_aliased_point_size_range = False
-                    arg.floatValue.append(0.0)
-
-            elif ((function_name == "glGetShaderInfoLog") or
-                  (function_name == "glGetProgramInfoLog")):
-                # WAR: the two last glGetShader/ProgramInfoLog arguments in the
-                #      trace are ints instead array of int and array of char,
-                #      convert to those
-                if (arg_index == 1):
-                    # Store the max length for later
-                    get_shader_info_log_max_length = arg.intValue[0]
-                    logger.debug("Found shader_info_log_max_length %d" % get_shader_info_log_max_length)
-                if (arg_index == 2):
-                    # Convert to pointer to int
-                    logger.debug("WAR: glGetShaderPrecisionFormat arg %d" % arg_index)
-                    arg.isArray = True
-                elif (arg_index == 3):
-                    # Convert to pointer to char
-                    logger.debug("WAR: glGetShaderPrecisionFormat arg %d" % arg_index)
-                    arg.isArray = True
-                    arg.charValue.append("?" * get_shader_info_log_max_length)
-
-            elif (function_name == "glGetAttachedShaders"):
-                # WAR: The last two parameters are ints instead of pointers,
-                #      convert to those and set the count (second parametre) to 1,
-                #      since the result is not necessary and the trace doesn't
-                #      contain it
-                # XXX Alternatively we could get the size from the second argument
-                #     and create arrays of that size, but the result is not used
-                #     at replay time anyway so ignore it.
-                if (arg_index == 1):
-                    logger.debug("WAR: glGetAttachedShaders arg %d" % arg_index)
-                    arg.intValue[0] = 1
-
-                elif (arg_index == 2):
-                    logger.debug("WAR: glGetAttachedShaders arg %d" % arg_index)
-                    arg.isArray = True
-
-                elif (arg_index == 3):
-                    logger.debug("WAR: glGetAttachedShaders arg %d" % arg_index)
-                    arg.isArray = True
-
-            elif ((function_name == "glGetShaderPrecisionFormat")):
-                # WAR: The last two parameters should be pointers but the trace
-                #      makes them ints
-                if ((arg_index == 2) or (arg_index == 3)):
-                    logger.debug("WAR: glGetShaderPrecisionFormat arg %d" % arg_index)
-                    arg.isArray = True
-
-            elif ((function_name == "glInvalidateFramebuffer")):
-                # WAR: The last two parameters should be pointers but the trace
-                #      makes them ints
-                if (arg_index == 2):
-                    logger.debug("WAR: glInvalidateFramebuffer arg %d" % arg_index)
-                    arg.isArray = True
-
-            elif (function_name == "glGetVertexAttribPointerv"):
-                # WAR: the last parameter in the trace is an INT instead of a pointer
-                #      to pointer, convert to pointer to int
-                if (arg_index == 2):
-                    logger.debug("WAR: glGetVertexAttribPointerv arg %d" % arg_index)
-                    arg.isArray = True
-                    arg.type = gltrace_pb2.GLMessage.DataType.VOID
-
-            elif (function_name == "glVertexAttribPointer"):
-                # the last parameter in the trace is an INT instead of a pointer,
-                # convert to pointer
-                if (arg_index == 5):
-                    arg.type = gltrace_pb2.GLMessage.DataType.VOID
-
-            elif (function_name == "glShaderSource"):
-                # The trace uses CHAR array, remove the array as a special case
-                # to signify that it's an array of char arrays
-                if (arg_index == 2):
-                    arg.isArray = False
-
-                # Always set the length pointer to zero, as we don't need it
-                # and passing random pointers causes errors otherwise
-                if (arg_index == 3):
-                    if (len(arg.intValue) > 0):
-                        arg.intValue[0] = 0
-                    else:
-                        arg.int64Value[0] = 0
-
-            elif (function_name == "glVertexAttribPointerData"):
-                # The C function only understands a few types, make sure we catch
-                # this issue at trace generation time
-                if ((arg_index == 2) and
-                    # GL_BYTE, GL_UNSIGNED_BYTE, GL_SHORT, GL_UNSIGNED_SHORT, GL_FIXED, GL_FLOAT
-                    (arg.intValue[0] not in [0x1400, 0x1401, 0x1402, 0x1403, 0x140C, 0x1406])):
-                    raise Exception("Unhandled type 0x%x in message %s" % (arg.intValue[0], msg))
-
-            elif ((function_name == "glTexParameteri") and (arg_index == 2)):
-                # glTexParameteri has an INT as last parameter but in real life
-                # it's always an ENUM
-                # Switch to ENUM so it gets translated
-                arg.type = gltrace_pb2.GLMessage.DataType.ENUM
-
-            elif  (((function_name == "glTexImage2D") and (arg_index == 8)) or
-                   ((function_name == "glTexSubImage2D") and (arg_index == 8)) or
-                   ((function_name == "glTexImage3D") and (arg_index == 9)) or
-                   ((function_name == "glTexSubImage3D") and (arg_index == 10)) or
-                   ((function_name == "glCompressedTexImage2D") and (arg_index == 7)) or
-                   ((function_name == "glCompressedTexSubImage2D") and (arg_index == 8))):
-
-                # If the trace contains pointers instead of rawBytes, it means
-                # the trace was generated without texture data, force all textures
-                # to empty to prevent access violations when accessing stale pointers
-                if ((not generate_empty_textures) and
-                    ((len(arg.rawBytes) == 0) and (
-                        ((len(arg.intValue) > 0) and (arg.intValue[0] != 0)) or
-                        ((len(arg.int64Value) > 0) and (arg.int64Value[0] != 0))))
-                     ):
-                    logger.warning("Trace doesn't contain texture data for %s, forcing texture to empty" %
-                        function_name)
-                    logger.debug(msg)
-                    # Don't just set generate_empty_textures, as some traces have
-                    # normal texture data but not compressed data
-                    arg.type = gltrace_pb2.GLMessage.DataType.VOID
-                    arg.isArray = False
-                    if (len(arg.int64Value) != 0):
-                        arg.int64Value[0] = 0
-                    else:
-                        arg.intValue[0] = 0
-
-                if (generate_empty_textures):
-                    # Set the texture pointer to NULL
-                    arg.type = gltrace_pb2.GLMessage.DataType.VOID
-                    arg.isArray = False
-                    arg.intValue[0] = 0
-
             # Do argument translation lookup if necessary
             lookup = translation_lookup.get(arg_index, None)
             translated_value = None
@@ -980,11 +2877,11 @@ def glparse(trace_filepath, output_dir, assets_dir, gl_contexts_to_trace):
                         # Create a temporary variable to hold all the translations
                         # and use that one
                         # XXX Check type
-                        var_name = "local_GLuint_ptr_%d" % num_allocated_vars
+                        var_name = "local_GLuint_ptr_%d" % state.num_allocated_vars
                         preamble_strings.append("GLuint %s[] = { %s }" % (
                             var_name,
                             string.join(translated_values, ", ")))
-                        num_allocated_vars += 1
+                        state.num_allocated_vars += 1
                         translated_value = var_name
 
             # Fall-back to the global enums for untranslated enums
@@ -999,284 +2896,12 @@ def glparse(trace_filepath, output_dir, assets_dir, gl_contexts_to_trace):
                 translation_table = translation_tables['global']
                 translated_value = translation_table.get(arg.intValue[0], None)
 
-            # Keep in order, some options have higher priority than others
-
-            # When all of intValue, charValue and isArray are set, a pointer is
-            # passed in with existing char contents
-            # This is used for glShaderSource, glPushGroupMarker, etc
-
-            # When all of intValue, floatValue and isArray are set, a pointer is
-            # passed in with existing float contents
-            # This is used for glUniformMatrix4fv, etc
-            # This is also used for glGetFloatv, etc so it cannot be declared
-            # const
-            if ((len(arg.floatValue) > 0) and (arg.isArray)):
-                if ((use_assets_for_floats and
-                    (len(arg.floatValue) > min_float_asset_size_in_floats)) or
-                    (len(arg.floatValue) > max_float_inlined_size_in_floats)):
-                    arg_name = "global_float_ptr_F"
-                    asset_filename = "float_asset_%d" % num_allocated_vars
-
-                    # Allocate one asset specifically for floats, since the pointer
-                    # variable declaration is keyed off the asset variable name
-
-                    preamble_strings.extend(allocate_asset(allocated_assets,
-                                                           allocated_asset_filenames,
-                                                           assets_dir,
-                                                           arg_name,
-                                                           asset_filename,
-                                                           "float*",
-                                                           "global_AAsset_ptr_F",
-                                                           string.join([struct.pack("f", f) for f in arg.floatValue],""),
-                                                           global_decls))
-
-                else:
-                    # XXX Change this to use the global pointer?
-                    arg_name = "local_float_ptr_%d" % num_allocated_vars
-                    preamble_strings.append("float %s[] = { %s }" % (
-                        arg_name,
-                        string.join([str(f) for f in arg.floatValue], ", ")))
-
-                args_strings.append(arg_name)
-                num_allocated_vars += 1
-
-            # When rawbytes is set, initialized data is passed in
-            # (glTexSubImage2D, glTexImage2D with BYTE, glBufferData with VOID, etc)
-            # Note isArray is set to False above when NULLing textures, so ignore
-            # those
-            elif ((len(arg.rawBytes) > 0) and (arg.isArray)):
-                if ((use_assets_for_ints and
-                    (len(arg.rawBytes[0]) > min_int_asset_size_in_bytes)) or
-                    (len(arg.rawBytes[0]) > max_int_inlined_size_in_bytes)):
-                    asset_filename = "int_asset_%d" % num_allocated_vars
-
-                    if (function_name == "glVertexAttribPointerData"):
-                        arg_name = "global_const_unsigned_int_ptr_%d" % msg.args[0].intValue[0]
-
-                        preamble_strings.extend(allocate_asset(allocated_assets,
-                                                               allocated_asset_filenames,
-                                                               assets_dir,
-                                                               arg_name,
-                                                               asset_filename,
-                                                               "const unsigned int*",
-                                                               "global_AAsset_ptr_%d" % msg.args[0].intValue[0],
-                                                               arg.rawBytes[0],
-                                                               global_decls))
-                        # The asset will be freed when it's allocated again with
-                        # that name
-                        # XXX Need to free the assets at the end of the trace
-                    else:
-                        arg_name = "global_const_unsigned_int_ptr_I"
-                        # Allocate one asset specifically for ints, since the pointer
-                        # variable declaration is keyed off the asset variable name
-                        preamble_strings.extend(allocate_asset(allocated_assets,
-                                                               allocated_asset_filenames,
-                                                               assets_dir,
-                                                               arg_name,
-                                                               asset_filename,
-                                                               "const unsigned int*",
-                                                               "global_AAsset_ptr_I",
-                                                               arg.rawBytes[0],
-                                                               global_decls))
-                        # This is a short-lived asset only used in this GL call, could
-                        # be freed after the call, but that complicates the asset
-                        # variable declaration, so we just free it the next time
-                        # an asset with this name is allocated
-                else:
-                    # XXX Change this to use the global pointer?
-                    arg_name = "local_const_char_ptr_%d" % num_allocated_vars
-                    preamble_strings.append("const char %s[%d] = { %s }" % (
-                        arg_name,
-                        len(arg.rawBytes[0]),
-                        string.join([hex(ord(b)) for b in arg.rawBytes[0]], ", ")))
-
-                args_strings.append(arg_name)
-                num_allocated_vars += 1
-
-            # When isArray is set, the parameter is passed by reference and
-            # contains a return value, which is held in the xxxValue part
-            # Those need to be stored in variables in case they are used
-            # in the future
-            # One special case is glDrawElements, where an array is passed in,
-            # but with values already
-            # XXX We actually don't need to initialize the arrays passed by reference
-            #     can we tell the difference between glGenTextures and glDrawElements?
-            # Note booleans have both len(intValue) and len(boolValue) greater
-            # than zero
-            # Note translated array values (eg glDeleteTextures) have already
-            # been put into a single array variable, so they don't need to be
-            # redeclared here
-            elif ((arg.isArray) and (translated_value is None) and
-                      ((len(arg.intValue) > 0) or (len(arg.boolValue) > 0) or
-                       (len(arg.charValue) > 0) or (len(arg.int64Value) > 0))):
-
-                # XXX Missing initializers for all but charvalue?
-                if (len(arg.boolValue) > 0):
-                    var_name = "local_boolean_ptr_%d" % num_allocated_vars
-                    preamble_strings.append("GLboolean %s[%d]" % (var_name , len(arg.boolValue)))
-                elif (len(arg.charValue) > 0):
-                    var_name = "local_char_ptr_%d" % num_allocated_vars
-                    if ("\n" in arg.charValue[0]):
-                        initializer = '"\\\n  %s\\n"' % arg.charValue[0].replace("\n", "\\\n  ")
-                    else:
-                        initializer = '"%s"' % arg.charValue[0]
-                    preamble_strings.append("GLchar %s[] = %s" % (var_name, initializer))
-                elif ((len(arg.intValue) > 0) or (len(arg.int64Value) > 0)):
-                    if (len(arg.intValue) > 0):
-                        argIntValue = arg.intValue
-                    else:
-                        argIntValue = arg.int64Value
-                    if (arg.type == gltrace_pb2.GLMessage.DataType.VOID):
-                        var_name = "local_void_ptr_%d" % num_allocated_vars
-                        # the parser patches some pointers to void from INTs to
-                        # VOID
-                        preamble_strings.append("GLvoid* %s[1]" % var_name)
-                    else:
-                        # This is used for generating texture ids, buffer ids, etc,
-                        # so it needs to preserve the data across invocations,
-                        # store in global variables
-                        # XXX Where else is static needed?
-                        # XXX This is not true for cases like glGetProgram/ShaderInfoLog
-                        #     probably others?
-                        # Remove the local prefix
-                        var_name = "global_unsigned_int_ptr_%d" % num_allocated_vars
-                        var_type = "GLuint"
-                        var_size = 4
-                        pack_type = "I"
-                        # glDrawElements can use different element sizes, use
-                        # the proper type
-                        # XXX Is there any other function with different int sizes?
-                        if (function_name == "glDrawElements"):
-
-                            # GL_UNSIGNED_SHORT 0x1403
-                            if (msg.args[2].intValue[0] == 0x1403):
-                                var_size = 2
-                                var_type = "GLushort"
-                                var_name = "global_GLushort_ptr_%d" % num_allocated_vars
-                                pack_type = "H"
-
-                            # GL_UNSIGNED_BYTE 0x1401
-                            elif (msg.args[2].intValue[0] == 0x1401):
-                                var_type = "GLubyte"
-                                var_name = "global_GLubyte_ptr_%d" % num_allocated_vars
-                                var_size = 1
-                                pack_type = "B"
-
-                            else:
-                                raise Exception("unhandled glDrawElements element type 0x%x" % msg.args[2].intValue[0])
-
-                        var_size *= len(argIntValue)
-
-                        # Using assets is specially important in the case of
-                        # glDrawElements, although is not special-cased here,
-                        # it will use whatever min/max check is done on integer
-                        # assets
-                        if ((use_assets_for_ints and
-                            (var_size > min_int_asset_size_in_bytes)) or
-                            (var_size > max_int_inlined_size_in_bytes)):
-                            # Store in a short-lived asset if for glDrawElements index
-                            # buffer and above the minimum asset size
-                            var_name = "global_const_unsigned_int_ptr_I"
-                            asset_filename = "int_asset_%d" % num_allocated_vars
-                            # Allocate one asset specifically for ints, since the pointer
-                            # variable declaration is keyed off the asset variable name
-                            preamble_strings.extend(allocate_asset(allocated_assets,
-                                                                   allocated_asset_filenames,
-                                                                   assets_dir,
-                                                                   var_name,
-                                                                   asset_filename,
-                                                                   "const %s*" % var_type,
-                                                                   "global_AAsset_ptr_I",
-                                                                   string.join([struct.pack(pack_type, i) for i in argIntValue],""),
-                                                                   global_decls))
-                            # This is a short-lived asset only used in this GL call, could
-                            # be freed after the call, but that complicates the asset
-                            # variable declaration, so we just free it the next time
-                            # an asset with this name is allocated
-
-                        else:
-                            # XXX This can be moved to a local for glDrawElements
-                            #     only, but would that make things harder for the
-                            #     inliner?
-                            global_decls.append("static %s %s[%d] = {%s}" %
-                                        (var_type, var_name , len(argIntValue),
-                                         string.join([str(i) for i in argIntValue], ", ")))
-                args_strings.append(var_name)
-                num_allocated_vars += 1
-
-            elif ((arg.isArray) and (translated_value is None)):
-                raise Exception("unhandled array argument %s for %s" % (arg, msg))
-
-            elif (len(arg.charValue) > 0):
-                # charValue with isArray set to false is only used for the
-                # special case of glSetShaderSource, in which case we need
-                # a pointer to pointer to const chars (const qualifier is not
-                # ignored across pointers)
-                if (use_assets_for_shaders):
-                    asset_filename = "char_asset_%d" % num_allocated_vars
-                    arg_name = "global_const_char_ptr_C"
-                    # Allocate one asset specifically for chars, since the pointer
-                    # variable declaration is keyed off the asset variable name
-                    # Note we zero-terminate the string as required by
-                    # glSetShaderSource when length is NULL
-                    preamble_strings.extend(allocate_asset(allocated_assets,
-                                                           allocated_asset_filenames,
-                                                           assets_dir,
-                                                           arg_name,
-                                                           asset_filename,
-                                                           "GLchar const *",
-                                                           "global_AAsset_ptr_C",
-                                                           arg.charValue[0] + "\0",
-                                                           global_decls))
-                    # glSetShaderSource requires a pointer to pointer
-                    arg_name = "&%s" % arg_name
-                else:
-                    # XXX Change this to use the global pointer?
-                    arg_name = "local_char_ptr_%d" % num_allocated_vars
-                    if ("\n" in arg.charValue[0]):
-                        initializer = '"\\\n  %s\\n"' % arg.charValue[0].replace("\n", "\\n\\\n  ")
-                    else:
-                        initializer = '"%s"' % arg.charValue[0]
-
-                    preamble_strings.append("const GLchar* %s[] = {%s} " % (
-                        arg_name,
-                        initializer))
-
-                args_strings.append(arg_name)
-                num_allocated_vars += 1
-
-            elif (len(arg.int64Value) > 0):
-                if (translated_value is not None):
-                    args_strings.append(str(translated_value))
-                else:
-                    args_strings.append("(GLvoid*) 0x%x" % ctypes.c_uint32(arg.int64Value[0]).value)
-
-            elif (len(arg.intValue) > 0):
-                # XXX Don't hard-code this only to intValues
-                if (translated_value is not None):
-                    args_strings.append(str(translated_value))
-                else:
-                    if (arg.type == gltrace_pb2.GLMessage.DataType.ENUM):
-                        args_strings.append(hex(arg.intValue[0]))
-                    elif (arg.type == gltrace_pb2.GLMessage.DataType.VOID):
-                        args_strings.append("(GLvoid*) 0x%x" % ctypes.c_uint32(arg.intValue[0]).value)
-                    else:
-                        args_strings.append(str(arg.intValue[0]))
-
-            elif (len(arg.floatValue) > 0):
-                args_strings.append(str(arg.floatValue[0]))
-
-            elif (len(arg.boolValue) > 0):
-                if (translated_value is not None):
-                    args_strings.append(str(translated_value))
-                else:
-                    if (arg.boolValue[0]):
-                        args_strings.append("GL_TRUE")
-                    else:
-                        args_strings.append("GL_FALSE")
-
+            if (arg.isArray):
+                formatter = get_arg_formatter(arg, translated_value)
             else:
-                raise Exception("unhandled argument %s" % arg)
+                formatter = SCALAR_ARG_FORMATTERS[arg.type]
+            arg_string = formatter(state, msg, arg, translated_value)
+            args_strings.append(arg_string)
 
             # Insert in the translation if necessary
             insertion = translation_insertion.get(arg_index, None)
@@ -1301,7 +2926,7 @@ def glparse(trace_filepath, output_dir, assets_dir, gl_contexts_to_trace):
                 values = getattr(arg, field_name)
 
                 for value_index, value in enumerate(values):
-                    table[value] = "%s[%d]" % (var_name, value_index)
+                    table[value] = "%s[%d]" % (arg_string, value_index)
                     logger.debug("Updated table %s entry %d to value %s" %
                         (table_name, value, table[value]))
 
@@ -1334,7 +2959,7 @@ def glparse(trace_filepath, output_dir, assets_dir, gl_contexts_to_trace):
             #      it in the second parameter
             if (function_name == "eglCreateContext"):
                 values = msg.args[1].intValue
-                var_name = "global_EGLContext_%d" % num_allocated_vars
+                var_name = "global_EGLContext_%d" % state.num_allocated_vars
                 var_decl = "static EGLContext %s" % var_name
                 args_strings = ["param_DrawState_ptr_0"]
 
@@ -1342,13 +2967,13 @@ def glparse(trace_filepath, output_dir, assets_dir, gl_contexts_to_trace):
 
                 values = getattr(msg.returnValue, field_name)
                 # Create a new variable to hold the return value
-                var_name = "global_unsigned_int_%d" % num_allocated_vars
+                var_name = "global_unsigned_int_%d" % state.num_allocated_vars
                 var_decl = "static unsigned int %s" % var_name
 
             # We only expect one value being returned
             assert(len(values) == 1)
             value = values[0]
-            num_allocated_vars += 1
+            state.num_allocated_vars += 1
             global_decls.append(var_decl)
 
             table[value] = var_name
@@ -1376,12 +3001,32 @@ def glparse(trace_filepath, output_dir, assets_dir, gl_contexts_to_trace):
             ## print "if (draw_count == draw_limit) { return; }"
             pass
 
+    # Stop the decoding processes and the read-ahead thread before closing the
+    # trace, decoding may have stopped before reaching the end of the trace
+    msgs.close()
+    decoded_messages.close()
+    messages.close()
+    trace.close()
+
+    if (translation_registry is not None):
+        translation_registry.save()
+
+    if (asset_store is not None):
+        asset_store.export(assets_dir)
+    if (asset_writer is not None):
+        asset_writer.close()
+    if (asset_compressor is not None):
+        for line in asset_compressor.get_report_lines():
+            logger.info(line)
+    if (asset_pack is not None):
+        asset_pack.close()
+
     logger.info("Writing code")
 
     # Generate some global declarations only known at trace end time
     # Note some traces don't have scissor calls, so always use the maximum of both
-    egl_width = max(max_viewport_width, max_scissor_width)
-    egl_height = max(max_viewport_height, max_scissor_height)
+    egl_width = max(state.max_viewport_width, state.max_scissor_width)
+    egl_height = max(state.max_viewport_height, state.max_scissor_height)
     global_decls.append("static const GLsizei max_viewport_width  = %d" % egl_width)
     global_decls.append("static const GLsizei max_viewport_height = %d" % egl_height)
     global_decls.append("static const GLsizei max_scissor_width  = %d" % egl_width)
@@ -1391,39 +3036,13 @@ def glparse(trace_filepath, output_dir, assets_dir, gl_contexts_to_trace):
     global_decls.append("int egl_height = %d" % egl_height)
     global_decls.append("GLenum gl_error = 0")
 
-    # Generate the global declarations
-    lines = []
-    for decl in global_decls:
-        lines.append("%s;" % decl)
-    lines.append("")
-
-    # Generate each frame
-    for (frame_count, code) in enumerate(code_frames):
-        lines.append("void frame%s(DrawState* param_DrawState_ptr_0)" % frame_count)
-        lines.append("{")
-        for line in code:
-            lines.append("    %s;" % line)
-        lines.append("}")
-
-    # Generate the code that calls each frame
-    lines.append("void draw(DrawState* param_DrawState_ptr_0)")
-    lines.append("{")
-    lines.append("    switch (param_DrawState_ptr_0->frame_limit)")
-    lines.append("    {")
-    for frame_index in xrange(len(code_frames)):
-        lines.append("        case %d: " % frame_index)
-        lines.append("            frame%d(param_DrawState_ptr_0);" % frame_index)
-        lines.append("        break;")
-    lines.append("        default: ")
-    lines.append('            LOGI("Reached frame %d end of replay, exiting", param_DrawState_ptr_0->frame_limit);')
-    lines.append('            exit(EXIT_SUCCESS);')
-    lines.append("    }")
-    lines.append("}")
-    lines.append("")
+    code_writer.write_frame(code)
+    code_writer.close()
 
     logger.info("Done")
 
-    return lines
+    if (return_lines):
+        return code_writer.lines
 
 if (__name__ == "__main__"): # pragma: no cover
     ## trace_filepath = "_out/bmk_hw_layer_use_color_hw_layer.gltrace.gz"
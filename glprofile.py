@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+
+# Copyright 2014 Antonio Tejada
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""!
+Report where the traced app spent its GL time, using the start_time, duration
+(wall time) and threadtime (thread CPU time) recorded in every GLMessage.
+
+The report has the time per function and per frame, the most expensive calls
+and the calls whose wall time is much bigger than their CPU time, which are
+likely to be waiting on the driver or the GPU.
+
+It can also write a collapsed stack file ("context;frame;function value" per
+line) to be rendered with flamegraph tools.
+
+Use as a tool with
+    glprofile.py profile --trace-filepath=foo.gltrace.gz --collapsed-filepath=foo.collapsed
+"""
+
+import collections
+import heapq
+import json
+import logging
+import string
+
+import gltrace
+from gltrace import gltrace_pb2
+import utils
+
+logger = logging.getLogger(__name__)
+
+# Number of most expensive calls and stall suspects to report
+TOP_CALLS = 20
+
+# Calls whose wall time is this many times their thread time are reported as
+# possible driver stalls
+STALL_RATIO = 4.0
+
+# Minimum wall time of a call to be reported as possible stall, in nanoseconds
+STALL_MIN_DURATION = 1000000
+
+CallTimes = collections.namedtuple("CallTimes",
+                                   ["frame", "index", "context_id", "function",
+                                    "duration", "threadtime"])
+
+def get_function_name(function):
+    value = gltrace_pb2.GLMessage.DESCRIPTOR.enum_types_by_name['Function'].values_by_number.get(function)
+    if (value is None):
+        return "function_%d" % function
+    return value.name
+
+def profile_trace(trace_filepath, contexts = None, first_frame = 0,
+                  last_frame = None, top_calls = TOP_CALLS,
+                  stall_ratio = STALL_RATIO,
+                  stall_min_duration = STALL_MIN_DURATION,
+                  collapsed_metric = "threadtime", processes = 1):
+    """!
+    Scan a trace and return a dict with its GL time profile.
+
+    Only the scalar fields of the messages are read, the args are skipped
+    without decoding them.
+
+    Frames end at the eglSwapBuffers of the profiled contexts, times are in
+    nanoseconds.
+
+    @param contexts: list of context ids to profile, None for all
+    @param first_frame: first frame to profile
+    @param last_frame: last frame to profile (inclusive), None for all
+    @param top_calls: number of most expensive calls and stall suspects to
+           return
+    @param stall_ratio: ratio of wall time to thread time above which a call is
+           a stall suspect
+    @param stall_min_duration: minimum wall time for a call to be a stall
+           suspect
+    @param collapsed_metric: "duration" or "threadtime", time to aggregate in
+           the collapsed stacks
+    @param processes: number of processes to decompress blocked gzip traces
+           with, None to use all the CPUs
+    """
+    if (collapsed_metric not in ["duration", "threadtime"]):
+        raise Exception("Unknown collapsed stack metric %s" % collapsed_metric)
+
+    logger.info("Profiling trace %s" % trace_filepath)
+
+    # Per function [calls, duration, threadtime, max duration]
+    functions = {}
+    frames = []
+    collapsed = collections.Counter()
+    # Min-heaps with the top_calls biggest, the key goes first in the tuples
+    top_duration_calls = []
+    top_stall_calls = []
+
+    frame = 0
+    frame_times = None
+    message_index = -1
+    with utils.xopen(trace_filepath, processes = processes) as trace:
+        for buffer in gltrace.iter_trace_messages(trace):
+            message_index += 1
+            times = gltrace.peek_message_times(buffer)
+            if (times is None):
+                logger.warning("Decode error, truncated protobuff, profile will be incomplete")
+                break
+
+            if ((contexts is not None) and (times.context_id not in contexts)):
+                continue
+
+            if ((last_frame is not None) and (frame > last_frame)):
+                break
+
+            if (frame >= first_frame):
+                if (frame_times is None):
+                    frame_times = { "frame" : frame, "calls" : 0, "duration" : 0,
+                                    "threadtime" : 0,
+                                    "start_time" : times.start_time,
+                                    "end_time" : times.start_time }
+                frame_times["calls"] += 1
+                frame_times["duration"] += times.duration
+                frame_times["threadtime"] += times.threadtime
+                frame_times["end_time"] = times.start_time + times.duration
+
+                try:
+                    function_times = functions[times.function]
+                except KeyError:
+                    function_times = [0, 0, 0, 0]
+                    functions[times.function] = function_times
+                function_times[0] += 1
+                function_times[1] += times.duration
+                function_times[2] += times.threadtime
+                function_times[3] = max(function_times[3], times.duration)
+
+                call = CallTimes(frame, message_index, times.context_id,
+                                 times.function, times.duration, times.threadtime)
+                if (len(top_duration_calls) < top_calls):
+                    heapq.heappush(top_duration_calls, (times.duration, call))
+                elif (times.duration > top_duration_calls[0][0]):
+                    heapq.heapreplace(top_duration_calls, (times.duration, call))
+
+                if ((times.duration >= stall_min_duration) and
+                    (times.duration > stall_ratio * times.threadtime)):
+                    stall = times.duration - times.threadtime
+                    if (len(top_stall_calls) < top_calls):
+                        heapq.heappush(top_stall_calls, (stall, call))
+                    elif (stall > top_stall_calls[0][0]):
+                        heapq.heapreplace(top_stall_calls, (stall, call))
+
+                collapsed[(times.context_id, frame, times.function)] += getattr(times, collapsed_metric)
+
+            if (times.function == gltrace.EGL_SWAP_BUFFERS):
+                if (frame_times is not None):
+                    frames.append(frame_times)
+                    frame_times = None
+                frame += 1
+
+    if (frame_times is not None):
+        frames.append(frame_times)
+
+    def get_call_dict(call):
+        call = call._asdict()
+        call["function"] = get_function_name(call["function"])
+        return call
+
+    profile = {
+        "trace" : trace_filepath,
+        "functions" : dict([(get_function_name(function),
+                             { "calls" : calls, "duration" : duration,
+                               "threadtime" : threadtime,
+                               "max_duration" : max_duration })
+                            for (function, (calls, duration, threadtime, max_duration))
+                            in functions.iteritems()]),
+        "frames" : frames,
+        "top_calls" : [get_call_dict(call) for (key, call) in
+                       sorted(top_duration_calls, reverse = True)],
+        "stalls" : [get_call_dict(call) for (key, call) in
+                    sorted(top_stall_calls, reverse = True)],
+        "collapsed" : dict([("context_%d;frame_%d;%s" % (context_id, frame,
+                                                         get_function_name(function)),
+                             value) for ((context_id, frame, function), value)
+                            in collapsed.iteritems()]),
+    }
+
+    logger.info("Profiled %d frames" % len(frames))
+
+    return profile
+
+def format_profile(profile, per_frame = True):
+    """!
+    Return the lines of the text version of a profile returned by
+    profile_trace
+    """
+    def format_time(ns):
+        return "%.3f" % (ns / 1000000.0)
+
+    def format_call(call):
+        return "frame %5d message %8d context %d %-32s %12s %12s" % (
+            call["frame"], call["index"], call["context_id"], call["function"],
+            format_time(call["duration"]), format_time(call["threadtime"]))
+
+    lines = ["trace %s" % profile["trace"]]
+    lines.append("total wall ms %s, thread ms %s, %d frames" % (
+        format_time(sum([frame["duration"] for frame in profile["frames"]])),
+        format_time(sum([frame["threadtime"] for frame in profile["frames"]])),
+        len(profile["frames"])))
+
+    lines.append("functions by wall time:")
+    lines.append("    %-40s %8s %12s %12s %12s" % ("function", "calls", "wall ms",
+                                                   "thread ms", "max wall ms"))
+    for (function, times) in sorted(profile["functions"].iteritems(),
+                                    key = lambda item: (-item[1]["duration"], item[0])):
+        lines.append("    %-40s %8d %12s %12s %12s" % (
+            function, times["calls"], format_time(times["duration"]),
+            format_time(times["threadtime"]), format_time(times["max_duration"])))
+
+    lines.append("most expensive calls (wall ms, thread ms):")
+    lines.extend(["    " + format_call(call) for call in profile["top_calls"]])
+
+    lines.append("driver stall suspects (wall ms, thread ms):")
+    lines.extend(["    " + format_call(call) for call in profile["stalls"]])
+
+    if (per_frame):
+        lines.append("frames:")
+        lines.append("    %5s %8s %12s %12s %12s" % ("frame", "calls", "wall ms",
+                                                    "thread ms", "span ms"))
+        for frame in profile["frames"]:
+            lines.append("    %5d %8d %12s %12s %12s" % (
+                frame["frame"], frame["calls"], format_time(frame["duration"]),
+                format_time(frame["threadtime"]),
+                format_time(frame["end_time"] - frame["start_time"])))
+
+    return lines
+
+def write_collapsed_stacks(collapsed_filepath, profile):
+    """!
+    Write the collapsed stacks of a profile, one "stack value" line per stack
+    with the value in microseconds, as expected by flamegraph.pl
+    """
+    with open(collapsed_filepath, "w") as f:
+        for (stack, value) in sorted(profile["collapsed"].iteritems()):
+            f.write("%s %d\n" % (stack, value / 1000))
+
+def profile_command(trace_filepath = "_out/test.gltrace.gz", contexts = None,
+                    first_frame = 0, last_frame = None, top_calls = TOP_CALLS,
+                    output_format = "text", per_frame = False,
+                    collapsed_filepath = None, collapsed_metric = "threadtime"):
+    """
+    Print the GL time spent by the traced app per function and per frame, the
+    most expensive calls and the likely driver stalls.
+
+    :param trace_filepath: Path to the OpenGL ES trace file
+    :param contexts: String with comma-separated numbers of the 0-based
+                     OpenGL ES contexts to profile
+    :param first_frame: First frame to profile
+    :param last_frame: Last frame to profile (inclusive)
+    :param top_calls: Number of most expensive calls and stall suspects to print
+    :param output_format: "text" or "json"
+    :param per_frame: Print the times of every frame in text format
+    :param collapsed_filepath: Path of the collapsed stack file to write for
+                               flamegraph tools
+    :param collapsed_metric: Time to use in the collapsed stacks, "duration"
+                             (wall time) or "threadtime" (CPU time)
+    """
+    if (contexts is not None):
+        contexts = [int(item) for item in str(contexts).split(",")]
+    if (last_frame is not None):
+        last_frame = int(last_frame)
+
+    profile = profile_trace(trace_filepath, contexts, int(first_frame), last_frame,
+                            int(top_calls), collapsed_metric = collapsed_metric)
+
+    if (collapsed_filepath is not None):
+        write_collapsed_stacks(collapsed_filepath, profile)
+
+    if (output_format == "json"):
+        print json.dumps(profile, indent = 4, sort_keys = True)
+    elif (output_format == "text"):
+        for line in format_profile(profile, per_frame):
+            print line
+    else:
+        raise Exception("Unknown output format %s" % output_format)
+
+if (__name__ == "__main__"): # pragma: no cover
+    import scriptine
+
+    logging_format = "%(asctime).23s %(levelname)s:%(filename)s(%(lineno)d) [%(thread)d]: %(message)s"
+    logger_handler = logging.StreamHandler()
+    logger_handler.setFormatter(logging.Formatter(logging_format))
+    logger.addHandler(logger_handler)
+    logger.setLevel(logging.INFO)
+
+    scriptine.run()
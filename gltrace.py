@@ -0,0 +1,853 @@
+#!/usr/bin/env python
+
+# Copyright 2014 Antonio Tejada
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""!
+Helpers to read, write and index .gltrace files.
+
+A .gltrace file is a sequence of GLMessage protobufs, each one prefixed by its
+length as a 4-byte network order integer.
+
+The index is a sidecar file next to the trace (foo.gltrace.idx for
+foo.gltrace) with one fixed-size record per message, so tools can count frames,
+filter contexts and jump to a given frame without decoding the protobufs.
+Use as a tool with
+    gltrace.py index --trace-filepath=foo.gltrace.gz
+    gltrace.py convert --trace-filepath=foo.gltrace.gz --output-filepath=foo.gltrace.bgz
+    gltrace.py summary --trace-filepath=foo.gltrace.gz --output-format=json
+"""
+
+import collections
+import itertools
+import json
+import logging
+import os
+import Queue
+import string
+import struct
+import sys
+import threading
+
+logger = logging.getLogger(__name__)
+
+PROTOBUFF_DIR = "external/google"
+sys.path.append(os.path.join(sys.path[0],PROTOBUFF_DIR))
+# XXX This is so when invoked from the test dir it can find the protobuf, fix
+#     in a more elgant way
+sys.path.append(os.path.join(sys.path[0],"..", PROTOBUFF_DIR))
+try:
+    import gltrace_pb2
+except ImportError as error:
+    logger.error(error)
+    logger.error("Protobuf Python package not found (install with 'pip protobuf') or "
+                 "the protobuff gltrace Python module %s/gltrace_pb2.py doesn't exist, "
+                 "generate it with\n"
+                 "  %s/protoc %s/gltrace.proto --python_out=%s" %
+                 (PROTOBUFF_DIR, PROTOBUFF_DIR, PROTOBUFF_DIR, PROTOBUFF_DIR))
+    # XXX Generate it automatically?
+    sys.exit()
+
+import utils
+
+# Length header of every message, as stored in .gltrace files
+TRACE_HEADER_FORMAT = "!i"
+# Size of the reads done on the underlying file, big enough so the per-read
+# overhead of GzipFile is amortized across many messages
+TRACE_BLOCK_SIZE = 1024 * 1024
+
+def iter_trace_messages(trace_file, block_size = TRACE_BLOCK_SIZE,
+                        header_format = TRACE_HEADER_FORMAT):
+    """!
+    Iterate over the serialized messages of an open trace file.
+
+    The file is read in blocks of block_size bytes and the messages are
+    returned as memoryview slices of those blocks, so they can be passed
+    straight to GLMessage.FromString without copying them.
+    Note each memoryview keeps its whole block alive, copy it with tobytes()
+    if it needs to be stored for long.
+
+    @param trace_file: file-like object with the trace, opened for reading.
+    @param block_size: size in bytes of each read on the file.
+    @param header_format: struct format of the length header, the header
+           is little endian when read from the gltrace socket.
+    """
+    header_size = struct.calcsize(header_format)
+    block = memoryview("")
+    block_offset = 0
+    eof = False
+
+    while True:
+        # Make sure there's a whole header in the block
+        # Only the leftover tail of the previous block needs to be copied
+        while ((not eof) and ((len(block) - block_offset) < header_size)):
+            data = trace_file.read(block_size)
+            eof = (data == "")
+            block = memoryview(block[block_offset:].tobytes() + data)
+            block_offset = 0
+
+        if ((len(block) - block_offset) < header_size):
+            if (block_offset != len(block)):
+                logger.warning("Truncated message header, trace will be incomplete")
+            break
+
+        buffer_length = struct.unpack_from(header_format, block, block_offset)[0]
+        block_offset += header_size
+
+        # Make sure there's a whole message in the block, reading at least
+        # block_size bytes so the following messages are also buffered
+        # Collect the reads and join them once, so messages bigger than the
+        # block are not copied again on every read
+        if ((not eof) and ((len(block) - block_offset) < buffer_length)):
+            datas = [block[block_offset:].tobytes()]
+            available = len(datas[0])
+            while ((not eof) and (available < buffer_length)):
+                data = trace_file.read(max(buffer_length - available, block_size))
+                eof = (data == "")
+                datas.append(data)
+                available += len(data)
+            block = memoryview("".join(datas))
+            block_offset = 0
+
+        if ((len(block) - block_offset) < buffer_length):
+            logger.warning("Truncated message, trace will be incomplete")
+            break
+
+        buffer = block[block_offset:block_offset + buffer_length]
+        block_offset += buffer_length
+
+        yield buffer
+
+# Number of messages the read-ahead thread hands over at a time, to amortize
+# the queue locking
+READ_AHEAD_BATCH_SIZE = 256
+
+def iter_read_ahead_messages(messages, queue_size,
+                             batch_size = READ_AHEAD_BATCH_SIZE):
+    """!
+    Iterate over messages produced by a background thread.
+
+    The thread pulls from the messages iterator (eg iter_trace_messages on a
+    gzip file), so the decompression and framing overlap with the consumer's
+    work (zlib releases the GIL while inflating).
+
+    @param messages: iterator to read ahead, it's only advanced from the
+           background thread
+    @param queue_size: maximum number of batches the thread can get ahead of
+           the consumer
+    @param batch_size: number of messages in each batch
+    """
+    batches = Queue.Queue(queue_size)
+    stopping = threading.Event()
+
+    def put(item):
+        # Don't block forever if the consumer stopped iterating
+        while (not stopping.is_set()):
+            try:
+                batches.put(item, True, 0.1)
+                return True
+            except Queue.Full:
+                pass
+        return False
+
+    def read_ahead():
+        try:
+            batch = []
+            for message in messages:
+                batch.append(message)
+                if (len(batch) >= batch_size):
+                    if (not put((batch, None))):
+                        return
+                    batch = []
+            put((batch, None))
+            put((None, None))
+        except:
+            # Re-raise on the consumer thread
+            put((None, sys.exc_info()))
+
+    thread = threading.Thread(target = read_ahead, name = "read_ahead")
+    thread.daemon = True
+    thread.start()
+    try:
+        while True:
+            (batch, exc_info) = batches.get()
+            if (exc_info is not None):
+                raise exc_info[0], exc_info[1], exc_info[2]
+            if (batch is None):
+                break
+            for message in batch:
+                yield message
+    finally:
+        # Wait for the thread so the caller can safely close the trace file
+        stopping.set()
+        thread.join()
+
+def write_trace_message(trace_file, buffer):
+    """!
+    Write a serialized message to a trace file, prefixed by its length.
+    """
+    trace_file.write(struct.pack(TRACE_HEADER_FORMAT, len(buffer)))
+    trace_file.write(buffer)
+
+# GLMessage field numbers peeked at the wire level, see gltrace.proto
+GLMESSAGE_CONTEXT_ID_FIELD = 1
+GLMESSAGE_START_TIME_FIELD = 2
+GLMESSAGE_DURATION_FIELD = 3
+GLMESSAGE_FUNCTION_FIELD = 4
+GLMESSAGE_THREADTIME_FIELD = 8
+# Protobuf serializes the fields in field number order, so context_id and
+# function are expected in the first bytes of the message (context_id,
+# start_time, duration and function take at most 4 * 11 bytes)
+PEEK_PREFIX_SIZE = 44
+
+def decode_varint(data, offset):
+    """!
+    Decode a protobuf varint from the bytearray at the given offset, return
+    the value and the offset after it
+    """
+    value = 0
+    shift = 0
+    while True:
+        b = data[offset]
+        offset += 1
+        value |= (b & 0x7f) << shift
+        if (b < 0x80):
+            return (value, offset)
+        shift += 7
+
+def peek_message_header(buffer):
+    """!
+    Return the (context_id, function) of a serialized GLMessage without
+    decoding the whole protobuf, or None if they can't be found (eg the
+    message is corrupt).
+    """
+    # Only copy the prefix where the fields are expected, fall back to the
+    # whole message in case some serializer wrote them out of order
+    for data in [bytearray(buffer[:PEEK_PREFIX_SIZE]), bytearray(buffer)]:
+        context_id = None
+        function = None
+        offset = 0
+        try:
+            while (offset < len(data)):
+                (key, offset) = decode_varint(data, offset)
+                field_number = key >> 3
+                wire_type = key & 0x7
+                if (wire_type == 0):
+                    (value, offset) = decode_varint(data, offset)
+                    if (field_number == GLMESSAGE_CONTEXT_ID_FIELD):
+                        # int32 are sign-extended to 64 bits when negative
+                        if (value >= (1 << 63)):
+                            value -= (1 << 64)
+                        context_id = value
+                    elif (field_number == GLMESSAGE_FUNCTION_FIELD):
+                        function = value
+                    if ((context_id is not None) and (function is not None)):
+                        return (context_id, function)
+                elif (wire_type == 1):
+                    offset += 8
+                elif (wire_type == 2):
+                    (length, offset) = decode_varint(data, offset)
+                    offset += length
+                elif (wire_type == 5):
+                    offset += 4
+                else:
+                    break
+        except IndexError:
+            # Field cut at the end of the prefix
+            pass
+
+        if (len(data) == len(buffer)):
+            break
+
+    return None
+
+MessageTimes = collections.namedtuple("MessageTimes",
+                                      ["context_id", "function", "start_time",
+                                       "duration", "threadtime"])
+
+def peek_message_times(buffer):
+    """!
+    Return the MessageTimes of a serialized GLMessage without decoding the
+    args, or None if the required fields can't be found (eg the message is
+    corrupt).
+
+    All times are in nanoseconds, threadtime is 0 if the message doesn't have
+    it (eg EGL functions).
+    """
+    # threadtime comes after the args, so the whole message needs to be
+    # walked, skipping the length-delimited fields
+    data = bytearray(buffer)
+    fields = {}
+    offset = 0
+    try:
+        while (offset < len(data)):
+            (key, offset) = decode_varint(data, offset)
+            wire_type = key & 0x7
+            if (wire_type == 0):
+                (value, offset) = decode_varint(data, offset)
+                fields[key >> 3] = value
+            elif (wire_type == 1):
+                offset += 8
+            elif (wire_type == 2):
+                (length, offset) = decode_varint(data, offset)
+                offset += length
+            elif (wire_type == 5):
+                offset += 4
+            else:
+                return None
+    except IndexError:
+        return None
+
+    if (offset != len(data)):
+        return None
+
+    try:
+        values = [fields[GLMESSAGE_CONTEXT_ID_FIELD],
+                  fields[GLMESSAGE_FUNCTION_FIELD],
+                  fields[GLMESSAGE_START_TIME_FIELD],
+                  fields[GLMESSAGE_DURATION_FIELD],
+                  fields.get(GLMESSAGE_THREADTIME_FIELD, 0)]
+    except KeyError:
+        return None
+
+    # Negative int32 and int64 are sign-extended to 64 bits
+    values = [(value - (1 << 64)) if (value >= (1 << 63)) else value
+              for value in values]
+
+    return MessageTimes(*values)
+
+def get_function_numbers(functions):
+    """!
+    Convert a list of function names or numbers to a set of function numbers
+    """
+    function_enum_type = gltrace_pb2.GLMessage.DESCRIPTOR.enum_types_by_name['Function']
+    return set([function_enum_type.values_by_name[function].number
+                if isinstance(function, basestring) else function
+                for function in functions])
+
+def iter_filtered_messages(messages, contexts = None, functions = None):
+    """!
+    Filter serialized messages by context and function at the wire level,
+    without decoding the protobufs.
+
+    Messages whose header can't be peeked are let through so the consumer
+    sees the same decode errors as without filtering.
+
+    @param messages: iterable of serialized messages, eg from iter_trace_messages
+    @param contexts: list of context ids to keep, None for all
+    @param functions: list of function names (eg "glTexImage2D") or numbers
+           to keep, None for all
+    """
+    if ((contexts is None) and (functions is None)):
+        for buffer in messages:
+            yield buffer
+        return
+
+    if (contexts is not None):
+        contexts = set(contexts)
+    if (functions is not None):
+        functions = get_function_numbers(functions)
+
+    for buffer in messages:
+        header = peek_message_header(buffer)
+        if (header is not None):
+            (context_id, function) = header
+            if (((contexts is not None) and (context_id not in contexts)) or
+                ((functions is not None) and (function not in functions))):
+                continue
+        yield buffer
+
+def iter_frame_window_messages(messages, first_frame, skipped_functions,
+                               draw_functions = []):
+    """!
+    Drop the messages of the given functions in the frames before first_frame,
+    without decoding the protobufs.
+
+    Frames end at every eglSwapBuffers in messages, so messages need to be
+    already filtered by context. Once first_frame is reached the remaining
+    messages are passed through without peeking them.
+
+    The draw functions are only dropped while the default framebuffer is bound
+    for drawing, the draws to other framebuffers (eg render to texture) can
+    produce the contents of textures used by the frames after first_frame.
+    Only the messages binding framebuffers are decoded to track this.
+
+    @param messages: iterable of serialized messages, eg from iter_trace_messages
+    @param first_frame: frame from which no messages are dropped
+    @param skipped_functions: list of function names or numbers to drop
+    @param draw_functions: list of function names or numbers to drop only when
+           drawing to the default framebuffer
+    """
+    skipped_functions = get_function_numbers(skipped_functions)
+    draw_functions = get_function_numbers(draw_functions)
+    messages = iter(messages)
+    frame = 0
+    # Framebuffer bound for drawing, indexed by context id
+    draw_framebuffers = {}
+    if (frame < first_frame):
+        for buffer in messages:
+            header = peek_message_header(buffer)
+            if (header is not None):
+                (context_id, function) = header
+                if (function == EGL_SWAP_BUFFERS):
+                    frame += 1
+                elif (function in skipped_functions):
+                    continue
+                elif (function in BIND_FRAMEBUFFER_FUNCTIONS):
+                    msg = gltrace_pb2.GLMessage.FromString(buffer)
+                    if (msg.args[0].intValue[0] != GL_READ_FRAMEBUFFER):
+                        draw_framebuffers[context_id] = msg.args[1].intValue[0]
+                elif ((function in draw_functions) and
+                      (draw_framebuffers.get(context_id, 0) == 0)):
+                    continue
+            yield buffer
+            if (frame >= first_frame):
+                break
+
+    for buffer in messages:
+        yield buffer
+
+# Index file layout, all little endian:
+# - header: magic, version, trace file size, trace file mtime, entry count
+# - one entry per message: offset of the message's length header in the
+#   uncompressed trace, message length, function, context id and frame number
+TRACE_INDEX_EXTENSION = ".idx"
+TRACE_INDEX_MAGIC = "GLTRCIDX"
+TRACE_INDEX_VERSION = 1
+TRACE_INDEX_HEADER = struct.Struct("<8sIQdQ")
+TRACE_INDEX_ENTRY = struct.Struct("<QIHiI")
+
+TraceIndexEntry = collections.namedtuple("TraceIndexEntry",
+                                         ["offset", "length", "function",
+                                          "context_id", "frame"])
+
+EGL_SWAP_BUFFERS = gltrace_pb2.GLMessage.eglSwapBuffers
+BIND_FRAMEBUFFER_FUNCTIONS = set([gltrace_pb2.GLMessage.glBindFramebuffer,
+                                  gltrace_pb2.GLMessage.glBindFramebufferOES])
+GL_READ_FRAMEBUFFER = 0x8CA8
+
+def get_trace_index_filepath(trace_filepath):
+    return trace_filepath + TRACE_INDEX_EXTENSION
+
+def get_trace_stamp(trace_filepath):
+    """!
+    Size and modification time of the trace, used to detect stale indices
+    """
+    return (os.path.getsize(trace_filepath), os.path.getmtime(trace_filepath))
+
+def build_trace_index(trace_filepath, processes = 1):
+    """!
+    Scan the whole trace and return the list of TraceIndexEntry for it.
+
+    Frames are counted the same way glparse counts them when tracing all
+    contexts: the frame number is incremented after every eglSwapBuffers, so
+    the eglSwapBuffers message belongs to the frame it ends.
+
+    @param processes: Number of processes to decompress blocked gzip traces
+           with, None to use all the CPUs
+    """
+    logger.info("Building index for trace %s" % trace_filepath)
+
+    header_size = struct.calcsize(TRACE_HEADER_FORMAT)
+    trace_index = []
+    offset = 0
+    frame = 0
+    with utils.xopen(trace_filepath, processes = processes) as trace:
+        for buffer in iter_trace_messages(trace):
+            header = peek_message_header(buffer)
+            if (header is None):
+                logger.warning("Decode error, truncated protobuff, index will be incomplete")
+                break
+            (context_id, function) = header
+            trace_index.append(TraceIndexEntry(offset, len(buffer), function,
+                                               context_id, frame))
+            if (function == EGL_SWAP_BUFFERS):
+                frame += 1
+            offset += header_size + len(buffer)
+
+    logger.info("Indexed %d messages and %d frames" % (len(trace_index), frame))
+
+    return trace_index
+
+def save_trace_index(trace_index_filepath, trace_index, trace_stamp):
+    with open(trace_index_filepath, "wb") as f:
+        f.write(TRACE_INDEX_HEADER.pack(TRACE_INDEX_MAGIC, TRACE_INDEX_VERSION,
+                                        trace_stamp[0], trace_stamp[1],
+                                        len(trace_index)))
+        pack = TRACE_INDEX_ENTRY.pack
+        f.write("".join([pack(*entry) for entry in trace_index]))
+
+def read_trace_index(trace_index_filepath, trace_stamp = None):
+    """!
+    Read an index file, return None if it doesn't exist, it's corrupt or
+    its stamp doesn't match the given trace stamp
+    """
+    try:
+        with open(trace_index_filepath, "rb") as f:
+            data = f.read()
+    except IOError:
+        return None
+
+    if (len(data) < TRACE_INDEX_HEADER.size):
+        return None
+    (magic, version, size, mtime, entry_count) = TRACE_INDEX_HEADER.unpack_from(data)
+    if ((magic != TRACE_INDEX_MAGIC) or (version != TRACE_INDEX_VERSION) or
+        (len(data) != TRACE_INDEX_HEADER.size + entry_count * TRACE_INDEX_ENTRY.size)):
+        logger.warning("Ignoring invalid trace index %s" % trace_index_filepath)
+        return None
+    if ((trace_stamp is not None) and ((size, mtime) != trace_stamp)):
+        logger.info("Ignoring stale trace index %s" % trace_index_filepath)
+        return None
+
+    unpack_from = TRACE_INDEX_ENTRY.unpack_from
+    entry_size = TRACE_INDEX_ENTRY.size
+    return [TraceIndexEntry._make(unpack_from(data, offset)) for offset in
+            xrange(TRACE_INDEX_HEADER.size, len(data), entry_size)]
+
+def load_trace_index(trace_filepath, processes = 1):
+    """!
+    Return the index of the given trace, reading it from the sidecar file if
+    up to date or building and saving it otherwise.
+
+    @param processes: Number of processes to decompress blocked gzip traces
+           with when building the index, None to use all the CPUs
+    """
+    trace_index_filepath = get_trace_index_filepath(trace_filepath)
+    trace_stamp = get_trace_stamp(trace_filepath)
+    trace_index = read_trace_index(trace_index_filepath, trace_stamp)
+    if (trace_index is None):
+        trace_index = build_trace_index(trace_filepath, processes)
+        try:
+            save_trace_index(trace_index_filepath, trace_index, trace_stamp)
+        except IOError as e:
+            # The index can still be used in memory
+            logger.warning("Unable to save trace index %s: %s" % (trace_index_filepath, e))
+
+    return trace_index
+
+def count_frames(trace_index, contexts = None):
+    """!
+    Number of eglSwapBuffers in the given contexts (or in all if None)
+    """
+    return sum([1 for entry in trace_index if
+                ((entry.function == EGL_SWAP_BUFFERS) and
+                 ((contexts is None) or (entry.context_id in contexts)))])
+
+def iter_indexed_messages(trace_file, trace_index, contexts = None,
+                          first_frame = 0, last_frame = None,
+                          block_size = TRACE_BLOCK_SIZE):
+    """!
+    Iterate over the serialized messages of the given contexts and frame
+    range without decoding them.
+
+    The trace file is seeked to the first message of first_frame, which is
+    cheap for uncompressed traces.
+
+    @param trace_file: file-like object opened on the trace the index belongs to
+    @param trace_index: list of TraceIndexEntry as returned by load_trace_index
+    @param contexts: list of context ids to return, None for all
+    @param first_frame: first frame to return
+    @param last_frame: last frame to return (inclusive), None for all
+    @param block_size: size in bytes of each read on the file
+    """
+    entries = [entry for entry in trace_index if
+               ((entry.frame >= first_frame) and
+                ((last_frame is None) or (entry.frame <= last_frame)))]
+    if (len(entries) == 0):
+        return
+
+    trace_file.seek(entries[0].offset)
+    for (buffer, entry) in itertools.izip(iter_trace_messages(trace_file, block_size),
+                                             entries):
+        if ((contexts is None) or (entry.context_id in contexts)):
+            yield buffer
+
+# GL enums needed to classify the payloads, see khronos gl2.h
+GL_ARRAY_BUFFER = 0x8892
+GL_ELEMENT_ARRAY_BUFFER = 0x8893
+GL_UNSIGNED_BYTE = 0x1401
+GL_UNSIGNED_SHORT = 0x1403
+GL_UNSIGNED_INT = 0x1405
+
+DRAW_ELEMENTS_INDEX_SIZES = {
+    GL_UNSIGNED_BYTE : 1,
+    GL_UNSIGNED_SHORT : 2,
+    GL_UNSIGNED_INT : 4,
+}
+
+PAYLOAD_KINDS = ["texture", "vertex", "index", "other"]
+
+# Functions whose payload is always texture data
+TEXTURE_FUNCTIONS = set([
+    gltrace_pb2.GLMessage.glTexImage2D,
+    gltrace_pb2.GLMessage.glTexSubImage2D,
+    gltrace_pb2.GLMessage.glTexImage3D,
+    gltrace_pb2.GLMessage.glTexSubImage3D,
+    gltrace_pb2.GLMessage.glCompressedTexImage2D,
+    gltrace_pb2.GLMessage.glCompressedTexSubImage2D,
+])
+
+# Functions whose payload is vertex or index data depending on the buffer target
+BUFFER_FUNCTIONS = set([
+    gltrace_pb2.GLMessage.glBufferData,
+    gltrace_pb2.GLMessage.glBufferSubData,
+])
+
+def get_payload_sizes(msg):
+    """!
+    Return a dict with the bytes of payload of a decoded message, indexed by
+    payload kind (see PAYLOAD_KINDS)
+    """
+    sizes = dict.fromkeys(PAYLOAD_KINDS, 0)
+    if (msg.function in TEXTURE_FUNCTIONS):
+        kind = "texture"
+    elif (msg.function in BUFFER_FUNCTIONS):
+        target = msg.args[0].intValue[0]
+        if (target == GL_ARRAY_BUFFER):
+            kind = "vertex"
+        elif (target == GL_ELEMENT_ARRAY_BUFFER):
+            kind = "index"
+        else:
+            kind = "other"
+    elif (msg.function == gltrace_pb2.GLMessage.glVertexAttribPointerData):
+        # Client side vertex arrays, glVertexAttribPointer only has the
+        # offset or pointer
+        kind = "vertex"
+    elif (msg.function == gltrace_pb2.GLMessage.glDrawElements):
+        kind = "index"
+        # Client side indices are sent as an array of ints
+        indices = msg.args[3]
+        if ((indices.isArray) and (len(indices.rawBytes) == 0)):
+            sizes[kind] += (len(indices.intValue) *
+                            DRAW_ELEMENTS_INDEX_SIZES.get(msg.args[2].intValue[0], 4))
+    else:
+        kind = "other"
+
+    for arg in msg.args:
+        for raw_bytes in arg.rawBytes:
+            sizes[kind] += len(raw_bytes)
+
+    return sizes
+
+def summarize_trace(trace_filepath, contexts = None, decoder_name = "protobuf",
+                    processes = 1):
+    """!
+    Scan a trace and return a dict with its statistics, without generating any
+    code.
+
+    Only the messages that can carry a payload are decoded, the rest are
+    counted from their wire-level header, so this runs faster than decoding
+    the whole trace.
+
+    Frames end at the eglSwapBuffers of the summarized contexts, a trailing
+    partial frame is also reported.
+
+    @param contexts: list of context ids to summarize, None for all
+    @param decoder_name: decoder for the messages with payload, see
+           gldecode.get_message_decoder
+    @param processes: number of processes to decompress blocked gzip traces
+           with, None to use all the CPUs
+    """
+    # gldecode imports this module, import here to prevent the cycle
+    import gldecode
+
+    logger.info("Summarizing trace %s" % trace_filepath)
+
+    decode = gldecode.get_message_decoder(decoder_name)
+    function_enum_type = gltrace_pb2.GLMessage.DESCRIPTOR.enum_types_by_name['Function']
+    payload_functions = (TEXTURE_FUNCTIONS | BUFFER_FUNCTIONS |
+                         set([gltrace_pb2.GLMessage.glVertexAttribPointerData,
+                              gltrace_pb2.GLMessage.glDrawElements]))
+
+    context_messages = collections.Counter()
+    context_frames = collections.Counter()
+    frames = []
+    frame_functions = collections.Counter()
+    frame_payload = dict.fromkeys(PAYLOAD_KINDS, 0)
+    message_count = 0
+    with utils.xopen(trace_filepath, processes = processes) as trace:
+        for buffer in iter_trace_messages(trace):
+            header = peek_message_header(buffer)
+            if (header is None):
+                logger.warning("Decode error, truncated protobuff, summary will be incomplete")
+                break
+            (context_id, function) = header
+            if ((contexts is not None) and (context_id not in contexts)):
+                continue
+
+            message_count += 1
+            context_messages[context_id] += 1
+            frame_functions[function] += 1
+            if (function in payload_functions):
+                for (kind, size) in get_payload_sizes(decode(buffer)).iteritems():
+                    frame_payload[kind] += size
+
+            if (function == EGL_SWAP_BUFFERS):
+                context_frames[context_id] += 1
+                frames.append((frame_functions, frame_payload))
+                frame_functions = collections.Counter()
+                frame_payload = dict.fromkeys(PAYLOAD_KINDS, 0)
+
+    if (len(frame_functions) > 0):
+        frames.append((frame_functions, frame_payload))
+
+    def get_function_name(function):
+        value = function_enum_type.values_by_number.get(function)
+        if (value is None):
+            return "function_%d" % function
+        return value.name
+
+    summary = {
+        "trace" : trace_filepath,
+        "messages" : message_count,
+        "frames" : sum(context_frames.values()),
+        "contexts" : dict([(context_id, { "messages" : context_messages[context_id],
+                                          "frames" : context_frames[context_id] })
+                           for context_id in sorted(context_messages)]),
+        "functions" : {},
+        "payload_bytes" : dict.fromkeys(PAYLOAD_KINDS, 0),
+        "per_frame" : [],
+    }
+    functions = collections.Counter()
+    for (frame_functions, frame_payload) in frames:
+        functions.update(frame_functions)
+        for kind in PAYLOAD_KINDS:
+            summary["payload_bytes"][kind] += frame_payload[kind]
+        summary["per_frame"].append({
+            "functions" : dict([(get_function_name(function), count) for
+                                (function, count) in frame_functions.iteritems()]),
+            "payload_bytes" : frame_payload,
+        })
+    summary["functions"] = dict([(get_function_name(function), count) for
+                                 (function, count) in functions.iteritems()])
+    summary["shaders"] = functions[gltrace_pb2.GLMessage.glCreateShader]
+    summary["programs"] = functions[gltrace_pb2.GLMessage.glCreateProgram]
+
+    logger.info("Summarized %d messages and %d frames" % (message_count, summary["frames"]))
+
+    return summary
+
+def format_summary(summary, per_frame = False):
+    """!
+    Return the lines of the text version of a summary returned by
+    summarize_trace
+    """
+    def format_payload(payload):
+        return string.join(["%s %d" % (kind, payload[kind]) for kind in PAYLOAD_KINDS], ", ")
+
+    def format_functions(functions, indent):
+        return ["%s%-40s %d" % (indent, function, count) for (function, count) in
+                sorted(functions.iteritems(), key = lambda item: (-item[1], item[0]))]
+
+    lines = [
+        "trace %s" % summary["trace"],
+        "%d messages, %d frames, %d shaders, %d programs" % (
+            summary["messages"], summary["frames"], summary["shaders"],
+            summary["programs"]),
+        "payload bytes: %s" % format_payload(summary["payload_bytes"]),
+    ]
+    for (context_id, context) in sorted(summary["contexts"].iteritems()):
+        lines.append("context %d: %d messages, %d frames" % (
+            context_id, context["messages"], context["frames"]))
+    lines.append("functions:")
+    lines.extend(format_functions(summary["functions"], "    "))
+    if (per_frame):
+        for (frame_index, frame) in enumerate(summary["per_frame"]):
+            lines.append("frame %d: payload bytes: %s" % (
+                frame_index, format_payload(frame["payload_bytes"])))
+            lines.extend(format_functions(frame["functions"], "    "))
+
+    return lines
+
+def index_command(trace_filepath = "_out/test.gltrace.gz", force = False):
+    """
+    Build the index sidecar file of a trace and print a summary.
+
+    :param trace_filepath: Path to the OpenGL ES trace file
+    :param force: Rebuild the index even if it's up to date
+    """
+    if (force):
+        trace_index = build_trace_index(trace_filepath)
+        save_trace_index(get_trace_index_filepath(trace_filepath), trace_index,
+                         get_trace_stamp(trace_filepath))
+    else:
+        trace_index = load_trace_index(trace_filepath)
+
+    contexts = sorted(set([entry.context_id for entry in trace_index]))
+    print "%d messages, %d frames" % (len(trace_index), count_frames(trace_index))
+    for context_id in contexts:
+        print "context %d: %d messages, %d frames" % (
+            context_id,
+            sum([1 for entry in trace_index if (entry.context_id == context_id)]),
+            count_frames(trace_index, [context_id]))
+
+def convert_command(trace_filepath = "_out/test.gltrace.gz",
+                    output_filepath = "_out/test.gltrace.bgz"):
+    """
+    Convert a trace between the uncompressed (.gltrace), gzip (.gz) and
+    blocked gzip (.bgz) formats, as given by the filename extensions.
+    Blocked gzip traces can be seeked and decompressed in parallel.
+
+    :param trace_filepath: Path to the source OpenGL ES trace file
+    :param output_filepath: Path to the destination OpenGL ES trace file
+    """
+    message_count = 0
+    with utils.xopen(trace_filepath) as trace:
+        with utils.xopen(output_filepath, "wb") as output_trace:
+            for buffer in iter_trace_messages(trace):
+                write_trace_message(output_trace, buffer)
+                message_count += 1
+
+    logger.info("Converted %d messages" % message_count)
+
+def summary_command(trace_filepath = "_out/test.gltrace.gz", contexts = None,
+                    output_format = "text", per_frame = False,
+                    decoder = "protobuf"):
+    """
+    Print the frames, contexts, function calls, payload bytes and shaders of a
+    trace without generating any code.
+
+    :param trace_filepath: Path to the OpenGL ES trace file
+    :param contexts: String with comma-separated numbers of the 0-based
+                     OpenGL ES contexts to summarize
+    :param output_format: "text" or "json", json always includes the per frame
+                          statistics
+    :param per_frame: Print the function calls and payload bytes of every frame
+                      in text format
+    :param decoder: Decoder to use for the messages with payload, "protobuf" or
+                    "fast"
+    """
+    if (contexts is not None):
+        contexts = [int(item) for item in str(contexts).split(",")]
+
+    summary = summarize_trace(trace_filepath, contexts, decoder)
+
+    if (output_format == "json"):
+        print json.dumps(summary, indent = 4, sort_keys = True)
+    elif (output_format == "text"):
+        for line in format_summary(summary, per_frame):
+            print line
+    else:
+        raise Exception("Unknown output format %s" % output_format)
+
+if (__name__ == "__main__"): # pragma: no cover
+    import scriptine
+
+    logging_format = "%(asctime).23s %(levelname)s:%(filename)s(%(lineno)d) [%(thread)d]: %(message)s"
+    logger_handler = logging.StreamHandler()
+    logger_handler.setFormatter(logging.Formatter(logging_format))
+    logger.addHandler(logger_handler)
+    logger.setLevel(logging.INFO)
+
+    scriptine.run()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+
+# Copyright 2014 Antonio Tejada
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+# XXX This is so __main__ can find gldecode.py and the unit tests can be debugged
+#     by running __main__. Is there a better way? Can unit tests be debugged from
+#     nose itself?
+if __name__ == '__main__': # pragma: no cover
+    sys.path.append('..')
+
+import nose
+
+import glob
+import multiprocessing
+import os
+
+import common
+import gldecode
+import gltrace
+import utils
+from gltrace import gltrace_pb2
+
+# Inform Nose that the tests can be split across processes
+_multiprocess_can_split_ = True
+
+TEST_FILES_FILEDIR = "glparse"
+
+def test_decode_message():
+    """!
+    The fast decoder must produce the same fields as the protobuf decoder
+    """
+    for filepath in glob.glob(os.path.join(TEST_FILES_FILEDIR, "*.gz")):
+        with utils.xopen(filepath) as f:
+            for buffer in gltrace.iter_trace_messages(f):
+                msg = gldecode.decode_message(buffer)
+                expected_msg = gltrace_pb2.GLMessage.FromString(buffer.tobytes())
+                assert(gldecode.get_message_fields(msg) ==
+                       gldecode.get_message_fields(expected_msg))
+
+def test_decode_message_synthetic():
+    """!
+    Exercise negative, multi-byte and mixed repeated values not present in the
+    test traces
+    """
+    msg = gltrace_pb2.GLMessage(context_id = -1, start_time = -(2 ** 63),
+                                duration = 2 ** 31 - 1, function = 2020,
+                                threadtime = 300)
+    arg = msg.args.add(type = 4, isArray = True)
+    arg.intValue.extend([0, 127, 128, -1, -(2 ** 31), 2 ** 31 - 1])
+    arg = msg.args.add(type = 3, isArray = True)
+    arg.floatValue.extend([0.5, -1.25, 3e10])
+    arg = msg.args.add(type = 5, isArray = False)
+    arg.charValue.append("glUniform1f")
+    arg.rawBytes.append("\x00\x01\xff")
+    arg.boolValue.extend([True, False])
+    arg.int64Value.extend([-(2 ** 63), 2 ** 63 - 1])
+    msg.returnValue.type = 4
+    msg.returnValue.isArray = False
+    msg.returnValue.intValue.append(-5)
+    msg.fb.width = 2
+    msg.fb.height = 3
+    msg.fb.contents.append("abc")
+    buffer = msg.SerializeToString()
+
+    assert(gldecode.get_message_fields(gldecode.decode_message(buffer)) ==
+           gldecode.get_message_fields(msg))
+
+    # Truncated messages are rejected instead of returning partial data
+    for length in [1, 5, len(buffer) / 2, len(buffer) - 1]:
+        try:
+            gldecode.decode_message(buffer[:length])
+        except gldecode.DecodeError:
+            pass
+        else:
+            assert False, "Truncated message at %d didn't fail" % length
+
+def test_iter_decoded_messages():
+    """!
+    Decoding on a pool must return the same messages in the same order and stop
+    at the same truncated message as decoding serially
+    """
+    buffers = []
+    for filepath in glob.glob(os.path.join(TEST_FILES_FILEDIR, "*.gz")):
+        with utils.xopen(filepath) as f:
+            buffers.extend([buffer.tobytes() for buffer in gltrace.iter_trace_messages(f)])
+    # Truncate a message in the middle of a chunk
+    truncated_index = len(buffers) / 2 + 3
+    truncated_buffers = buffers[:]
+    truncated_buffers[truncated_index] = truncated_buffers[truncated_index][:5]
+
+    for decoder_name in ["protobuf", "fast"]:
+        expected_fields = [gldecode.get_message_fields(msg) for msg in
+                           gldecode.iter_decoded_messages(buffers, decoder_name)]
+        assert(len(expected_fields) == len(buffers))
+        for processes in [1, 2]:
+            for chunk_size in [1, 7, gldecode.DECODE_CHUNK_SIZE]:
+                msgs = gldecode.iter_decoded_messages(buffers, decoder_name,
+                                                      processes, chunk_size)
+                assert([gldecode.get_message_fields(msg) for msg in msgs] ==
+                       expected_fields)
+                msgs = gldecode.iter_decoded_messages(truncated_buffers, decoder_name,
+                                                      processes, chunk_size)
+                assert([gldecode.get_message_fields(msg) for msg in msgs] ==
+                       expected_fields[:truncated_index])
+
+def test_iter_decoded_messages_close():
+    """!
+    Closing the decoded messages before the end must stop the decoding
+    processes
+    """
+    buffers = []
+    with utils.xopen(os.path.join(TEST_FILES_FILEDIR, "resources.gltrace.gz")) as f:
+        buffers.extend([buffer.tobytes() for buffer in gltrace.iter_trace_messages(f)])
+
+    msgs = gldecode.iter_decoded_messages(buffers, "fast", 2, 7)
+    for (i, msg) in enumerate(msgs):
+        if (i == 10):
+            break
+    assert(len(multiprocessing.active_children()) > 0)
+    msgs.close()
+    assert(len(multiprocessing.active_children()) == 0)
+
+if (__name__ == '__main__'): # pragma: no cover
+    common.invoke_per_file_functions(__name__)
@@ -23,11 +23,17 @@ if __name__ == '__main__': # pragma: no cover
 
 import nose
 
+import array
+import copy
 import errno
 import glob
 import logging
 import os
+import random
 import shutil
+import string
+import struct
+import zlib
 
 import common
 import glparse
@@ -78,6 +84,564 @@ def test_single_file(filename):
     # Do non-shallow directory comparison
     common.dircmp(oldOutFiledir, newOutFiledir)
 
+def make_output_dir(dirname):
+    """!
+    Return the path of an empty directory for the output of a test, deleting
+    the output of previous runs
+    """
+    output_dir = os.path.join(TEST_FILES_FILEDIR, OUTPUT_FILEDIR, dirname)
+    try:
+        shutil.rmtree(output_dir)
+    except OSError as e:
+        if (e.errno != errno.ENOENT):
+            raise
+    common.makedirs(output_dir)
+
+    return output_dir
+
+def copy_gl_xml(dirname):
+    """!
+    Copy gl.xml to an empty directory for the output of a test, returning the
+    path of the copy, so the tests that point glparse to it don't write the
+    caches and modules generated next to gl.xml into the source tree
+    """
+    gl_xml_filepath = os.path.join(make_output_dir(dirname),
+                                   os.path.basename(glparse.GL_XML_FILEPATH))
+    shutil.copyfile(glparse.get_gl_xml_filepath(), gl_xml_filepath)
+
+    return gl_xml_filepath
+
+def test_translation_cache():
+    """!
+    The cached translation machinery must be the same as the one from the xml,
+    also when the initial lookups change
+    """
+    gl_xml_filepath = glparse.GL_XML_FILEPATH
+    glparse.GL_XML_FILEPATH = copy_gl_xml("translation_cache")
+    try:
+        for initial_lookups in [{}, { "glBindTexture" : { 1 : { "field" : "intValue", "table" : "textures" }}}]:
+            expected_tables = { 'global' : {} }
+            expected_lookups = copy.deepcopy(initial_lookups)
+            glparse.update_translation_machinery_from_xml(expected_tables, expected_lookups)
+
+            # Once to create or update the cache, once to read it
+            for i in xrange(2):
+                tables = { 'global' : {} }
+                lookups = copy.deepcopy(initial_lookups)
+                glparse.update_translation_machinery_from_cache(tables, lookups)
+                assert(tables == expected_tables)
+                assert(lookups == expected_lookups)
+    finally:
+        glparse.GL_XML_FILEPATH = gl_xml_filepath
+
+def test_translation_cache_key():
+    """!
+    The translation cache key must not depend on the line endings of the xml
+    """
+    output_dir = make_output_dir("translation_cache_key")
+    gl_xml_filepath = glparse.get_gl_xml_filepath()
+    crlf_gl_xml_filepath = os.path.join(output_dir, "gl_crlf.xml")
+    with open(gl_xml_filepath, "rb") as f:
+        data = f.read().replace("\r\n", "\n")
+    with open(crlf_gl_xml_filepath, "wb") as f:
+        f.write(data.replace("\n", "\r\n"))
+
+    assert(glparse.get_translation_cache_key(crlf_gl_xml_filepath, {}, {}) ==
+           glparse.get_translation_cache_key(gl_xml_filepath, {}, {}))
+
+def test_translation_module():
+    """!
+    The translation machinery from the generated module must be the same as the
+    one from the xml
+    """
+    gl_xml_filepath = glparse.GL_XML_FILEPATH
+    glparse.GL_XML_FILEPATH = copy_gl_xml("translation_module")
+    try:
+        glparse.generate_translation_module()
+        for initial_lookups in [{}, { "glBindTexture" : { 1 : { "field" : "intValue", "table" : "textures" }}}]:
+            expected_tables = { 'global' : {} }
+            expected_lookups = copy.deepcopy(initial_lookups)
+            glparse.update_translation_machinery_from_xml(expected_tables, expected_lookups)
+
+            tables = { 'global' : {} }
+            lookups = copy.deepcopy(initial_lookups)
+            assert(glparse.update_translation_machinery_from_module(tables, lookups))
+            assert(tables == expected_tables)
+            assert(lookups == expected_lookups)
+    finally:
+        glparse.GL_XML_FILEPATH = gl_xml_filepath
+
+def test_dispatch_table():
+    """!
+    The dispatch table must be indexed by Function enum number and contain the
+    translation specs and the argument handler of each function
+    """
+    function_enum_type = glparse.gltrace_pb2.GLMessage.DESCRIPTOR.enum_types_by_name['Function']
+    insertions = { "glGenTextures" : { 1 : { "field" : "intValue", "table" : "textures" }}}
+    lookups = { "glBindTexture" : { 1 : { "field" : "intValue", "table" : "textures" }}}
+    dispatch_table = glparse.build_dispatch_table(insertions, lookups)
+
+    for value in function_enum_type.values:
+        dispatch = dispatch_table[value.number]
+        assert(dispatch.name == value.name)
+        assert(dispatch.insertion == insertions.get(value.name, {}))
+        assert(dispatch.lookup == lookups.get(value.name, {}))
+        assert(dispatch.fixups == tuple(glparse.FIXUPS.get(value.name, [])))
+
+    assert(dispatch_table[function_enum_type.values_by_name["glViewport"].number].fixups
+           == (glparse.fixup_viewport,))
+    assert(dispatch_table[function_enum_type.values_by_name["glClear"].number].fixups
+           == ())
+
+def test_register_fixup():
+    """!
+    Fixups registered from outside glparse must be called once per message of
+    their functions, and must be able to ignore the message
+    """
+    fixed_messages = []
+    def ignore_clear(state, msg):
+        fixed_messages.append(state.function_name)
+        return True
+
+    output_dir = make_output_dir("fixup")
+
+    glparse.register_fixup(["glClear"], ignore_clear)
+    try:
+        lines = glparse.glparse(os.path.join(TEST_FILES_FILEDIR, "simple.gltrace.gz"),
+                                output_dir, os.path.join(output_dir, "assets"),
+                                None)
+    finally:
+        glparse.FIXUPS["glClear"].remove(ignore_clear)
+
+    assert(len(fixed_messages) > 0)
+    assert(set(fixed_messages) == set(["glClear"]))
+    assert(not any(["glClear(" in line for line in lines]))
+
+def test_file_code_writer():
+    """!
+    Streaming the code to a file must generate the same program as collecting
+    it in memory
+    """
+    output_dir = make_output_dir("code_writer")
+
+    trace_filepath = os.path.join(TEST_FILES_FILEDIR, "twocontexts.gltrace.gz")
+    lines = glparse.glparse(trace_filepath, output_dir,
+                            os.path.join(output_dir, "assets"), [0])
+
+    trace_incpath = os.path.join(output_dir, "trace.inc")
+    assert(glparse.glparse(trace_filepath, output_dir,
+                           os.path.join(output_dir, "assets"), [0],
+                           code_writer = glparse.FileCodeWriter(trace_incpath)) is None)
+
+    with open(trace_incpath, "r") as f:
+        assert(f.read() == "".join(["%s\n" % line for line in lines]))
+    assert(os.listdir(output_dir).count("trace.inc") == 1)
+    assert(not any([filename.startswith("trace.inc.") for filename in os.listdir(output_dir)]))
+
+def test_asset_store():
+    """!
+    The asset store must only write new contents, across runs too, and the
+    replayer generated with it must load the same contents
+    """
+    output_dir = make_output_dir("asset_store")
+    store_dir = os.path.join(output_dir, "store")
+
+    store = glparse.AssetStore(store_dir)
+    a_filename = store.add("a" * 10)
+    b_filename = store.add("b" * 10)
+    c_filename = store.add("c" * 3)
+    assert(len(set([a_filename, b_filename, c_filename])) == 3)
+    assert(store.add("a" * 10) == a_filename)
+    assert((store.num_writes, store.num_hits) == (3, 1))
+
+    # Runs sharing the store must never overwrite each other's files
+    other_store = glparse.AssetStore(store_dir)
+    d_filename = other_store.add("d" * 10)
+    assert(d_filename not in [a_filename, b_filename, c_filename])
+    assert(other_store.add("a" * 10) == a_filename)
+    with open(os.path.join(store_dir, a_filename), "rb") as f:
+        assert(f.read() == "a" * 10)
+    assert(sorted(os.listdir(store_dir)) ==
+           sorted([a_filename, b_filename, c_filename, d_filename]))
+
+    store = glparse.AssetStore(store_dir)
+    assert(store.add("c" * 3) == c_filename)
+    assert(store.add("b" * 10) == b_filename)
+    assert((store.num_writes, store.num_hits) == (0, 2))
+    assets_dir = os.path.join(output_dir, "store_assets")
+    common.makedirs(assets_dir)
+    store.export(assets_dir)
+    assert(sorted(os.listdir(assets_dir)) == sorted([b_filename, c_filename]))
+    with open(os.path.join(assets_dir, b_filename), "rb") as f:
+        assert(f.read() == "b" * 10)
+
+    trace_filepath = os.path.join(TEST_FILES_FILEDIR, "resources.gltrace.gz")
+    assets_dir = os.path.join(output_dir, "assets")
+    lines = glparse.glparse(trace_filepath, output_dir, assets_dir, None)
+    for run in xrange(2):
+        store_assets_dir = os.path.join(output_dir, "assets%d" % run)
+        store_lines = glparse.glparse(trace_filepath, output_dir, store_assets_dir,
+                                      None, asset_store_dir = store_dir)
+        assert(len(store_lines) == len(lines))
+        for (line, store_line) in zip(lines, store_lines):
+            if (line != store_line):
+                # Only the asset filenames can differ
+                asset_filename = line.split('"')[1]
+                store_asset_filename = store_line.split('"')[1]
+                assert(line.replace(asset_filename, store_asset_filename) == store_line)
+                with open(os.path.join(assets_dir, asset_filename), "rb") as f:
+                    with open(os.path.join(store_assets_dir, store_asset_filename), "rb") as store_f:
+                        assert(f.read() == store_f.read())
+
+def test_pack_assets():
+    """!
+    Packed assets must have the same contents as the asset files, aligned
+    """
+    output_dir = make_output_dir("pack_assets")
+
+    trace_filepath = os.path.join(TEST_FILES_FILEDIR, "resources.gltrace.gz")
+    assets_dir = os.path.join(output_dir, "assets")
+    lines = glparse.glparse(trace_filepath, output_dir, assets_dir, None)
+    pack_assets_dir = os.path.join(output_dir, "pack_assets")
+    pack_lines = glparse.glparse(trace_filepath, output_dir, pack_assets_dir, None,
+                                 pack_assets = True)
+
+    assert(os.listdir(pack_assets_dir) == [glparse.ASSET_PACK_FILENAME])
+    with open(os.path.join(pack_assets_dir, glparse.ASSET_PACK_FILENAME), "rb") as f:
+        pack = f.read()
+
+    assert(len(pack_lines) == len(lines))
+    num_packed_assets = 0
+    for (line, pack_line) in zip(lines, pack_lines):
+        if (line != pack_line):
+            asset_filename = line.split('"')[1]
+            (offset, length) = [int(arg) for arg in pack_line.split(", ")[1:3]]
+            assert(pack_line.lstrip().startswith("getPackedAssetBuffer("))
+            assert(offset % glparse.ASSET_PACK_ALIGNMENT == 0)
+            with open(os.path.join(assets_dir, asset_filename), "rb") as f:
+                assert(f.read() == pack[offset:offset + length])
+            num_packed_assets += 1
+    assert(num_packed_assets > 0)
+
+def test_asset_writer():
+    """!
+    The asset writer must write every file once in the background and raise
+    the write errors on the calling thread
+    """
+    output_dir = make_output_dir("asset_writer")
+
+    asset_writer = glparse.AssetWriter(2, 4)
+    contents = dict([(os.path.join(output_dir, "asset_%d" % i), str(i) * (i + 1))
+                     for i in xrange(32)])
+    for (filepath, asset_bytes) in contents.iteritems():
+        asset_writer.write(filepath, asset_bytes)
+        # Writing the same file again is ignored
+        asset_writer.write(filepath, "")
+    asset_writer.flush()
+    for (filepath, asset_bytes) in contents.iteritems():
+        with open(filepath, "rb") as f:
+            assert(f.read() == asset_bytes)
+    asset_writer.close()
+
+    asset_writer = glparse.AssetWriter(1)
+    asset_writer.write(os.path.join(output_dir, "missing", "asset"), "")
+    try:
+        asset_writer.close()
+        assert(False)
+    except IOError:
+        pass
+
+    # The asset store must find the files it's writing in the background, and
+    # rename them into place
+    store_dir = os.path.join(output_dir, "store")
+    asset_writer = glparse.AssetWriter(2)
+    store = glparse.AssetStore(store_dir, asset_writer)
+    filenames = [store.add(chr(i) * 1024) for i in xrange(16)]
+    assert([store.add(chr(i) * 1024) for i in xrange(16)] == filenames)
+    assert((store.num_writes, store.num_hits) == (16, 16))
+    asset_writer.close()
+    assert(sorted(os.listdir(store_dir)) == sorted(filenames))
+    for (i, filename) in enumerate(filenames):
+        with open(os.path.join(store_dir, filename), "rb") as f:
+            assert(f.read() == chr(i) * 1024)
+
+def test_asset_compressor():
+    """!
+    Only the big assets that compress well must be compressed, and must inflate
+    to the original contents
+    """
+    asset_compressor = glparse.AssetCompressor()
+    small_bytes = "a" * (glparse.ASSET_COMPRESSION_MIN_SIZE - 1)
+    random_bytes = os.urandom(glparse.ASSET_COMPRESSION_MIN_SIZE)
+    big_bytes = "abcd" * glparse.ASSET_COMPRESSION_MIN_SIZE
+
+    assert(asset_compressor.compress(small_bytes, "small") == (small_bytes, "small"))
+    assert(asset_compressor.compress(random_bytes, "random") == (random_bytes, "random"))
+    (compressed_bytes, filename) = asset_compressor.compress(big_bytes, "big")
+    assert(filename == "big" + glparse.ASSET_COMPRESSED_EXTENSION)
+    header_size = struct.calcsize(glparse.ASSET_COMPRESSION_HEADER_FORMAT)
+    assert(struct.unpack(glparse.ASSET_COMPRESSION_HEADER_FORMAT,
+                         compressed_bytes[:header_size])[0] == len(big_bytes))
+    assert(zlib.decompress(compressed_bytes[header_size:]) == big_bytes)
+
+    assert((asset_compressor.num_assets, asset_compressor.num_compressed) == (3, 1))
+    assert(asset_compressor.bytes - asset_compressor.compressed_bytes ==
+           len(big_bytes) - len(compressed_bytes))
+    assert(len(asset_compressor.get_report_lines()) > 0)
+
+def test_chunk_assets():
+    """!
+    Chunking must find the same chunks around a change, and the packed chunks
+    must reassemble the payloads
+    """
+    output_dir = make_output_dir("chunk_assets")
+
+    rand = random.Random(0)
+    payload = "".join([chr(rand.randint(0, 255)) for i in xrange(200000)])
+    changed_payload = payload[:100000] + "changed" + payload[100000:]
+
+    chunk_ends = glparse.get_chunk_ends(payload)
+    assert(chunk_ends[-1] == len(payload))
+    chunk_sizes = [end - start for (start, end) in zip([0] + chunk_ends, chunk_ends)]
+    assert(all([(size >= glparse.ASSET_CHUNK_MIN_SIZE) for size in chunk_sizes[:-1]]))
+    assert(all([(size <= glparse.ASSET_CHUNK_MAX_SIZE) for size in chunk_sizes]))
+    assert(glparse.get_chunk_ends(payload[:100]) == [100])
+
+    pack_filepath = os.path.join(output_dir, glparse.ASSET_PACK_FILENAME)
+    asset_pack = glparse.AssetPack(pack_filepath, True)
+    chunks = asset_pack.add(payload)
+    changed_chunks = asset_pack.add(changed_payload)
+    assert(asset_pack.add(payload) == chunks)
+    assert(len(chunks) == len(chunk_ends))
+    # Only the chunks around the change are different
+    assert(len(set(changed_chunks) - set(chunks)) <= 2)
+    asset_pack.close()
+    assert(asset_pack.chunk_bytes < len(payload) + len(changed_payload) / 4)
+
+    with open(pack_filepath, "rb") as f:
+        pack = f.read()
+    for (p, c) in [(payload, chunks), (changed_payload, changed_chunks)]:
+        assert("".join([pack[offset:offset + length] for (offset, length) in c]) == p)
+        assert(all([offset % glparse.ASSET_PACK_ALIGNMENT == 0 for (offset, length) in c]))
+
+def test_scalar_arg_formatters():
+    """!
+    The formatters specialised by DataType must generate the same code as the
+    generic one, also when the payload is not the one expected for the type
+    """
+    DataType = glparse.gltrace_pb2.GLMessage.DataType
+    payloads = [("intValue", 0x1403), ("intValue", -1), ("int64Value", 0x12345678),
+                ("floatValue", 0.5), ("boolValue", True)]
+    for data_type in DataType.Type.values():
+        for payload_count in [1, 2]:
+            for first in xrange(len(payloads)):
+                arg = DataType()
+                arg.type = data_type
+                arg.isArray = False
+                for (field_name, value) in payloads[first:first + payload_count]:
+                    getattr(arg, field_name).append(value)
+
+                for translated_value in [None, "GL_UNSIGNED_SHORT"]:
+                    formatter = glparse.get_arg_formatter(arg, translated_value)
+                    assert(formatter(None, None, arg, translated_value) ==
+                           glparse.format_scalar_arg(None, None, arg, translated_value))
+
+def test_pack_values():
+    """!
+    Packing in bulk must return the same bytes as packing value by value
+    """
+    floats = [0.0, -1.5, 1e-3, 3.14159, 1e30]
+    ints = [0, 1, 127, 255]
+    for (pack_type, values) in [("f", floats), ("f", array.array("f", floats)),
+                                ("I", ints + [2 ** 32 - 1]), ("I", array.array("i", ints)),
+                                ("H", ints + [65535]), ("B", ints), ("f", [])]:
+        assert(glparse.pack_values(pack_type, values) ==
+               "".join([struct.pack(pack_type, value) for value in values]))
+
+def test_format_literals():
+    """!
+    Formatting literals in bulk must generate the same text as formatting them
+    one by one
+    """
+    data = "".join([chr(value) for value in xrange(256)]) + "\x00abc"
+    for byte_data in [data, buffer(data), ""]:
+        assert(glparse.format_byte_literals(byte_data) ==
+               ", ".join([hex(ord(b)) for b in byte_data]))
+
+    floats = [0.0, -1.5, 1e-3, 3.14159, 1e30]
+    ints = [0, 1, -1, 2 ** 32 - 1, 2 ** 40]
+    for values in [floats, array.array("f", floats), ints, array.array("i", ints[:3]), []]:
+        assert(glparse.format_literals(values) ==
+               ", ".join([str(value) for value in values]))
+
+def test_lazy_translations():
+    """!
+    The lazily built translation machinery must be the same as the one from the
+    xml for the functions that have been looked up, also when memoised
+    """
+    gl_xml_filepath = glparse.GL_XML_FILEPATH
+    glparse.GL_XML_FILEPATH = copy_gl_xml("lazy_translations")
+    try:
+        initial_lookups = { "glBindTexture" : { 1 : { "field" : "intValue", "table" : "textures" }}}
+        expected_tables = { 'global' : {} }
+        expected_lookups = copy.deepcopy(initial_lookups)
+        glparse.update_translation_machinery_from_xml(expected_tables, expected_lookups)
+
+        function_names = ["glBindTexture", "glTexImage2D", "glEnable", "glBlendFunc",
+                          "glColorMask", "glDrawElements", "eglSwapBuffers"]
+        # Once to create or update the memo, once to read it
+        for i in xrange(2):
+            tables = { 'global' : {} }
+            lookups = copy.deepcopy(initial_lookups)
+            registry = glparse.TranslationRegistry(use_cache = True)
+            tables['global'].update(registry.get_global())
+            for function_name in function_names:
+                glparse.update_translation_machinery_for_function(registry, function_name,
+                                                                  tables, lookups)
+            registry.save()
+
+            assert(tables['global'] == expected_tables['global'])
+            for function_name in function_names:
+                assert(lookups.get(function_name) == expected_lookups.get(function_name))
+                for lookup in lookups.get(function_name, {}).itervalues():
+                    if (lookup["table"] in expected_tables):
+                        assert(tables[lookup["table"]] == expected_tables[lookup["table"]])
+    finally:
+        glparse.GL_XML_FILEPATH = gl_xml_filepath
+
+def test_setup_collapser():
+    """!
+    The setup calls superseded by a later call must be dropped, keeping the
+    rest in order
+    """
+    setup_collapser = glparse.SetupCollapser()
+    msgs = []
+    def add(context_id, function_name, *values):
+        msg = glparse.gltrace_pb2.GLMessage()
+        msg.context_id = context_id
+        for value in values:
+            msg.args.add().intValue.append(value)
+        msgs.append(msg)
+        setup_collapser.add(msg, function_name)
+
+    dropped = []
+    dropped.append(len(msgs))
+    add(0, "glEnable", 0x0C11)
+    dropped.append(len(msgs))
+    add(0, "glViewport", 0, 0, 1, 1)
+    add(0, "glBindTexture", 0x0DE1, 1)
+    dropped.append(len(msgs))
+    add(0, "glTexImage2D", 0x0DE1, 0, 0x1907, 1, 1, 0, 0x1907, 0x1401, 0)
+    add(0, "glTexParameteri", 0x0DE1, 0x2801, 0x2601)
+    add(0, "glDisable", 0x0C11)
+    # Same cap in another context
+    add(1, "glEnable", 0x0C11)
+    dropped.append(len(msgs))
+    add(0, "glViewport", 0, 0, 2, 2)
+    add(0, "glTexImage2D", 0x0DE1, 0, 0x1907, 1, 1, 0, 0x1907, 0x1401, 0)
+    # Bind not used before the next one
+    dropped.append(len(msgs))
+    add(0, "glBindTexture", 0x0DE1, 2)
+    add(0, "glBindTexture", 0x0DE1, 3)
+    # The mipmap generation uses the upload
+    add(0, "glTexImage2D", 0x0DE1, 0, 0x1907, 1, 1, 0, 0x1907, 0x1401, 0)
+    add(0, "glGenerateMipmap", 0x0DE1)
+    add(0, "glTexImage2D", 0x0DE1, 0, 0x1907, 1, 1, 0, 0x1907, 0x1401, 0)
+    add(0, "glUseProgram", 4)
+    dropped.append(len(msgs))
+    add(0, "glUniform1i", 0, 1)
+    add(0, "glUniform1i", 1, 1)
+    add(0, "glUniform1i", 0, 2)
+    # Same location in another program
+    add(0, "glUseProgram", 5)
+    dropped.append(len(msgs))
+    add(0, "glUniform1i", 0, 3)
+    # A draw uses the state and objects set before it
+    add(0, "glViewport", 0, 0, 3, 3)
+    add(0, "glUniform1i", 0, 4)
+    add(0, "glDrawArrays", 0x0004, 0, 3)
+    add(0, "glViewport", 0, 0, 4, 4)
+    add(0, "glUniform1i", 0, 5)
+
+    # Compare identities, some messages are equal
+    expected_msgs = [msg for (index, msg) in enumerate(msgs) if (index not in dropped)]
+    assert(map(id, setup_collapser.collapse()) == map(id, expected_msgs))
+    assert(setup_collapser.dropped_count == len(dropped))
+
+def test_frame_window():
+    """!
+    Only the frames in the window must be replayed, with the setup of the
+    previous frames and without their draws or the assets of the superseded
+    uploads
+    """
+    GLMessage = glparse.gltrace_pb2.GLMessage
+    INT = GLMessage.DataType.INT
+    ENUM = GLMessage.DataType.ENUM
+    GL_TEXTURE_2D = 0x0DE1
+    GL_RGBA = 0x1908
+    GL_UNSIGNED_BYTE = 0x1401
+    GL_TRIANGLES = 0x0004
+    frame_count = 6
+    start_frame = 2
+    end_frame = 4
+
+    outFiledir = make_output_dir("frame_window")
+    assetsFiledir = os.path.join(outFiledir, "assets")
+    traceFilepath = os.path.join(outFiledir, "frame_window.gltrace")
+    with open(traceFilepath, "wb") as f:
+        def write(function, args):
+            msg = GLMessage(context_id = 0, start_time = 0, duration = 0,
+                            function = function)
+            for (datatype, value) in args:
+                arg = msg.args.add(type = datatype, isArray = False)
+                if (isinstance(value, list)):
+                    arg.isArray = True
+                    arg.intValue.extend(value)
+                elif (isinstance(value, str)):
+                    arg.isArray = True
+                    arg.rawBytes.append(value)
+                else:
+                    arg.intValue.append(value)
+            glparse.gltrace.write_trace_message(f, msg.SerializeToString())
+
+        write(GLMessage.glGenTextures, [(INT, 1), (INT, [1])])
+        for frame in xrange(frame_count):
+            write(GLMessage.glBindTexture, [(ENUM, GL_TEXTURE_2D), (INT, 1)])
+            # Different contents every frame, so every upload needs an asset
+            write(GLMessage.glTexImage2D, [(ENUM, GL_TEXTURE_2D), (INT, 0), (INT, GL_RGBA),
+                                           (INT, 16), (INT, 16), (INT, 0), (ENUM, GL_RGBA),
+                                           (ENUM, GL_UNSIGNED_BYTE),
+                                           (GLMessage.DataType.BYTE, chr(frame) * 16 * 16 * 4)])
+            write(GLMessage.glDrawArrays, [(ENUM, GL_TRIANGLES), (INT, 0), (INT, 3)])
+            write(GLMessage.eglSwapBuffers, [])
+
+    lines = glparse.glparse(traceFilepath, outFiledir, assetsFiledir, None,
+                            start_frame = start_frame, end_frame = end_frame)
+    code = string.join(lines, "\n")
+
+    assert(len([line for line in lines if line.startswith("void frame")]) ==
+           end_frame - start_frame + 1)
+    assert(code.count("glGenTextures(") == 1)
+    assert("glBindTexture(" in code)
+    # The last upload before the start frame and the uploads of the window
+    assert(code.count("glTexImage2D(") == 1 + end_frame - start_frame + 1)
+    assert(code.count("glDrawArrays(") == end_frame - start_frame + 1)
+    asset_filenames = os.listdir(assetsFiledir)
+    assert(len(asset_filenames) == 1 + end_frame - start_frame + 1)
+    for asset_filename in asset_filenames:
+        assert('"%s"' % asset_filename in code)
+
+def test_frame_window_validation():
+    """!
+    An end frame before the start frame must fail before generating any code
+    """
+    outFiledir = make_output_dir("frame_window_validation")
+    nose.tools.assert_raises(Exception, glparse.glparse,
+                             os.path.join(TEST_FILES_FILEDIR, "simple.gltrace.gz"),
+                             outFiledir, outFiledir, None, start_frame = 2,
+                             end_frame = 1)
+    assert(os.listdir(outFiledir) == [])
+
 filepaths = glob.glob(os.path.join(TEST_FILES_FILEDIR, "*.gz"))
 filepaths += glob.glob(os.path.join(TEST_FILES_FILEDIR, "*.gltrace"))
 if __name__ == '__main__': # pragma: no cover
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+
+# Copyright 2014 Antonio Tejada
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+# XXX This is so __main__ can find glprofile.py and the unit tests can be debugged
+#     by running __main__. Is there a better way? Can unit tests be debugged from
+#     nose itself?
+if __name__ == '__main__': # pragma: no cover
+    sys.path.append('..')
+
+import nose
+
+import glob
+import os
+
+import common
+import glprofile
+import gltrace
+import utils
+from gltrace import gltrace_pb2
+
+# Inform Nose that the tests can be split across processes
+_multiprocess_can_split_ = True
+
+TEST_FILES_FILEDIR = "glparse"
+OUTPUT_FILEDIR = "_out"
+
+def read_decoded_messages(filepath):
+    with utils.xopen(filepath) as f:
+        return [gltrace_pb2.GLMessage.FromString(buffer) for
+                buffer in gltrace.iter_trace_messages(f)]
+
+def test_peek_message_times():
+    """!
+    The peeked times must match the decoded ones
+    """
+    for filepath in glob.glob(os.path.join(TEST_FILES_FILEDIR, "*.gz")):
+        with utils.xopen(filepath) as f:
+            for buffer in gltrace.iter_trace_messages(f):
+                msg = gltrace_pb2.GLMessage.FromString(buffer)
+                times = gltrace.peek_message_times(buffer)
+                assert(times == (msg.context_id, msg.function, msg.start_time,
+                                 msg.duration, msg.threadtime))
+                assert(gltrace.peek_message_times(buffer[:-1]) is None)
+
+def test_profile_trace():
+    """!
+    The profile totals must match the decoded messages
+    """
+    for filepath in glob.glob(os.path.join(TEST_FILES_FILEDIR, "*.gz")):
+        msgs = read_decoded_messages(filepath)
+        profile = glprofile.profile_trace(filepath)
+
+        functions = profile["functions"].values()
+        assert(sum([times["calls"] for times in functions]) == len(msgs))
+        assert(sum([times["duration"] for times in functions]) ==
+               sum([msg.duration for msg in msgs]))
+        assert(sum([frame["threadtime"] for frame in profile["frames"]]) ==
+               sum([msg.threadtime for msg in msgs]))
+        assert(sum(profile["collapsed"].values()) ==
+               sum([msg.threadtime for msg in msgs]))
+
+        top_durations = sorted([msg.duration for msg in msgs],
+                               reverse = True)[:glprofile.TOP_CALLS]
+        assert([call["duration"] for call in profile["top_calls"]] == top_durations)
+        for call in profile["stalls"]:
+            assert(call["duration"] > glprofile.STALL_RATIO * call["threadtime"])
+
+        assert(len(glprofile.format_profile(profile)) > 0)
+
+        outFiledir = os.path.join(TEST_FILES_FILEDIR, OUTPUT_FILEDIR, "new", "profile")
+        common.makedirs(outFiledir)
+        collapsed_filepath = os.path.join(outFiledir, os.path.basename(filepath) + ".collapsed")
+        glprofile.write_collapsed_stacks(collapsed_filepath, profile)
+        with open(collapsed_filepath, "r") as f:
+            assert(len(f.readlines()) == len(profile["collapsed"]))
+
+def test_profile_frame_range():
+    """!
+    Frame ranges and context filters only profile the selected messages
+    """
+    filepath = os.path.join(TEST_FILES_FILEDIR, "twocontexts.gltrace.gz")
+    profile = glprofile.profile_trace(filepath, [0], 1, 1, collapsed_metric = "duration")
+    assert([frame["frame"] for frame in profile["frames"]] == [1])
+    for stack in profile["collapsed"]:
+        assert(stack.startswith("context_0;frame_1;"))
+
+if (__name__ == '__main__'): # pragma: no cover
+    common.invoke_per_file_functions(__name__)
@@ -0,0 +1,374 @@
+#!/usr/bin/env python
+
+# Copyright 2014 Antonio Tejada
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+# XXX This is so __main__ can find gltrace.py and the unit tests can be debugged
+#     by running __main__. Is there a better way? Can unit tests be debugged from
+#     nose itself?
+if __name__ == '__main__': # pragma: no cover
+    sys.path.append('..')
+
+import nose
+
+import glob
+import gzip
+import logging
+import os
+import struct
+import StringIO
+
+import common
+import gltrace
+import utils
+
+# Inform Nose that the tests can be split across processes
+_multiprocess_can_split_ = True
+
+logger = logging.getLogger(__name__)
+
+TEST_FILES_FILEDIR = "glparse"
+OUTPUT_FILEDIR = "_out"
+
+def read_messages(trace_file):
+    """!
+    Reference implementation of the trace framing, one small read per field
+    """
+    messages = []
+    while True:
+        buffer_length = trace_file.read(4)
+        if (buffer_length == ""):
+            break
+        buffer_length = struct.unpack('!i', buffer_length)[0]
+        messages.append(trace_file.read(buffer_length))
+
+    return messages
+
+def test_iter_trace_messages_block_sizes():
+    """!
+    Framing must not depend on where the block boundaries fall
+    """
+    for filepath in glob.glob(os.path.join(TEST_FILES_FILEDIR, "*.gz")):
+        with utils.xopen(filepath) as f:
+            expected_messages = read_messages(f)
+
+        for block_size in [1, 3, 4, 5, 64, gltrace.TRACE_BLOCK_SIZE]:
+            with utils.xopen(filepath) as f:
+                messages = [buffer.tobytes() for buffer in
+                            gltrace.iter_trace_messages(f, block_size)]
+            assert(messages == expected_messages)
+
+def test_iter_trace_messages_truncated():
+    """!
+    Truncated trailing messages are dropped
+    """
+    trace_file = StringIO.StringIO()
+    gltrace.write_trace_message(trace_file, "first")
+    gltrace.write_trace_message(trace_file, "second")
+    trace_data = trace_file.getvalue()
+
+    for truncated_size in xrange(len(trace_data)):
+        messages = [buffer.tobytes() for buffer in
+                    gltrace.iter_trace_messages(StringIO.StringIO(trace_data[:truncated_size]), 4)]
+        if (truncated_size < 4 + len("first")):
+            assert(messages == [])
+        else:
+            assert(messages == ["first"])
+
+def test_iter_trace_messages_short_reads():
+    """!
+    Messages bigger than the block must be framed when the file returns less
+    than requested
+    """
+    class ShortReadFile(object):
+        def __init__(self, data, max_read_size):
+            self.file = StringIO.StringIO(data)
+            self.max_read_size = max_read_size
+
+        def read(self, size):
+            return self.file.read(min(size, self.max_read_size))
+
+    trace_file = StringIO.StringIO()
+    expected_messages = ["small", "big" * 10000, "", "last"]
+    for message in expected_messages:
+        gltrace.write_trace_message(trace_file, message)
+
+    for max_read_size in [1, 7, 1000]:
+        messages = [buffer.tobytes() for buffer in
+                    gltrace.iter_trace_messages(ShortReadFile(trace_file.getvalue(),
+                                                              max_read_size), 16)]
+        assert(messages == expected_messages)
+
+def test_iter_read_ahead_messages():
+    """!
+    Reading ahead on a thread returns the same messages, stops the thread if
+    the consumer stops early and forwards the reader's exceptions
+    """
+    for filepath in glob.glob(os.path.join(TEST_FILES_FILEDIR, "*.gz")):
+        with utils.xopen(filepath) as f:
+            expected_messages = read_messages(f)
+
+        for (queue_size, batch_size) in [(1, 1), (2, 3), (16, gltrace.READ_AHEAD_BATCH_SIZE)]:
+            with utils.xopen(filepath) as f:
+                messages = [buffer.tobytes() for buffer in
+                            gltrace.iter_read_ahead_messages(
+                                gltrace.iter_trace_messages(f, 64),
+                                queue_size, batch_size)]
+            assert(messages == expected_messages)
+
+            with utils.xopen(filepath) as f:
+                messages = gltrace.iter_read_ahead_messages(
+                    gltrace.iter_trace_messages(f), queue_size, batch_size)
+                assert(messages.next().tobytes() == expected_messages[0])
+                messages.close()
+
+    def failing_messages():
+        yield "first"
+        raise IOError("Read error")
+
+    messages = gltrace.iter_read_ahead_messages(failing_messages(), 1, 1)
+    assert(messages.next() == "first")
+    try:
+        messages.next()
+    except IOError:
+        pass
+    else:
+        assert False, "Read error wasn't forwarded"
+
+def test_trace_index():
+    """!
+    The index survives a save/read round trip and selects the right messages
+    """
+    filepath = os.path.join(TEST_FILES_FILEDIR, "twocontexts.gltrace.gz")
+    outFiledir = os.path.join(TEST_FILES_FILEDIR, OUTPUT_FILEDIR, "new", "index")
+    common.makedirs(outFiledir)
+    indexFilepath = os.path.join(outFiledir, "twocontexts.gltrace.gz.idx")
+
+    with utils.xopen(filepath) as f:
+        messages = [gltrace.gltrace_pb2.GLMessage.FromString(buffer) for buffer in
+                    read_messages(f)]
+
+    trace_index = gltrace.build_trace_index(filepath)
+    assert(len(trace_index) == len(messages))
+    assert([entry.context_id for entry in trace_index] ==
+           [msg.context_id for msg in messages])
+    assert([entry.function for entry in trace_index] ==
+           [msg.function for msg in messages])
+
+    trace_stamp = gltrace.get_trace_stamp(filepath)
+    gltrace.save_trace_index(indexFilepath, trace_index, trace_stamp)
+    assert(gltrace.read_trace_index(indexFilepath, trace_stamp) == trace_index)
+    assert(gltrace.read_trace_index(indexFilepath, (0, 0)) is None)
+
+    for context_id in [0, 1]:
+        with utils.xopen(filepath) as f:
+            buffers = [buffer.tobytes() for buffer in
+                       gltrace.iter_indexed_messages(f, trace_index, [context_id])]
+        assert(buffers == [msg.SerializeToString() for msg in messages
+                           if (msg.context_id == context_id)])
+        assert(gltrace.count_frames(trace_index, [context_id]) ==
+               len([msg for msg in messages if ((msg.context_id == context_id) and
+                    (msg.function == gltrace.EGL_SWAP_BUFFERS))]))
+
+    # Seek to the last frame
+    last_frame = trace_index[-1].frame
+    with utils.xopen(filepath) as f:
+        buffers = list(gltrace.iter_indexed_messages(f, trace_index,
+                                                     first_frame = last_frame))
+    assert(len(buffers) == len([entry for entry in trace_index
+                                if (entry.frame == last_frame)]))
+
+def test_iter_frame_window_messages():
+    """!
+    Only the skipped functions before the first frame are dropped
+    """
+    filepath = os.path.join(TEST_FILES_FILEDIR, "twocontexts.gltrace.gz")
+    with utils.xopen(filepath) as f:
+        buffers = read_messages(f)
+    msgs = [gltrace.gltrace_pb2.GLMessage.FromString(buffer) for buffer in buffers]
+    skipped_functions = [gltrace.gltrace_pb2.GLMessage.glClear, "glGetError"]
+
+    for first_frame in xrange(4):
+        expected_buffers = []
+        frame = 0
+        for (buffer, msg) in zip(buffers, msgs):
+            if ((frame >= first_frame) or
+                (msg.function not in [gltrace.gltrace_pb2.GLMessage.glClear,
+                                      gltrace.gltrace_pb2.GLMessage.glGetError])):
+                expected_buffers.append(buffer)
+            if (msg.function == gltrace.EGL_SWAP_BUFFERS):
+                frame += 1
+
+        window_buffers = list(gltrace.iter_frame_window_messages(buffers, first_frame,
+                                                                 skipped_functions))
+        assert(window_buffers == expected_buffers)
+
+def test_iter_frame_window_draws():
+    """!
+    The draw functions before the first frame are only dropped while the
+    default framebuffer is bound for drawing in their context
+    """
+    GLMessage = gltrace.gltrace_pb2.GLMessage
+    GL_FRAMEBUFFER = 0x8D40
+    GL_READ_FRAMEBUFFER = 0x8CA8
+    buffers = []
+    expected_buffers = []
+    for (context_id, function, args, kept) in [
+        (0, GLMessage.glDrawArrays, [], False),
+        (0, GLMessage.glBindFramebuffer, [GL_FRAMEBUFFER, 1], True),
+        (0, GLMessage.glClear, [], True),
+        (0, GLMessage.glDrawArrays, [], True),
+        # Other contexts have their own binding
+        (1, GLMessage.glDrawArrays, [], False),
+        # Reading from the default framebuffer still draws to the bound one
+        (0, GLMessage.glBindFramebuffer, [GL_READ_FRAMEBUFFER, 0], True),
+        (0, GLMessage.glDrawElements, [], True),
+        (0, GLMessage.glGetError, [], False),
+        (0, GLMessage.glBindFramebuffer, [GL_FRAMEBUFFER, 0], True),
+        (0, GLMessage.glDrawArrays, [], False),
+        (0, GLMessage.eglSwapBuffers, [], True),
+        (0, GLMessage.glDrawArrays, [], True)]:
+        msg = GLMessage(context_id = context_id, start_time = 0, duration = 0,
+                        function = function)
+        for value in args:
+            msg.args.add(type = GLMessage.DataType.INT, isArray = False).intValue.append(value)
+        buffers.append(msg.SerializeToString())
+        if (kept):
+            expected_buffers.append(buffers[-1])
+
+    window_buffers = list(gltrace.iter_frame_window_messages(
+        buffers, 1, ["glGetError"], ["glClear", "glDrawArrays", "glDrawElements"]))
+    assert(window_buffers == expected_buffers)
+
+def test_summarize_trace():
+    """!
+    The summary must match the counts of the fully decoded trace
+    """
+    for filepath in glob.glob(os.path.join(TEST_FILES_FILEDIR, "*.gz")):
+        with utils.xopen(filepath) as f:
+            msgs = [gltrace.gltrace_pb2.GLMessage.FromString(buffer) for
+                    buffer in read_messages(f)]
+        frame_count = sum([1 for msg in msgs if
+                           (msg.function == gltrace.EGL_SWAP_BUFFERS)])
+
+        for decoder_name in ["protobuf", "fast"]:
+            summary = gltrace.summarize_trace(filepath, None, decoder_name)
+            assert(summary["messages"] == len(msgs))
+            assert(summary["frames"] == frame_count)
+            assert(sum(summary["functions"].values()) == len(msgs))
+            assert(sum([sum(frame["functions"].values()) for frame in
+                        summary["per_frame"]]) == len(msgs))
+            assert(sum(summary["payload_bytes"].values()) ==
+                   sum([len(raw_bytes) for msg in msgs for arg in msg.args
+                        for raw_bytes in arg.rawBytes]))
+            assert(summary["shaders"] == summary["functions"].get("glCreateShader", 0))
+            assert(len(gltrace.format_summary(summary, True)) > 0)
+
+    summary = gltrace.summarize_trace(os.path.join(TEST_FILES_FILEDIR,
+                                                   "twocontexts.gltrace.gz"), [1])
+    assert(summary["contexts"].keys() == [1])
+    assert(summary["frames"] == 1)
+
+def test_summarize_vertex_data():
+    """!
+    Client side vertex arrays must be counted as vertex payload, the pointers
+    of glVertexAttribPointer carry no payload
+    """
+    GLMessage = gltrace.gltrace_pb2.GLMessage
+    outFiledir = os.path.join(TEST_FILES_FILEDIR, OUTPUT_FILEDIR, "new", "summary")
+    common.makedirs(outFiledir)
+    traceFilepath = os.path.join(outFiledir, "vertex_data.gltrace")
+
+    vertex_bytes = "\x00" * 48
+    with open(traceFilepath, "wb") as f:
+        for (function, raw_bytes) in [(GLMessage.glVertexAttribPointer, None),
+                                      (GLMessage.glVertexAttribPointerData, vertex_bytes),
+                                      (GLMessage.glDrawArrays, None),
+                                      (GLMessage.eglSwapBuffers, None)]:
+            msg = GLMessage(context_id = 0, start_time = 0, duration = 0,
+                            function = function)
+            arg = msg.args.add(type = GLMessage.DataType.INT, isArray = False)
+            if (raw_bytes is None):
+                arg.intValue.append(0x100)
+            else:
+                arg.type = GLMessage.DataType.VOID
+                arg.isArray = True
+                arg.rawBytes.append(raw_bytes)
+            gltrace.write_trace_message(f, msg.SerializeToString())
+
+    for decoder_name in ["protobuf", "fast"]:
+        summary = gltrace.summarize_trace(traceFilepath, None, decoder_name)
+        assert(summary["payload_bytes"]["vertex"] == len(vertex_bytes))
+        assert(sum(summary["payload_bytes"].values()) == len(vertex_bytes))
+
+def test_filtered_messages():
+    """!
+    Wire-level peeking matches the decoded context and function
+    """
+    for filepath in glob.glob(os.path.join(TEST_FILES_FILEDIR, "*.gz")):
+        with utils.xopen(filepath) as f:
+            buffers = read_messages(f)
+        messages = [gltrace.gltrace_pb2.GLMessage.FromString(buffer) for buffer in buffers]
+
+        for (buffer, msg) in zip(buffers, messages):
+            assert(gltrace.peek_message_header(buffer) == (msg.context_id, msg.function))
+
+        filtered_buffers = list(gltrace.iter_filtered_messages(buffers, [1], ["eglSwapBuffers"]))
+        assert(filtered_buffers == [buffer for (buffer, msg) in zip(buffers, messages)
+                                    if ((msg.context_id == 1) and
+                                        (msg.function == gltrace.EGL_SWAP_BUFFERS))])
+
+    # Negative context ids and fields out of order
+    msg = gltrace.gltrace_pb2.GLMessage(context_id = -1, start_time = 0, duration = 0,
+                                        function = gltrace.EGL_SWAP_BUFFERS)
+    buffer = msg.SerializeToString()
+    assert(gltrace.peek_message_header(buffer) == (-1, gltrace.EGL_SWAP_BUFFERS))
+    buffer = buffer[-3:] + buffer[:-3]
+    assert(gltrace.peek_message_header(buffer) == (-1, gltrace.EGL_SWAP_BUFFERS))
+    assert(gltrace.peek_message_header("\xff") is None)
+
+def test_blocked_gzip():
+    """!
+    Converting to blocked gzip keeps the messages, allows seeking and is
+    still readable by gzip
+    """
+    filepath = os.path.join(TEST_FILES_FILEDIR, "resources.gltrace.gz")
+    outFiledir = os.path.join(TEST_FILES_FILEDIR, OUTPUT_FILEDIR, "new", "bgz")
+    common.makedirs(outFiledir)
+    bgzFilepath = os.path.join(outFiledir, "resources.gltrace.bgz")
+
+    with utils.xopen(filepath) as f:
+        data = f.read()
+
+    # Use small blocks so messages straddle blocks
+    with utils.BlockedGzipFile(bgzFilepath, "wb", block_size = 1000) as f:
+        f.write(data)
+
+    with gzip.open(bgzFilepath) as f:
+        assert(f.read() == data)
+
+    for processes in [1, 2]:
+        with utils.xopen(bgzFilepath, processes = processes) as f:
+            assert(f.read() == data)
+            for offset in xrange(0, len(data), 333):
+                f.seek(offset)
+                assert(f.read(1500) == data[offset:offset + 1500])
+
+    gltrace.convert_command(filepath, bgzFilepath)
+    with utils.xopen(bgzFilepath) as f:
+        assert(f.read() == data)
+
+if (__name__ == '__main__'): # pragma: no cover
+    common.invoke_per_file_functions(__name__)
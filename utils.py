@@ -14,9 +14,263 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import bisect
+import multiprocessing
+import os
+import struct
+import zlib
+
+# Blocked gzip files (.bgz) are a sequence of independently compressed gzip
+# members of up to BGZ_BLOCK_SIZE uncompressed bytes, so they can still be
+# decompressed with any gzip tool, but they also allow random access and
+# parallel decompression.
+# Every member stores in the gzip extra field a "GB" subfield with the size of
+# the whole member and the uncompressed size of the block, so the block offset
+# table can be built by hopping from header to header without inflating.
+BGZ_EXTENSION = ".bgz"
+BGZ_BLOCK_SIZE = 1024 * 1024
+# ID1, ID2, CM, FLG, MTIME, XFL, OS, XLEN, SI1, SI2, SLEN, member size, ISIZE
+BGZ_HEADER = struct.Struct("<BBBBIBBH2sHII")
+BGZ_TRAILER = struct.Struct("<II")
+BGZ_SUBFIELD_ID = "GB"
+
+def bgz_compress_block(data, compresslevel=9):
+    """!
+    Return the gzip member for the given block of data
+    """
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+    deflated = compressor.compress(data) + compressor.flush()
+    member_size = BGZ_HEADER.size + len(deflated) + BGZ_TRAILER.size
+    # FEXTRA flag, unknown OS, XLEN covers the GB subfield
+    header = BGZ_HEADER.pack(0x1f, 0x8b, zlib.DEFLATED, 4, 0, 0, 255,
+                             BGZ_HEADER.size - 12, BGZ_SUBFIELD_ID, 8,
+                             member_size, len(data))
+    trailer = BGZ_TRAILER.pack(zlib.crc32(data) & 0xffffffff, len(data) & 0xffffffff)
+
+    return header + deflated + trailer
+
+def bgz_decompress_block(member):
+    """!
+    Return the data of the given gzip member, as returned by bgz_compress_block
+    """
+    data = zlib.decompress(member[BGZ_HEADER.size:-BGZ_TRAILER.size], -zlib.MAX_WBITS)
+    crc = BGZ_TRAILER.unpack(member[-BGZ_TRAILER.size:])[0]
+    if ((zlib.crc32(data) & 0xffffffff) != crc):
+        raise IOError("CRC check failed on blocked gzip member")
+
+    return data
+
+def bgz_read_block(args):
+    """!
+    Read and decompress one block given as (filepath, file offset, member size)
+
+    This is a top level function so it can be used from a multiprocessing pool
+    """
+    (filepath, file_offset, member_size) = args
+    with open(filepath, "rb") as f:
+        f.seek(file_offset)
+        return bgz_decompress_block(f.read(member_size))
+
+def bgz_read_block_table(f):
+    """!
+    Return a list of (file offset, member size, uncompressed size) for each
+    block of the given open blocked gzip file
+    """
+    block_table = []
+    file_offset = 0
+    while True:
+        f.seek(file_offset)
+        header = f.read(BGZ_HEADER.size)
+        if (header == ""):
+            break
+        if (len(header) != BGZ_HEADER.size):
+            raise IOError("Truncated blocked gzip header at offset %d" % file_offset)
+        fields = BGZ_HEADER.unpack(header)
+        (id1, id2, member_size, uncompressed_size) = (fields[0], fields[1], fields[10], fields[11])
+        if ((id1, id2, fields[8]) != (0x1f, 0x8b, BGZ_SUBFIELD_ID)):
+            raise IOError("Not a blocked gzip member at offset %d" % file_offset)
+        block_table.append((file_offset, member_size, uncompressed_size))
+        file_offset += member_size
+
+    return block_table
+
+class BlockedGzipFile(object):
+    """!
+    File object for blocked gzip files, see BGZ_BLOCK_SIZE.
+
+    Reading supports seeking and can decompress the blocks ahead of the
+    current one on a multiprocessing pool of the given number of processes
+    (None to use as many as CPUs). Writing is append-only.
+    """
+    def __init__(self, filepath, mode='rb', compresslevel=9, processes=1,
+                 block_size=BGZ_BLOCK_SIZE):
+        self.filepath = filepath
+        self.mode = mode
+        self.compresslevel = compresslevel
+        self.block_size = block_size
+        self.file = open(filepath, mode)
+        self.closed = False
+
+        if ('r' in mode):
+            self.block_table = bgz_read_block_table(self.file)
+            # Uncompressed offset where each block starts
+            self.block_starts = []
+            offset = 0
+            for (file_offset, member_size, uncompressed_size) in self.block_table:
+                self.block_starts.append(offset)
+                offset += uncompressed_size
+            self.size = offset
+
+            self.offset = 0
+            self.block_index = None
+            self.block_data = ""
+
+            if (processes is None):
+                processes = multiprocessing.cpu_count()
+            self.processes = processes
+            self.pool = None
+            # AsyncResults for the blocks being decompressed ahead, indexed by
+            # block index, bounded to twice the number of processes
+            self.pending_blocks = {}
+
+        else:
+            self.write_buffer = []
+            self.write_buffer_size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if (self.closed):
+            return
+        if ('r' not in self.mode):
+            self.flush_block()
+        else:
+            if (self.pool is not None):
+                self.pool.terminate()
+                self.pool = None
+        self.file.close()
+        self.closed = True
+
+    #
+    # Writing
+    #
+
+    def flush_block(self):
+        """!
+        Write the pending data as a block, even if smaller than block_size
+        """
+        if (self.write_buffer_size > 0):
+            self.file.write(bgz_compress_block("".join(self.write_buffer),
+                                               self.compresslevel))
+        self.write_buffer = []
+        self.write_buffer_size = 0
+
+    def write(self, data):
+        if (isinstance(data, memoryview)):
+            data = data.tobytes()
+        self.write_buffer.append(data)
+        self.write_buffer_size += len(data)
+        if (self.write_buffer_size >= self.block_size):
+            # Write all the full blocks and keep the remainder for later
+            data = "".join(self.write_buffer)
+            block_start = 0
+            while ((len(data) - block_start) >= self.block_size):
+                self.file.write(bgz_compress_block(data[block_start:block_start + self.block_size],
+                                                   self.compresslevel))
+                block_start += self.block_size
+            self.write_buffer = [data[block_start:]]
+            self.write_buffer_size = len(data) - block_start
+
+    #
+    # Reading
+    #
+
+    def read_block(self, block_index):
+        """!
+        Return the uncompressed data of the given block, scheduling the
+        decompression of the following blocks if using a pool
+        """
+        if (self.processes <= 1):
+            (file_offset, member_size, uncompressed_size) = self.block_table[block_index]
+            self.file.seek(file_offset)
+            return bgz_decompress_block(self.file.read(member_size))
+
+        if (self.pool is None):
+            self.pool = multiprocessing.Pool(self.processes)
+
+        # Drop the read-ahead if this is not a sequential read
+        for pending_index in self.pending_blocks.keys():
+            if ((pending_index < block_index) or
+                (pending_index >= block_index + 2 * self.processes)):
+                del self.pending_blocks[pending_index]
+
+        for ahead_index in xrange(block_index,
+                                  min(block_index + 2 * self.processes, len(self.block_table))):
+            if (ahead_index not in self.pending_blocks):
+                (file_offset, member_size, uncompressed_size) = self.block_table[ahead_index]
+                self.pending_blocks[ahead_index] = self.pool.apply_async(
+                    bgz_read_block, [(self.filepath, file_offset, member_size)])
+
+        return self.pending_blocks.pop(block_index).get()
+
+    def read(self, size=-1):
+        if ((size < 0) or (self.offset + size > self.size)):
+            size = self.size - self.offset
+
+        chunks = []
+        while (size > 0):
+            # Find the block containing the current offset, normally the
+            # current or the next one
+            block_index = self.block_index
+            if ((block_index is None) or
+                (not (self.block_starts[block_index] <= self.offset <
+                      self.block_starts[block_index] + len(self.block_data)))):
+                if ((block_index is not None) and (block_index + 1 < len(self.block_starts)) and
+                    (self.block_starts[block_index + 1] == self.offset)):
+                    block_index += 1
+                else:
+                    block_index = bisect.bisect_right(self.block_starts, self.offset) - 1
+                self.block_data = self.read_block(block_index)
+                self.block_index = block_index
+
+            block_offset = self.offset - self.block_starts[block_index]
+            chunk = self.block_data[block_offset:block_offset + size]
+            chunks.append(chunk)
+            self.offset += len(chunk)
+            size -= len(chunk)
+
+        if (len(chunks) == 1):
+            return chunks[0]
+        return "".join(chunks)
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if (whence == os.SEEK_CUR):
+            offset += self.offset
+        elif (whence == os.SEEK_END):
+            offset += self.size
+        self.offset = max(0, offset)
+
+    def tell(self):
+        return self.offset
+
 # XXX Note using compression will cause corrupt files if the program is aborted
 #     with ctrl+break while saving (ctrl+c seems to work fine)
-def xopen(filepath, mode = 'rb', compresslevel=9):
+def xopen(filepath, mode = 'rb', compresslevel=9, processes=1):
+    """!
+    Open a file, decompressing it if the filename ends in .gz or .bgz
+
+    @param processes: Number of processes to use when decompressing blocked
+           gzip files, None to use as many as CPUs.
+    """
+    if (filepath.endswith(BGZ_EXTENSION)):
+        # Blocked gzip files are always binary
+        newmode = mode.replace('U', '').replace('b', '') + 'b'
+        return BlockedGzipFile(filepath, newmode, compresslevel, processes)
+
     # Guess from the filename whether to decompress or not
     if (filepath.endswith(".gz")):
         compressed = True
@@ -44,6 +298,11 @@ def xopen(filepath, mode = 'rb', compresslevel=9):
     return file
 
 def xgetsize(filepath): # pragma: no cover
+    if (filepath.endswith(BGZ_EXTENSION)):
+        # The uncompressed size of every block is in the block table
+        with open(filepath, "rb") as f:
+            return sum([block[2] for block in bgz_read_block_table(f)])
+
     # Guess from the filename whether to decompress or not
     if (filepath.endswith(".gz")):
         compressed = True
@@ -55,7 +314,6 @@ def xgetsize(filepath): # pragma: no cover
         # http://www.gzip.org/zlib/rfc-gzip.html#header-trailer
         # Note this assumes there's only one component in the gzip file
         # and that the size is less than 2GB
-        import struct
         with open(filepath, "rb") as f:
             f.seek(-4, os.SEEK_END)
             size = struct.unpack("<I", f.read(4))[0]